@@ -11,7 +11,6 @@ import os
 
 from claude_agent_sdk import (
     ClaudeAgentOptions,
-    ClaudeSDKClient,
     ResultMessage,
 )
 
@@ -19,6 +18,8 @@ from app.cc_tools.waiting_answer.waiting_answer_tools import create_waiting_answ
 from app.cc_tools.slack.slack_tools import create_slack_mcp_server
 from app.cc_utils.waiting_answer_db import get_user_pending_requests
 from app.config.settings import get_settings
+from app.cc_utils.claude_client_pool import get_claude_client_pool
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
 
 
 def create_system_prompt() -> str:
@@ -126,7 +127,10 @@ async def call_answer_aggregator(
     )
 
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with (
+            llm_slot(LLMTier.MODERATE, LLMPriority.INTERACTIVE, "answer_aggregator"),
+            get_claude_client_pool().client(options, "answer_aggregator") as client,
+        ):
             query = f"""
 다음 정보를 분석하여 처리하세요:
 
@@ -2,19 +2,107 @@
 봇 호출 감지 에이전트 (Bot Call Detector Agent)
 
 이 모듈은 메시지가 봇을 직접 호출하는 것인지 판단합니다.
+
+판단은 단계적으로 이루어집니다:
+1. 봇 user ID 멘션 → true
+2. 봇 이름(줄임말 포함)이 전혀 없음 → false
+3. 메시지 첫머리에서 이름으로 부름 ("키라야", "Hey KIRA", "KIRA,") → true
+4. 이전에 LLM이 false로 판단한 메시지 (negative cache) → false
+5. 그 외 애매한 경우에만 LLM 호출
 """
 
 import logging
 import os
+import re
+import unicodedata
+from collections import Counter
+from typing import List, Optional, Tuple
 
 from claude_agent_sdk import (
     ClaudeAgentOptions,
-    ClaudeSDKClient,
     ResultMessage,
 )
 
 from app.config.settings import get_settings
 from app.cc_utils.language_helper import detect_language
+from app.cc_utils.claude_client_pool import get_claude_client_pool
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
+from app.cc_utils.ttl_cache import TTLCache
+
+# LLM이 false로 판단한 메시지 캐시 (반복되는 알림/공지 메시지 등)
+NEGATIVE_CACHE_TTL_SECONDS = 60 * 60
+_negative_cache = TTLCache(NEGATIVE_CACHE_TTL_SECONDS, max_entries=5000)
+
+# 판단 출처별 카운터 (mention / no_name / direct_address / negative_cache / llm)
+decision_counts: Counter = Counter()
+
+KOREAN_HONORIFICS = ("님", "씨", "야", "아")
+ENGLISH_GREETINGS = ("hey", "hi", "hello", "yo", "dear")
+
+
+def _get_short_name(bot_name: str) -> Optional[str]:
+    """한글 이름인 경우만 줄임말 생성 (예: 김키라 → 키라)"""
+    is_korean_name = detect_language(bot_name) == "Korean" if bot_name else False
+    return bot_name[1:] if is_korean_name and len(bot_name) > 2 else None
+
+
+def _normalize(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", text).lower().split())
+
+
+def _name_forms(bot_name: str) -> List[str]:
+    """봇 이름과 줄임말 (정규화, 긴 것부터)"""
+    forms = {_normalize(form) for form in (bot_name, _get_short_name(bot_name)) if form}
+    return sorted(forms, key=len, reverse=True)
+
+
+def detect_bot_call_fast(
+    message_text: str,
+    bot_name: str,
+    bot_user_id: Optional[str] = None
+) -> Tuple[Optional[bool], str]:
+    """
+    LLM 없이 확실하게 판단 가능한 경우를 처리합니다.
+
+    Args:
+        message_text: 멘션이 "이름(@U...)" 형태로 변환된 메시지
+        bot_name: 봇의 이름
+        bot_user_id: 봇의 Slack user ID
+
+    Returns:
+        (판단 결과, 판단 출처) - 애매한 경우 판단 결과는 None
+    """
+    if bot_user_id and (f"@{bot_user_id}" in message_text or f"<@{bot_user_id}>" in message_text):
+        return True, "mention"
+
+    text = _normalize(message_text)
+    forms = _name_forms(bot_name)
+    if not any(form in text for form in forms):
+        return False, "no_name"
+
+    names = "|".join(re.escape(form) for form in forms)
+    honorifics = "|".join(KOREAN_HONORIFICS)
+    greetings = "|".join(ENGLISH_GREETINGS)
+    direct_address = re.compile(
+        # "KIRA, ...", "키라님!", "키라야?"
+        rf"^@?(?:{names})(?:{honorifics})?\s*(?:[,!?~:]|$)"
+        # "키라야 이것 좀 봐줘", "키라님 확인 부탁드려요"
+        rf"|^@?(?:{names})(?:{honorifics})\s"
+        # "Hey KIRA ...", "hi kira"
+        rf"|^(?:{greetings})\s+@?(?:{names})\b"
+    )
+    if direct_address.search(text):
+        return True, "direct_address"
+
+    return None, "ambiguous"
+
+
+def _log_decision(result: bool, source: str, message_text: str) -> bool:
+    decision_counts[source] += 1
+    logging.info(
+        f"[BOT_CALL_DETECTOR] Decision={str(result).lower()} source={source} text='{message_text[:50]}'"
+    )
+    return result
 
 
 def create_system_prompt(bot_name: str) -> str:
@@ -27,8 +115,7 @@ def create_system_prompt(bot_name: str) -> str:
         str: 봇 호출 감지를 위한 system prompt
     """
     # 한글 이름인 경우만 줄임말 생성
-    is_korean_name = detect_language(bot_name) == "Korean" if bot_name else False
-    bot_short_name = bot_name[1:] if is_korean_name and len(bot_name) > 2 else None
+    bot_short_name = _get_short_name(bot_name)
 
     # 줄임말 설명
     short_name_desc = f' 혹은 "{bot_short_name}"' if bot_short_name else ''
@@ -66,7 +153,9 @@ Target not called: output "false"
 
 async def call_bot_call_detector(
     message_text: str,
-    bot_name: str = None
+    bot_name: str = None,
+    bot_user_id: str = None,
+    fast_result: Optional[Tuple[Optional[bool], str]] = None
 ) -> bool:
     """
     봇 호출 감지 에이전트를 실행합니다.
@@ -74,6 +163,8 @@ async def call_bot_call_detector(
     Args:
         message_text: 사용자가 보낸 메시지 텍스트
         bot_name: 봇의 이름 (기본값: settings에서 가져옴)
+        bot_user_id: 봇의 Slack user ID (멘션 감지용)
+        fast_result: 호출 측에서 이미 계산한 detect_bot_call_fast 결과 (있으면 규칙 판단을 다시 하지 않음)
 
     Returns:
         bool: 봇이 호출되었는지 여부
@@ -82,6 +173,18 @@ async def call_bot_call_detector(
     if not bot_name:
         bot_name = settings.BOT_NAME or "KIRA"
 
+    # 1~3단계: 규칙 기반 판단
+    if fast_result is None:
+        fast_result = detect_bot_call_fast(message_text, bot_name, bot_user_id)
+    result, source = fast_result
+    if result is not None:
+        return _log_decision(result, source, message_text)
+
+    # 4단계: 이전에 LLM이 false로 판단한 메시지
+    cache_key = (bot_name, _normalize(message_text))
+    if cache_key in _negative_cache:
+        return _log_decision(False, "negative_cache", message_text)
+
     system_prompt = create_system_prompt(bot_name)
 
     options = ClaudeAgentOptions(
@@ -103,7 +206,10 @@ async def call_bot_call_detector(
     )
 
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with (
+            llm_slot(LLMTier.SIMPLE, LLMPriority.INTERACTIVE, "bot_call_detector"),
+            get_claude_client_pool().client(options, "bot_call_detector") as client,
+        ):
             query = f"""Determine if the following message is directly calling the target "{bot_name}".
 
 Message: {message_text}"""
@@ -114,7 +220,10 @@ Message: {message_text}"""
                 if isinstance(message, ResultMessage):
                     result_text = message.result.strip().lower()
                     logging.info(f"[BOT_CALL_DETECTOR] Response: {result_text}")
-                    return "true" in result_text
+                    is_called = "true" in result_text
+                    if not is_called:
+                        _negative_cache.set(cache_key, True)
+                    return _log_decision(is_called, "llm", message_text)
     except Exception as e:
         logging.error(f"[BOT_CALL_DETECTOR] Error: {e}")
 
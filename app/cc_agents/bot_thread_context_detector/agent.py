@@ -9,12 +9,13 @@ import os
 
 from claude_agent_sdk import (
     ClaudeAgentOptions,
-    ClaudeSDKClient,
     ResultMessage,
 )
 from slack_sdk.web.async_client import AsyncWebClient
 
 from app.config.settings import get_settings
+from app.cc_utils.claude_client_pool import get_claude_client_pool
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
 
 
 def create_system_prompt(bot_name: str) -> str:
@@ -130,7 +131,10 @@ async def call_bot_thread_context_detector(
             cwd=os.getcwd()
         )
 
-        async with ClaudeSDKClient(options=options) as sdk_client:
+        async with (
+            llm_slot(LLMTier.SIMPLE, LLMPriority.INTERACTIVE, "bot_thread_context_detector"),
+            get_claude_client_pool().client(options, "bot_thread_context_detector") as sdk_client,
+        ):
             conversation = "\n".join(thread_messages)
             query = f"""스레드 대화 내역:
 {conversation}
@@ -3,12 +3,61 @@ Context Assembler
 
 Assembles context from multiple sources (filesystem, OneFlow, persona, etc.)
 into a unified context string for injection into agent prompts.
+
+Sources are queried concurrently under an overall deadline; a source that
+exceeds its own timeout is dropped (ContextSourceTimeoutError) and the
+context is assembled from the sources that answered in time.
 """
 
+import asyncio
 import logging
+import time
 from typing import List, Optional, Dict, Any
 
-from app.cc_agents.context_sources import ContextSource, ContextSourceError
+from app.cc_agents.context_sources import ContextSource, ContextSourceError, ContextSourceTimeoutError
+
+# Overall budget for one assemble_context() call
+DEFAULT_DEADLINE_SECONDS = 90.0
+
+
+class SourceStats:
+    """Latency and outcome counters for one context source"""
+
+    def __init__(self):
+        self.calls = 0
+        self.hits = 0
+        self.empty = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record(self, outcome: str, latency: float) -> None:
+        self.calls += 1
+        setattr(self, outcome, getattr(self, outcome) + 1)
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "hits": self.hits,
+            "empty": self.empty,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "hit_rate": round(self.hits / self.calls, 3) if self.calls else 0.0,
+            "avg_latency": round(self.total_latency / self.calls, 3) if self.calls else 0.0,
+            "max_latency": round(self.max_latency, 3),
+        }
+
+
+# Shared across assembler instances (one is built per retrieval)
+_source_stats: Dict[str, SourceStats] = {}
+
+
+def get_source_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-source latency and hit statistics since startup"""
+    return {name: stats.as_dict() for name, stats in _source_stats.items()}
 
 
 class ContextAssembler:
@@ -19,14 +68,21 @@ class ContextAssembler:
     context string. Handles source failures gracefully (continues with available sources).
     """
     
-    def __init__(self, sources: Optional[List[ContextSource]] = None):
+    def __init__(
+        self,
+        sources: Optional[List[ContextSource]] = None,
+        deadline_seconds: float = DEFAULT_DEADLINE_SECONDS
+    ):
         """
         Initialize context assembler.
         
         Args:
             sources: List of context sources to use. If None, uses default sources.
+            deadline_seconds: Overall time budget for assembling context.
+                Each source is additionally bounded by its own timeout_seconds.
         """
         self._sources = sources or []
+        self._deadline_seconds = deadline_seconds
         self._logger = logging.getLogger(__name__)
     
     def add_source(self, source: ContextSource) -> None:
@@ -80,49 +136,53 @@ class ContextAssembler:
             self._logger.warning("[CONTEXT_ASSEMBLER] No sources configured")
             return ""
         
+        source_kwargs = {**kwargs}
+        if persona_name:
+            source_kwargs['persona_name'] = persona_name
+
+        available_sources = []
+        for source in self._sources:
+            if not source.is_available():
+                self._logger.debug(f"[CONTEXT_ASSEMBLER] Source {source.get_source_name()} is not available, skipping")
+                continue
+            available_sources.append(source)
+
+        # Query all sources concurrently; results keep source order
+        deadline = time.monotonic() + self._deadline_seconds
+        results = await asyncio.gather(
+            *(
+                self._fetch(source, deadline, search_query, slack_data, message_data, source_kwargs)
+                for source in available_sources
+            ),
+            return_exceptions=True
+        )
+
         context_parts = []
         successful_sources = []
         failed_sources = []
-        
-        # Retrieve context from each source
-        for source in self._sources:
+
+        for source, result in zip(available_sources, results):
             source_name = source.get_source_name()
-            
-            # Check if source is available
-            if not source.is_available():
-                self._logger.debug(f"[CONTEXT_ASSEMBLER] Source {source_name} is not available, skipping")
-                continue
-            
-            try:
-                # Get context from source (pass persona_name if available)
-                source_kwargs = {**kwargs}
-                if persona_name:
-                    source_kwargs['persona_name'] = persona_name
-                
-                context = await source.get_context(
-                    search_query=search_query,
-                    slack_data=slack_data,
-                    message_data=message_data,
-                    **source_kwargs
-                )
-                
-                if context and context.strip():
-                    # Add source header for clarity
-                    context_parts.append(f"## Context from {source_name.title()}")
-                    context_parts.append(context)
-                    successful_sources.append(source_name)
-                else:
-                    self._logger.debug(f"[CONTEXT_ASSEMBLER] Source {source_name} returned empty context")
-                    
-            except ContextSourceError as e:
+
+            if isinstance(result, ContextSourceTimeoutError):
+                self._logger.warning(f"[CONTEXT_ASSEMBLER] Source {source_name} timed out: {result}")
+                failed_sources.append(source_name)
+            elif isinstance(result, ContextSourceError):
                 # Context source specific error (log but continue)
-                self._logger.warning(f"[CONTEXT_ASSEMBLER] Source {source_name} error: {e}")
+                self._logger.warning(f"[CONTEXT_ASSEMBLER] Source {source_name} error: {result}")
                 failed_sources.append(source_name)
-            except Exception as e:
+            elif isinstance(result, BaseException):
                 # Unexpected error (log but continue with other sources)
-                self._logger.error(f"[CONTEXT_ASSEMBLER] Unexpected error from source {source_name}: {e}")
+                self._logger.error(f"[CONTEXT_ASSEMBLER] Unexpected error from source {source_name}: {result}")
                 failed_sources.append(source_name)
-        
+            elif result and result.strip():
+                # Add source header for clarity
+                context_parts.append(f"## Context from {source_name.title()}")
+                context_parts.append(result)
+                successful_sources.append(source_name)
+            else:
+                self._logger.debug(f"[CONTEXT_ASSEMBLER] Source {source_name} returned empty context")
+
         # Log assembly results
         if successful_sources:
             self._logger.info(
@@ -146,6 +206,52 @@ class ContextAssembler:
         
         return assembled_context
     
+    async def _fetch(
+        self,
+        source: ContextSource,
+        deadline: float,
+        search_query: str,
+        slack_data: Optional[Dict[str, Any]],
+        message_data: Optional[Dict[str, Any]],
+        source_kwargs: Dict[str, Any]
+    ) -> str:
+        """
+        Get context from one source within min(source timeout, remaining deadline).
+
+        Raises:
+            ContextSourceTimeoutError: If the source does not answer in time
+        """
+        source_name = source.get_source_name()
+        timeout = max(0.0, deadline - time.monotonic())
+        if source.timeout_seconds is not None:
+            timeout = min(timeout, source.timeout_seconds)
+
+        stats = _source_stats.setdefault(source_name, SourceStats())
+        started = time.monotonic()
+        try:
+            context = await asyncio.wait_for(
+                source.get_context(
+                    search_query=search_query,
+                    slack_data=slack_data,
+                    message_data=message_data,
+                    **source_kwargs
+                ),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            stats.record("timeouts", time.monotonic() - started)
+            raise ContextSourceTimeoutError(f"{source_name} did not respond within {timeout:.1f}s")
+        except Exception:
+            stats.record("errors", time.monotonic() - started)
+            raise
+
+        stats.record("hits" if context and context.strip() else "empty", time.monotonic() - started)
+        return context
+
+    def get_source_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-source latency and hit statistics (shared by all assemblers)"""
+        return get_source_stats()
+
     def get_source_count(self) -> int:
         """Get the number of configured sources."""
         return len(self._sources)
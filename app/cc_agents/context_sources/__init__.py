@@ -23,6 +23,9 @@ class ContextSource(ABC):
     Context sources provide context from various origins (filesystem, API, database, etc.)
     and can be assembled into a unified context string for injection into agent prompts.
     """
+
+    # Max seconds the assembler waits for this source (None = overall deadline only)
+    timeout_seconds: Optional[float] = None
     
     @abstractmethod
     async def get_context(
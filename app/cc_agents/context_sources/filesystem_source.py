@@ -1,23 +1,23 @@
 """
 Filesystem Context Source
 
-Wraps KIRA's existing filesystem memory retrieval (slack-memory-retrieval skill)
-to provide context from KIRA's memories directory.
+Wraps KIRA's filesystem memory retrieval (memory index, then the
+slack-memory-retrieval skill) to provide context from KIRA's memories directory.
 """
 
 import logging
 from typing import Optional, Dict, Any
 
 from app.cc_agents.context_sources import ContextSource
-from app.cc_agents.memory_retriever.agent import call_memory_retriever
 
 
 class FilesystemContextSource(ContextSource):
     """
     Context source that retrieves context from KIRA's filesystem memories.
     
-    This wraps the existing `call_memory_retriever()` function to provide
-    context from KIRA's memories directory via the slack-memory-retrieval skill.
+    This calls `retrieve_filesystem_memory()` directly; going through
+    `call_memory_retriever()` would re-enter the ContextAssembler that owns
+    this source.
     """
     
     def __init__(self):
@@ -34,8 +34,8 @@ class FilesystemContextSource(ContextSource):
         """
         Retrieve context from KIRA's filesystem memories.
         
-        This wraps the existing `call_memory_retriever()` function to maintain
-        backward compatibility with KIRA's existing memory retrieval mechanism.
+        Calls the filesystem retriever that `call_memory_retriever()` used to
+        run, without assembling the other sources again.
         
         Args:
             search_query: The search query or user message
@@ -47,15 +47,17 @@ class FilesystemContextSource(ContextSource):
             str: Context string from filesystem memories. Empty string if no memories found.
         """
         try:
-            # Call existing memory retriever (preserves existing behavior)
-            context = await call_memory_retriever(
+            # Lazy import: memory_retriever.agent imports this module
+            from app.cc_agents.memory_retriever.agent import NO_MEMORY_MESSAGE, retrieve_filesystem_memory
+
+            context = await retrieve_filesystem_memory(
                 search_query=search_query,
                 slack_data=slack_data,
                 message_data=message_data
             )
             
             # Return empty string if no memories found (matches existing behavior)
-            if context == "관련된 메모리가 없습니다.":
+            if context == NO_MEMORY_MESSAGE:
                 logging.debug(f"[FILESYSTEM_SOURCE] No memories found for query: {search_query[:50]}...")
                 return ""
             
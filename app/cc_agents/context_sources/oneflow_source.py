@@ -18,6 +18,9 @@ class OneFlowContextSource(ContextSource):
     Initially uses mocked data. When OneFlow API endpoints are implemented
     (deferred per FR-027), this will make real API calls.
     """
+
+    # Remote API: never hold up filesystem memories or persona overlays
+    timeout_seconds = 5.0
     
     def __init__(self, api_key: Optional[str] = None, api_base_url: Optional[str] = None):
         """
@@ -19,6 +19,9 @@ class PersonaContextSource(ContextSource):
     This source retrieves persona configuration and returns the prompt overlay
     as context. The persona overlay is then injected into system prompts.
     """
+
+    # Local config lookup; should be near-instant
+    timeout_seconds = 5.0
     
     def __init__(self, persona_name: Optional[str] = None, persona_manager: Optional[PersonaManager] = None):
         """
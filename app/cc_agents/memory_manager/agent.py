@@ -15,14 +15,17 @@ from claude_agent_sdk import (
 )
 
 from app.config.settings import get_settings
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
+from app.cc_utils.memory_locks import MemoryWriteGuard, get_memory_locks
 
 
-def create_system_prompt(state_prompt: str, memories_path: str) -> str:
+def create_system_prompt(state_prompt: str, memories_path: str, update_index: bool = True) -> str:
     """Memory manager를 위한 system prompt 생성
 
     Args:
         state_prompt: create_state_prompt()로 생성된 현재 상태 프롬프트
         memories_path: memories 폴더 절대 경로
+        update_index: index.md 갱신 여부 (False면 별도 인덱스 단계에서 갱신)
 
     Returns:
         str: 메모리 관리를 위한 system prompt
@@ -41,9 +44,13 @@ def create_system_prompt(state_prompt: str, memories_path: str) -> str:
 이 역할과 관련된 정보를 우선적으로 저장하세요.
 </bot_role>"""
 
-    system_prompt = f"""당신은 Slack에서 상주하는 가상 직원 에이전트를 위해 기억을 관리하는 메모리 에이전트입니다.
+    # 병렬 저장 시 index.md는 인덱스 단계에서만 갱신 (동시 수정 충돌 방지)
+    if update_index:
+        index_step = "4. 주기적으로 update_index.py를 실행하여 인덱스를 갱신합니다."
+    else:
+        index_step = "4. index.md는 수정하지 않습니다 (update_index.py 실행 금지, 인덱스는 별도 단계에서 갱신됩니다)."
 
-{state_prompt}
+    system_prompt = f"""당신은 Slack에서 상주하는 가상 직원 에이전트를 위해 기억을 관리하는 메모리 에이전트입니다.
 
 # 기본 지침
 가상 직원 에이전트의 다음 답변에 참고할 정보를 {memories_path}에 저장합니다.
@@ -54,7 +61,7 @@ def create_system_prompt(state_prompt: str, memories_path: str) -> str:
 1. 반드시 `slack-memory-store` skill을 사용하여 메모리를 관리합니다.
 2. 전달받은 정보를 분석하고, 적절한 메타데이터를 추출합니다.
 3. add_memory.py 스크립트를 사용하여 자동 분류 및 저장합니다.
-4. 주기적으로 update_index.py를 실행하여 인덱스를 갱신합니다.
+{index_step}
 </workflow>
 
 ## 핵심 행동 원칙
@@ -71,19 +78,23 @@ def create_system_prompt(state_prompt: str, memories_path: str) -> str:
 - {memories_path} 외부 접근 금지
 - 스케줄링 요청은 저장 제외
 - 가상 직원 정체성 정보는 저장 제외
-</guardrails>"""
+</guardrails>
+
+{state_prompt}"""
 
     return system_prompt
 
 
 async def call_memory_manager(
     query: str,
+    update_index: bool = True,
 ) -> str:
     """
     메모리 관리 에이전트를 실행합니다.
 
     Args:
         query: 메모리 저장 요청 쿼리
+        update_index: False면 index.md를 건드리지 않음 (병렬 메모리 저장용)
 
     Returns:
         str: 에이전트 실행 결과
@@ -99,7 +110,10 @@ async def call_memory_manager(
     from app.cc_agents.state_prompt import create_state_prompt
     state_prompt = create_state_prompt()
 
-    system_prompt = create_system_prompt(state_prompt, memories_path)
+    system_prompt = create_system_prompt(state_prompt, memories_path, update_index)
+
+    # 병렬 저장 시 같은 카테고리 파일을 동시에 수정하지 않도록 쓰기 도구 호출마다 잠금
+    write_guard = MemoryWriteGuard(get_memory_locks(), memories_path)
 
     options = ClaudeAgentOptions(
         system_prompt=system_prompt,
@@ -117,11 +131,15 @@ async def call_memory_manager(
         ],
         setting_sources=['project'],
         cwd=os.getcwd(),
-        max_buffer_size=10 * 1024 * 1024
+        max_buffer_size=10 * 1024 * 1024,
+        hooks=write_guard.hooks()
     )
 
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with (
+            llm_slot(LLMTier.MODERATE, LLMPriority.BACKGROUND, "memory_manager"),
+            ClaudeSDKClient(options=options) as client,
+        ):
             await client.query(query)
 
             result_message = ""
@@ -140,3 +158,5 @@ async def call_memory_manager(
     except Exception as e:
         logging.error(f"[MEMORY_MANAGER] Error: {e}")
         return f"메모리 작업 중 오류가 발생했습니다: {str(e)}"
+    finally:
+        write_guard.release_all()
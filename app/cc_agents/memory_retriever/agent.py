@@ -8,9 +8,10 @@ This module now supports enhanced context injection, assembling context from
 multiple sources (KIRA memories, OneFlow data, persona) before returning.
 """
 
+import asyncio
 import logging
 import os
-from typing import Optional
+from typing import List, Optional
 
 from claude_agent_sdk import (
     ClaudeAgentOptions,
@@ -19,6 +20,18 @@ from claude_agent_sdk import (
 )
 
 from app.config.settings import get_settings
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
+from app.cc_utils.memory_index import get_memory_index
+from app.cc_utils.single_flight import SingleFlight
+
+# 인덱스 검색 결과를 그대로 사용하기 위한 최소 BM25 점수
+MEMORY_INDEX_MIN_SCORE = 1.0
+MEMORY_INDEX_TOP_K = 5
+
+NO_MEMORY_MESSAGE = "관련된 메모리가 없습니다."
+
+# 동일한 (쿼리, 채널, 유저) 검색은 진행 중인 검색 결과를 공유
+_retrieval_flight = SingleFlight()
 
 # Enhanced context injection imports
 try:
@@ -44,8 +57,6 @@ def create_system_prompt(state_prompt: str, memories_path: str) -> str:
     """
     system_prompt = f"""당신은 Slack에서 상주하는 가상 직원 에이전트의 작업을 위해 메모리를 취합하는 에이전트입니다.
 
-{state_prompt}
-
 # 기본 지침
 `slack-memory-retrieval` skill을 사용하여 답변에 필요한 컨텍스트를 조회합니다.
 
@@ -72,21 +83,61 @@ def create_system_prompt(state_prompt: str, memories_path: str) -> str:
 - 채널/유저 선호도 적용
 - 필요한 것만 로드 (과도한 조회 금지)
 - {memories_path} 외부 접근 금지
-</guidelines>"""
+</guidelines>
+
+{state_prompt}"""
 
     return system_prompt
 
 
-async def _get_original_memory(
+def _format_index_results(results: List[dict]) -> str:
+    """인덱스 검색 결과를 메모리 컨텍스트 문자열로 변환"""
+    sections = []
+    for result in results:
+        if not result["snippet"]:
+            continue
+        sections.append(f"### {result['title']} ({result['path']})\n{result['snippet']}")
+    return "\n\n".join(sections)
+
+
+def _search_memory_index(
+    search_query: str,
+    slack_data: Optional[dict] = None,
+    message_data: Optional[dict] = None
+) -> Optional[str]:
+    """
+    BM25 인덱스로 메모리를 검색합니다 (blocking, 스레드에서 실행).
+
+    Returns:
+        Optional[str]: 충분히 관련된 결과가 있으면 메모리 내용, 없으면 None
+    """
+    message_data = message_data or {}
+    # 검색 쿼리 템플릿 문구보다 실제 사용자 메시지가 더 좋은 검색어
+    query = " ".join(filter(None, [
+        message_data.get("user_text") or search_query,
+        message_data.get("user_name"),
+    ]))
+
+    results = get_memory_index().search(
+        query,
+        top_k=MEMORY_INDEX_TOP_K,
+        channel_id=message_data.get("channel_id"),
+        user_id=message_data.get("user_id")
+    )
+    relevant = [r for r in results if r["pinned"] or r["score"] >= MEMORY_INDEX_MIN_SCORE]
+    return _format_index_results(relevant) or None
+
+
+async def retrieve_filesystem_memory(
     search_query: str,
     slack_data: Optional[dict] = None,
     message_data: Optional[dict] = None
 ) -> str:
     """
-    Original memory retrieval implementation (preserved for backward compatibility).
-    
-    This function contains the original implementation of memory retrieval
-    using the slack-memory-retrieval skill.
+    memories 폴더에서 메모리를 검색합니다 (BM25 인덱스 → slack-memory-retrieval 스킬).
+
+    FilesystemContextSource가 직접 호출합니다. call_memory_retriever()를 거치면
+    ContextAssembler가 다시 실행되어 재귀 호출이 발생합니다.
     
     Args:
         search_query: 메모리 검색 쿼리
@@ -103,7 +154,20 @@ async def _get_original_memory(
     # memories 폴더가 없으면 빈 결과 반환
     if not os.path.exists(memories_path):
         logging.info(f"[MEMORY_RETRIEVER] No memories folder found")
-        return "관련된 메모리가 없습니다."
+        return NO_MEMORY_MESSAGE
+
+    # 1. 로컬 BM25 인덱스 (에이전트 없이 수 ms)
+    if settings.MEMORY_INDEX_ENABLED:
+        try:
+            indexed_memory = await asyncio.to_thread(_search_memory_index, search_query, slack_data, message_data)
+            if indexed_memory:
+                logging.info(f"[MEMORY_RETRIEVER] Answered from memory index ({len(indexed_memory)} chars)")
+                return indexed_memory
+            logging.info("[MEMORY_RETRIEVER] No confident index match, falling back to agent")
+        except Exception as e:
+            logging.warning(f"[MEMORY_RETRIEVER] Memory index search failed, falling back to agent: {e}")
+
+    # 2. 메모리 검색 에이전트
 
     # state_prompt 생성
     from app.cc_agents.state_prompt import create_state_prompt
@@ -134,7 +198,10 @@ async def _get_original_memory(
     )
 
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with (
+            llm_slot(LLMTier.SIMPLE, LLMPriority.INTERACTIVE, "memory_retriever"),
+            ClaudeSDKClient(options=options) as client,
+        ):
             await client.query(search_query)
 
             result_message = ""
@@ -144,11 +211,11 @@ async def _get_original_memory(
                     logging.info(f"[MEMORY_RETRIEVER] Result: {result_message[:100]}...")
                     break
 
-            return result_message if result_message else "관련된 메모리가 없습니다."
+            return result_message if result_message else NO_MEMORY_MESSAGE
 
     except Exception as e:
         logging.error(f"[MEMORY_RETRIEVER] Error: {e}")
-        return "관련된 메모리가 없습니다."
+        return NO_MEMORY_MESSAGE
 
 
 async def call_memory_retriever(
@@ -174,6 +241,23 @@ async def call_memory_retriever(
     Returns:
         str: 취합된 메모리 내용 (enhanced with multiple sources if available)
     """
+    message_info = message_data or {}
+    channel_id = message_info.get("channel_id") or (slack_data or {}).get("channel", {}).get("channel_id")
+    key = (search_query, channel_id, message_info.get("user_id"), persona_name)
+
+    return await _retrieval_flight.do(
+        key,
+        lambda: _assemble_memory(search_query, slack_data, message_data, persona_name)
+    )
+
+
+async def _assemble_memory(
+    search_query: str,
+    slack_data: Optional[dict],
+    message_data: Optional[dict],
+    persona_name: Optional[str]
+) -> str:
+    """모든 컨텍스트 소스에서 메모리를 취합합니다 (single-flight 내부에서 실행)"""
     # Use enhanced context injection if available
     if ENHANCED_CONTEXT_AVAILABLE:
         try:
@@ -210,14 +294,14 @@ async def call_memory_retriever(
                 logging.info("[MEMORY_RETRIEVER] Using enhanced context injection")
                 return enhanced_context
             else:
-                # Fallback to original if enhanced context is empty
-                logging.debug("[MEMORY_RETRIEVER] Enhanced context empty, falling back to original")
-                return await _get_original_memory(search_query, slack_data, message_data)
+                # Filesystem source already ran the retrieval; nothing found in any source
+                logging.debug("[MEMORY_RETRIEVER] Enhanced context empty")
+                return NO_MEMORY_MESSAGE
                 
         except Exception as e:
             # Fallback to original on error
             logging.warning(f"[MEMORY_RETRIEVER] Enhanced context injection error: {e}, falling back to original")
-            return await _get_original_memory(search_query, slack_data, message_data)
+            return await retrieve_filesystem_memory(search_query, slack_data, message_data)
     
     # Fallback to original behavior if enhanced context injection is not available
-    return await _get_original_memory(search_query, slack_data, message_data)
+    return await retrieve_filesystem_memory(search_query, slack_data, message_data)
@@ -8,11 +8,14 @@
 import json
 import logging
 import os
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from claude_agent_sdk import (
+    AssistantMessage,
     ClaudeAgentOptions,
     ClaudeSDKClient,
     ResultMessage,
+    ToolUseBlock,
 )
 
 from app.cc_tools.slack.slack_tools import create_slack_mcp_server, get_slack_client
@@ -23,8 +26,24 @@ from app.cc_tools.meeting_transcription.meeting_transcription_tools import (
 )
 from app.cc_tools.deepl.deepl_tools import create_deepl_tools_server
 from app.cc_tools.files.files_tools import create_files_mcp_server
+from app.cc_tools.time.time_tools import create_time_mcp_server
 from app.config.settings import get_settings, Settings
-from app.cc_agents.state_prompt import create_state_prompt
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
+from app.cc_utils.mcp_supervisor import route_mcp_servers
+from app.cc_utils.token_helper import estimate_tokens
+from app.cc_agents.operator.context_budget import plan_operator_context, record_context_overflow
+from app.cc_agents.operator.tool_router import (
+    MAX_TOOL_ESCALATIONS,
+    TOOL_REQUEST_SERVER,
+    ToolEscalation,
+    create_tool_request_server,
+    describe_servers,
+    select_tool_servers,
+    tool_request_rule,
+)
+
+# 요청자에게 응답을 보내는 Slack 도구 (한 번이라도 호출되면 사용자는 이미 답변을 받음)
+REPLY_TOOLS = {"mcp__slack__answer", "mcp__slack__answer_with_emoji", "mcp__slack__upload_file"}
 
 
 def build_mcp_servers_dict(settings: Settings) -> dict:
@@ -41,7 +60,7 @@ def build_mcp_servers_dict(settings: Settings) -> dict:
         "slack": create_slack_mcp_server(),
         "scheduler": create_scheduler_mcp_server(),
         "files": create_files_mcp_server(),
-        "time": {"command": "npx", "args": ["-y", "@mcpcentral/mcp-time"]},
+        "time": create_time_mcp_server(),
         "context7": {"command": "npx", "args": ["-y", "@upstash/context7-mcp"]},
         "arxiv": {
             "command": "npx",
@@ -175,105 +194,113 @@ def build_mcp_servers_dict(settings: Settings) -> dict:
     return mcp_servers
 
 
-def build_tool_usage_rules(settings: Settings) -> str:
-    """설정에 따라 활성화된 도구 사용 원칙만 생성합니다.
+# 항상 포함되는 공통 도구 사용 원칙의 키 (나머지 키는 MCP 서버 이름)
+CORE_RULES_KEY = "_core"
+
+
+def build_tool_usage_rule_sections(settings: Settings) -> Dict[str, List[str]]:
+    """설정에 따라 활성화된 도구 사용 원칙을 MCP 서버별로 생성합니다.
 
     Args:
         settings: Settings 객체
 
     Returns:
-        str: 도구 사용 원칙 문자열
+        dict: {서버 이름: 규칙 목록}, CORE_RULES_KEY에는 항상 포함되는 공통 규칙
     """
     bot_name = settings.BOT_NAME or "KIRA"
 
     # 기본 규칙들 (항상 포함)
-    rules = f"""## 도구 사용 원칙
-<how_to_use_tool>
-- 요청을 수행할 때 먼저 `mcp__time__get_current_time`으로 현재 시각을 확인하고, 확인한 시간을 기준으로 정보 탐색에 활용하세요. '어제', '내일', '다음주', '작년', '이번 년도' 같은 상대적 표현은 반드시 확인한 현재 시간 기준으로 정확한 날짜로 변환하여 검색/필터링해야 합니다. 
-- `mcp__slack__answer`를 사용할 때는 도구 호출의 결과와 출처, 링크를 최대한 누락되지 않게 상세하게 포함하세요.
-- 사용자가 파일을 업로드 하여 slack 파일 url 이 주어졌을 경우, `mcp__slack__download_file_to_channel`를 활용해서 파일을 다운로드하고 작업을 해야합니다.
-- `<!subteam^slack_group_id>` 형태는 그룹태그를 의미하며, 이 그룹태그가 입력되는 경우 `mcp__slack__get_usergroup_members` 도구를 호출 후 그룹에 포함된 유저 정보를 읽어온 후에 지시를 수행해야 합니다.
-- 보다 긴 대화 맥락이나 스레드 전체의 대화 내용을 참조해야 하는 경우에는 `mcp__slack__get_thread_replies` 도구를 호출하여 데이터를 가져와야 합니다.
-- 도구 호출이 3회 이상이면 `mcp__slack__answer_with_emoji`로 작업 상태를 간단히 표현할 수 있습니다.
-- 도구 호출이 8회 이상이면 `mcp__slack__answer`로 중간 보고를 할 수 있습니다. 그렇지만 **작업 완료 시에는 반드시 `mcp__slack__answer`로 한 번 더 최종 결과를 응답해야 합니다.** 중간 보고만 하고 끝내지 마세요.
-- 다른 사람들에게 메시지를 전달할 때는 `mcp__slack__forward_message`를 사용하세요. 메시지 전달에 대한 응답이 필요하면 `request_answer=True`로 설정하세요.
-  - **중복 발송 금지**: 같은 내용의 메시지를 여러 명에게 보낼 때는 `mcp__slack__forward_message`를 **절대 여러 번 호출하지 마세요**. respondents 리스트에 모든 사람을 포함하여 **단 한 번만** 호출해야 합니다.
-  - **개인화 금지**: 개인화된 인사말(예: "안녕하세요 OOO님")을 추가하지 마세요. 모든 수신자에게 동일한 메시지를 보내야 합니다.
-  - **예외**: 각 사람에게 완전히 다른 내용의 질문을 보낼 때만 각각 별도로 호출하세요.
-- `mcp__scheduler__*` 도구의 `text` 파라미터는 **스케줄 실행 시점에 가상 상주 직원이 받을 명령**입니다. 가상 상주 직원에게 내리는 명령 형태로 작성하세요.
-  - **명령문 시작**: 반드시 RESPONSE LANGUAGE에 맞춰 작성하세요. (Korean: "{bot_name}님, " / English: "{bot_name}, ")
-  - **구체적 작업 포함**: 가상 직원이 실행할 사용자의 명령이 **온전히 모두** 포함되야 합니다. 필요한 링크와 세부 정보를 모두 포함 하세요.
-  - **한글 예시**: 사용자 "페이지 요약해줘" → text: "{bot_name}님, https://your-domain.atlassian.net/wiki/spaces/SPACE/pages/123456 이 페이지 내용을 요약해서 채널에 공지해줘"
-  - **영문 예시**: User "summarize the page" → text: "{bot_name}, summarize the content of https://your-domain.atlassian.net/wiki/spaces/SPACE/pages/123456 and announce it to the channel"
-- 워크샵 장소를 찾을 때는 `mcp__airbnb__*` 도구를 사용하세요.
-- arXiv 논문 링크(예: https://arxiv.org/)가 주어졌을 때는 `mcp__arxiv__*` 도구를 사용하세요.
-- 코드 관련 문서를 찾을 때는 `mcp__context7__*` 도구를 사용하세요.
-"""
+    sections = {
+        CORE_RULES_KEY: [
+            "- 현재 시각은 state_data의 '현재 시각'을 기준으로 정보 탐색에 활용하세요. '어제', '내일', '다음주', '작년', '이번 년도' 같은 상대적 표현은 반드시 현재 시각 기준으로 정확한 날짜로 변환하여 검색/필터링해야 합니다. 다른 시간대 변환이나 헷갈리는 날짜 계산은 `mcp__time__convert_time`, `mcp__time__resolve_relative_date`를 사용하세요.",
+            "- `mcp__slack__answer`를 사용할 때는 도구 호출의 결과와 출처, 링크를 최대한 누락되지 않게 상세하게 포함하세요.",
+            "- 사용자가 파일을 업로드 하여 slack 파일 url 이 주어졌을 경우, `mcp__slack__download_file_to_channel`를 활용해서 파일을 다운로드하고 작업을 해야합니다.",
+            "- `<!subteam^slack_group_id>` 형태는 그룹태그를 의미하며, 이 그룹태그가 입력되는 경우 `mcp__slack__get_usergroup_members` 도구를 호출 후 그룹에 포함된 유저 정보를 읽어온 후에 지시를 수행해야 합니다.",
+            "- 보다 긴 대화 맥락이나 스레드 전체의 대화 내용을 참조해야 하는 경우에는 `mcp__slack__get_thread_replies` 도구를 호출하여 데이터를 가져와야 합니다.",
+            "- 도구 호출이 3회 이상이면 `mcp__slack__answer_with_emoji`로 작업 상태를 간단히 표현할 수 있습니다.",
+            "- 도구 호출이 8회 이상이면 `mcp__slack__answer`로 중간 보고를 할 수 있습니다. 그렇지만 **작업 완료 시에는 반드시 `mcp__slack__answer`로 한 번 더 최종 결과를 응답해야 합니다.** 중간 보고만 하고 끝내지 마세요.",
+            "\n".join([
+                "- 다른 사람들에게 메시지를 전달할 때는 `mcp__slack__forward_message`를 사용하세요. 메시지 전달에 대한 응답이 필요하면 `request_answer=True`로 설정하세요.",
+                "  - **중복 발송 금지**: 같은 내용의 메시지를 여러 명에게 보낼 때는 `mcp__slack__forward_message`를 **절대 여러 번 호출하지 마세요**. respondents 리스트에 모든 사람을 포함하여 **단 한 번만** 호출해야 합니다.",
+                '  - **개인화 금지**: 개인화된 인사말(예: "안녕하세요 OOO님")을 추가하지 마세요. 모든 수신자에게 동일한 메시지를 보내야 합니다.',
+                "  - **예외**: 각 사람에게 완전히 다른 내용의 질문을 보낼 때만 각각 별도로 호출하세요.",
+            ]),
+            "\n".join([
+                "- `mcp__scheduler__*` 도구의 `text` 파라미터는 **스케줄 실행 시점에 가상 상주 직원이 받을 명령**입니다. 가상 상주 직원에게 내리는 명령 형태로 작성하세요.",
+                f'  - **명령문 시작**: 반드시 RESPONSE LANGUAGE에 맞춰 작성하세요. (Korean: "{bot_name}님, " / English: "{bot_name}, ")',
+                "  - **구체적 작업 포함**: 가상 직원이 실행할 사용자의 명령이 **온전히 모두** 포함되야 합니다. 필요한 링크와 세부 정보를 모두 포함 하세요.",
+                f'  - **한글 예시**: 사용자 "페이지 요약해줘" → text: "{bot_name}님, https://your-domain.atlassian.net/wiki/spaces/SPACE/pages/123456 이 페이지 내용을 요약해서 채널에 공지해줘"',
+                f'  - **영문 예시**: User "summarize the page" → text: "{bot_name}, summarize the content of https://your-domain.atlassian.net/wiki/spaces/SPACE/pages/123456 and announce it to the channel"',
+            ]),
+        ],
+        "airbnb": ["- 워크샵 장소를 찾을 때는 `mcp__airbnb__*` 도구를 사용하세요."],
+        "arxiv": ["- arXiv 논문 링크(예: https://arxiv.org/)가 주어졌을 때는 `mcp__arxiv__*` 도구를 사용하세요."],
+        "context7": ["- 코드 관련 문서를 찾을 때는 `mcp__context7__*` 도구를 사용하세요."],
+    }
 
     # dev.env 순서대로 조건부 규칙들 추가
-    conditional_rules = []
 
     # MCP 설정 - Perplexity
     if settings.PERPLEXITY_ENABLED:
-        conditional_rules.append(
+        sections["perplexity"] = [
             "- 웹 전체에서 정보 검색/종합을 해야하는 경우에는 `mcp__perplexity__*` 도구를 사용하세요. Perplexity 응답에 Citations (출처 링크)가 포함되어 있으면 반드시 답변에 함께 포함하세요."
-        )
+        ]
 
     # MCP 설정 - DeepL
     if settings.DEEPL_ENABLED:
-        conditional_rules.append(
+        sections["deepl"] = [
             "- 문서 번역 요청 시 `mcp__deepl__*` 도구를 사용하세요. 바이너리 파일은 Read 툴 사용하지 말고 파일 경로를 바로 전달하세요."
-        )
+        ]
 
     # MCP 설정 - GitHub
     if settings.GITHUB_ENABLED:
-        conditional_rules.append(
+        sections["github"] = [
             "- GitHub 저장소 작업(이슈, PR, 파일 관리 등)은 `mcp__github__*` 도구를 사용하세요."
-        )
+        ]
 
     # MCP 설정 - GitLab
     if settings.GITLAB_ENABLED:
-        conditional_rules.append(
+        sections["gitlab"] = [
             "- Gitlab 링크(예: https://gitlab.com/, https://git.company.com/)가 주어졌을 때는 `mcp__gitlab__*` 도구를 사용하세요."
-        )
+        ]
 
     # MCP - Microsoft 365 (Lokka)
     if settings.MS365_ENABLED:
-        conditional_rules.append(
+        sections["ms365"] = [
             "- Microsoft 365 작업은 `mcp__ms365__*` 도구를 사용하세요. Outlook 이메일, 캘린더 일정, OneDrive 파일, SharePoint 문서(https://company-my.sharepoint.com/, https://company.sharepoint.com/sites/Team)를 모두 관리할 수 있습니다."
-        )
+        ]
 
     # MCP - Atlassian
     if settings.ATLASSIAN_ENABLED:
-        conditional_rules.append(
+        sections["atlassian"] = [
             "- Atlassian(Confluence/Jira) 링크(예: https://your-domain.atlassian.net/, https://confluence.company.com/, https://jira.company.com/)가 주어졌을 때는 먼저 `confluence-deep-reader` skill을 사용하고 워크플로우에 따라 `mcp__atlassian__*` 도구를 사용하세요."
-        )
+        ]
 
     # MCP - Tableau
     if settings.TABLEAU_ENABLED:
-        conditional_rules.append(
+        sections["tableau"] = [
             "- 테블로 데이터 조회 요청 시 `mcp__tableau__*` 도구를 사용해 데이터를 조회하고 답변하세요. 사용자가 정확한 대시보드를 명시하지 않으면 가장 많이 사용하는 대시보드 1개를 선택해서 보여주세요."
-        )
+        ]
 
     # MCP 설정 - X (Twitter)
     if settings.X_ENABLED:
-        conditional_rules.append(
+        sections["x"] = [
             "- X 트윗 링크(예: x.com, twitter.com)가 주어졌을 때는 `mcp__x__*` 도구를 사용하세요. 트윗을 게시할 때는 250자 이내로 올려야 합니다."
-        )
+        ]
 
     # 음성 수신 채널 - Clova (Meeting Transcription)
     if settings.CLOVA_ENABLED:
-        conditional_rules.append(
+        sections["meeting_transcription"] = [
             "- 녹취 회의록, 녹음 회의록 작성 요청 시 `mcp__meeting_transcription__*` 도구를 사용하세요. 먼저 `mcp__meeting_transcription__list_meeting_files`로 날짜별 녹음 파일을 조회하고, `mcp__meeting_transcription__transcribe_meeting`으로 텍스트를 추출하여 회의록을 작성하세요. 날짜 언급이 없다면 가장 최근 파일로 작성하세요."
-        )
+        ]
 
     # Computer Use - Chrome
     if settings.CHROME_ENABLED:
-        conditional_rules.extend([
+        sections["playwright"] = [
             "- 특정 사이트에서 여러 게시글이나 콘텐츠를 확인해야하는 경우에는 `web-navigation-strategies` skill을 사용하고 워크플로우에 따라 `mcp__playwright__*` 도구를 사용하세요.",
             "- 회식 장소를 찾을 때는 `mcp__playwright__*` 도구를 사용하세요. 캐치테이블(app.catchtable.co.kr)에서 식당을 검색하고, 네이버에서 각 식당의 블로그 후기 링크를 수집하세요.",
             "- `mcp__playwright__browser_take_screenshot`로 스크린 샷을 저장할 때는 `filename` 파라미터를 `{{channel_id}}/파일명.png` 형태로 지정합니다.",
-        ])
+        ]
 
     # MCP 설정 - Custom Remote MCP Servers
     if settings.REMOTE_MCP_SERVERS:
@@ -283,17 +310,40 @@ def build_tool_usage_rules(settings: Settings) -> str:
                 name = server.get("name", "").strip()
                 instruction = server.get("instruction", "").strip()
                 if name and instruction:
-                    conditional_rules.append(f"- 다음의 경우에 반드시 `mcp__{name}__*`를 사용하세요: {instruction}")
+                    sections[name] = [f"- 다음의 경우에 반드시 `mcp__{name}__*`를 사용하세요: {instruction}"]
         except json.JSONDecodeError:
             pass
 
-    # 조건부 규칙들을 기본 규칙에 추가
-    if conditional_rules:
-        rules += "\n".join(conditional_rules) + "\n"
+    return sections
+
+
+def build_tool_usage_rules(
+    settings: Settings,
+    servers: Optional[Iterable[str]] = None,
+    extra_rules: Optional[List[str]] = None,
+) -> str:
+    """설정에 따라 활성화된 도구 사용 원칙만 생성합니다.
 
-    rules += "</how_to_use_tool>"
+    Args:
+        settings: Settings 객체
+        servers: 규칙을 포함할 MCP 서버 이름 (None이면 활성화된 모든 서버)
+        extra_rules: 마지막에 덧붙일 규칙 (예: 도구 추가 요청 방법)
 
-    return rules
+    Returns:
+        str: 도구 사용 원칙 문자열
+    """
+    sections = build_tool_usage_rule_sections(settings)
+    rules = list(sections.pop(CORE_RULES_KEY))
+    for name, section in sections.items():
+        if servers is None or name in servers:
+            rules.extend(section)
+    rules.extend(extra_rules or [])
+
+    rules_text = "\n".join(rules)
+    return f"""## 도구 사용 원칙
+<how_to_use_tool>
+{rules_text}
+</how_to_use_tool>"""
 
 
 async def save_to_memory(
@@ -340,18 +390,34 @@ async def save_to_memory(
 소속 팀 동료와 관련된 사항은 반드시 저장합니다.
 """
 
-        # 메모리 큐에 작업 추가 (순차 처리됨)
-        await enqueue_memory_job({"memory_query": memory_query})
+        # 메모리 큐에 작업 추가 (순차 처리, 메모리 워커가 채널/사용자별로 묶어서 저장)
+        await enqueue_memory_job({
+            "memory_query": memory_query,
+            "source": "operator",
+            "channel_id": channel_id,
+            "channel_name": channel_name,
+            "channel_type": channel_type,
+            "user_id": message_data["user_id"],
+            "user_name": message_data["user_name"],
+            "query": query,
+            "content": final_message,
+        })
         logging.info(f"[OPERATOR_AGENT] Memory job enqueued")
     except Exception as e:
         logging.error(f"[OPERATOR_AGENT] Memory enqueue failed: {e}")
 
 
-def create_system_prompt(state_prompt: str) -> str:
+def create_system_prompt(
+    state_prompt: str,
+    servers: Optional[Iterable[str]] = None,
+    extra_tool_rules: Optional[List[str]] = None,
+) -> str:
     """Core agent를 위한 system prompt 생성
 
     Args:
         state_prompt: create_state_prompt()로 생성된 현재 상태 프롬프트
+        servers: 연결된 MCP 서버 이름 (해당 서버의 도구 사용 원칙만 포함, None이면 전체)
+        extra_tool_rules: 도구 사용 원칙에 덧붙일 규칙
 
     Returns:
         str: 에이전트의 행동 원칙과 도구 사용 원칙을 포함한 system prompt
@@ -362,7 +428,7 @@ def create_system_prompt(state_prompt: str) -> str:
     bot_role = settings.BOT_ROLE or ""
 
     # 동적으로 도구 사용 원칙 생성
-    tool_usage_rules = build_tool_usage_rules(settings)
+    tool_usage_rules = build_tool_usage_rules(settings, servers, extra_tool_rules)
 
     # 직군/역할 섹션 (설정된 경우에만)
     role_section = ""
@@ -380,8 +446,6 @@ def create_system_prompt(state_prompt: str) -> str:
 동료들의 요청을 정확하고 효율적으로 처리하여 **Slack 도구**를 통해 응답하고 작업 처리 내역을 정리하세요.
 {role_section}
 
-{state_prompt}
-
 ## 핵심 행동 원칙
 <important_actions>
 1. state_data의 "관련 메모리" 섹션을 확인하세요. 전임 에이전트가 요청에 필요한 메모리를 정리했습니다.
@@ -443,84 +507,65 @@ def create_system_prompt(state_prompt: str) -> str:
 - 사용자에게 명확히 누구에게 보낼지 다시 물어보거나, 슬랙 태그(@사용자명)를 요청하세요
 - 잘못된 user_id로 메시지를 보내는 것은 엄격히 금지됩니다
 </guardrails>
+
+{state_prompt}
 """
 
     return system_prompt
 
 
-async def call_operator_agent(
-    user_query: str, slack_data: dict, message_data: dict, retrieved_memory: str = ""
-) -> None:
+async def _run_operator_session(
+    options: ClaudeAgentOptions,
+    query: str,
+    message_data: dict,
+    settings: Settings,
+    priority: LLMPriority = LLMPriority.INTERACTIVE,
+) -> Tuple[str, Optional[str], bool]:
     """
-    핵심 에이전트를 실행하여 사용자 요청을 처리하고 Slack에 메시지를 전송합니다.
+    operator 세션 하나를 실행합니다 (context overflow 시 /compact 후 재시도).
 
     Args:
-        user_query: 사용자 질의 (원본 메시지 텍스트)
-        slack_data: Slack API 데이터 (채널, 멤버, 메시지 히스토리)
-        message_data: 현재 메시지 정보 (user_id, text, channel_id 등)
-        retrieved_memory: 검색된 관련 메모리 내용
-    """
-
-    state_prompt = create_state_prompt(slack_data, message_data)
-
-    # 메모리가 있으면 state_prompt에 추가
-    if retrieved_memory and retrieved_memory != "관련된 메모리가 없습니다.":
-        state_prompt += f"\n\n## 관련 메모리\n<retrieved_memory>\n{retrieved_memory}\n</retrieved_memory>"
-
-    system_prompt = create_system_prompt(state_prompt)
-
-    settings = get_settings()
-
-    # 설정에 따라 활성화된 MCP 서버만 로드
-    mcp_servers = build_mcp_servers_dict(settings)
-
-    options = ClaudeAgentOptions(
-        mcp_servers=mcp_servers,
-        system_prompt=system_prompt,
-        model=settings.MODEL_FOR_COMPLEX,
-        permission_mode="bypassPermissions",
-        allowed_tools=["*"],
-        disallowed_tools=[
-            "Bash(curl:*)",
-            "Read(./.env)",
-            "Read(./credential.json)",
-            "mcp__tableau__get-view-image",
-        ],
-        setting_sources=["project"],
-        cwd=os.getcwd(),
-        max_buffer_size=10 * 1024 * 1024,
-    )
+        options: ClaudeAgentOptions
+        query: 세션에 보낼 요청
+        message_data: 현재 메시지 정보 (에러 메시지 전송용)
+        settings: Settings 객체
+        priority: LLM 슬롯 우선순위 (스케줄/체커 작업은 사용자 요청보다 뒤로)
 
-    # 세션 아이디 설정
+    Returns:
+        (최종 메시지, 세션 아이디, Slack 응답 도구 호출 여부)
+    """
     session_id = None
     final_message = ""
-    from devtools import pprint
-
-    # user_query에 역할 선택 지시사항 추가
-    enhanced_query = f"""{user_query}
-
-요청을 처리하기 전에 `it-role-expert` skill을 이용해 이 요청에 가장 적합한 IT 역할을 선택하고, 해당 역할의 전문성을 바탕으로 작업을 진행하세요.
-
-'어제', '내일', '다음주', '작년', '이번 년도' 같은 상대적 표현은 반드시 확인한 현재 시간 기준으로 정확한 날짜로 변환하여 검색/필터링해야 합니다."""
+    replied = False
 
     # Context overflow 시 /compact 후 재시도 (같은 client 유지, 최대 2회)
     max_retries = 2
 
-    async with ClaudeSDKClient(options=options) as client:
+    async with (
+        llm_slot(LLMTier.COMPLEX, priority, "operator"),
+        ClaudeSDKClient(options=options) as client,
+    ):
         for attempt in range(max_retries + 1):
             try:
                 # 첫 시도는 새 세션, 재시도는 compact된 세션 이어서
                 if session_id:
-                    await client.query(enhanced_query, session_id)
+                    await client.query(query, session_id)
                 else:
-                    await client.query(enhanced_query)
+                    await client.query(query)
 
                 async for message in client.receive_response():
                     if hasattr(message, "subtype") and message.subtype == "init":
                         session_id = message.data.get("session_id")
                         logging.info(f"[OPERATOR_AGENT] Session ID: {session_id}")
 
-                    pprint(message)
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug(f"[OPERATOR_AGENT] Message: {message!r}")
+
+                    if isinstance(message, AssistantMessage):
+                        replied = replied or any(
+                            isinstance(block, ToolUseBlock) and block.name in REPLY_TOOLS
+                            for block in message.content
+                        )
 
                     if type(message) is ResultMessage:
                         if "API Error" in message.result and "413" in message.result:
@@ -555,6 +600,9 @@ async def call_operator_agent(
                     ]
                 )
 
+                if is_context_error:
+                    record_context_overflow(compacted=attempt < max_retries)
+
                 if is_context_error and attempt < max_retries:
                     logging.warning(
                         f"[OPERATOR_AGENT] Context overflow detected (attempt {attempt + 1}/{max_retries}), executing /compact..."
@@ -598,9 +646,110 @@ async def call_operator_agent(
 
                     break
 
+    return final_message, session_id, replied
+
+
+async def call_operator_agent(
+    user_query: str,
+    slack_data: dict,
+    message_data: dict,
+    retrieved_memory: str = "",
+    priority: LLMPriority = LLMPriority.INTERACTIVE,
+) -> None:
+    """
+    핵심 에이전트를 실행하여 사용자 요청을 처리하고 Slack에 메시지를 전송합니다.
+
+    Args:
+        user_query: 사용자 질의 (원본 메시지 텍스트)
+        slack_data: Slack API 데이터 (채널, 멤버, 메시지 히스토리)
+        message_data: 현재 메시지 정보 (user_id, text, channel_id 등)
+        retrieved_memory: 검색된 관련 메모리 내용
+        priority: LLM 슬롯 우선순위 (작업 출처에 따라 결정, priority_for_source 참고)
+    """
+
+    settings = get_settings()
+
+    # 설정에 따라 활성화된 MCP 서버 중 요청에 필요한 서버만 연결 (나머지는 작업 중 추가 요청 가능)
+    all_servers = build_mcp_servers_dict(settings)
+    channel_name = slack_data.get("channel", {}).get("channel_name", "")
+    attached = await select_tool_servers(user_query, all_servers.keys(), channel_name, retrieved_memory)
+    escalation = ToolEscalation(describe_servers(name for name in all_servers if name not in attached))
+
+    # user_query에 역할 선택 지시사항 추가
+    enhanced_query = f"""{user_query}
+
+요청을 처리하기 전에 `it-role-expert` skill을 이용해 이 요청에 가장 적합한 IT 역할을 선택하고, 해당 역할의 전문성을 바탕으로 작업을 진행하세요.
+
+'어제', '내일', '다음주', '작년', '이번 년도' 같은 상대적 표현은 반드시 확인한 현재 시간 기준으로 정확한 날짜로 변환하여 검색/필터링해야 합니다."""
+
+    # 첫 호출 전에 system prompt + 메모리 + 질의를 컨텍스트 예산에 맞춤 (초과 후 /compact 재시도 방지)
+    fixed_prompt_tokens = estimate_tokens(create_system_prompt(
+        "",
+        servers=attached,
+        extra_tool_rules=[tool_request_rule(escalation)] if escalation.unattached else None,
+    ))
+    context = plan_operator_context(
+        enhanced_query, slack_data, message_data, retrieved_memory, fixed_prompt_tokens
+    )
+    state_prompt = context.state_prompt
+
+    session_id = None
+    query = enhanced_query
+    final_messages = []
+    for escalation_round in range(MAX_TOOL_ESCALATIONS + 1):
+        can_escalate = bool(escalation.unattached) and escalation_round < MAX_TOOL_ESCALATIONS
+        system_prompt = create_system_prompt(
+            state_prompt,
+            servers=attached,
+            extra_tool_rules=[tool_request_rule(escalation)] if can_escalate else None,
+        )
+
+        mcp_servers = {name: spec for name, spec in all_servers.items() if name in attached}
+        if can_escalate:
+            mcp_servers[TOOL_REQUEST_SERVER] = create_tool_request_server(escalation)
+        # 공유 MCP 프로세스가 준비된 서버는 SSE로 연결
+        mcp_servers = await route_mcp_servers(mcp_servers)
+
+        options = ClaudeAgentOptions(
+            mcp_servers=mcp_servers,
+            system_prompt=system_prompt,
+            model=settings.MODEL_FOR_COMPLEX,
+            permission_mode="bypassPermissions",
+            allowed_tools=["*"],
+            disallowed_tools=[
+                "Bash(curl:*)",
+                "Read(./.env)",
+                "Read(./credential.json)",
+                "mcp__tableau__get-view-image",
+            ],
+            setting_sources=["project"],
+            cwd=os.getcwd(),
+            max_buffer_size=10 * 1024 * 1024,
+            # 큰 도구 결과는 CLI에서 잘라서 전달
+            env={"MAX_MCP_OUTPUT_TOKENS": str(settings.OPERATOR_MAX_MCP_OUTPUT_TOKENS)},
+            resume=session_id,
+        )
+
+        final_message, session_id, replied = await _run_operator_session(
+            options, query, message_data, settings, priority=priority
+        )
+        final_messages.append(final_message)
+
+        # 도구 추가 요청이 있고 아직 답변하지 않았으면 같은 대화를 이어서 추가된 도구와 함께 다시 실행
+        requested = escalation.take()
+        if not requested or not session_id:
+            break
+        if replied:
+            logging.info(f"[OPERATOR_AGENT] Already answered in Slack, not resuming for requested tools: {sorted(requested)}")
+            break
+        attached |= requested
+        logging.info(f"[OPERATOR_AGENT] Resuming session {session_id} with requested tools: {sorted(requested)}")
+        query = f"요청한 도구({', '.join(sorted(requested))})가 추가되었습니다. 이어서 원래 요청을 처리하세요."
+
     # Slack에 메시지 전송 (에이전트 레벨로 올림)
 
-    # 메모리에 저장
+    # 메모리에 저장 (도구 추가 요청으로 이어진 모든 라운드의 결과)
+    final_message = "\n\n".join(message for message in final_messages if message)
     await save_to_memory(user_query, final_message, slack_data, message_data)
 
     return final_message
@@ -0,0 +1,217 @@
+"""
+Operator 컨텍스트 예산 (Context Budget)
+
+operator 호출 전에 system prompt, 검색된 메모리, 질의의 토큰 수를 추정하고
+예산을 넘으면 첫 호출 전에 메모리와 상태 정보를 줄입니다.
+(초과 후 413/"prompt is too long" 오류를 받고 /compact로 재시도하면 COMPLEX 모델 호출 1회가 낭비됨)
+
+줄이는 순서:
+1. 검색된 메모리를 문단 단위로 잘라 메모리 예산에 맞춤
+2. 상태 정보의 멤버/최근 메시지 예산을 절반씩 줄여 다시 생성
+3. 그래도 넘치면 남은 예산까지 메모리를 더 자름
+
+도구 결과는 MAX_MCP_OUTPUT_TOKENS 환경 변수로 CLI에서 잘리도록 합니다.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from app.config.settings import get_settings
+from app.cc_agents.state_prompt import build_state_prompt
+from app.cc_utils.token_helper import estimate_tokens, truncate_to_tokens
+
+NO_MEMORY_MESSAGE = "관련된 메모리가 없습니다."
+
+# 상태 정보를 줄일 때 멤버/최근 메시지 예산의 하한 (이보다 작게는 줄이지 않음)
+MIN_STATE_SECTION_TOKENS = 200
+
+# 상태 정보를 다시 생성하는 최대 횟수 (매번 예산 절반)
+MAX_STATE_SHRINKS = 3
+
+
+@dataclass
+class ContextPlan:
+    """예산에 맞춘 operator 입력"""
+    state_prompt: str  # 관련 메모리가 포함된 state prompt
+    retrieved_memory: str
+    estimated_tokens: int
+    actions: List[str] = field(default_factory=list)
+
+
+class ContextBudgetStats:
+    """컨텍스트 예산 적용 및 초과 통계"""
+
+    def __init__(self):
+        self.planned = 0
+        self.memory_trimmed = 0
+        self.state_trimmed = 0
+        self.over_budget = 0
+        self.tokens_saved = 0
+        self.overflow_errors = 0
+        self.compact_retries = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "planned": self.planned,
+            "memory_trimmed": self.memory_trimmed,
+            "state_trimmed": self.state_trimmed,
+            "over_budget": self.over_budget,
+            "tokens_saved": self.tokens_saved,
+            "overflow_errors": self.overflow_errors,
+            "compact_retries": self.compact_retries,
+            "overflow_rate": round(self.overflow_errors / self.planned, 3) if self.planned else 0.0,
+        }
+
+
+_stats = ContextBudgetStats()
+
+
+def get_context_budget_stats() -> Dict[str, Any]:
+    """시작 이후 컨텍스트 예산 통계"""
+    return _stats.as_dict()
+
+
+def record_context_overflow(compacted: bool) -> None:
+    """사전 예산에도 불구하고 컨텍스트 초과 오류가 발생한 경우 기록
+
+    Args:
+        compacted: /compact 후 재시도했는지 여부
+    """
+    _stats.overflow_errors += 1
+    if compacted:
+        _stats.compact_retries += 1
+
+
+def trim_memory(retrieved_memory: str, max_tokens: int) -> str:
+    """검색된 메모리를 앞쪽 문단부터 예산 안에서만 남김
+
+    메모리 검색 결과는 관련도 순으로 정렬되어 있으므로 뒤쪽 문단부터 생략합니다.
+
+    Args:
+        retrieved_memory: 검색된 메모리 ("\\n\\n"으로 구분된 문단)
+        max_tokens: 메모리에 허용하는 토큰 수
+
+    Returns:
+        str: 예산에 맞춘 메모리 (생략된 문단이 있으면 안내 문구 포함)
+    """
+    if estimate_tokens(retrieved_memory) <= max_tokens:
+        return retrieved_memory
+
+    paragraphs = retrieved_memory.split("\n\n")
+    kept = []
+    used = 0
+    for paragraph in paragraphs:
+        tokens = estimate_tokens(paragraph)
+        if used + tokens > max_tokens:
+            if not kept:
+                kept.append(truncate_to_tokens(paragraph, max_tokens))
+            break
+        kept.append(paragraph)
+        used += tokens
+
+    omitted = len(paragraphs) - len(kept)
+    note = f"(컨텍스트 예산 초과로 메모리 {omitted}개 문단 생략)" if omitted else "(컨텍스트 예산 초과로 메모리 일부 생략)"
+    return "\n\n".join(kept + [note])
+
+
+def _with_memory(state_prompt: str, retrieved_memory: str) -> str:
+    """state prompt에 관련 메모리 섹션 추가"""
+    if not retrieved_memory or retrieved_memory == NO_MEMORY_MESSAGE:
+        return state_prompt
+    return state_prompt + f"\n\n## 관련 메모리\n<retrieved_memory>\n{retrieved_memory}\n</retrieved_memory>"
+
+
+def plan_operator_context(
+    query: str,
+    slack_data: dict,
+    message_data: dict,
+    retrieved_memory: str,
+    fixed_prompt_tokens: int,
+    max_tokens: Optional[int] = None,
+    memory_max_tokens: Optional[int] = None,
+) -> ContextPlan:
+    """operator 첫 호출 전에 입력을 컨텍스트 예산에 맞춤
+
+    Args:
+        query: operator에 전달할 질의
+        slack_data: Slack API 데이터
+        message_data: 현재 메시지 정보
+        retrieved_memory: 검색된 관련 메모리
+        fixed_prompt_tokens: state prompt를 제외한 system prompt의 예상 토큰 수
+        max_tokens: system prompt + 메모리 + 질의 전체 예산 (None이면 설정값)
+        memory_max_tokens: 메모리 예산 (None이면 설정값)
+
+    Returns:
+        ContextPlan: 예산에 맞춘 state prompt와 메모리, 예상 토큰 수, 적용한 조치
+    """
+    settings = get_settings()
+    if max_tokens is None:
+        max_tokens = settings.OPERATOR_CONTEXT_MAX_TOKENS
+    if memory_max_tokens is None:
+        memory_max_tokens = settings.OPERATOR_MEMORY_MAX_TOKENS
+
+    _stats.planned += 1
+    actions = []
+    fixed_tokens = fixed_prompt_tokens + estimate_tokens(query)
+
+    # 1. 메모리를 메모리 예산에 맞춤
+    memory = retrieved_memory or ""
+    original_memory_tokens = estimate_tokens(memory)
+    if original_memory_tokens > memory_max_tokens:
+        memory = trim_memory(memory, memory_max_tokens)
+        actions.append("memory")
+
+    # 2. 전체 예산을 넘으면 상태 정보의 멤버/최근 메시지 예산을 절반씩 줄임
+    state_prompt, section_tokens = build_state_prompt(slack_data, message_data)
+    original_state_tokens = state_tokens = sum(section_tokens.values())
+    members_budget = settings.STATE_PROMPT_MEMBERS_MAX_TOKENS
+    messages_budget = settings.STATE_PROMPT_MESSAGES_MAX_TOKENS
+    for _ in range(MAX_STATE_SHRINKS):
+        if fixed_tokens + state_tokens + estimate_tokens(memory) <= max_tokens:
+            break
+        if members_budget <= MIN_STATE_SECTION_TOKENS and messages_budget <= MIN_STATE_SECTION_TOKENS:
+            break
+        members_budget = max(MIN_STATE_SECTION_TOKENS, members_budget // 2)
+        messages_budget = max(MIN_STATE_SECTION_TOKENS, messages_budget // 2)
+        state_prompt, section_tokens = build_state_prompt(
+            slack_data, message_data, members_budget, messages_budget
+        )
+        state_tokens = sum(section_tokens.values())
+        if "state" not in actions:
+            actions.append("state")
+
+    # 3. 그래도 넘치면 남은 예산까지 메모리를 더 자름
+    remaining = max_tokens - fixed_tokens - state_tokens
+    if estimate_tokens(memory) > remaining and memory:
+        memory = trim_memory(memory, max(remaining, 0))
+        if "memory" not in actions:
+            actions.append("memory")
+
+    memory_tokens = estimate_tokens(memory)
+    estimated = fixed_tokens + state_tokens + memory_tokens
+    saved = (original_memory_tokens - memory_tokens) + (original_state_tokens - state_tokens)
+
+    if "memory" in actions:
+        _stats.memory_trimmed += 1
+    if "state" in actions:
+        _stats.state_trimmed += 1
+    _stats.tokens_saved += saved
+
+    if estimated > max_tokens:
+        _stats.over_budget += 1
+        logging.warning(
+            f"[CONTEXT_BUDGET] Still over budget after trimming: ~{estimated}/{max_tokens} tokens"
+        )
+    elif actions:
+        logging.info(
+            f"[CONTEXT_BUDGET] Trimmed {', '.join(actions)} before first call: "
+            f"~{estimated}/{max_tokens} tokens (saved ~{saved})"
+        )
+
+    return ContextPlan(
+        state_prompt=_with_memory(state_prompt, memory),
+        retrieved_memory=memory,
+        estimated_tokens=estimated,
+        actions=actions,
+    )
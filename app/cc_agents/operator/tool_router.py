@@ -0,0 +1,319 @@
+"""
+Operator 도구 라우터 (Tool Router)
+
+요청에 필요한 MCP 서버만 operator 세션에 연결합니다.
+
+선택은 단계적으로 이루어집니다:
+1. 기본 서버(slack, scheduler, files, time)와 사용자 정의 원격 서버는 항상 포함
+2. 요청/채널 이름의 키워드와 URL, 검색된 메모리의 URL로 서버 선택
+3. 규칙으로 아무 서버도 고르지 못한 긴 요청은 작은 모델에게 선택을 맡김
+   (TOOL_ROUTER_LLM_FALLBACK, 기본 꺼짐: operator 첫 호출 전에 작은 모델 호출 1회만큼 지연됨)
+4. 작업 중 도구가 부족하면 operator가 `mcp__tools__request_tools`로 서버를 추가 요청
+   (operator는 같은 세션을 이어서 추가된 서버와 함께 다시 실행됨)
+"""
+
+import json
+import logging
+import os
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from claude_agent_sdk import ClaudeAgentOptions, ResultMessage, create_sdk_mcp_server, tool
+
+from app.config.settings import get_settings
+from app.cc_utils.claude_client_pool import get_claude_client_pool
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
+
+# 모든 요청에 포함되는 서버
+CORE_SERVERS = {"slack", "scheduler", "files", "time"}
+
+# 도구 추가 요청용 서버 이름 (mcp__tools__request_tools)
+TOOL_REQUEST_SERVER = "tools"
+
+# 한 요청에서 도구 추가 요청으로 세션을 이어서 실행하는 최대 횟수
+MAX_TOOL_ESCALATIONS = 2
+
+# 작은 모델 선택은 이 길이 이상의 요청에만 사용 (짧은 요청은 기본 서버로 충분)
+LLM_FALLBACK_MIN_CHARS = 40
+
+# 서버 설명 (작은 모델 선택과 도구 추가 요청에 사용)
+SERVER_DESCRIPTIONS = {
+    "context7": "라이브러리/프레임워크의 코드 문서 검색",
+    "arxiv": "arXiv 논문 검색/조회",
+    "airbnb": "숙소/워크샵 장소 검색 (Airbnb)",
+    "youtube-info": "YouTube 영상 정보/자막 조회",
+    "steam-review": "Steam 게임 정보/리뷰 조회",
+    "perplexity": "웹 전체 검색 및 정보 종합",
+    "deepl": "문서/텍스트 번역 (DeepL)",
+    "github": "GitHub 저장소, 이슈, PR 작업",
+    "gitlab": "GitLab 저장소, 이슈, MR 작업",
+    "ms365": "Outlook 메일, 캘린더, OneDrive, SharePoint (Microsoft 365)",
+    "atlassian": "Confluence 페이지, Jira 이슈 (Atlassian)",
+    "tableau": "Tableau 대시보드 데이터 조회",
+    "x": "X(Twitter) 트윗 조회/게시",
+    "meeting_transcription": "녹음 파일로 회의록 작성",
+    "playwright": "브라우저로 웹사이트 탐색/스크린샷",
+}
+
+# 서버별 키워드 (요청과 채널 이름에 적용)
+KEYWORD_RULES = {
+    "context7": r"라이브러리|프레임워크|패키지|코드|\blibrary\b|framework|package|\bsdk\b|\bapi\b|documentation|\bdocs?\b",
+    "arxiv": r"arxiv|논문|\bpapers?\b",
+    "airbnb": r"airbnb|에어비앤비|숙소|숙박|워크샵|workshop|\blodging\b",
+    "youtube-info": r"youtube|유튜브",
+    "steam-review": r"steam|스팀",
+    "perplexity": r"검색|찾아|알아봐|조사|최신|뉴스|트렌드|search|look up|research|latest|news",
+    "deepl": r"번역|translat|deepl",
+    "github": r"github|깃허브|pull request|\bpr\b|커밋|commit",
+    "gitlab": r"gitlab|깃랩|merge request|\bmr\b",
+    "ms365": r"outlook|아웃룩|메일|e-?mail|캘린더|calendar|일정|schedule|회의실|onedrive|sharepoint|\bteams\b|office ?365|m365",
+    "atlassian": r"atlassian|confluence|컨플루언스|jira|지라|위키|\bwiki\b|티켓|ticket",
+    "tableau": r"tableau|테블로|태블로|대시보드|dashboard",
+    "x": r"트윗|트위터|tweet|twitter",
+    "meeting_transcription": r"녹취|녹음|회의록|transcri|recording|meeting notes",
+    "playwright": r"웹사이트|사이트|브라우저|스크린 ?샷|캐치테이블|회식|식당|맛집|website|browser|screenshot|restaurant",
+}
+
+# 서버별 URL 패턴 (요청과 검색된 메모리의 링크에 적용)
+URL_RULES = {
+    "arxiv": r"arxiv\.org",
+    "youtube-info": r"youtube\.com|youtu\.be",
+    "steam-review": r"steampowered\.com|steamcommunity\.com",
+    "github": r"github\.com",
+    "gitlab": r"gitlab\.",
+    "ms365": r"sharepoint\.com|office\.com|outlook\.|onedrive\.",
+    "atlassian": r"atlassian\.net|confluence\.|jira\.",
+    "tableau": r"tableau",
+    "x": r"(?:^|//|\.)x\.com|twitter\.com",
+}
+
+URL_PATTERN = re.compile(r"https?://[^\s<>|)]+", re.IGNORECASE)
+
+
+def _compile(rules: Dict[str, str]) -> Dict[str, re.Pattern]:
+    return {name: re.compile(pattern, re.IGNORECASE) for name, pattern in rules.items()}
+
+
+_keyword_rules = _compile(KEYWORD_RULES)
+_url_rules = _compile(URL_RULES)
+
+
+def _gitlab_host() -> Optional[str]:
+    url = get_settings().GITLAB_API_URL
+    match = re.match(r"https?://([^/]+)", url or "")
+    return match.group(1).lower() if match else None
+
+
+def select_servers_by_rules(
+    query: str,
+    channel_name: str = "",
+    retrieved_memory: str = "",
+    available: Iterable[str] = (),
+) -> Set[str]:
+    """
+    키워드/URL 규칙으로 요청에 필요한 서버를 선택합니다 (기본 서버 제외).
+
+    Args:
+        query: 사용자 요청
+        channel_name: 채널 이름 (예: jira-alerts)
+        retrieved_memory: 검색된 메모리 (링크만 사용)
+        available: 활성화된 서버 이름
+
+    Returns:
+        set: 선택된 서버 이름
+    """
+    available = set(available)
+    text = f"{query}\n{channel_name}"
+    selected = {name for name, pattern in _keyword_rules.items() if pattern.search(text)}
+
+    gitlab_host = _gitlab_host()
+    unclaimed_urls = []
+    for url in URL_PATTERN.findall(f"{query}\n{retrieved_memory}"):
+        matched = {name for name, pattern in _url_rules.items() if pattern.search(url)}
+        if gitlab_host and gitlab_host in url.lower():
+            matched.add("gitlab")
+        selected |= matched
+        if not matched and "slack.com" not in url and url in query:
+            unclaimed_urls.append(url)
+
+    # 전용 도구가 없는 요청 속 링크는 브라우저로 확인
+    if unclaimed_urls:
+        selected.add("playwright")
+
+    return selected & available
+
+
+def _fallback_system_prompt(candidates: Dict[str, str]) -> str:
+    server_list = "\n".join(f"- {name}: {description}" for name, description in candidates.items())
+    return f"""You select which tool servers an assistant needs for a Slack request.
+Slack messaging, scheduling, files and the current time are always available.
+
+Available tool servers:
+{server_list}
+
+Reply with a comma-separated list of the server names that are needed, or "none".
+Do not add anything else."""
+
+
+async def select_servers_by_llm(query: str, candidates: Dict[str, str]) -> Set[str]:
+    """규칙으로 판단하지 못한 요청의 서버를 작은 모델로 선택합니다."""
+    settings = get_settings()
+    options = ClaudeAgentOptions(
+        system_prompt=_fallback_system_prompt(candidates),
+        model=settings.MODEL_FOR_SIMPLE,
+        permission_mode="bypassPermissions",
+        allowed_tools=["*"],
+        disallowed_tools=[
+            "Bash(curl:*)",
+            "Bash(rm:*)",
+            "Bash(rm -r*)",
+            "Bash(rm -rf*)",
+            "Read(./.env)",
+            "Read(./credential.json)",
+            "WebFetch",
+        ],
+        setting_sources=["project"],
+        cwd=os.getcwd(),
+    )
+
+    try:
+        async with (
+            llm_slot(LLMTier.SIMPLE, LLMPriority.INTERACTIVE, "tool_router"),
+            get_claude_client_pool().client(options, "tool_router") as client,
+        ):
+            await client.query(f"Request: {query}")
+            async for message in client.receive_response():
+                if isinstance(message, ResultMessage):
+                    names = {part.strip().strip("`'\"") for part in (message.result or "").split(",")}
+                    return names & set(candidates)
+    except Exception as e:
+        logging.error(f"[TOOL_ROUTER] LLM selection failed: {e}")
+    return set()
+
+
+def describe_servers(names: Iterable[str]) -> Dict[str, str]:
+    """서버 이름 → 설명"""
+    return {name: SERVER_DESCRIPTIONS.get(name, name) for name in names}
+
+
+def remote_server_instructions() -> Dict[str, str]:
+    """REMOTE_MCP_SERVERS의 서버 이름 → instruction"""
+    try:
+        servers = json.loads(get_settings().REMOTE_MCP_SERVERS or "[]")
+    except json.JSONDecodeError:
+        return {}
+    return {
+        server.get("name", "").strip(): server.get("instruction", "").strip()
+        for server in servers
+        if server.get("name", "").strip()
+    }
+
+
+async def select_tool_servers(
+    query: str,
+    available: Iterable[str],
+    channel_name: str = "",
+    retrieved_memory: str = "",
+) -> Set[str]:
+    """
+    operator 세션에 연결할 MCP 서버를 선택합니다.
+
+    Args:
+        query: 사용자 요청
+        available: 활성화된 서버 이름 (build_mcp_servers_dict의 키)
+        channel_name: 채널 이름
+        retrieved_memory: 검색된 메모리
+
+    Returns:
+        set: 연결할 서버 이름
+    """
+    settings = get_settings()
+    available = set(available)
+    if not settings.TOOL_ROUTER_ENABLED:
+        return available
+
+    remote = remote_server_instructions()
+    always = (CORE_SERVERS | set(remote)) & available
+    optional = available - always
+
+    selected = select_servers_by_rules(query, channel_name, retrieved_memory, optional)
+    source = "rules"
+    if not selected and settings.TOOL_ROUTER_LLM_FALLBACK and optional and len(query) >= LLM_FALLBACK_MIN_CHARS:
+        started = time.monotonic()
+        selected = await select_servers_by_llm(query, describe_servers(sorted(optional)))
+        source = f"llm in {time.monotonic() - started:.2f}s"
+
+    logging.info(
+        f"[TOOL_ROUTER] Attached {len(always | selected)}/{len(available)} MCP servers "
+        f"(selected by {source}: {sorted(selected) or 'none'})"
+    )
+    return always | selected
+
+
+class ToolEscalation:
+    """operator 세션 중 추가로 요청된 MCP 서버"""
+
+    def __init__(self, unattached: Dict[str, str]):
+        self.unattached = dict(unattached)
+        self.requested: Set[str] = set()
+
+    def request(self, names: List[str]) -> Set[str]:
+        valid = {name for name in names if name in self.unattached}
+        self.requested |= valid
+        return valid
+
+    def take(self) -> Set[str]:
+        """요청된 서버를 꺼내고 미연결 목록에서 제외"""
+        requested, self.requested = self.requested, set()
+        for name in requested:
+            self.unattached.pop(name, None)
+        return requested
+
+
+def create_tool_request_server(escalation: ToolEscalation):
+    """도구 추가 요청 MCP 서버 (세션별)"""
+    server_list = "\n".join(f"- {name}: {description}" for name, description in escalation.unattached.items())
+
+    @tool(
+        "request_tools",
+        f"""Requests tool servers that are not attached to this session yet.
+After calling this, stop working and end your turn without answering; the conversation continues with the requested tools attached.
+
+Available tool servers:
+{server_list}""",
+        {
+            "type": "object",
+            "properties": {
+                "servers": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Names of the tool servers to attach"
+                },
+                "reason": {
+                    "type": "string",
+                    "description": "Why the tools are needed"
+                }
+            },
+            "required": ["servers"]
+        }
+    )
+    async def request_tools(args):
+        granted = escalation.request(args.get("servers") or [])
+        logging.info(f"[TOOL_ROUTER] Tools requested: {sorted(granted)} (reason: {args.get('reason', '')})")
+        if granted:
+            text = f"Requested {', '.join(sorted(granted))}. End your turn now; the tools will be attached when the conversation continues."
+        else:
+            text = f"Unknown tool servers. Choose from: {', '.join(escalation.unattached)}"
+        return {"content": [{"type": "text", "text": text}]}
+
+    return create_sdk_mcp_server(name="tools", version="1.0.0", tools=[request_tools])
+
+
+def tool_request_rule(escalation: ToolEscalation) -> str:
+    """도구 추가 요청 방법 (system prompt용)"""
+    names = ", ".join(f"`{name}`" for name in escalation.unattached)
+    return (
+        f"- 필요한 도구가 없으면 `mcp__{TOOL_REQUEST_SERVER}__request_tools`로 추가 도구를 요청하세요 ({names}). "
+        "요청한 뒤에는 답변하지 말고 바로 작업을 멈추세요. 도구가 추가된 상태로 작업이 이어집니다."
+    )
@@ -10,7 +10,6 @@ from typing import Tuple, Optional, Dict, Any
 
 from claude_agent_sdk import (
     ClaudeAgentOptions,
-    ClaudeSDKClient,
     ResultMessage,
 )
 
@@ -19,6 +18,8 @@ from app.cc_utils.confirm_db import (
     update_confirm_response,
 )
 from app.config.settings import get_settings
+from app.cc_utils.claude_client_pool import get_claude_client_pool
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
 
 
 def create_system_prompt() -> str:
@@ -112,7 +113,10 @@ async def call_proactive_confirm(
     )
 
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with (
+            llm_slot(LLMTier.SIMPLE, LLMPriority.INTERACTIVE, "proactive_confirm"),
+            get_claude_client_pool().client(options, "proactive_confirm") as client,
+        ):
             # DB에서 원래 사용자 요청 텍스트 추출
             original_user_text = confirm["original_request_text"]
 
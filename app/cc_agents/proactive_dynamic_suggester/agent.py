@@ -14,8 +14,10 @@ from claude_agent_sdk import (
 
 from app.cc_tools.confirm.confirm_tools import create_confirm_mcp_server
 from app.cc_tools.slack.slack_tools import create_slack_mcp_server
+from app.cc_tools.time.time_tools import create_time_mcp_server
 from app.cc_agents.state_prompt import create_state_prompt
 from app.config.settings import get_settings
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
 
 
 def create_system_prompt(memories_path: str) -> str:
@@ -35,8 +37,6 @@ def create_system_prompt(memories_path: str) -> str:
     system_prompt = f"""You are {bot_name}, analyzing Slack memories to proactively provide useful suggestions to colleagues.
 CRITICAL: Respond in the same language as the target user's memory file.
 
-{state_prompt}
-
 # 메모리 경로
 {memories_path}
 
@@ -479,6 +479,7 @@ mcp__confirm__request_confirmation(
 - {memories_path} 외부 파일 접근 절대 금지
 </guardrails>
 
+{state_prompt}
 """
 
     return system_prompt
@@ -505,10 +506,7 @@ async def call_dynamic_suggester() -> str:
     options = ClaudeAgentOptions(
         # MCP 서버 설정
         mcp_servers={
-            "time": {
-                "command": "npx",
-                "args": ["-y", "@mcpcentral/mcp-time"]
-            },
+            "time": create_time_mcp_server(),
             "confirm": create_confirm_mcp_server(),
             "slack": create_slack_mcp_server()
         },
@@ -545,7 +543,10 @@ async def call_dynamic_suggester() -> str:
     )
 
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with (
+            llm_slot(LLMTier.MODERATE, LLMPriority.PROACTIVE, "proactive_dynamic_suggester"),
+            ClaudeSDKClient(options=options) as client,
+        ):
             query = f"""
 최근 15분간 업데이트된 메모리를 분석하여, 동료들에게 유용한 정보를 제안하세요.
 
@@ -16,6 +16,7 @@ from claude_agent_sdk import (
 
 from app.cc_tools.confirm import create_confirm_mcp_server
 from app.config.settings import get_settings
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
 
 
 def create_system_prompt(state_prompt: str) -> str:
@@ -35,8 +36,6 @@ def create_system_prompt(state_prompt: str) -> str:
 # 기본 지침
 과거 작업 처리 성공 사례를 통해 유용한 정보나 도움을 제공할 수 있는 경우, 동료들에게 먼저 도움을 제공하세요.
 
-{state_prompt}
-
 ## 핵심 행동 원칙
 <important_actions>
 1. **사용자 요청이 구체적인 작업 요청일 때만** 제안을 고려합니다:
@@ -84,6 +83,8 @@ def create_system_prompt(state_prompt: str) -> str:
 
 예: "true - 과거 성공 사례 있음" / "false - 일상 대화임"
 </output_format>
+
+{state_prompt}
 """
 
     return system_prompt
@@ -147,7 +148,10 @@ async def call_proactive_suggester(
     )
 
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with (
+            llm_slot(LLMTier.MODERATE, LLMPriority.PROACTIVE, "proactive_suggester"),
+            ClaudeSDKClient(options=options) as client,
+        ):
             query = f"""다음 메시지가 도움을 제안할 만한지 판단하세요.
 
 메시지: {user_text}
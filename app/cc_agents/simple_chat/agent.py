@@ -15,8 +15,10 @@ from claude_agent_sdk import (
 )
 
 from app.cc_tools.slack.slack_tools import create_slack_mcp_server
+from app.cc_tools.time.time_tools import create_time_mcp_server
 from app.config.settings import get_settings
 from app.cc_agents.state_prompt import create_state_prompt
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
 
 
 def create_system_prompt(state_prompt: str) -> str:
@@ -49,12 +51,10 @@ def create_system_prompt(state_prompt: str) -> str:
 동료들의 요청을 분석하여 간단한 대화는 **Slack 도구**를 통해 직접 응답하고 true를 반환하세요.
 복잡한 작업은 후임 에이전트가 처리하도록 false를 반환하세요.
 
-{state_prompt}
-
 ## 핵심 행동 원칙
 <important_actions>
 1. 반드시 state_data의 "관련 메모리" 섹션을 확인하세요. 전임 에이전트가 요청에 필요한 메모리를 정리했습니다.
-2. 반드시 모든 작업은 `mcp__time__*`를 사용해 정확한 시간을 확인하고 진행하세요.
+2. 반드시 모든 작업은 state_data의 '현재 시각'을 기준으로 진행하세요.
 3. 반드시 요청이 불분명하거나 작업이 불가하거나 선택지를 제안할 때도 `mcp__slack__answer`도구로 응답하세요.
 4. 절대 동료 요청에 응답은 절대 건너뛸 수 없습니다. `mcp__slack__answer`도구를 최소 1번 호출합니다.
 5. 간단한 대화면:
@@ -106,7 +106,7 @@ def create_system_prompt(state_prompt: str) -> str:
 
 ## 도구 사용 원칙
 <how_to_use_tool>
-- 요청을 수행할 때 먼저 `mcp__time__get_current_time`으로 현재 시각을 확인하고, 확인한 시간을 기준으로 정보 탐색에 활용하세요. '어제', '내일', '다음주', '작년', '이번 년도' 같은 상대적 표현은 반드시 확인한 현재 시간 기준으로 정확한 날짜로 변환하여 검색/필터링해야 합니다. 
+- 현재 시각은 state_data의 '현재 시각'을 기준으로 정보 탐색에 활용하세요. '어제', '내일', '다음주', '작년', '이번 년도' 같은 상대적 표현은 반드시 현재 시각 기준으로 정확한 날짜로 변환하여 검색/필터링해야 합니다. 다른 시간대 변환이나 헷갈리는 날짜 계산은 `mcp__time__convert_time`, `mcp__time__resolve_relative_date`를 사용하세요.
 - `mcp__slack__answer` 사용 시 파라미터를 state_data에서 가져와 사용하세요.
 </how_to_use_tool>
 
@@ -114,7 +114,9 @@ def create_system_prompt(state_prompt: str) -> str:
 <output_format>
 간단한 대화 처리: 답변 후 "true" 출력
 복잡한 작업: 적절한 대기 메시지로 응답 후 "false" 출력
-</output_format>"""
+</output_format>
+
+{state_prompt}"""
 
     return system_prompt
 
@@ -150,10 +152,7 @@ async def call_simple_chat(
 
     options = ClaudeAgentOptions(
         mcp_servers={
-            "time": {
-                "command": "npx",
-                "args": ["-y", "@mcpcentral/mcp-time"]
-            },
+            "time": create_time_mcp_server(),
             "slack": create_slack_mcp_server(),
         },
         system_prompt=system_prompt,
@@ -161,6 +160,8 @@ async def call_simple_chat(
         permission_mode="bypassPermissions",
         allowed_tools=[
             "mcp__slack__answer",
+            "mcp__time__convert_time",
+            "mcp__time__resolve_relative_date",
             "WebFetch",
         ],
         disallowed_tools=[
@@ -176,7 +177,10 @@ async def call_simple_chat(
     )
 
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with (
+            llm_slot(LLMTier.SIMPLE, LLMPriority.INTERACTIVE, "simple_chat"),
+            ClaudeSDKClient(options=options) as client,
+        ):
             query = f"""다음 메시지가 간단한 대화인지 복잡한 작업인지 판단하세요.
 
 메시지: {user_text}
@@ -2,26 +2,193 @@
 프롬프트 생성 함수들
 
 이 모듈은 Claude SDK 에이전트에서 사용하는 system prompt와 state prompt를 생성합니다.
+프롬프트 캐시가 적중하도록 고정 섹션(정체성, 데이터 설명)을 앞에, 매 요청마다 바뀌는
+상태(현재 시각, Slack 데이터, 현재 메시지)를 뒤에 배치하고, 채널 멤버와 최근 메시지는
+토큰 예산 안에서만 포함합니다.
 """
 
 import json
+import logging
 import os
-from typing import Optional
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from app.config.settings import get_settings
 from app.cc_utils.language_helper import detect_language
+from app.cc_utils.time_helper import format_current_time
+from app.cc_utils.token_helper import estimate_tokens, truncate_to_tokens
 
+# 메시지 하나에 허용하는 최대 토큰 (긴 메시지는 잘라서 포함)
+MESSAGE_MAX_TOKENS = 300
+
+# 요약에 표시할 최대 참여자 수
+SUMMARY_MAX_PARTICIPANTS = 10
+
+# "[사용자명]: 메시지 내용" 형식에서 사용자명 추출
+_AUTHOR_PATTERN = re.compile(r"^\[([^\]]+)\]:")
+
+
+def _compact_json(data: Any) -> str:
+    """공백 없는 JSON 직렬화"""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _without_empty(data: Dict[str, Any]) -> Dict[str, Any]:
+    """빈 값(빈 문자열, None, 빈 리스트) 필드 제거"""
+    return {key: value for key, value in data.items() if value not in ("", None, [], {})}
+
+
+def _message_author(message: str) -> str:
+    match = _AUTHOR_PATTERN.match(message)
+    return match.group(1) if match else ""
 
-def create_state_prompt(slack_data: Optional[dict] = None, message_data: Optional[dict] = None) -> str:
-    """Slack API 데이터와 현재 메시지 정보를 바탕으로 state prompt 생성
+
+def budget_members(
+    members: List[Dict[str, Any]],
+    max_tokens: int,
+    priority_user_id: str = "",
+    active_names: Iterable[str] = (),
+) -> Tuple[List[Dict[str, Any]], int]:
+    """토큰 예산 안에 들어가는 채널 멤버만 선택
+
+    메시지를 보낸 사용자, 최근 대화 참여자, 나머지 멤버 순으로 채웁니다.
 
     Args:
-        slack_data: Slack API로부터 받은 데이터 (채널, 멤버, 최근 메시지 등). None이면 생략됨
-        message_data: 현재 메시지 정보 (user_id, text, channel_id, thread_ts 등). None이면 생략됨
+        members: slack_data의 members
+        max_tokens: 멤버 목록에 허용하는 토큰 수
+        priority_user_id: 가장 먼저 포함할 사용자 ID (현재 메시지 발신자)
+        active_names: 최근 대화 참여자 이름
 
     Returns:
-        str: 에이전트가 현재 상태를 이해하기 위한 프롬프트
+        (포함할 멤버 목록, 생략된 멤버 수)
+    """
+    active = set(active_names)
+
+    def priority(member: Dict[str, Any]) -> int:
+        if priority_user_id and member.get("user_id") == priority_user_id:
+            return 0
+        if member.get("real_name") in active or member.get("display_name") in active:
+            return 1
+        return 2
+
+    selected = []
+    used = 0
+    for member in sorted(members, key=priority):
+        member = _without_empty(member)
+        tokens = estimate_tokens(_compact_json(member))
+        if used + tokens > max_tokens:
+            break
+        selected.append(member)
+        used += tokens
+
+    return selected, len(members) - len(selected)
+
+
+def budget_messages(messages: List[str], max_tokens: int) -> Tuple[List[str], List[str]]:
+    """토큰 예산 안에 들어가는 최근 메시지만 선택 (최신 메시지 우선)
+
+    Args:
+        messages: 오래된 순으로 정렬된 "[사용자명]: 메시지 내용" 목록
+        max_tokens: 메시지 목록에 허용하는 토큰 수
+
+    Returns:
+        (포함할 메시지 목록 - 오래된 순, 생략된 메시지 목록)
+    """
+    selected = []
+    used = 0
+    for index in range(len(messages) - 1, -1, -1):
+        message = truncate_to_tokens(messages[index], MESSAGE_MAX_TOKENS)
+        tokens = estimate_tokens(message)
+        if used + tokens > max_tokens:
+            return list(reversed(selected)), messages[:index + 1]
+        selected.append(message)
+        used += tokens
+
+    return list(reversed(selected)), []
+
+
+def summarize_omitted_messages(messages: List[str]) -> str:
+    """생략된 메시지를 한 줄로 요약"""
+    participants = []
+    for message in messages:
+        author = _message_author(message)
+        if author and author not in participants:
+            participants.append(author)
+
+    summary = f"이전 메시지 {len(messages)}개 생략"
+    if participants:
+        names = ", ".join(participants[:SUMMARY_MAX_PARTICIPANTS])
+        if len(participants) > SUMMARY_MAX_PARTICIPANTS:
+            names += f" 외 {len(participants) - SUMMARY_MAX_PARTICIPANTS}명"
+        summary += f" (참여자: {names})"
+    return summary + ". 필요하면 `mcp__slack__get_channel_history`로 조회하세요."
+
+
+def compact_slack_data(
+    slack_data: Dict[str, Any],
+    message_data: Optional[Dict[str, Any]] = None,
+    members_max_tokens: Optional[int] = None,
+    messages_max_tokens: Optional[int] = None,
+) -> Dict[str, Any]:
+    """slack_data에서 빈 필드를 제거하고 멤버/최근 메시지를 토큰 예산에 맞춤
+
+    Args:
+        slack_data: Slack API로부터 받은 데이터
+        message_data: 현재 메시지 정보 (발신자를 멤버 목록에 우선 포함)
+        members_max_tokens: 멤버 목록 토큰 예산 (None이면 설정값)
+        messages_max_tokens: 최근 메시지 토큰 예산 (None이면 설정값)
+
+    Returns:
+        dict: 예산에 맞춘 slack_data. 생략된 항목은 members_omitted, earlier_messages로 요약됩니다.
+    """
+    settings = get_settings()
+    if members_max_tokens is None:
+        members_max_tokens = settings.STATE_PROMPT_MEMBERS_MAX_TOKENS
+    if messages_max_tokens is None:
+        messages_max_tokens = settings.STATE_PROMPT_MESSAGES_MAX_TOKENS
+
+    compacted: Dict[str, Any] = {}
+    if slack_data.get("channel"):
+        compacted["channel"] = _without_empty(slack_data["channel"])
+
+    recent_messages = slack_data.get("recent_messages") or []
+    messages, omitted_messages = budget_messages(recent_messages, messages_max_tokens)
+
+    members, omitted_members = budget_members(
+        slack_data.get("members") or [],
+        members_max_tokens,
+        priority_user_id=(message_data or {}).get("user_id", ""),
+        active_names=(_message_author(message) for message in recent_messages),
+    )
+    compacted["members"] = members
+    if omitted_members:
+        compacted["members_omitted"] = (
+            f"{omitted_members}명 생략. 필요하면 `mcp__slack__find_user_by_name`으로 조회하세요."
+        )
+
+    if omitted_messages:
+        compacted["earlier_messages"] = summarize_omitted_messages(omitted_messages)
+    compacted["recent_messages"] = messages
+
+    return compacted
+
+
+def build_state_prompt(
+    slack_data: Optional[dict] = None,
+    message_data: Optional[dict] = None,
+    members_max_tokens: Optional[int] = None,
+    messages_max_tokens: Optional[int] = None,
+) -> Tuple[str, Dict[str, int]]:
+    """state prompt와 섹션별 예상 토큰 수를 생성
+
+    Args:
+        slack_data: Slack API로부터 받은 데이터. None이면 생략됨
+        message_data: 현재 메시지 정보. None이면 생략됨
+        members_max_tokens: 멤버 목록 토큰 예산 (None이면 설정값)
+        messages_max_tokens: 최근 메시지 토큰 예산 (None이면 설정값)
+
+    Returns:
+        (state prompt, 섹션 이름별 예상 토큰 수)
     """
-    # 파일 시스템 기본 디렉토리
     settings = get_settings()
     filesystem_base_dir = settings.FILESYSTEM_BASE_DIR or os.getcwd()
     bot_name = settings.BOT_NAME or "봇"
@@ -32,23 +199,12 @@ def create_state_prompt(slack_data: Optional[dict] = None, message_data: Optiona
     authorized_users_kr = settings.BOT_AUTHORIZED_USERS_KR or ""
     confluence_default_page_id = settings.ATLASSIAN_CONFLUENCE_DEFAULT_PAGE_ID or ""
 
-    # combined_data 구성 (None이 아닌 것만 포함)
-    combined_data = {
-        "filesystem_base_dir": filesystem_base_dir
-    }
-    if slack_data is not None:
-        combined_data["slack_data"] = slack_data
-    if message_data is not None:
-        combined_data["current_message"] = message_data
-
-    state_json = json.dumps(combined_data, ensure_ascii=False, indent=2)
-
-    # 섹션 구성 (동적 번호 매기기)
-    sections = []
+    # 고정 섹션 (동적 번호 매기기) - 설정과 데이터 유무에만 의존하므로 요청 간에 동일
+    guide = []
     section_num = 0
 
     # 0. 당신의 정체성 (항상 포함)
-    sections.append(f"""### {section_num}. 당신의 정체성
+    guide.append(f"""### {section_num}. 당신의 정체성
 - 이름: {bot_name}
 - 이메일: {bot_email}
 - 소속 조직: {bot_organization}
@@ -59,15 +215,15 @@ def create_state_prompt(slack_data: Optional[dict] = None, message_data: Optiona
 
     # 1. slack_data가 있을 때만 채널 정보 추가
     if slack_data is not None:
-        sections.append(f"""### {section_num}. 채널 정보 (slack_data):
+        guide.append(f"""### {section_num}. 채널 정보 (slack_data):
 - `channel`: 현재 채널의 기본 정보 (이름, 타입, 주제, 목적, 멤버 수)
-- `members`: 채널에 속한 사용자들의 정보 (user_id, real_name, display_name, email)
-- `recent_messages`: 최근 대화 내역 ("[사용자명]: 메시지 내용" 형식)""")
+- `members`: 채널에 속한 사용자들의 정보 (user_id, real_name, display_name, email). 인원이 많으면 일부만 포함되고 `members_omitted`에 생략 인원이 표시됩니다.
+- `recent_messages`: 최근 대화 내역 ("[사용자명]: 메시지 내용" 형식). 오래된 메시지는 `earlier_messages`로 요약됩니다.""")
         section_num += 1
 
     # 2. message_data가 있을 때만 현재 메시지 추가
     if message_data is not None:
-        sections.append(f"""### {section_num}. 현재 메시지 (current_message):
+        guide.append(f"""### {section_num}. 현재 메시지 (current_message):
 - `user_id`: 메시지를 보낸 사용자의 Slack ID
 - `user_text`: 사용자가 보낸 메시지 내용
 - `channel_id`: 메시지가 발생한 채널 ID
@@ -77,34 +233,81 @@ def create_state_prompt(slack_data: Optional[dict] = None, message_data: Optiona
         section_num += 1
 
     # 3. 파일 시스템 정보 (항상 포함)
-    sections.append(f"""### {section_num}. 파일 시스템 정보 (FILESYSTEM_BASE_DIR):
+    guide.append(f"""### {section_num}. 파일 시스템 정보 (FILESYSTEM_BASE_DIR):
 - 이 디렉토리는 파일을 생성하거나 저장할 때 사용하는 기본 경로입니다.
 - 파일 작업 시 이 경로를 기준으로 하위 폴더를 만들어 사용하세요.""")
     section_num += 1
 
     # 4. Confluence 기본 페이지 (설정되어 있을 때만)
     if confluence_default_page_id:
-        sections.append(f"""### {section_num}. Confluence 기본 페이지:
+        guide.append(f"""### {section_num}. Confluence 기본 페이지:
 - 사용자가 "위키에 올려줘", "Confluence에 작성해줘" 등으로 요청하면 페이지 ID `{confluence_default_page_id}`를 사용하세요.
 - 명시적으로 다른 페이지를 지정하지 않는 한, 이 페이지의 하위 페이지를 만들어 작성합니다.""")
         section_num += 1
 
-    # 5. 응답 언어 감지
+    # 변동 섹션 - 현재 시각과 상태 데이터 (고정 섹션 뒤에 배치)
+    current_time = f"""### 현재 시각:
+- {format_current_time()}
+- 상대적 날짜 표현은 이 시각을 기준으로 계산하세요."""
+
+    # 상태 데이터 (변동이 적은 값부터, 현재 메시지는 마지막)
+    state_parts = [f'"filesystem_base_dir":{_compact_json(filesystem_base_dir)}']
+    if slack_data is not None:
+        compacted = compact_slack_data(slack_data, message_data, members_max_tokens, messages_max_tokens)
+        state_parts.append(f'"slack_data":{_compact_json(compacted)}')
+    if message_data is not None:
+        state_parts.append(f'"current_message":{_compact_json(_without_empty(message_data))}')
+    state_json = "{" + ",".join(state_parts) + "}"
+
+    # 응답 언어 감지
     user_text = message_data.get("user_text", "") if message_data else ""
     response_language = detect_language(user_text)
+    language = f"""## RESPONSE LANGUAGE
+You MUST respond in {response_language}. This is a critical requirement."""
 
-    state_prompt = f"""
-## RESPONSE LANGUAGE
-You MUST respond in {response_language}. This is a critical requirement.
-
-## 작업을 수행하기 위한 상태 정보:
+    guide_text = chr(10).join(guide)
+    state_prompt = f"""## 작업을 수행하기 위한 상태 정보:
 <state_data>
-{chr(10).join(sections)}
+{guide_text}
+
+{current_time}
 
 {state_json}
-</state_data>""".strip()
+</state_data>
 
-    return state_prompt
+{language}"""
 
+    section_tokens = {
+        "guide": estimate_tokens(guide_text),
+        "current_time": estimate_tokens(current_time),
+        "state_data": estimate_tokens(state_json),
+        "language": estimate_tokens(language),
+    }
+    return state_prompt, section_tokens
 
 
+def create_state_prompt(
+    slack_data: Optional[dict] = None,
+    message_data: Optional[dict] = None,
+    members_max_tokens: Optional[int] = None,
+    messages_max_tokens: Optional[int] = None,
+) -> str:
+    """Slack API 데이터와 현재 메시지 정보를 바탕으로 state prompt 생성
+
+    Args:
+        slack_data: Slack API로부터 받은 데이터 (채널, 멤버, 최근 메시지 등). None이면 생략됨
+        message_data: 현재 메시지 정보 (user_id, text, channel_id, thread_ts 등). None이면 생략됨
+        members_max_tokens: 멤버 목록 토큰 예산 (None이면 설정값)
+        messages_max_tokens: 최근 메시지 토큰 예산 (None이면 설정값)
+
+    Returns:
+        str: 에이전트가 현재 상태를 이해하기 위한 프롬프트. system prompt의 끝에 배치하세요.
+    """
+    state_prompt, section_tokens = build_state_prompt(
+        slack_data, message_data, members_max_tokens, messages_max_tokens
+    )
+    logging.info(
+        f"[STATE_PROMPT] ~{sum(section_tokens.values())} tokens "
+        f"({', '.join(f'{name}={tokens}' for name, tokens in section_tokens.items())})"
+    )
+    return state_prompt
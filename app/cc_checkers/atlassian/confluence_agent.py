@@ -13,6 +13,7 @@ from claude_agent_sdk import (
     ClaudeSDKClient,
     ResultMessage,
 )
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
 
 
 async def save_to_memory(content: str) -> None:
@@ -35,7 +36,8 @@ async def save_to_memory(content: str) -> None:
 
         # 메모리 큐에 작업 추가 (순차 처리됨)
         await enqueue_memory_job({
-            "memory_query": memory_query
+            "memory_query": memory_query,
+            "source": "confluence",
         })
         logging.info(f"[CONFLUENCE_SUMMARIZER] Memory job enqueued")
     except Exception as e:
@@ -72,8 +74,6 @@ Confluence 페이지 업데이트를 분석하고 중요한 정보만 추출하
 후임 에이전트가 다음 대화에서 참고할 수 있도록 중요한 페이지 업데이트만 정리하여 전달하는 것이 핵심입니다.
 {role_section}
 
-{state_prompt}
-
 ## 워크플로우
 <workflow>
 1. 전달받은 Confluence 페이지 업데이트 배치를 분석합니다.
@@ -124,7 +124,9 @@ Confluence 페이지 업데이트를 분석하고 중요한 정보만 추출하
 - FILESYSTEM_BASE_DIR 외부의 파일이나 디렉토리에 절대 접근하지 마세요
 - 시스템 파일, 홈 디렉토리, 설정 파일 등을 읽거나 수정하는 것은 엄격히 금지됩니다
 - 파일 작업은 반드시 FILESYSTEM_BASE_DIR 내부로 제한됩니다
-</guardrails>"""
+</guardrails>
+
+{state_prompt}"""
 
     return system_prompt
 
@@ -225,7 +227,10 @@ URL: {page_url}
     # Context overflow 시 /compact 후 재시도 (같은 client 유지, 최대 2회)
     max_retries = 2
 
-    async with ClaudeSDKClient(options=options) as client:
+    async with (
+        llm_slot(LLMTier.SIMPLE, LLMPriority.SCHEDULED, "confluence_agent"),
+        ClaudeSDKClient(options=options) as client,
+    ):
         for attempt in range(max_retries + 1):
             try:
                 # 첫 시도는 새 세션, 재시도는 compact된 세션 이어서
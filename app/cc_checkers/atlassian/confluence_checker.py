@@ -12,6 +12,7 @@ from datetime import datetime, timedelta, timezone
 
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient, ResultMessage
 from app.config.settings import get_settings
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -92,7 +93,10 @@ JSON 배열로만 응답 (설명 없이):
     )
 
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with (
+            llm_slot(LLMTier.SIMPLE, LLMPriority.SCHEDULED, "confluence_checker"),
+            ClaudeSDKClient(options=options) as client,
+        ):
             await client.query("페이지 목록을 조회하세요.")
 
             result_message = ""
@@ -11,6 +11,7 @@ from typing import List, Dict, Any
 
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient, ResultMessage
 from app.config.settings import get_settings
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -89,7 +90,10 @@ JSON 배열로만 응답 (설명 없이):
     )
 
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with (
+            llm_slot(LLMTier.SIMPLE, LLMPriority.SCHEDULED, "jira_checker"),
+            ClaudeSDKClient(options=options) as client,
+        ):
             await client.query("mcp__atlassian__* 도구를 사용해서 할당된 Jira 티켓을 조회하고 JSON으로 반환해주세요.")
 
             result_message = ""
@@ -215,6 +219,7 @@ async def process_issues_batch(issues: List[Dict[str, Any]]):
                     "ts": "",
                     "user": user_id,
                     "thread_ts": None,
+                    "source": "checker",
                 })
                 logger.info(f"[JIRA_PROCESSOR] Enqueued task {task_id} to user {user_id}")
 
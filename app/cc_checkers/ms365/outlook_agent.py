@@ -14,6 +14,7 @@ from claude_agent_sdk import (
     ClaudeSDKClient,
     ResultMessage,
 )
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
 
 
 def create_system_prompt(state_prompt: str, bot_name: str) -> str:
@@ -31,8 +32,6 @@ def create_system_prompt(state_prompt: str, bot_name: str) -> str:
 # 기본 지침
 전달받은 이메일들을 분석하여 **당신에게 할당된 할 일**을 추출하고 DB에 저장하세요.
 
-{state_prompt}
-
 ## 핵심 행동 원칙
 <important_actions>
 1. 전달받은 이메일들을 분석하여 당신에게 할당된 액션 아이템을 추출합니다.
@@ -59,7 +58,9 @@ def create_system_prompt(state_prompt: str, bot_name: str) -> str:
 - FILESYSTEM_BASE_DIR 외부의 파일이나 디렉토리에 절대 접근하지 마세요
 - 시스템 파일, 홈 디렉토리, 설정 파일 등을 읽거나 수정하는 것은 엄격히 금지됩니다
 - 파일 작업은 반드시 FILESYSTEM_BASE_DIR 내부로 제한됩니다
-</guardrails>"""
+</guardrails>
+
+{state_prompt}"""
 
     return system_prompt
 
@@ -185,7 +186,10 @@ async def call_email_task_extractor(
     )
 
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with (
+            llm_slot(LLMTier.SIMPLE, LLMPriority.SCHEDULED, "outlook_agent"),
+            ClaudeSDKClient(options=options) as client,
+        ):
             await client.query(query)
 
             result_message = ""
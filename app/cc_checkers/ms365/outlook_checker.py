@@ -16,6 +16,7 @@ from typing import List, Dict, Any
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient, ResultMessage
 
 from app.config.settings import get_settings
+from app.cc_utils.llm_governor import LLMPriority, LLMTier, llm_slot
 
 settings = get_settings()
 
@@ -117,7 +118,10 @@ Lokka MCP (Microsoft 365 MCP)를 사용하여 읽지 않은 이메일 목록을
             mcp_servers=mcp_servers,
         )
 
-        async with ClaudeSDKClient(options=options) as client:
+        async with (
+            llm_slot(LLMTier.SIMPLE, LLMPriority.SCHEDULED, "outlook_checker"),
+            ClaudeSDKClient(options=options) as client,
+        ):
             await client.query("mcp__ms365__* 도구를 사용해서 받은편지함의 읽지 않은 이메일을 최신 10개까지 조회하고 JSON으로 반환해주세요.")
 
             async for message in client.receive_response():
@@ -206,6 +210,7 @@ async def process_emails_batch(emails: List[Dict[str, Any]]):
             "ts": "",
             "user": user_id,
             "thread_ts": None,
+            "source": "checker",
         })
 
         # 작업 완료 표시
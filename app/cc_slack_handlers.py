@@ -1,10 +1,15 @@
+import asyncio
 import logging
 import random
 import re
-from app.queueing_extended import debounced_enqueue_message, enqueue_orchestrator_job
+from app.queueing_extended import admit_message, debounced_enqueue_message, enqueue_orchestrator_job, is_duplicate_event
+from app.cc_utils.admission import Admission, pick_busy_message
 from app.cc_utils.language_helper import detect_language
-from app.cc_utils.slack_helper import get_slack_context_data
+from app.cc_utils.slack_helper import get_slack_context_data_async
+from app.cc_utils.slack_directory import get_slack_directory
+from app.cc_utils.stage_pipeline import StagePipeline
 from app.cc_agents.bot_call_detector import call_bot_call_detector
+from app.cc_agents.bot_call_detector.agent import detect_bot_call_fast
 from app.cc_agents.bot_thread_context_detector import call_bot_thread_context_detector
 from app.cc_agents.answer_aggregator import call_answer_aggregator
 from app.cc_agents.memory_retriever import call_memory_retriever
@@ -70,9 +75,8 @@ async def get_user_name(user_id: str, client: WebClient) -> str:
         str: display_name or real_name (returns user_id on failure)
     """
     try:
-        response = await client.users_info(user=user_id)
-        if response["ok"]:
-            user = response["user"]
+        user = await get_slack_directory().get_user(user_id, client)
+        if user:
             profile = user.get("profile", {})
             # Prefer display_name, use real_name if not available
             return profile.get("display_name") or user.get("real_name", user_id)
@@ -97,10 +101,9 @@ async def convert_mentions_to_readable(text: str, client: WebClient) -> str:
         user_id = match.group(1)
         if user_id not in user_map:
             try:
-                # Fetch user info via Slack API
-                response = await client.users_info(user=user_id)
-                if response["ok"]:
-                    user = response["user"]
+                # Fetch user info via Slack directory (API only on cache miss)
+                user = await get_slack_directory().get_user(user_id, client)
+                if user:
                     profile = user.get("profile", {})
                     # Prefer display_name, use real_name if not available
                     display_name = profile.get("display_name") or user.get("real_name", f"User {user_id}")
@@ -137,10 +140,12 @@ async def _process_message_logic(message, client):
     # Message received log
     logging.info(f"[MESSAGE_RECEIVED] channel={channel_id}, user={user_id}, text='{user_text[:50]}...', ts={message_ts}")
 
-    # Get user name
-    user_name = await get_user_name(user_id, client)
-
-    user_text = await convert_mentions_to_readable(user_text, client)
+    # Get user name, readable mentions and Slack context concurrently (non-blocking)
+    user_name, user_text, slack_context = await asyncio.gather(
+        get_user_name(user_id, client),
+        convert_mentions_to_readable(user_text, client),
+        get_slack_context_data_async(channel_id, message_limit=10, client=client),
+    )
 
     # Use adapter router to ensure message is in correct format
     # (For Slack, this is a pass-through, but ensures consistency)
@@ -149,13 +154,13 @@ async def _process_message_logic(message, client):
         router = get_adapter_router()
         slack_data, message_data = router.adapt_message(
             message,
-            context={"slack_data": get_slack_context_data(channel_id, message_limit=10)},
+            context={"slack_data": slack_context},
             source="slack"
         )
     except ImportError:
         # Fallback to original behavior if adapters not available
         logging.warning("[SLACK_HANDLERS] Adapter router not available, using original behavior")
-        slack_data = get_slack_context_data(channel_id, message_limit=10)
+        slack_data = slack_context
         message_data = {
             "user_id": user_id,
             "user_name": user_name,
@@ -169,11 +174,77 @@ async def _process_message_logic(message, client):
         if message.get("files"):
             message_data["files"] = message.get("files")
 
+    # Origin of the message (scheduled/checker/voice); orchestrator priority uses it
+    # The adapter marks every message as "slack", so take it from the raw message
+    message_data["source"] = message.get("source") or "slack"
+
+    pipeline = StagePipeline(f"{channel_id}/{message_ts}")
+    outcome = "error"
+    try:
+        outcome = await _triage_message(
+            pipeline, client, user_id, user_name, user_text,
+            channel_id, thread_ts, message_ts, slack_data, message_data
+        )
+    finally:
+        pipeline.finish(outcome)
+
+
+async def _triage_message(
+    pipeline: StagePipeline,
+    client,
+    user_id: str,
+    user_name: str,
+    user_text: str,
+    channel_id: str,
+    thread_ts: str,
+    message_ts: str,
+    slack_data: dict,
+    message_data: dict
+) -> str:
+    """
+    Gates (proactive confirm → bot call → answer aggregator → authorization)
+    followed by memory retrieval and simple_chat / orchestrator.
+
+    Read-only stages (bot call, thread context, memory) start concurrently with
+    the gates and are cancelled as soon as a gate makes them unnecessary.
+
+    Returns the triage outcome: "confirm", "proactive", "ignore",
+    "unauthorized" or "respond".
+    """
+    channel_type = slack_data.get("channel", {}).get("channel_type", "")
+    is_group_channel = channel_type in ["public_channel", "private_channel", "group_dm"]
+    settings = get_settings()
+    fast_result = detect_bot_call_fast(user_text, settings.BOT_NAME or "KIRA", get_bot_user_id())
+    fast_bot_call = fast_result[0]
+
+    # Speculative stages
+    memory_query = f"""Please gather and provide the memory needed to fulfill user {user_name}({user_id})'s request '{user_text}' in channel {channel_id}.
+Be sure to include **guidelines** and information (channel_id, user_id, user_name) about this channel and requesting user."""
+    if is_group_channel:
+        pipeline.start(
+            "bot_call",
+            call_bot_call_detector(user_text, bot_user_id=get_bot_user_id(), fast_result=fast_result)
+        )
+        if thread_ts and fast_bot_call is not True:
+            pipeline.start(
+                "thread_context",
+                call_bot_thread_context_detector(thread_ts, channel_id, user_text, client)
+            )
+    # Skip speculation when the message clearly does not address the bot
+    # or the user could not get an answer anyway
+    clearly_not_called = is_group_channel and fast_bot_call is False and not thread_ts
+    if not clearly_not_called and is_authorized_user(user_name):
+        pipeline.start("memory", call_memory_retriever(memory_query, slack_data, message_data))
+
     # Proactive Confirm check: Check if user responded to pending confirm
     logging.info(f"[PROACTIVE_CONFIRM] Checking for pending confirms (user={user_id}, channel={channel_id}, thread_ts={thread_ts})")
-    approved, original_message = await call_proactive_confirm(user_text, channel_id, user_id, thread_ts)
+    approved, original_message = await pipeline.run(
+        "proactive_confirm",
+        call_proactive_confirm(user_text, channel_id, user_id, thread_ts)
+    )
 
     if approved and original_message:
+        pipeline.cancel("bot_call", "thread_context", "memory", reason="confirm approved")
         logging.info(f"[PROACTIVE_CONFIRM] User approved! Processing original message: '{original_message['user_text'][:50]}...'")
 
         # Check channel type (DM vs group channel)
@@ -240,29 +311,33 @@ Be sure to include **guidelines** and information (channel_id, user_id, user_nam
             "query": original_user_text,
             "slack_data": slack_data,
             "message_data": original_message,
-            "retrieved_memory": retrieved_memory
+            "retrieved_memory": retrieved_memory,
+            "source": "proactive_confirm"  # User-approved, served as an interactive request
         }
         await enqueue_orchestrator_job(orchestrator_job)
         logging.info(f"[PROACTIVE_CONFIRM] Original message enqueued to orchestrator successfully")
-        return
+        return "confirm"
 
     # Bot call check logic for group channels/group DMs
-    channel_type = slack_data.get("channel", {}).get("channel_type", "")
-    if channel_type in ["public_channel", "private_channel", "group_dm"]:
+    if is_group_channel:
         logging.info(f"[BOT_CALL_CHECK] Checking if bot is called in group context (channel={channel_id}, type={channel_type})")
-        is_bot_called = await call_bot_call_detector(user_text)
+        is_bot_called = await pipeline.result("bot_call")
         logging.info(f"[BOT_CALL_RESULT] is_bot_called={is_bot_called}, user_text='{user_text[:50]}...'")
 
         # Check if bot should respond in thread even without explicit call
-        if not is_bot_called and thread_ts:
+        if not is_bot_called and thread_ts and pipeline.is_started("thread_context"):
             logging.info(f"[THREAD_CONTEXT_CHECK] Checking if bot is participating in thread (thread_ts={thread_ts})")
-            is_bot_in_thread = await call_bot_thread_context_detector(thread_ts, channel_id, user_text, client)
+            is_bot_in_thread = await pipeline.result("thread_context")
             logging.info(f"[THREAD_CONTEXT_RESULT] is_bot_in_thread={is_bot_in_thread}")
             if is_bot_in_thread:
                 is_bot_called = True
                 logging.info(f"[THREAD_CONTEXT] Bot participating in thread, treating as bot call")
+        else:
+            pipeline.cancel("thread_context", reason="bot called")
 
         if not is_bot_called:
+            pipeline.cancel("memory", reason="bot not called")
+
             # Proactive system: Check if similar work was done before
             logging.info(f"[PROACTIVE] Checking if bot can proactively suggest help (user={user_id}, channel={channel_id})")
 
@@ -270,41 +345,42 @@ Be sure to include **guidelines** and information (channel_id, user_id, user_nam
             proactive_memory_query = f"""The user made a request '{user_text}'. Please gather memory to check if I've done similar work before.
 Be sure to include **guidelines** and information (channel_id, user_id, user_name) about this channel and requesting user."""
             
-            retrieved_memory = await call_memory_retriever(
-                proactive_memory_query,
-                slack_data,
-                message_data
+            retrieved_memory = await pipeline.run(
+                "proactive_memory",
+                call_memory_retriever(proactive_memory_query, slack_data, message_data)
             )
             logging.info(f"[PROACTIVE] Memory retrieved: {retrieved_memory[:100] if retrieved_memory else 'None'}...")
 
             # 2. Call proactive_suggester
-            suggested = await call_proactive_suggester(
+            suggested = await pipeline.run("proactive_suggester", call_proactive_suggester(
                 user_text=user_text,
                 retrieved_memory=retrieved_memory,
                 slack_data=slack_data,
                 message_data=message_data
-            )
+            ))
 
             if suggested:
                 logging.info(f"[PROACTIVE] Suggestion sent to user, stopping message processing")
-                return
+                return "proactive"
 
             # Exit if no memory or no suggestion made
             logging.info(f"[BOT_CALL_SKIPPED] Bot not called in group channel, skipping message processing")
-            return
+            return "ignore"
         logging.info(f"[BOT_CALLED] Bot was called, proceeding with message processing")
 
     # Response aggregation logic
     logging.info(f"[RESPONSE_PROCESSING] Calling answer_aggregator (user={user_id}, channel={channel_id})")
-    is_answer_completed = await call_answer_aggregator(user_text, message_data)
+    is_answer_completed = await pipeline.run("answer_aggregator", call_answer_aggregator(user_text, message_data))
     logging.info(f"[ANSWER_AGGREGATOR_RESULT] is_answer_completed={is_answer_completed}")
     if is_answer_completed:
+        pipeline.cancel("memory", reason="answer aggregated")
         logging.info(f"[RESPONSE_COMPLETED] Answer aggregator processed the message, skipping simple_chat and orchestrator (user={user_id})")
-        return
+        return "respond"
 
     # Authorization check: Only process authorized users (check for new requests only)
     if not is_authorized_user(user_name):
         logging.info(f"[UNAUTHORIZED] User '{user_name}'({user_id}) is not authorized, skipping message")
+        pipeline.cancel("memory", reason="unauthorized")
 
         # Calculate thread_ts based on channel_type
         channel_type = slack_data.get("channel", {}).get("channel_type", "")
@@ -317,58 +393,36 @@ Be sure to include **guidelines** and information (channel_id, user_id, user_nam
         else:
             final_thread_ts = None
 
-        # 바쁨 응답 메시지 샘플 (언어에 따라 선택)
-        lang = detect_language(user_text)
-
-        if lang == "Korean":
-            busy_messages = [
-                "지금 급한 업무가 있어서 조금 있다가 답변드릴게요.",
-                "팀 업무로 바빠서 답변이 어렵습니다. 죄송합니다.",
-                "급한 일 처리 중이라 시간이 좀 걸릴 것 같아요.",
-                "지금은 다른 작업 중이라 나중에 확인하고 답변드릴게요.",
-                "업무 중이라 바로 답변이 어려울 것 같습니다. 조금만 기다려주세요."
-            ]
-        else:
-            busy_messages = [
-                "I'm busy with urgent work right now. I'll get back to you soon.",
-                "I'm tied up with team work at the moment. Sorry about that.",
-                "I'm handling something urgent, so it might take a while.",
-                "I'm working on something else right now. I'll check and respond later.",
-                "I'm in the middle of work, so I can't respond immediately. Please wait a moment."
-            ]
-
         # Send message
         post_params = {
             "channel": channel_id,
-            "text": random.choice(busy_messages)
+            "text": pick_busy_message(user_text)
         }
 
         if final_thread_ts:
             post_params["thread_ts"] = final_thread_ts
 
         await client.chat_postMessage(**post_params)
-        return
+        return "unauthorized"
 
-    # Memory retrieval (shared by simple_chat and orchestrator)
+    # Memory retrieval (shared by simple_chat and orchestrator; usually already running)
     logging.info(f"[MEMORY_RETRIEVER] Retrieving memory (user={user_id}, channel={channel_id})")
-    memory_query = f"""Please gather and provide the memory needed to fulfill user {user_name}({user_id})'s request '{user_text}' in channel {channel_id}.
-Be sure to include **guidelines** and information (channel_id, user_id, user_name) about this channel and requesting user."""
-    
-    retrieved_memory = await call_memory_retriever(
-        memory_query,
-        slack_data,
-        message_data
-    )
+    if not pipeline.is_started("memory"):
+        pipeline.start("memory", call_memory_retriever(memory_query, slack_data, message_data))
+    retrieved_memory = await pipeline.result("memory")
     logging.info(f"[MEMORY_RETRIEVER] Memory retrieved: {retrieved_memory[:100] if retrieved_memory else 'None'}...")
 
     logging.info(f"[SIMPLE_CHAT] Calling simple_chat agent (user={user_id}, channel={channel_id})")
-    is_simple_completed = await call_simple_chat(user_text, slack_data, message_data, retrieved_memory)
+    is_simple_completed = await pipeline.run(
+        "simple_chat",
+        call_simple_chat(user_text, slack_data, message_data, retrieved_memory)
+    )
     logging.info(f"[SIMPLE_CHAT_RESULT] is_simple_completed={is_simple_completed}")
 
     # Skip orchestrator if simple_chat handled the message
     if is_simple_completed:
         logging.info(f"[RESPONSE_COMPLETED] Simple chat processed the message, skipping orchestrator (user={user_id})")
-        return
+        return "respond"
 
     # Complex task → forward to orchestrator
     logging.info(f"[ORCHESTRATOR_ENQUEUE] Enqueuing orchestrator job (user={user_id}, channel={channel_id})")
@@ -376,11 +430,60 @@ Be sure to include **guidelines** and information (channel_id, user_id, user_nam
         "query": user_text,
         "slack_data": slack_data,
         "message_data": message_data,
-        "retrieved_memory": retrieved_memory  # Pass already retrieved memory
+        "retrieved_memory": retrieved_memory,  # Pass already retrieved memory
+        "source": message_data.get("source")
     }
     await enqueue_orchestrator_job(orchestrator_job)
     logging.info(f"[ORCHESTRATOR_ENQUEUED] Orchestrator job enqueued successfully (user={user_id})")
-    
+    return "respond"
+
+# =============================================
+# Admission (load shedding before queueing)
+# =============================================
+
+async def admit_or_shed(event: dict, client, addressed: bool) -> bool:
+    """
+    Admission check before queueing a message (never waits on a full queue).
+
+    Returns True if the message should be queued. Shed messages are either
+    dropped silently or answered with a busy reply.
+    """
+    decision = admit_message(event, addressed=addressed)
+    if decision == Admission.ADMIT:
+        return True
+
+    if decision == Admission.BUSY_REPLY:
+        post_params = {
+            "channel": event.get("channel"),
+            "text": pick_busy_message(event.get("text", ""))
+        }
+        # Group channels: reply in thread / DMs: keep the conversation's thread
+        if event.get("channel_type") in ["channel", "group"]:
+            post_params["thread_ts"] = event.get("thread_ts") or event.get("ts")
+        elif event.get("thread_ts"):
+            post_params["thread_ts"] = event.get("thread_ts")
+        try:
+            await client.chat_postMessage(**post_params)
+        except Exception as e:
+            logging.warning(f"[ADMISSION] Failed to send busy reply: {e}")
+    return False
+
+
+async def enqueue_if_admitted(event: dict, body: dict, client, addressed: bool):
+    """Queue a message (debounced) unless it is a duplicate delivery or admission control sheds it"""
+    if await is_duplicate_event(event, body):
+        return
+    if await admit_or_shed(event, client, addressed):
+        await debounced_enqueue_message(event)
+
+
+def is_addressed_to_bot(event: dict) -> bool:
+    """Cheap check whether a channel message may be directed at the bot (mention, direct address by name or thread reply)"""
+    is_called, _ = detect_bot_call_fast(event.get("text", ""), get_settings().BOT_NAME or "KIRA", get_bot_user_id())
+    if is_called:
+        return True
+    return bool(event.get("thread_ts"))
+
 # =============================================
 # Slack Event Handler Registration
 # =============================================
@@ -405,9 +508,8 @@ def register_handlers(app):
             return False
 
         try:
-            # Check if bot is a member by fetching channel info
-            result = await client.conversations_info(channel=channel_id)
-            return result.get("channel", {}).get("is_member", False)
+            # Check membership via Slack directory (kept current by channel events)
+            return await get_slack_directory().is_bot_member(channel_id, client)
         except Exception as e:
             # Return False if channel info fetch fails (e.g., no permission)
             logging.debug(f"Channel membership check failed for {channel_id}: {e}")
@@ -443,12 +545,12 @@ def register_handlers(app):
 
         # Check file message (before subtype check!)
         if await has_files(body):
-            await debounced_enqueue_message(event, delay_seconds=5.0)
+            await enqueue_if_admitted(event, body, client, addressed=True)
             return
 
         # Check link message
         if await has_links(body):
-            await debounced_enqueue_message(event, delay_seconds=5.0)
+            await enqueue_if_admitted(event, body, client, addressed=True)
             return
 
         # Ignore messages with subtype (edit, delete, etc.)
@@ -457,7 +559,7 @@ def register_handlers(app):
             return
 
         # Process pure text messages (both normal and thread messages)
-        await debounced_enqueue_message(event, delay_seconds=5.0)
+        await enqueue_if_admitted(event, body, client, addressed=True)
         return
 
 
@@ -479,12 +581,12 @@ def register_handlers(app):
 
         # Check file message (before subtype check!)
         if await has_files(body):
-            await debounced_enqueue_message(event, delay_seconds=5.0)
+            await enqueue_if_admitted(event, body, client, addressed=is_addressed_to_bot(event))
             return
 
         # Check link message
         if await has_links(body):
-            await debounced_enqueue_message(event, delay_seconds=5.0)
+            await enqueue_if_admitted(event, body, client, addressed=is_addressed_to_bot(event))
             return
 
         # Ignore messages with subtype (edit, delete, etc.)
@@ -493,7 +595,7 @@ def register_handlers(app):
             return
 
         # Process pure text messages (both normal and thread messages)
-        await debounced_enqueue_message(event, delay_seconds=5.0)
+        await enqueue_if_admitted(event, body, client, addressed=is_addressed_to_bot(event))
         return
 
 
@@ -520,25 +622,46 @@ def register_handlers(app):
     async def ignore_link_shared(body, logger):
         logger.debug("link_shared event ignored (already handled via message event)")
 
+    # === Slack directory updates ===
+
+    # user_change - profile/name changed
+    @app.event("user_change")
+    async def handle_user_change(body, logger):
+        user = body.get("event", {}).get("user", {})
+        get_slack_directory().on_user_change(user)
+        logger.debug(f"user_change applied to directory: {user.get('id')}")
+
     # member_joined_channel - member joined channel
     @app.event("member_joined_channel")
-    async def ignore_member_joined(body, logger):
-        logger.debug("member_joined_channel event ignored")
+    async def handle_member_joined(body, logger):
+        event = body.get("event", {})
+        user_id = event.get("user")
+        get_slack_directory().on_member_joined(
+            event.get("channel"), user_id, is_self=user_id == get_bot_user_id()
+        )
+        logger.debug(f"member_joined_channel applied to directory: {user_id} -> {event.get('channel')}")
 
     # member_left_channel - member left channel
     @app.event("member_left_channel")
-    async def ignore_member_left(body, logger):
-        logger.debug("member_left_channel event ignored")
+    async def handle_member_left(body, logger):
+        event = body.get("event", {})
+        user_id = event.get("user")
+        get_slack_directory().on_member_left(
+            event.get("channel"), user_id, is_self=user_id == get_bot_user_id()
+        )
+        logger.debug(f"member_left_channel applied to directory: {user_id} <- {event.get('channel')}")
 
     # channel_left - bot left/removed from channel
     @app.event("channel_left")
-    async def ignore_channel_left(body, logger):
-        logger.debug("channel_left event ignored")
+    async def handle_channel_left(body, logger):
+        channel_id = body.get("event", {}).get("channel")
+        get_slack_directory().on_bot_left(channel_id)
 
     # group_left - bot left group
     @app.event("group_left")
-    async def ignore_group_left(body, logger):
-        logger.debug("group_left event ignored")
+    async def handle_group_left(body, logger):
+        channel_id = body.get("event", {}).get("channel")
+        get_slack_directory().on_bot_left(channel_id)
 
     # All other message subtypes (edit, delete, join/leave, etc.)
     @app.event("message")
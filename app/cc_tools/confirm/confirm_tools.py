@@ -11,17 +11,13 @@ from claude_agent_sdk import create_sdk_mcp_server, tool
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 
-from app.config.settings import get_settings
 from app.cc_utils.confirm_db import add_confirm_request
+from app.cc_utils.slack_client_pool import get_pooled_slack_client
 
 
 def get_slack_client() -> AsyncWebClient:
-    """Return Slack AsyncWebClient instance"""
-    settings = get_settings()
-    token = settings.SLACK_BOT_TOKEN
-    if not token:
-        raise ValueError("SLACK_BOT_TOKEN is not set in settings")
-    return AsyncWebClient(token=token)
+    """Return the shared, rate-limit-aware Slack AsyncWebClient"""
+    return get_pooled_slack_client()
 
 
 @tool(
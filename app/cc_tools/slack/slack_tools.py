@@ -14,15 +14,13 @@ from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 
 from app.config.settings import get_settings
+from app.cc_utils.slack_client_pool import get_pooled_slack_client
+from app.cc_utils.slack_directory import get_slack_directory
 
 
 def get_slack_client() -> AsyncWebClient:
-    """Return Slack AsyncWebClient instance"""
-    settings = get_settings()
-    token = settings.SLACK_BOT_TOKEN
-    if not token:
-        raise ValueError("SLACK_BOT_TOKEN is not set in settings")
-    return AsyncWebClient(token=token)
+    """Return the shared, rate-limit-aware Slack AsyncWebClient"""
+    return get_pooled_slack_client()
 
 
 
@@ -957,11 +955,9 @@ async def slack_get_user_profile(args: Dict[str, Any]) -> Dict[str, Any]:
     user_id = args["user_id"]
 
     try:
-        client = get_slack_client()
-        response = await client.users_info(user=user_id)
+        user = await get_slack_directory().get_user(user_id, get_slack_client())
 
-        if response and response.get("ok"):
-            user = response.get("user", {})
+        if user:
             profile = user.get("profile", {})
 
             return {
@@ -1376,8 +1372,9 @@ async def slack_find_user_by_name(args: Dict[str, Any]) -> Dict[str, Any]:
     search_name = args["name"].strip().lower()
 
     try:
-        client = get_slack_client()
-        response = await client.users_list()
+        # Directory searches its user list, reloading it when stale or on a miss
+        members = await get_slack_directory().search_users(search_name)
+        response = {"ok": True, "members": members}
 
         if response and response.get("ok"):
             members = response.get("members", [])
@@ -1469,11 +1466,9 @@ async def slack_get_channel_info(args: Dict[str, Any]) -> Dict[str, Any]:
     channel_id = args["channel_id"]
 
     try:
-        client = get_slack_client()
-        response = await client.conversations_info(channel=channel_id)
+        channel = await get_slack_directory().get_channel(channel_id, get_slack_client())
 
-        if response and response.get("ok"):
-            channel = response.get("channel", {})
+        if channel:
 
             return {
                 "content": [{
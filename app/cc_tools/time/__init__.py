@@ -0,0 +1 @@
+"""Claude SDK Tools"""
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""
+Time Tools for Claude Code SDK
+In-process replacement for the npx time MCP server
+"""
+
+import json
+from typing import Any, Dict
+
+from claude_agent_sdk import create_sdk_mcp_server, tool
+
+from app.cc_utils import time_helper
+
+
+def _result(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "content": [{
+            "type": "text",
+            "text": json.dumps(payload, ensure_ascii=False, indent=2)
+        }]
+    }
+
+
+def _error(message: str) -> Dict[str, Any]:
+    return {
+        "content": [{
+            "type": "text",
+            "text": json.dumps({
+                "success": False,
+                "error": True,
+                "message": message
+            }, ensure_ascii=False, indent=2)
+        }],
+        "error": True
+    }
+
+
+@tool(
+    "get_current_time",
+    "Returns the current date and time. Uses the server's local timezone unless an IANA timezone is given.",
+    {
+        "type": "object",
+        "properties": {
+            "timezone": {
+                "type": "string",
+                "description": "IANA timezone name (e.g., 'Asia/Seoul', 'America/New_York'). Optional"
+            }
+        },
+        "required": []
+    }
+)
+async def time_get_current_time(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the current time"""
+    try:
+        return _result(time_helper.describe_time(time_helper.now_in(args.get("timezone"))))
+    except ValueError as e:
+        return _error(str(e))
+
+
+@tool(
+    "convert_time",
+    "Converts a time from one timezone to another.",
+    {
+        "type": "object",
+        "properties": {
+            "time": {
+                "type": "string",
+                "description": "'HH:MM' (today in the source timezone) or 'YYYY-MM-DD HH:MM:SS'"
+            },
+            "source_timezone": {
+                "type": "string",
+                "description": "IANA timezone of the given time. Defaults to the server's local timezone"
+            },
+            "target_timezone": {
+                "type": "string",
+                "description": "IANA timezone to convert to. Defaults to the server's local timezone"
+            }
+        },
+        "required": ["time"]
+    }
+)
+async def time_convert_time(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a time between timezones"""
+    try:
+        return _result(time_helper.convert_time(
+            args["time"],
+            args.get("source_timezone"),
+            args.get("target_timezone"),
+        ))
+    except ValueError as e:
+        return _error(str(e))
+
+
+@tool(
+    "resolve_relative_date",
+    "Resolves a relative date expression in Korean or English (e.g., '어제', '다음주 월요일', '지난달', '3 days ago', 'last week') to a start/end date range. Weeks run Monday to Sunday.",
+    {
+        "type": "object",
+        "properties": {
+            "expression": {
+                "type": "string",
+                "description": "Relative date expression"
+            },
+            "timezone": {
+                "type": "string",
+                "description": "IANA timezone that defines 'today'. Defaults to the server's local timezone"
+            }
+        },
+        "required": ["expression"]
+    }
+)
+async def time_resolve_relative_date(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve a relative date expression"""
+    try:
+        now = time_helper.now_in(args.get("timezone"))
+        return _result(time_helper.resolve_relative_date(args["expression"], now))
+    except ValueError as e:
+        return _error(str(e))
+
+
+time_tools = [
+    time_get_current_time,
+    time_convert_time,
+    time_resolve_relative_date,
+]
+
+
+def create_time_mcp_server():
+    """Time MCP server for Claude Code SDK"""
+    return create_sdk_mcp_server(
+        name="time",
+        version="1.0.0",
+        tools=time_tools
+    )
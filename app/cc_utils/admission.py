@@ -0,0 +1,122 @@
+"""
+Admission Control
+Decides, before a Slack event is queued, whether the bot can take it
+
+Checks are cheap and never block, so the Bolt listener acks Socket Mode
+events immediately even under overload (no Slack retries / duplicates).
+
+- Low-priority events (group channel chatter that does not address the bot)
+  are dropped first, as soon as a queue passes its soft limit.
+- Events addressed to the bot are queued until the hard limit, after which
+  the user gets a busy reply instead (at most one per user per cooldown).
+"""
+
+import logging
+import random
+from collections import Counter
+from enum import Enum
+from typing import Dict
+
+from app.cc_utils.language_helper import detect_language
+from app.cc_utils.ttl_cache import TTLCache
+
+BUSY_MESSAGES = {
+    "Korean": [
+        "지금 급한 업무가 있어서 조금 있다가 답변드릴게요.",
+        "팀 업무로 바빠서 답변이 어렵습니다. 죄송합니다.",
+        "급한 일 처리 중이라 시간이 좀 걸릴 것 같아요.",
+        "지금은 다른 작업 중이라 나중에 확인하고 답변드릴게요.",
+        "업무 중이라 바로 답변이 어려울 것 같습니다. 조금만 기다려주세요."
+    ],
+    "English": [
+        "I'm busy with urgent work right now. I'll get back to you soon.",
+        "I'm tied up with team work at the moment. Sorry about that.",
+        "I'm handling something urgent, so it might take a while.",
+        "I'm working on something else right now. I'll check and respond later.",
+        "I'm in the middle of work, so I can't respond immediately. Please wait a moment."
+    ],
+}
+
+# Minimum seconds between two busy replies to the same user
+BUSY_REPLY_COOLDOWN_SECONDS = 60
+
+
+def pick_busy_message(user_text: str) -> str:
+    """Random busy reply in the user's language"""
+    lang = detect_language(user_text)
+    return random.choice(BUSY_MESSAGES["Korean" if lang == "Korean" else "English"])
+
+
+class Admission(Enum):
+    ADMIT = "admit"
+    BUSY_REPLY = "busy_reply"  # Not queued; tell the user we're busy
+    DROP = "drop"              # Not queued; no reply
+
+
+class AdmissionController:
+    """
+    Queue-depth based admission with soft/hard thresholds.
+
+    Args:
+        channel_soft_limit / channel_hard_limit: Pending messages in one channel
+        orchestrator_soft_limit / orchestrator_hard_limit: Queued orchestrator jobs
+    """
+
+    def __init__(
+        self,
+        channel_soft_limit: int,
+        channel_hard_limit: int,
+        orchestrator_soft_limit: int,
+        orchestrator_hard_limit: int
+    ):
+        self.channel_soft_limit = channel_soft_limit
+        self.channel_hard_limit = channel_hard_limit
+        self.orchestrator_soft_limit = orchestrator_soft_limit
+        self.orchestrator_hard_limit = orchestrator_hard_limit
+        self._busy_replied = TTLCache(ttl_seconds=BUSY_REPLY_COOLDOWN_SECONDS)
+        self.shed: Counter = Counter()
+        self.admitted = 0
+
+    def load_level(self, channel_depth: int, orchestrator_depth: int) -> str:
+        """'normal', 'soft' or 'hard'"""
+        if channel_depth >= self.channel_hard_limit or orchestrator_depth >= self.orchestrator_hard_limit:
+            return "hard"
+        if channel_depth >= self.channel_soft_limit or orchestrator_depth >= self.orchestrator_soft_limit:
+            return "soft"
+        return "normal"
+
+    def decide(self, user_id: str, addressed: bool, channel_depth: int, orchestrator_depth: int) -> Admission:
+        """
+        Admission decision for one event.
+
+        Args:
+            user_id: Sender
+            addressed: Whether the event is directed at the bot (DM, mention, bot thread)
+            channel_depth: Messages pending in the event's channel
+            orchestrator_depth: Jobs queued for the orchestrator
+        """
+        level = self.load_level(channel_depth, orchestrator_depth)
+
+        if level == "normal" or (level == "soft" and addressed):
+            self.admitted += 1
+            return Admission.ADMIT
+
+        if not addressed:
+            self.shed[f"{level}:low_priority"] += 1
+            decision = Admission.DROP
+        elif user_id in self._busy_replied:
+            self.shed[f"{level}:busy_suppressed"] += 1
+            decision = Admission.DROP
+        else:
+            self._busy_replied.set(user_id, True)
+            self.shed[f"{level}:busy_reply"] += 1
+            decision = Admission.BUSY_REPLY
+
+        logging.warning(
+            f"[ADMISSION] Shed event from {user_id} ({decision.value}, load={level}, "
+            f"channel_depth={channel_depth}, orchestrator_depth={orchestrator_depth}, shed={dict(self.shed)})"
+        )
+        return decision
+
+    def stats(self) -> Dict[str, int]:
+        return {"admitted": self.admitted, **self.shed}
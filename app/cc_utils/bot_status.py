@@ -0,0 +1,110 @@
+"""
+Bot Status Reconciler
+Keeps the bot's Slack status (busy/idle) in line with orchestrator load
+
+Workers only report load (`set_load`), which never blocks. A background task
+compares the desired state with the last state written to Slack and calls
+`users.profile.set` only on a real transition that has held for a settle
+period (hysteresis), so rapid busy/idle flips collapse into at most one write.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+BUSY_PROFILE = {
+    "status_text": "i'm busy",
+    "status_emoji": ":hourglass_flowing_sand:"
+}
+IDLE_PROFILE = {
+    "status_text": "",
+    "status_emoji": "",
+    "status_expiration": 0
+}
+
+
+class BotStatusReconciler:
+    """
+    Desired-state reconciler for the bot's busy status.
+
+    Args:
+        client: Slack AsyncWebClient
+        busy_settle_seconds: Busy must hold this long before it is shown
+        idle_settle_seconds: Idle must hold this long before busy is cleared
+        min_interval_seconds: Minimum time between two profile writes
+    """
+
+    def __init__(
+        self,
+        client,
+        busy_settle_seconds: float = 2.0,
+        idle_settle_seconds: float = 10.0,
+        min_interval_seconds: float = 15.0
+    ):
+        self._client = client
+        self.busy_settle_seconds = busy_settle_seconds
+        self.idle_settle_seconds = idle_settle_seconds
+        self.min_interval_seconds = min_interval_seconds
+
+        self.desired_busy = False
+        self.applied_busy: Optional[bool] = None  # Unknown until the first write
+        self._desired_since = time.monotonic()
+        self._last_write = 0.0
+        self._changed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._supported = True
+        self.writes = 0
+        self.reports = 0
+
+    def set_load(self, active: int, capacity: int) -> None:
+        """Report current load (non-blocking); busy when every worker is occupied"""
+        self.reports += 1
+        busy = active >= capacity
+        if busy != self.desired_busy:
+            self.desired_busy = busy
+            self._desired_since = time.monotonic()
+            self._changed.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def _settle_seconds(self) -> float:
+        return self.busy_settle_seconds if self.desired_busy else self.idle_settle_seconds
+
+    async def _run(self) -> None:
+        # Startup: the status may be stale from a previous run, so reconcile once
+        self._changed.set()
+        while self._supported:
+            await self._changed.wait()
+            self._changed.clear()
+
+            # Wait until the desired state has held for its settle period and the
+            # write interval has passed; any flip restarts the wait
+            while self._supported and self.desired_busy != self.applied_busy:
+                now = time.monotonic()
+                wait = self._last_write + self.min_interval_seconds - now
+                if self.applied_busy is not None:
+                    wait = max(wait, self._desired_since + self._settle_seconds() - now)
+                if wait > 0:
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), timeout=wait)
+                        self._changed.clear()
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                await self._apply(self.desired_busy)
+
+    async def _apply(self, busy: bool) -> None:
+        self._last_write = time.monotonic()
+        try:
+            await self._client.users_profile_set(profile=BUSY_PROFILE if busy else IDLE_PROFILE)
+            self.writes += 1
+            self.applied_busy = busy
+            logging.info(f"[STATUS] Bot status {'updated to BUSY' if busy else 'cleared'} (writes={self.writes}, reports={self.reports})")
+        except Exception as e:
+            if "not_allowed_token_type" in str(e):
+                logging.debug(f"[STATUS] Bot status update not supported with current token type, disabling")
+                self._supported = False
+            else:
+                # Retried after min_interval_seconds
+                logging.warning(f"[STATUS] Failed to update bot status: {e}")
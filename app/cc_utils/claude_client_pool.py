@@ -0,0 +1,269 @@
+"""
+Claude Client Pool
+Warm, reusable ClaudeSDKClient sessions per agent profile.
+
+Opening a ClaudeSDKClient starts a CLI subprocess and registers its MCP
+servers, which dominates the latency of short classifier agents. Clients are
+kept per profile (system prompt, model, tools, MCP servers) and handed out
+again after their conversation is cleared:
+
+    async with (
+        llm_slot(LLMTier.SIMPLE, LLMPriority.INTERACTIVE, "bot_call_detector"),
+        get_claude_client_pool().client(options, "bot_call_detector") as client,
+    ):
+        ...
+
+- Conversation state is reset with /clear before a client is reused
+- Clients are recycled after CLAUDE_POOL_MAX_USES uses, when their process
+  exceeds CLAUDE_POOL_MAX_RSS_MB, or after sitting idle too long
+- A client whose use raised an error is never reused
+
+Only agents with a static system prompt benefit; prompts containing the
+current time or state produce a new profile per call.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+import psutil
+from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+
+from app.config.settings import get_settings
+
+IDLE_TTL_SECONDS = 10 * 60
+RESET_TIMEOUT_SECONDS = 30
+CONNECT_TIMEOUT_SECONDS = 60
+
+
+def profile_key(options: ClaudeAgentOptions) -> str:
+    """Identity of everything that is fixed for the lifetime of a client"""
+    profile = {
+        "system_prompt": options.system_prompt,
+        "model": options.model,
+        "permission_mode": options.permission_mode,
+        "allowed_tools": list(options.allowed_tools or []),
+        "disallowed_tools": list(options.disallowed_tools or []),
+        "mcp_servers": sorted((options.mcp_servers or {}).keys())
+        if isinstance(options.mcp_servers, dict) else str(options.mcp_servers),
+        "setting_sources": list(options.setting_sources or []),
+        "cwd": str(options.cwd),
+        "env": options.env or {},
+    }
+    encoded = json.dumps(profile, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class _PooledClient:
+    """
+    A connected client plus the task that owns its connection.
+
+    The SDK ties a client's internal task group to the task that connected
+    it, so connect() and disconnect() both run in a dedicated owner task while
+    callers only query/receive.
+    """
+
+    def __init__(self, key: str, profile: str):
+        self.key = key
+        self.profile = profile
+        self.client: Optional[ClaudeSDKClient] = None
+        self.uses = 0
+        self.last_used = time.monotonic()
+        self._closing = asyncio.Event()
+        self._owner: Optional[asyncio.Task] = None
+
+    async def open(self, options: ClaudeAgentOptions) -> None:
+        ready = asyncio.get_running_loop().create_future()
+        self._owner = asyncio.create_task(self._own(options, ready))
+        self.client = await asyncio.wait_for(asyncio.shield(ready), CONNECT_TIMEOUT_SECONDS)
+
+    async def _own(self, options: ClaudeAgentOptions, ready: asyncio.Future) -> None:
+        client = ClaudeSDKClient(options=options)
+        try:
+            await client.connect()
+            if ready.done():
+                return
+            ready.set_result(client)
+            await self._closing.wait()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            try:
+                await client.disconnect()
+            except Exception as e:
+                logging.debug(f"[CLAUDE_POOL] Disconnect failed ({self.profile}): {e}")
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._owner is not None:
+            try:
+                await self._owner
+            except BaseException:
+                pass
+
+    def rss_mb(self) -> Optional[float]:
+        """Resident memory of the CLI process (and its children), if known"""
+        # No public accessor for the subprocess; tolerate SDK internals changing
+        transport = getattr(self.client, "_transport", None)
+        pid = getattr(getattr(transport, "_process", None), "pid", None)
+        if pid is None:
+            return None
+        try:
+            process = psutil.Process(pid)
+            rss = process.memory_info().rss
+            for child in process.children(recursive=True):
+                rss += child.memory_info().rss
+            return rss / (1024 * 1024)
+        except psutil.Error:
+            return None
+
+
+class ClaudeClientPool:
+    """Per-profile pool of idle, connected ClaudeSDKClient instances"""
+
+    def __init__(self, max_idle_per_profile: int = 2, max_uses: int = 50, max_rss_mb: float = 1024):
+        self.max_idle_per_profile = max_idle_per_profile
+        self.max_uses = max_uses
+        self.max_rss_mb = max_rss_mb
+        self._idle: Dict[str, Deque[_PooledClient]] = {}
+        self._background: set = set()
+        self.hits = 0
+        self.misses = 0
+        self.recycled = 0
+        self.discarded = 0
+
+    def _take_idle(self, key: str) -> Optional[_PooledClient]:
+        idle = self._idle.get(key)
+        now = time.monotonic()
+        while idle:
+            pooled = idle.pop()  # Most recently used first
+            if now - pooled.last_used <= IDLE_TTL_SECONDS:
+                return pooled
+            self._spawn(pooled.close())
+        return None
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    @asynccontextmanager
+    async def client(self, options: ClaudeAgentOptions, profile: str = "unknown") -> AsyncIterator[ClaudeSDKClient]:
+        """
+        Borrow a connected client for `options`.
+
+        Args:
+            options: Agent options (also identify the pool profile)
+            profile: Agent name used in logs/metrics
+        """
+        if self.max_idle_per_profile <= 0:
+            async with ClaudeSDKClient(options=options) as client:
+                yield client
+            return
+
+        key = profile_key(options)
+        pooled = self._take_idle(key)
+        if pooled is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            pooled = _PooledClient(key, profile)
+            try:
+                await pooled.open(options)
+            except BaseException:
+                self._spawn(pooled.close())
+                raise
+
+        succeeded = False
+        try:
+            yield pooled.client
+            succeeded = True
+        finally:
+            pooled.uses += 1
+            pooled.last_used = time.monotonic()
+            if succeeded:
+                self._spawn(self._reset_and_return(pooled))
+            else:
+                self.discarded += 1
+                self._spawn(pooled.close())
+
+    async def _reset_and_return(self, pooled: _PooledClient) -> None:
+        rss = pooled.rss_mb()
+        if pooled.uses >= self.max_uses or (rss is not None and rss > self.max_rss_mb):
+            self.recycled += 1
+            logging.info(
+                f"[CLAUDE_POOL] Recycling {pooled.profile} client "
+                f"(uses={pooled.uses}, rss={rss if rss is None else round(rss)}MB)"
+            )
+            await pooled.close()
+            return
+
+        idle = self._idle.setdefault(pooled.key, deque())
+        if len(idle) >= self.max_idle_per_profile:
+            await pooled.close()
+            return
+
+        try:
+            await asyncio.wait_for(self._clear(pooled.client), RESET_TIMEOUT_SECONDS)
+        except Exception as e:
+            logging.warning(f"[CLAUDE_POOL] Failed to reset {pooled.profile} client: {e}")
+            self.discarded += 1
+            await pooled.close()
+            return
+
+        idle.append(pooled)
+
+    @staticmethod
+    async def _clear(client: ClaudeSDKClient) -> None:
+        await client.query("/clear")
+        async for _ in client.receive_response():
+            pass
+
+    async def close_all(self) -> None:
+        """Disconnect every idle client (shutdown)"""
+        idle = [pooled for clients in self._idle.values() for pooled in clients]
+        self._idle.clear()
+        await asyncio.gather(*(pooled.close() for pooled in idle), return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool hit/miss and recycling counters"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "recycled": self.recycled,
+            "discarded": self.discarded,
+            "idle": sum(len(clients) for clients in self._idle.values()),
+            "profiles": len(self._idle),
+        }
+
+
+# Global pool instance
+_claude_client_pool: Optional[ClaudeClientPool] = None
+
+
+def get_claude_client_pool() -> ClaudeClientPool:
+    """
+    Get or create global Claude client pool instance.
+
+    Returns:
+        ClaudeClientPool instance
+    """
+    global _claude_client_pool
+    if _claude_client_pool is None:
+        settings = get_settings()
+        _claude_client_pool = ClaudeClientPool(
+            max_idle_per_profile=settings.CLAUDE_POOL_SIZE,
+            max_uses=settings.CLAUDE_POOL_MAX_USES,
+            max_rss_mb=settings.CLAUDE_POOL_MAX_RSS_MB,
+        )
+    return _claude_client_pool
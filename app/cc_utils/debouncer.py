@@ -0,0 +1,154 @@
+"""
+Timer Wheel Debouncer
+One background task drives the debounce timers of every (channel, user) key
+
+Deadlines live in a hashed timer wheel (TICK_SECONDS per slot). Re-arming a
+key only updates its deadline; stale wheel entries are skipped when their slot
+comes around, so a burst of messages costs no task creation or cancellation.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+TICK_SECONDS = 0.1
+WHEEL_SLOTS = 512
+
+# Short replies/commands ("/status", "!help me") that should not wait for more input
+# Paths ("/home/...") and exclamations ("!!!") are not commands
+_IMMEDIATE_PATTERN = re.compile(
+    r"^\s*(?:[!/][a-z_-]+(?:\s.*)?|stop|cancel|yes|no|ok|okay|네|예|아니요|아니오|응|취소|중지|멈춰|그만)\s*[.!]?\s*$",
+    re.IGNORECASE
+)
+
+# A message that reads like a finished thought (question, sentence end, Korean final endings)
+_COMPLETE_PATTERN = re.compile(r"(?:[?？.!。]|요|다|까|죠|세요|니다|해줘|줘|해)\s*$")
+
+# Typing continues: trailing conjunctions, commas, ellipses
+_CONTINUATION_PATTERN = re.compile(r"(?:[,:~]|\.\.\.|…|그리고|근데|그런데|and|but|also)\s*$", re.IGNORECASE)
+
+
+def adaptive_delay(
+    message: dict,
+    short_seconds: float,
+    default_seconds: float,
+    long_seconds: float
+) -> float:
+    """
+    Debounce delay for a message.
+
+    - 0: clear commands and one-word answers (process now)
+    - long: files, links, or text that is obviously unfinished
+    - short: a single complete sentence/question
+    - default: everything else
+    """
+    text = (message.get("text") or "").strip()
+
+    if message.get("files") or message.get("subtype") == "file_share":
+        return long_seconds
+    if "http://" in text or "https://" in text:
+        return long_seconds
+    if not text:
+        return default_seconds
+    if _IMMEDIATE_PATTERN.match(text):
+        return 0
+    if _CONTINUATION_PATTERN.search(text):
+        return long_seconds
+    if _COMPLETE_PATTERN.search(text) and len(text) >= 5:
+        return short_seconds
+    return default_seconds
+
+
+class TimerWheelDebouncer:
+    """
+    Debounce timers for many keys driven by a single task.
+
+    `touch(key, delay)` (re)arms a key; the deadline is `now + delay` but never
+    later than `max_wait_seconds` after the key was first touched, so a
+    continuous stream of messages still flushes. When a deadline passes,
+    `on_fire(key)` is run as a task.
+    """
+
+    def __init__(self, on_fire: Callable[[str], Awaitable[None]], max_wait_seconds: float = 15.0):
+        self._on_fire = on_fire
+        self.max_wait_seconds = max_wait_seconds
+        self._wheel: List[Set[str]] = [set() for _ in range(WHEEL_SLOTS)]
+        self._deadline_tick: Dict[str, int] = {}
+        self._first_touch: Dict[str, float] = {}
+        self._origin = time.monotonic()
+        self._tick = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._driver: Optional[asyncio.Task] = None
+        self.fired = 0
+
+    def _now_tick(self) -> int:
+        return int((time.monotonic() - self._origin) / TICK_SECONDS)
+
+    def pending(self) -> int:
+        return len(self._deadline_tick)
+
+    def touch(self, key: str, delay_seconds: float) -> float:
+        """Arm or re-arm `key`; returns the effective delay"""
+        now = time.monotonic()
+        first = self._first_touch.setdefault(key, now)
+        delay = max(0.0, min(delay_seconds, first + self.max_wait_seconds - now))
+
+        # Never schedule into the slot currently being processed
+        tick = max(self._tick + 1, int((now + delay - self._origin) / TICK_SECONDS))
+        self._deadline_tick[key] = tick
+        self._wheel[tick % WHEEL_SLOTS].add(key)
+        self._ensure_driver()
+        return delay
+
+    def fire_now(self, key: str) -> None:
+        """Flush `key` immediately"""
+        self._forget(key)
+        self._dispatch(key)
+
+    def _forget(self, key: str) -> None:
+        self._deadline_tick.pop(key, None)
+        self._first_touch.pop(key, None)
+
+    def _dispatch(self, key: str) -> None:
+        self.fired += 1
+        task = asyncio.create_task(self._on_fire(key))
+        task.add_done_callback(lambda t: self._log_failure(key, t))
+
+    @staticmethod
+    def _log_failure(key: str, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logging.error(f"[DEBOUNCE] Flush failed for {key}: {task.exception()}")
+
+    def _ensure_driver(self) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        if self._driver is None or self._driver.done():
+            self._driver = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            if not self._deadline_tick:
+                # Idle: sleep until something is armed
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            await asyncio.sleep(TICK_SECONDS)
+            target = self._now_tick()
+            # Jump over slots before the earliest deadline (e.g. after an idle period)
+            self._tick = max(self._tick, min(self._deadline_tick.values(), default=target) - 1)
+            while self._tick < target:
+                self._tick += 1
+                index = self._tick % WHEEL_SLOTS
+                slot = self._wheel[index]
+                for key in list(slot):
+                    deadline = self._deadline_tick.get(key)
+                    if deadline == self._tick:
+                        slot.discard(key)
+                        self._forget(key)
+                        self._dispatch(key)
+                    elif deadline is None or deadline < self._tick or deadline % WHEEL_SLOTS != index:
+                        # Re-armed elsewhere or already flushed
+                        slot.discard(key)
@@ -0,0 +1,404 @@
+"""
+Durable Queue
+SQLite (WAL) backed job queues that survive restarts
+
+Every job is written to the store before it is handed to a worker and is only
+deleted when the worker acknowledges it with `task_done()`. On startup all
+unacknowledged jobs are redelivered (at-least-once). Writes from concurrent
+producers/consumers are group-committed in one transaction per short window.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.config.settings import get_settings
+
+# Group commit window (seconds)
+COMMIT_WINDOW_SECONDS = 0.01
+
+# Jobs delivered this many times without an ack are parked as dead
+MAX_DELIVERY_ATTEMPTS = 3
+
+# How often expired leases are checked
+LEASE_CHECK_INTERVAL_SECONDS = 30
+
+# Held leases are renewed every visibility_timeout * LEASE_RENEW_FRACTION
+LEASE_RENEW_FRACTION = 1 / 3
+
+
+def get_db_path() -> Path:
+    """Return SQLite database file path"""
+    settings = get_settings()
+    base_dir = settings.FILESYSTEM_BASE_DIR or os.getcwd()
+    db_dir = Path(base_dir) / "db"
+    db_dir.mkdir(parents=True, exist_ok=True)
+    return db_dir / "job_queue.db"
+
+
+def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """Return SQLite connection (WAL mode, with Row factory set)"""
+    conn = sqlite3.connect(db_path or get_db_path(), check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def init_db(conn: sqlite3.Connection):
+    """Create tables"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            queue TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            attempts INTEGER DEFAULT 0,
+            status TEXT DEFAULT 'ready',
+            created_at REAL NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_jobs_queue_status
+        ON jobs(queue, status, created_at)
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS debounce (
+            id TEXT PRIMARY KEY,
+            debounce_key TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            created_at REAL NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS seen_events (
+            event_key TEXT PRIMARY KEY,
+            seen_at REAL NOT NULL
+        )
+    """)
+    conn.commit()
+
+
+def _dumps(payload: Any) -> str:
+    return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class JobStore:
+    """
+    Persistent storage for queued jobs and pending debounced messages.
+
+    Writes are collected for COMMIT_WINDOW_SECONDS and applied in a single
+    transaction on a worker thread (group commit); `write()` returns once the
+    batch containing it is durable.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self._conn = get_connection(db_path)
+        init_db(self._conn)
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, tuple, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self.commits = 0
+        self.writes = 0
+
+    def _apply(self, statements: List[Tuple[str, tuple]]) -> None:
+        with self._lock, self._conn:
+            for sql, params in statements:
+                self._conn.execute(sql, params)
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(COMMIT_WINDOW_SECONDS)
+        batch, self._pending = self._pending, []
+        self._flush_task = None
+        try:
+            await asyncio.to_thread(self._apply, [(sql, params) for sql, params, _ in batch])
+            self.commits += 1
+            self.writes += len(batch)
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+        except Exception as e:
+            logging.error(f"[DURABLE_QUEUE] Commit of {len(batch)} writes failed: {e}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def write(self, sql: str, params: tuple = ()) -> None:
+        """Queue a write for the next group commit and wait until it is durable"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((sql, params, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+        await future
+
+    def _query(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # --- jobs -------------------------------------------------------------
+
+    async def insert_job(self, job_id: str, queue: str, payload: Any) -> None:
+        await self.write(
+            "INSERT INTO jobs (id, queue, payload, created_at) VALUES (?, ?, ?, ?)",
+            (job_id, queue, _dumps(payload), time.time())
+        )
+
+    async def mark_delivered(self, job_id: str) -> None:
+        await self.write("UPDATE jobs SET attempts = attempts + 1 WHERE id = ?", (job_id,))
+
+    async def delete_job(self, job_id: str) -> None:
+        await self.write("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    async def mark_dead(self, job_id: str) -> None:
+        await self.write("UPDATE jobs SET status = 'dead' WHERE id = ?", (job_id,))
+
+    def load_jobs(self, queue: str) -> List[sqlite3.Row]:
+        """Unacknowledged jobs of a queue, oldest first"""
+        return self._query(
+            "SELECT id, payload, attempts FROM jobs WHERE queue = ? AND status = 'ready' ORDER BY created_at",
+            (queue,)
+        )
+
+    def queue_names(self, prefix: str = "") -> List[str]:
+        """Queues that still have unacknowledged jobs"""
+        rows = self._query(
+            "SELECT DISTINCT queue FROM jobs WHERE status = 'ready' AND queue LIKE ?",
+            (f"{prefix}%",)
+        )
+        return [row["queue"] for row in rows]
+
+    # --- debounce ---------------------------------------------------------
+
+    async def insert_debounced(self, entry_id: str, debounce_key: str, message: dict) -> None:
+        await self.write(
+            "INSERT INTO debounce (id, debounce_key, payload, created_at) VALUES (?, ?, ?, ?)",
+            (entry_id, debounce_key, _dumps(message), time.time())
+        )
+
+    async def delete_debounced(self, entry_ids: List[str]) -> None:
+        if entry_ids:
+            placeholders = ",".join("?" * len(entry_ids))
+            await self.write(f"DELETE FROM debounce WHERE id IN ({placeholders})", tuple(entry_ids))
+
+    def load_debounced(self) -> Dict[str, List[Tuple[str, dict]]]:
+        """Pending debounced messages grouped by debounce key, oldest first"""
+        grouped: Dict[str, List[Tuple[str, dict]]] = {}
+        for row in self._query("SELECT id, debounce_key, payload FROM debounce ORDER BY created_at"):
+            grouped.setdefault(row["debounce_key"], []).append((row["id"], json.loads(row["payload"])))
+        return grouped
+
+    # --- seen events (Slack event deduplication) ---------------------------
+
+    async def insert_seen_events(self, event_keys: List[str]) -> None:
+        now = time.time()
+        # All keys of an event land in the same group commit
+        await asyncio.gather(*(
+            self.write("INSERT OR REPLACE INTO seen_events (event_key, seen_at) VALUES (?, ?)", (event_key, now))
+            for event_key in event_keys
+        ))
+
+    async def prune_seen_events(self, before: float) -> None:
+        await self.write("DELETE FROM seen_events WHERE seen_at < ?", (before,))
+
+    def load_seen_events(self, since: float) -> List[Tuple[str, float]]:
+        """Event keys seen after `since` (epoch seconds)"""
+        rows = self._query("SELECT event_key, seen_at FROM seen_events WHERE seen_at >= ?", (since,))
+        return [(row["event_key"], row["seen_at"]) for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        """Counts per queue/status for logging"""
+        rows = self._query("SELECT queue, status, COUNT(*) AS n FROM jobs GROUP BY queue, status")
+        return {
+            "jobs": {f"{row['queue']}/{row['status']}": row["n"] for row in rows},
+            "commits": self.commits,
+            "writes": self.writes,
+        }
+
+
+class DurableQueue:
+    """
+    asyncio.Queue with a persistent copy of every job.
+
+    Usage:
+        await queue.put(job)
+        job_id, job = await queue.get()
+        try:
+            ...
+        finally:
+            await queue.task_done(job_id)
+
+    A delivered job is leased for `visibility_timeout` seconds. Workers hold
+    the lease with `keep_alive()` while they run the job, which renews it
+    periodically, so a long-running job is never handed to a second worker.
+    Only a lease that is neither renewed nor acknowledged (its owner is gone)
+    expires and is delivered again; jobs of a stopped process are redelivered
+    by `recover()` on the next start. `on_ready` is called once for
+    every job that becomes available (for dispatchers that pull from many
+    queues). `queue` replaces the in-memory FIFO (e.g. a priority queue);
+    it receives (job_id, job) tuples.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 100,
+        visibility_timeout: float = 600,
+        on_ready: Optional[Callable[[], None]] = None,
+        queue: Optional[asyncio.Queue] = None
+    ):
+        self.name = name
+        self.visibility_timeout = visibility_timeout
+        self._queue: asyncio.Queue = queue if queue is not None else asyncio.Queue(maxsize=maxsize)
+        self._leases: Dict[str, Tuple[float, Any]] = {}
+        self._lease_task: Optional[asyncio.Task] = None
+        self._on_ready = on_ready
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def is_idle(self) -> bool:
+        """No queued and no in-flight jobs"""
+        return self._queue.empty() and not self._leases
+
+    async def _enqueue(self, job: Tuple[str, Any]) -> None:
+        await self._queue.put(job)
+        if self._on_ready is not None:
+            self._on_ready()
+
+    async def put(self, item: Any) -> str:
+        """Persist and enqueue a job; returns its id"""
+        job_id = uuid.uuid4().hex
+        store = get_job_store()
+        if store is not None:
+            await store.insert_job(job_id, self.name, item)
+        await self._enqueue((job_id, item))
+        return job_id
+
+    async def get(self) -> Tuple[str, Any]:
+        """Wait for the next job and lease it"""
+        job_id, item = await self._queue.get()
+        return await self._lease(job_id, item)
+
+    async def get_batch(self, max_items: int, window_seconds: float) -> List[Tuple[str, Any]]:
+        """Wait for a job, then collect more for up to `window_seconds` (at most `max_items`)"""
+        batch = [await self.get()]
+        deadline = time.monotonic() + window_seconds
+        while len(batch) < max_items:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                job_id, item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            batch.append(await self._lease(job_id, item))
+        return batch
+
+    async def _lease(self, job_id: str, item: Any) -> Tuple[str, Any]:
+        self._leases[job_id] = (time.monotonic() + self.visibility_timeout, item)
+        self._ensure_lease_checker()
+        store = get_job_store()
+        if store is not None:
+            try:
+                await store.mark_delivered(job_id)
+            except Exception as e:
+                logging.warning(f"[DURABLE_QUEUE] {self.name}: failed to record delivery of {job_id}: {e}")
+        return job_id, item
+
+    def renew(self, job_id: str) -> bool:
+        """Extend the lease of an in-flight job; False if it is no longer leased"""
+        lease = self._leases.get(job_id)
+        if lease is None:
+            return False
+        self._leases[job_id] = (time.monotonic() + self.visibility_timeout, lease[1])
+        return True
+
+    def keep_alive(self, *job_ids: str):
+        """Renew the leases of `job_ids` (heartbeat) while the block runs"""
+        return self.keep_alive_each(lambda: job_ids)
+
+    @asynccontextmanager
+    async def keep_alive_each(self, job_ids: Callable[[], Iterable[str]]):
+        """Renew the leases of whatever jobs `job_ids()` returns at each heartbeat while the block runs"""
+        interval = self.visibility_timeout * LEASE_RENEW_FRACTION
+
+        async def heartbeat():
+            while True:
+                for job_id in job_ids():
+                    self.renew(job_id)
+                await asyncio.sleep(interval)
+
+        task = asyncio.create_task(heartbeat())
+        try:
+            yield
+        finally:
+            task.cancel()
+
+    async def task_done(self, job_id: str) -> None:
+        """Acknowledge a job (removes it from the store)"""
+        self._queue.task_done()
+        self._leases.pop(job_id, None)
+        store = get_job_store()
+        if store is not None:
+            try:
+                await store.delete_job(job_id)
+            except Exception as e:
+                logging.warning(f"[DURABLE_QUEUE] {self.name}: failed to ack {job_id}: {e}")
+
+    async def recover(self) -> int:
+        """Redeliver jobs left unacknowledged by a previous run"""
+        store = get_job_store()
+        if store is None:
+            return 0
+
+        rows = await asyncio.to_thread(store.load_jobs, self.name)
+        redeliver = []
+        for row in rows:
+            if row["attempts"] >= MAX_DELIVERY_ATTEMPTS:
+                logging.error(f"[DURABLE_QUEUE] {self.name}: job {row['id']} failed {row['attempts']} deliveries, parking as dead")
+                await store.mark_dead(row["id"])
+            else:
+                redeliver.append((row["id"], json.loads(row["payload"])))
+
+        if redeliver:
+            logging.info(f"[DURABLE_QUEUE] {self.name}: redelivering {len(redeliver)} jobs from previous run")
+            # Workers may not be running yet, so a full queue must not block startup
+            asyncio.create_task(self._requeue(redeliver))
+        return len(redeliver)
+
+    async def _requeue(self, jobs: List[Tuple[str, Any]]) -> None:
+        for job in jobs:
+            await self._enqueue(job)
+
+    def _ensure_lease_checker(self) -> None:
+        if self._lease_task is None or self._lease_task.done():
+            self._lease_task = asyncio.create_task(self._check_leases())
+
+    async def _check_leases(self) -> None:
+        while self._leases:
+            await asyncio.sleep(LEASE_CHECK_INTERVAL_SECONDS)
+            now = time.monotonic()
+            expired = [(job_id, item) for job_id, (deadline, item) in self._leases.items() if deadline <= now]
+            for job_id, item in expired:
+                del self._leases[job_id]
+                logging.warning(f"[DURABLE_QUEUE] {self.name}: lease of {job_id} expired without renewal, redelivering")
+                # The stale delivery still owns its own task_done() call
+                await self._enqueue((job_id, item))
+
+
+_job_store: Optional[JobStore] = None
+
+
+def get_job_store() -> Optional[JobStore]:
+    """Global job store (None when durable queues are disabled)"""
+    global _job_store
+    if _job_store is None and get_settings().DURABLE_QUEUE_ENABLED:
+        _job_store = JobStore()
+    return _job_store
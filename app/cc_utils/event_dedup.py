@@ -0,0 +1,93 @@
+"""
+Event Deduplication
+Drops Slack events that were already received (Socket Mode retries, repeated deliveries)
+
+An event is identified by every key it carries: the envelope `event_id`, the
+message's `client_msg_id` and its `(channel, ts)`. A retry may arrive with a
+different envelope, so an event counts as a duplicate if any of its keys was
+seen within the TTL. Keys can be persisted in the job store so a restart
+does not re-run events Slack redelivers right after it.
+"""
+
+import logging
+import time
+from typing import Dict, List, Optional
+
+from app.cc_utils.ttl_cache import TTLCache
+
+# Persisted keys are pruned after this many new records
+PRUNE_EVERY_RECORDS = 500
+
+
+def event_keys(event: dict, body: Optional[dict] = None) -> List[str]:
+    """Identity keys of a Slack event"""
+    keys = []
+    if body and body.get("event_id"):
+        keys.append(f"event:{body['event_id']}")
+    if event.get("client_msg_id"):
+        keys.append(f"client_msg:{event['client_msg_id']}")
+    if event.get("channel") and event.get("ts"):
+        keys.append(f"ts:{event['channel']}:{event['ts']}")
+    return keys
+
+
+class EventDeduplicator:
+    """
+    Bounded, TTL-based seen-set of Slack events.
+
+    Args:
+        ttl_seconds: How long a key is remembered
+        max_entries: Oldest keys are evicted beyond this size
+        store: Optional JobStore to persist keys across restarts
+    """
+
+    def __init__(self, ttl_seconds: float = 3600, max_entries: int = 20000, store=None):
+        self.ttl_seconds = ttl_seconds
+        self._seen = TTLCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self._store = store
+        self._records = 0
+        self.duplicates = 0
+
+    async def is_duplicate(self, event: dict, body: Optional[dict] = None) -> bool:
+        """Check an event and remember it (check-and-set; call once per delivery)"""
+        keys = event_keys(event, body)
+        if not keys:
+            return False
+
+        if any(key in self._seen for key in keys):
+            self.duplicates += 1
+            # Remember keys the retry added (e.g. a new envelope event_id)
+            for key in keys:
+                self._seen.set(key, True)
+            logging.info(f"[EVENT_DEDUP] Duplicate event dropped ({', '.join(keys)}, total={self.duplicates})")
+            return True
+
+        for key in keys:
+            self._seen.set(key, True)
+        await self._persist(keys)
+        return False
+
+    async def _persist(self, keys: List[str]) -> None:
+        if self._store is None:
+            return
+        try:
+            await self._store.insert_seen_events(keys)
+            self._records += 1
+            if self._records % PRUNE_EVERY_RECORDS == 0:
+                await self._store.prune_seen_events(time.time() - self.ttl_seconds)
+        except Exception as e:
+            logging.warning(f"[EVENT_DEDUP] Failed to persist event keys: {e}")
+
+    def load(self) -> int:
+        """Restore keys persisted by a previous run (blocking; call at startup)"""
+        if self._store is None:
+            return 0
+        now = time.time()
+        loaded = 0
+        for key, seen_at in self._store.load_seen_events(now - self.ttl_seconds):
+            self._seen.set(key, True, ttl_seconds=self.ttl_seconds - (now - seen_at))
+            loaded += 1
+        return loaded
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._seen), "duplicates": self.duplicates}
@@ -0,0 +1,99 @@
+"""
+Fair Priority Queue
+asyncio.Queue that orders jobs by priority class with per-user fairness and aging
+
+- Lower class value is served first (interactive DM before proactive work)
+- Within a class, users are served by weighted fair queuing, so one user's
+  burst of jobs interleaves with other users' jobs instead of blocking them
+- A waiting job moves up one class every `aging_seconds`, so nothing starves
+"""
+
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class JobClass(IntEnum):
+    """Orchestrator job classes (lower = served first)"""
+    INTERACTIVE = 0      # Direct request (DM, mention, voice)
+    THREAD_FOLLOWUP = 1  # Follow-up in an existing thread
+    SCHEDULED = 2        # Cron schedules
+    CHECKER = 3          # Jira/Outlook/Confluence checker tasks
+    PROACTIVE = 4        # Bot-initiated work
+
+
+@dataclass
+class _Entry:
+    item: Any
+    job_class: JobClass
+    user: str
+    start_tag: float
+    finish_tag: float
+    enqueued_at: float
+    seq: int
+
+
+class FairPriorityQueue(asyncio.Queue):
+    """
+    Priority queue with per-user weighted fair queuing and aging.
+
+    Args:
+        classify: Returns (job class, user key) for an item
+        aging_seconds: Wait after which a job is promoted by one class
+        weights: Optional per-user weights (default 1.0; higher = larger share)
+    """
+
+    def __init__(
+        self,
+        classify: Callable[[Any], Tuple[JobClass, str]],
+        maxsize: int = 0,
+        aging_seconds: float = 60,
+        weights: Optional[Dict[str, float]] = None
+    ):
+        self._classify = classify
+        self._aging_seconds = aging_seconds
+        self._weights = weights or {}
+        super().__init__(maxsize=maxsize)
+
+    def _init(self, maxsize):
+        self._queue: List[_Entry] = []
+        self._virtual_time: Dict[JobClass, float] = {}
+        self._last_finish: Dict[Tuple[JobClass, str], float] = {}
+        self._seq = itertools.count()
+        self.served: Dict[str, int] = {job_class.name: 0 for job_class in JobClass}
+
+    def _put(self, item):
+        job_class, user = self._classify(item)
+        start = max(self._virtual_time.get(job_class, 0.0), self._last_finish.get((job_class, user), 0.0))
+        finish = start + 1.0 / self._weights.get(user, 1.0)
+        self._last_finish[(job_class, user)] = finish
+        self._queue.append(_Entry(item, job_class, user, start, finish, time.monotonic(), next(self._seq)))
+
+    def _effective_class(self, entry: _Entry, now: float) -> int:
+        promoted = int((now - entry.enqueued_at) // self._aging_seconds) if self._aging_seconds > 0 else 0
+        return max(0, entry.job_class - promoted)
+
+    def _get(self):
+        now = time.monotonic()
+        index = min(
+            range(len(self._queue)),
+            key=lambda i: (
+                self._effective_class(self._queue[i], now),
+                self._queue[i].finish_tag,
+                self._queue[i].seq,
+            )
+        )
+        entry = self._queue.pop(index)
+        self._virtual_time[entry.job_class] = max(self._virtual_time.get(entry.job_class, 0.0), entry.start_tag)
+        self.served[entry.job_class.name] += 1
+        return entry.item
+
+    def snapshot(self) -> Dict[str, int]:
+        """Queued job count per class"""
+        counts = {job_class.name: 0 for job_class in JobClass}
+        for entry in self._queue:
+            counts[entry.job_class.name] += 1
+        return counts
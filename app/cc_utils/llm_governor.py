@@ -0,0 +1,225 @@
+"""
+LLM Governor
+Process-wide admission control for Claude agent subprocesses.
+
+Every ClaudeSDKClient spawns a CLI subprocess, so the number of concurrently
+running agents is what bounds memory. Agents acquire a slot before opening a
+client:
+
+    async with (
+        llm_slot(LLMTier.SIMPLE, LLMPriority.INTERACTIVE, "bot_call_detector"),
+        ClaudeSDKClient(options=options) as client,
+    ):
+        ...
+
+- Per-tier limits (MODEL_FOR_SIMPLE / MODERATE / COMPLEX) plus a global cap
+- Waiters are served by priority class, FIFO within a class
+- Queue-wait metrics per tier and per agent
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from enum import Enum, IntEnum
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.cc_utils.process_share import scale_limit
+from app.config.settings import get_settings
+
+# Waits longer than this are logged at INFO
+SLOW_WAIT_LOG_SECONDS = 1.0
+
+
+class LLMTier(str, Enum):
+    """Model tier of the agent (matches MODEL_FOR_* settings)"""
+    SIMPLE = "simple"
+    MODERATE = "moderate"
+    COMPLEX = "complex"
+
+
+class LLMPriority(IntEnum):
+    """Priority class; lower value is served first"""
+    INTERACTIVE = 0   # A user is waiting on the answer (detectors, operator, ...)
+    BACKGROUND = 1    # Work triggered by users but not awaited (memory saving)
+    SCHEDULED = 2     # Periodic checkers (Outlook, Jira, Confluence)
+    PROACTIVE = 3     # Proactive suggestions
+
+
+# Message sources nobody is waiting on (everything else is served as INTERACTIVE)
+_SOURCE_PRIORITIES = {
+    "scheduled": LLMPriority.SCHEDULED,
+    "checker": LLMPriority.SCHEDULED,
+    "proactive": LLMPriority.PROACTIVE,
+}
+
+
+def priority_for_source(source: Optional[str]) -> LLMPriority:
+    """Priority class of agent work started by a message from `source` (see message_data["source"])"""
+    return _SOURCE_PRIORITIES.get(source, LLMPriority.INTERACTIVE)
+
+
+class PrioritySemaphore:
+    """
+    Counting semaphore whose waiters are woken in (priority, arrival) order.
+
+    Designed for use from a single asyncio event loop.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.in_use = 0
+        self._waiters: List[list] = []
+        self._seq = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: int = LLMPriority.INTERACTIVE) -> None:
+        if self.in_use < self.limit and not self._waiters:
+            self.in_use += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, [int(priority), next(self._seq), future])
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Slot was handed over just before cancellation: pass it on
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        # Hand the slot directly to the next live waiter (in_use unchanged)
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_use -= 1
+
+
+class _WaitStats:
+    """Queue-wait counters for one tier or agent"""
+
+    def __init__(self):
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, waited: float) -> None:
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "acquired": self.acquired,
+            "avg_wait": round(self.total_wait / self.acquired, 3) if self.acquired else 0.0,
+            "max_wait": round(self.max_wait, 3),
+        }
+
+
+class LLMGovernor:
+    """Per-tier and global concurrency limits for LLM agent calls"""
+
+    def __init__(self, tier_limits: Dict[LLMTier, int], total_limit: int):
+        self._tiers = {tier: PrioritySemaphore(limit) for tier, limit in tier_limits.items()}
+        self._total = PrioritySemaphore(total_limit)
+        self._tier_stats = {tier: _WaitStats() for tier in tier_limits}
+        self._agent_stats: Dict[str, _WaitStats] = {}
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        tier: LLMTier,
+        priority: LLMPriority = LLMPriority.INTERACTIVE,
+        agent: str = "unknown"
+    ) -> AsyncIterator[None]:
+        """
+        Hold one tier slot and one global slot for the duration of the block.
+
+        The tier slot is always taken before the global slot, so waiters never
+        deadlock against each other.
+        """
+        tier_semaphore = self._tiers[tier]
+        started = time.monotonic()
+
+        await tier_semaphore.acquire(priority)
+        try:
+            await self._total.acquire(priority)
+        except BaseException:
+            tier_semaphore.release()
+            raise
+
+        waited = time.monotonic() - started
+        self._tier_stats[tier].record(waited)
+        self._agent_stats.setdefault(agent, _WaitStats()).record(waited)
+        if waited >= SLOW_WAIT_LOG_SECONDS:
+            logging.info(
+                f"[LLM_GOVERNOR] {agent} waited {waited:.1f}s for a {tier.value} slot "
+                f"(priority={priority.name})"
+            )
+
+        try:
+            yield
+        finally:
+            self._total.release()
+            tier_semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Current usage and queue-wait metrics"""
+        return {
+            "total": {"in_use": self._total.in_use, "limit": self._total.limit, "waiting": self._total.waiting},
+            "tiers": {
+                tier.value: {
+                    "in_use": semaphore.in_use,
+                    "limit": semaphore.limit,
+                    "waiting": semaphore.waiting,
+                    **self._tier_stats[tier].as_dict(),
+                }
+                for tier, semaphore in self._tiers.items()
+            },
+            "agents": {agent: stats.as_dict() for agent, stats in self._agent_stats.items()},
+        }
+
+
+# Global governor instance
+_llm_governor: Optional[LLMGovernor] = None
+
+
+def get_llm_governor() -> LLMGovernor:
+    """
+    Get or create global LLM governor instance.
+
+    In orchestrator process mode the configured limits are split between the
+    processes (see process_share).
+
+    Returns:
+        LLMGovernor instance
+    """
+    global _llm_governor
+    if _llm_governor is None:
+        settings = get_settings()
+        _llm_governor = LLMGovernor(
+            tier_limits={
+                LLMTier.SIMPLE: scale_limit(settings.LLM_MAX_CONCURRENT_SIMPLE),
+                LLMTier.MODERATE: scale_limit(settings.LLM_MAX_CONCURRENT_MODERATE),
+                LLMTier.COMPLEX: scale_limit(settings.LLM_MAX_CONCURRENT_COMPLEX),
+            },
+            total_limit=scale_limit(settings.LLM_MAX_CONCURRENT_TOTAL),
+        )
+    return _llm_governor
+
+
+def llm_slot(
+    tier: LLMTier,
+    priority: LLMPriority = LLMPriority.INTERACTIVE,
+    agent: str = "unknown"
+):
+    """Shortcut for `get_llm_governor().slot(...)`"""
+    return get_llm_governor().slot(tier, priority, agent)
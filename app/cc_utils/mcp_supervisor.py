@@ -0,0 +1,560 @@
+"""
+MCP Supervisor
+Runs the stdio MCP servers (npx ...) once and shares them with every agent session
+
+Each supervised server is a single long-lived child process. A local HTTP
+bridge exposes it as an SSE MCP endpoint (/mcp/<name>/sse); any number of
+agent sessions connect to it concurrently:
+
+- JSON-RPC request ids of every session are remapped to unique ids on the
+  shared process, and responses are routed back to the session that asked
+- The MCP handshake is done once by the supervisor; a session's `initialize`
+  is answered from the cached result
+- Servers are pinged periodically and restarted (with backoff) when they
+  exit or stop responding; sessions of a restarted server are closed
+
+Sessions are routed to a server only while it is healthy; otherwise the
+operator falls back to spawning the stdio server itself. The bridge only
+accepts requests carrying the random token generated at startup (the
+servers hold the bot's credentials), and if its port cannot be bound the
+supervisor is not started and every session uses stdio.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import secrets
+import signal
+import socket
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.config.settings import get_settings
+
+PROTOCOL_VERSION = "2024-11-05"
+
+# First start may download the npm package
+START_TIMEOUT_SECONDS = 180
+HEALTH_CHECK_INTERVAL_SECONDS = 30
+PING_TIMEOUT_SECONDS = 10
+# Consecutive unanswered pings before a server is restarted
+MAX_PING_FAILURES = 2
+MAX_RESTART_BACKOFF_SECONDS = 300
+SSE_KEEPALIVE_SECONDS = 15
+# Worker processes cache the supervisor's health status this long
+STATUS_CACHE_SECONDS = 5
+MAX_MESSAGE_BYTES = 32 * 1024 * 1024
+
+# Servers whose state belongs to one conversation (browser tabs/profile)
+UNSHARED_SERVERS = {"playwright"}
+
+
+class McpServerError(Exception):
+    """JSON-RPC error returned by a supervised server"""
+
+
+class McpBridgeError(Exception):
+    """The supervisor's HTTP bridge could not be started"""
+
+
+def is_supervisable(name: str, spec: Any) -> bool:
+    """stdio server specs that can be shared (SDK and HTTP servers are left alone)"""
+    return (
+        isinstance(spec, dict)
+        and "command" in spec
+        and spec.get("type", "stdio") == "stdio"
+        and name not in UNSHARED_SERVERS
+    )
+
+
+def sse_spec(port: int, name: str, token: str) -> dict:
+    return {"type": "sse", "url": f"http://127.0.0.1:{port}/mcp/{name}/sse?token={token}"}
+
+
+class _Session:
+    """One connected agent session (SSE stream)"""
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.outbox: asyncio.Queue = asyncio.Queue()
+        self.last_request = time.monotonic()
+
+
+class SupervisedServer:
+    """A shared stdio MCP server process and the sessions multiplexed onto it"""
+
+    def __init__(self, name: str, spec: dict):
+        self.name = name
+        self.spec = spec
+        self.healthy = False
+        self.restarts = 0
+        self.last_error: Optional[str] = None
+        self.sessions: Dict[str, _Session] = {}
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Tuple[str, Any]] = {}          # proxy id -> (session id, client id)
+        self._internal: Dict[int, asyncio.Future] = {}          # supervisor's own requests
+        self._server_requests: Dict[Any, str] = {}              # server -> client request id -> session id
+        self._init_result: Optional[dict] = None
+
+    # --- process lifecycle -------------------------------------------------
+
+    async def run(self) -> None:
+        """Keep the server running (start, monitor, restart with backoff)"""
+        backoff = 1
+        while True:
+            try:
+                await self._start()
+                self.healthy = True
+                backoff = 1
+                logging.info(f"[MCP_SUPERVISOR] {self.name} ready (pid={self._process.pid}, restarts={self.restarts})")
+                await self._monitor()
+            except asyncio.CancelledError:
+                await self._stop()
+                raise
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                logging.error(f"[MCP_SUPERVISOR] {self.name} failed: {self.last_error}")
+
+            self.healthy = False
+            await self._stop()
+            self.restarts += 1
+            logging.warning(f"[MCP_SUPERVISOR] Restarting {self.name} in {backoff}s")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, MAX_RESTART_BACKOFF_SECONDS)
+
+    async def _start(self) -> None:
+        self._process = await asyncio.create_subprocess_exec(
+            self.spec["command"],
+            *self.spec.get("args", []),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env={**os.environ, **self.spec.get("env", {})},
+            limit=MAX_MESSAGE_BYTES,
+            start_new_session=True,  # npx spawns node; stop the whole group
+        )
+        self._reader = asyncio.create_task(self._read_loop(self._process))
+        self._init_result = await self._call(
+            "initialize",
+            {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "kira-mcp-supervisor", "version": "1.0"},
+            },
+            timeout=START_TIMEOUT_SECONDS,
+        )
+        await self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+    async def _monitor(self) -> None:
+        """Return when the process exited or stopped answering pings"""
+        failures = 0
+        while True:
+            try:
+                await asyncio.wait_for(self._process.wait(), timeout=HEALTH_CHECK_INTERVAL_SECONDS)
+                self.last_error = f"exited with code {self._process.returncode}"
+                logging.warning(f"[MCP_SUPERVISOR] {self.name} {self.last_error}")
+                return
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                await self._call("ping", timeout=PING_TIMEOUT_SECONDS)
+                failures = 0
+            except McpServerError:
+                failures = 0  # Answered (e.g. ping not implemented), so it is alive
+            except asyncio.TimeoutError:
+                failures += 1
+                logging.warning(f"[MCP_SUPERVISOR] {self.name} did not answer ping ({failures}/{MAX_PING_FAILURES})")
+                if failures >= MAX_PING_FAILURES:
+                    self.last_error = "unresponsive"
+                    return
+
+    async def _stop(self) -> None:
+        if self._reader:
+            self._reader.cancel()
+            self._reader = None
+
+        process, self._process = self._process, None
+        if process and process.returncode is None:
+            try:
+                if hasattr(os, "killpg"):
+                    os.killpg(process.pid, signal.SIGTERM)
+                else:
+                    process.terminate()
+                await asyncio.wait_for(process.wait(), timeout=5)
+            except (ProcessLookupError, asyncio.TimeoutError):
+                if process.returncode is None:
+                    process.kill()
+            except Exception as e:
+                logging.warning(f"[MCP_SUPERVISOR] Failed to stop {self.name}: {e}")
+
+        for future in self._internal.values():
+            if not future.done():
+                future.set_exception(ConnectionError(f"MCP server {self.name} stopped"))
+        for session_id, client_id in self._pending.values():
+            self._deliver(session_id, {
+                "jsonrpc": "2.0",
+                "id": client_id,
+                "error": {"code": -32000, "message": f"MCP server {self.name} restarted"},
+            })
+        # Sessions hold state of the old process; clients reconnect
+        for session in self.sessions.values():
+            session.outbox.put_nowait(None)
+        self.sessions.clear()
+        self._internal.clear()
+        self._pending.clear()
+        self._server_requests.clear()
+        self._init_result = None
+
+    # --- child process I/O -------------------------------------------------
+
+    async def _send(self, message: dict) -> None:
+        process = self._process
+        if process is None or process.stdin is None:
+            raise ConnectionError(f"MCP server {self.name} is not running")
+        process.stdin.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+        await process.stdin.drain()
+
+    async def _call(self, method: str, params: Optional[dict] = None, timeout: float = PING_TIMEOUT_SECONDS) -> Any:
+        """Request from the supervisor itself"""
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._internal[request_id] = future
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            message["params"] = params
+        try:
+            await self._send(message)
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self._internal.pop(request_id, None)
+
+    async def _read_loop(self, process: asyncio.subprocess.Process) -> None:
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    return
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue  # Some servers print logs to stdout
+                self._dispatch(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.error(f"[MCP_SUPERVISOR] {self.name} output reader failed: {e}")
+            if process.returncode is None:
+                process.kill()
+
+    def _dispatch(self, message: Any) -> None:
+        if isinstance(message, list):
+            for item in message:
+                self._dispatch(item)
+            return
+        if not isinstance(message, dict):
+            return
+
+        message_id = message.get("id")
+        if "method" not in message:
+            # Response to a request of the supervisor or of a session
+            if message_id in self._internal:
+                future = self._internal.pop(message_id)
+                if not future.done():
+                    if "error" in message:
+                        future.set_exception(McpServerError(message["error"]))
+                    else:
+                        future.set_result(message.get("result"))
+            elif message_id in self._pending:
+                session_id, client_id = self._pending.pop(message_id)
+                self._deliver(session_id, {**message, "id": client_id})
+            return
+
+        if message_id is not None:
+            # Server -> client request: ask the most recently active session
+            session = max(self.sessions.values(), key=lambda s: s.last_request, default=None)
+            if session is not None:
+                self._server_requests[message_id] = session.id
+                session.outbox.put_nowait(message)
+            return
+
+        # Notification (progress, list_changed, ...): every session
+        for session in self.sessions.values():
+            session.outbox.put_nowait(message)
+
+    def _deliver(self, session_id: str, message: dict) -> None:
+        session = self.sessions.get(session_id)
+        if session is not None:
+            session.outbox.put_nowait(message)
+
+    # --- sessions ----------------------------------------------------------
+
+    def open_session(self) -> _Session:
+        session = _Session()
+        self.sessions[session.id] = session
+        return session
+
+    def close_session(self, session_id: str) -> None:
+        self.sessions.pop(session_id, None)
+        for proxy_id in [pid for pid, (sid, _) in self._pending.items() if sid == session_id]:
+            del self._pending[proxy_id]
+
+    async def handle_client_message(self, session_id: str, message: dict) -> None:
+        """Forward a message from a session to the shared process"""
+        session = self.sessions[session_id]
+        method = message.get("method")
+
+        if method is None:
+            # Response to a server -> client request (ids are the server's own)
+            self._server_requests.pop(message.get("id"), None)
+            await self._send(message)
+            return
+
+        if method == "initialize":
+            self._deliver(session_id, {"jsonrpc": "2.0", "id": message.get("id"), "result": self._init_result})
+            return
+        if method == "notifications/initialized":
+            return
+
+        if method == "notifications/cancelled":
+            client_id = (message.get("params") or {}).get("requestId")
+            for proxy_id, (sid, cid) in self._pending.items():
+                if sid == session_id and cid == client_id:
+                    message = {**message, "params": {**message["params"], "requestId": proxy_id}}
+                    break
+            else:
+                return
+
+        if "id" in message:
+            session.last_request = time.monotonic()
+            proxy_id = next(self._ids)
+            self._pending[proxy_id] = (session_id, message["id"])
+            message = {**message, "id": proxy_id}
+
+        await self._send(message)
+
+    def status(self) -> dict:
+        return {
+            "healthy": self.healthy,
+            "pid": self._process.pid if self._process else None,
+            "sessions": len(self.sessions),
+            "in_flight": len(self._pending),
+            "restarts": self.restarts,
+            "last_error": self.last_error,
+        }
+
+
+class McpSupervisor:
+    """
+    Supervises the shareable MCP servers of a server dict and serves them over SSE.
+
+    Usage:
+        supervisor = McpSupervisor(build_mcp_servers_dict(settings), port=8765)
+        await supervisor.start()
+        mcp_servers = supervisor.route(build_mcp_servers_dict(settings))
+        ...
+        await supervisor.close()
+    """
+
+    def __init__(self, mcp_servers: dict, port: int):
+        self.port = port
+        # Required on every bridge request (header "Authorization: Bearer ..." or ?token=)
+        self.token = secrets.token_urlsafe(32)
+        self.servers: Dict[str, SupervisedServer] = {
+            name: SupervisedServer(name, spec)
+            for name, spec in mcp_servers.items()
+            if is_supervisable(name, spec)
+        }
+        self._tasks: List[asyncio.Task] = []
+        self._http = None
+        self._http_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """
+        Start the HTTP bridge and all servers (servers become routable once ready).
+
+        Raises:
+            McpBridgeError: The port is taken (e.g. by a second bot instance)
+        """
+        import uvicorn
+
+        # Bound here: uvicorn exits the process when it fails to bind by itself
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.bind(("127.0.0.1", self.port))
+        except OSError as e:
+            sock.close()
+            raise McpBridgeError(f"cannot bind 127.0.0.1:{self.port}: {e}") from e
+
+        config = uvicorn.Config(self._create_app(), log_level="warning")
+        self._http = uvicorn.Server(config)
+        self._http_task = asyncio.create_task(self._serve(sock))
+        for server in self.servers.values():
+            self._tasks.append(asyncio.create_task(server.run()))
+        logging.info(f"[MCP_SUPERVISOR] Starting {len(self.servers)} shared MCP servers on port {self.port}: {', '.join(self.servers)}")
+
+    async def _serve(self, sock: socket.socket) -> None:
+        try:
+            await self._http.serve(sockets=[sock])
+        except (Exception, SystemExit) as e:
+            logging.error(f"[MCP_SUPERVISOR] HTTP bridge stopped: {type(e).__name__}: {e}")
+        finally:
+            sock.close()
+
+    def _authorized(self, request) -> bool:
+        header = request.headers.get("authorization", "")
+        token = header[len("Bearer "):] if header.startswith("Bearer ") else request.query_params.get("token", "")
+        return secrets.compare_digest(token, self.token)
+
+    def _create_app(self):
+        from fastapi import Depends, FastAPI, HTTPException, Request, Response
+        from fastapi.responses import StreamingResponse
+
+        def require_token(request: Request):
+            if not self._authorized(request):
+                raise HTTPException(status_code=401, detail="Invalid MCP bridge token")
+
+        app = FastAPI(dependencies=[Depends(require_token)])
+
+        @app.get("/mcp/status")
+        async def status():
+            return self.status()
+
+        @app.get("/mcp/{name}/sse")
+        async def sse(name: str):
+            server = self.servers.get(name)
+            if server is None or not server.healthy:
+                raise HTTPException(status_code=503, detail=f"MCP server {name} is not available")
+            session = server.open_session()
+
+            async def stream():
+                try:
+                    yield f"event: endpoint\ndata: /mcp/{name}/message?session_id={session.id}&token={self.token}\n\n"
+                    while True:
+                        try:
+                            message = await asyncio.wait_for(session.outbox.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                        except asyncio.TimeoutError:
+                            yield ": keepalive\n\n"
+                            continue
+                        if message is None:
+                            return
+                        yield f"event: message\ndata: {json.dumps(message, ensure_ascii=False)}\n\n"
+                finally:
+                    server.close_session(session.id)
+
+            return StreamingResponse(stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+        @app.post("/mcp/{name}/message")
+        async def message(name: str, session_id: str, request: Request):
+            server = self.servers.get(name)
+            if server is None or session_id not in server.sessions:
+                raise HTTPException(status_code=404, detail="Unknown session")
+            payload = await request.json()
+            try:
+                for item in payload if isinstance(payload, list) else [payload]:
+                    await server.handle_client_message(session_id, item)
+            except (ConnectionError, KeyError) as e:
+                raise HTTPException(status_code=503, detail=str(e))
+            return Response(status_code=202)
+
+        return app
+
+    def healthy_servers(self) -> Set[str]:
+        if self._http_task is None or self._http_task.done():
+            return set()  # Bridge is down, nothing is reachable
+        return {name for name, server in self.servers.items() if server.healthy}
+
+    def route(self, mcp_servers: dict) -> dict:
+        """Replace healthy supervised servers with their shared SSE endpoint"""
+        return route_servers(mcp_servers, self.healthy_servers(), self.port, self.token)
+
+    def status(self) -> dict:
+        return {name: server.status() for name, server in self.servers.items()}
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._http is not None:
+            self._http.should_exit = True
+            await asyncio.gather(self._http_task, return_exceptions=True)
+        logging.info("[MCP_SUPERVISOR] Shared MCP servers stopped")
+
+
+def route_servers(mcp_servers: dict, healthy: Set[str], port: int, token: str) -> dict:
+    return {
+        name: sse_spec(port, name, token) if name in healthy and is_supervisable(name, spec) else spec
+        for name, spec in mcp_servers.items()
+    }
+
+
+# Supervisor of this process (None in orchestrator worker processes)
+_supervisor: Optional[McpSupervisor] = None
+# Bridge token of the main process's supervisor (orchestrator worker processes)
+_remote_token: Optional[str] = None
+_remote_status: Tuple[float, Set[str]] = (0.0, set())
+
+
+async def start_mcp_supervisor(mcp_servers: dict) -> Optional[McpSupervisor]:
+    """Start the process-wide supervisor (main process); None if it could not start"""
+    global _supervisor
+    supervisor = McpSupervisor(mcp_servers, port=get_settings().MCP_SUPERVISOR_PORT)
+    try:
+        await supervisor.start()
+    except McpBridgeError as e:
+        logging.error(f"[MCP_SUPERVISOR] Not started, MCP servers will be spawned per session: {e}")
+        return None
+    _supervisor = supervisor
+    return _supervisor
+
+
+def get_bridge_token() -> Optional[str]:
+    """Token for the bridge of this process's supervisor (passed to worker processes)"""
+    return _supervisor.token if _supervisor is not None else None
+
+
+def set_remote_bridge_token(token: Optional[str]) -> None:
+    """Worker processes: token of the main process's bridge (None = no shared servers)"""
+    global _remote_token
+    _remote_token = token
+
+
+async def _fetch_remote_healthy(port: int, token: str) -> Set[str]:
+    """Healthy servers of the main process's supervisor (orchestrator worker processes)"""
+    global _remote_status
+    fetched_at, healthy = _remote_status
+    if time.monotonic() - fetched_at < STATUS_CACHE_SECONDS:
+        return healthy
+
+    import httpx
+
+    try:
+        async with httpx.AsyncClient(timeout=1.0) as client:
+            response = await client.get(
+                f"http://127.0.0.1:{port}/mcp/status", headers={"Authorization": f"Bearer {token}"}
+            )
+            response.raise_for_status()
+            healthy = {name for name, status in response.json().items() if status.get("healthy")}
+    except Exception as e:
+        logging.debug(f"[MCP_SUPERVISOR] Status check failed: {e}")
+        healthy = set()
+    _remote_status = (time.monotonic(), healthy)
+    return healthy
+
+
+async def route_mcp_servers(mcp_servers: dict) -> dict:
+    """Use the shared MCP server processes where available, stdio spawning otherwise"""
+    settings = get_settings()
+    if not settings.MCP_SUPERVISOR_ENABLED:
+        return mcp_servers
+    if _supervisor is not None:
+        return _supervisor.route(mcp_servers)
+    if _remote_token is None:
+        return mcp_servers
+    healthy = await _fetch_remote_healthy(settings.MCP_SUPERVISOR_PORT, _remote_token)
+    return route_servers(mcp_servers, healthy, settings.MCP_SUPERVISOR_PORT, _remote_token)
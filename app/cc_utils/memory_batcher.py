@@ -0,0 +1,100 @@
+"""
+Memory Batcher
+Consolidates queued memory-save jobs into one memory_manager request
+
+Jobs collected by the memory worker within a time/size window are
+de-duplicated (near-identical content is dropped), grouped by
+channel/user (or by source for non-conversation jobs) and rendered into a
+single query, so one agent session stores the whole batch.
+"""
+
+from typing import Dict, List, Tuple
+
+from app.cc_utils.memory_index import tokenize
+
+# Jaccard similarity of content tokens above which two jobs are duplicates
+DUPLICATE_SIMILARITY = 0.85
+
+
+def _content(job: dict) -> str:
+    """Text that identifies what a job would store"""
+    if job.get("content"):
+        return f"{job.get('query', '')}\n{job['content']}"
+    return job.get("memory_query", "")
+
+
+def group_key(job: dict) -> Tuple[str, str, str]:
+    """(source, channel, user) grouping of a memory job"""
+    return (job.get("source") or "", job.get("channel_id") or "", job.get("user_id") or "")
+
+
+def dedupe_jobs(jobs: List[dict]) -> List[dict]:
+    """Drop jobs whose content is a near-duplicate of an earlier job in the same group"""
+    kept: List[dict] = []
+    kept_tokens: List[Tuple[Tuple[str, str, str], set]] = []
+
+    for job in jobs:
+        key = group_key(job)
+        tokens = set(tokenize(_content(job)))
+        duplicate = any(
+            other_key == key and tokens and other_tokens
+            and len(tokens & other_tokens) / len(tokens | other_tokens) >= DUPLICATE_SIMILARITY
+            for other_key, other_tokens in kept_tokens
+        )
+        if not duplicate:
+            kept.append(job)
+            kept_tokens.append((key, tokens))
+    return kept
+
+
+def _render_conversation(index: int, job: dict) -> str:
+    return f"""### 대화 {index}
+**요청:**
+{job.get('query', '')}
+
+**작업 처리 내역:**
+{job.get('content', '')}"""
+
+
+def _render_group(key: Tuple[str, str, str], jobs: List[dict]) -> str:
+    source, channel_id, user_id = key
+    first = jobs[0]
+
+    # Jobs without structured fields (e.g. Confluence summaries) keep their own query
+    if not first.get("content") or not channel_id:
+        return "\n\n---\n\n".join(job["memory_query"] for job in jobs)
+
+    header = f"""## 채널 {first.get('channel_name', 'unknown')} ({channel_id}, {first.get('channel_type', 'unknown')}) / 사용자 {first.get('user_name', 'unknown')} ({user_id})"""
+    conversations = "\n\n".join(_render_conversation(i + 1, job) for i, job in enumerate(jobs))
+    return f"{header}\n\n{conversations}"
+
+
+def build_memory_batch(jobs: List[dict]) -> dict:
+    """
+    Merge memory jobs into one job for memory_manager.
+
+    Args:
+        jobs: Memory jobs ({"memory_query": ..., plus optional structured fields})
+
+    Returns:
+        dict: Single memory job ({"memory_query": ..., "batch_size": n})
+    """
+    unique = dedupe_jobs(jobs)
+    if len(unique) == 1:
+        return {**unique[0], "batch_size": len(jobs)}
+
+    groups: Dict[Tuple[str, str, str], List[dict]] = {}
+    for job in unique:
+        groups.setdefault(group_key(job), []).append(job)
+
+    sections = "\n\n---\n\n".join(_render_group(key, group) for key, group in groups.items())
+    memory_query = f"""다음은 최근 처리된 작업 {len(unique)}건입니다 (채널/사용자별로 묶음). 다음 대화에서 참고할 만한 정보가 있다면 저장하세요.
+
+{sections}
+
+`slack-memory-store` skill을 사용해서 각 정보를 적절한 카테고리에 분류하고 저장하세요.
+같은 채널/사용자의 내용은 한 번에 정리해서 저장하세요.
+반드시 작업의 성공/실패 사례를 저장하세요.
+소속 팀 동료와 관련된 사항은 반드시 저장합니다.
+"""
+    return {"memory_query": memory_query, "batch_size": len(jobs)}
@@ -0,0 +1,474 @@
+"""
+Memory Index
+On-disk BM25 index over FILESYSTEM_BASE_DIR/memories
+
+Lets the memory retriever answer most queries in milliseconds instead of
+running an agent that walks the memories folder with tool calls.
+
+- Korean-aware tokenization: Hangul runs become character bigrams (so
+  particles like 은/는/에서 do not block matches), other text is split into
+  words/IDs
+- Field boosts: title/path and YAML frontmatter (tags, names, IDs) weigh more
+  than the body (BM25F-style weighted term frequencies)
+- Incremental: files are re-indexed only when their mtime/size changes
+- index.md (the folder overview read by agents) is rendered from the same
+  parsed documents, without an LLM call
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+from app.config.settings import get_settings
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Field weights (BM25F-style)
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "path": 2.0,
+    "frontmatter": 2.0,
+    "body": 1.0,
+}
+
+# Walk the memories folder at most this often
+REFRESH_INTERVAL_SECONDS = 5.0
+
+SNIPPET_MAX_CHARS = 600
+
+# Frontmatter keys shown next to each file in index.md
+INDEX_MD_TAG_KEYS = ("tags",)
+INDEX_MD_SUMMARY_KEYS = ("summary", "description")
+INDEX_MD_SUMMARY_MAX_CHARS = 120
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_HANGUL_RE = re.compile(r"[가-힣]+")
+_FRONTMATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
+
+# Frontmatter keys used to pin channel/user memories
+CHANNEL_KEYS = ("channel_id",)
+USER_KEYS = ("user_id",)
+
+
+def get_memories_path() -> Path:
+    """Return memories folder path"""
+    settings = get_settings()
+    base_dir = settings.FILESYSTEM_BASE_DIR or os.getcwd()
+    return Path(base_dir) / "memories"
+
+
+def get_db_path() -> Path:
+    """Return SQLite database file path"""
+    settings = get_settings()
+    base_dir = settings.FILESYSTEM_BASE_DIR or os.getcwd()
+    db_dir = Path(base_dir) / "db"
+    db_dir.mkdir(parents=True, exist_ok=True)
+    return db_dir / "memory_index.db"
+
+
+def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """Return SQLite connection (with Row factory set)"""
+    conn = sqlite3.connect(db_path or get_db_path())
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def init_db(db_path: Optional[Path] = None):
+    """Initialize database and create tables"""
+    conn = get_connection(db_path)
+    cursor = conn.cursor()
+
+    cursor.execute("PRAGMA journal_mode=WAL")
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS documents (
+            path TEXT PRIMARY KEY,
+            mtime REAL NOT NULL,
+            size INTEGER NOT NULL,
+            length REAL NOT NULL,
+            title TEXT,
+            channel_id TEXT,
+            user_id TEXT,
+            frontmatter TEXT,
+            body TEXT
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS postings (
+            term TEXT NOT NULL,
+            path TEXT NOT NULL,
+            tf REAL NOT NULL,
+            PRIMARY KEY (term, path)
+        )
+    """)
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_postings_path
+        ON postings(path)
+    """)
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_documents_channel
+        ON documents(channel_id)
+    """)
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_documents_user
+        ON documents(user_id)
+    """)
+
+    conn.commit()
+    conn.close()
+
+
+# =============================================
+# Tokenization / parsing
+# =============================================
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercase, NFKC-normalize and split text into index terms.
+
+    Hangul runs are split into character bigrams (a single syllable is kept
+    as a unigram); everything else is split into alphanumeric words/IDs.
+    """
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    tokens = _WORD_RE.findall(_HANGUL_RE.sub(" ", text))
+    for run in _HANGUL_RE.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def parse_memory_file(content: str) -> Tuple[Dict[str, Any], str]:
+    """Split a memory file into (frontmatter dict, body)"""
+    match = _FRONTMATTER_RE.match(content)
+    if not match:
+        return {}, content
+
+    try:
+        frontmatter = yaml.safe_load(match.group(1)) or {}
+    except yaml.YAMLError:
+        frontmatter = {}
+    if not isinstance(frontmatter, dict):
+        frontmatter = {}
+    return frontmatter, content[match.end():]
+
+
+def _flatten(value: Any) -> Iterable[str]:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield str(key)
+            yield from _flatten(item)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            yield from _flatten(item)
+    elif value is not None:
+        yield str(value)
+
+
+def _first(frontmatter: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[str]:
+    for key in keys:
+        value = frontmatter.get(key)
+        if value:
+            return str(value)
+    return None
+
+
+# =============================================
+# Index
+# =============================================
+
+class MemoryIndex:
+    """BM25 index over markdown memory files, persisted in SQLite"""
+
+    def __init__(self, memories_path: Optional[Path] = None, db_path: Optional[Path] = None):
+        self.memories_path = Path(memories_path) if memories_path else get_memories_path()
+        self.db_path = db_path or get_db_path()
+        self._last_refresh = 0.0
+        self._refresh_lock = threading.Lock()
+        init_db(self.db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        return get_connection(self.db_path)
+
+    def _iter_files(self) -> Iterable[Path]:
+        if not self.memories_path.exists():
+            return []
+        return (
+            path for path in self.memories_path.rglob("*.md")
+            if path.name != "index.md" and path.is_file()
+        )
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Re-index files whose mtime/size changed and drop deleted files.
+
+        Returns:
+            Number of documents (re)indexed or removed
+        """
+        with self._refresh_lock:
+            now = time.monotonic()
+            if not force and now - self._last_refresh < REFRESH_INTERVAL_SECONDS:
+                return 0
+            self._last_refresh = now
+            return self._refresh()
+
+    def _refresh(self) -> int:
+        conn = self._connect()
+        try:
+            known = {
+                row["path"]: (row["mtime"], row["size"])
+                for row in conn.execute("SELECT path, mtime, size FROM documents")
+            }
+            seen = set()
+            changed = 0
+
+            for file_path in self._iter_files():
+                rel_path = file_path.relative_to(self.memories_path).as_posix()
+                seen.add(rel_path)
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                if known.get(rel_path) == (stat.st_mtime, stat.st_size):
+                    continue
+                try:
+                    content = file_path.read_text(encoding="utf-8", errors="replace")
+                except OSError as e:
+                    logging.warning(f"[MEMORY_INDEX] Failed to read {rel_path}: {e}")
+                    continue
+                self._index_document(conn, rel_path, stat.st_mtime, stat.st_size, content)
+                changed += 1
+
+            for rel_path in set(known) - seen:
+                conn.execute("DELETE FROM postings WHERE path = ?", (rel_path,))
+                conn.execute("DELETE FROM documents WHERE path = ?", (rel_path,))
+                changed += 1
+
+            conn.commit()
+        finally:
+            conn.close()
+
+        if changed:
+            logging.info(f"[MEMORY_INDEX] Refreshed {changed} document(s)")
+        return changed
+
+    def _index_document(self, conn: sqlite3.Connection, rel_path: str, mtime: float, size: int, content: str) -> None:
+        frontmatter, body = parse_memory_file(content)
+        title = str(frontmatter.get("title") or Path(rel_path).stem)
+
+        fields = {
+            "title": tokenize(title),
+            "path": tokenize(rel_path.replace("/", " ").replace("_", " ").replace("-", " ")),
+            "frontmatter": tokenize(" ".join(_flatten(frontmatter))),
+            "body": tokenize(body),
+        }
+        weighted: Counter = Counter()
+        for field, tokens in fields.items():
+            for token in tokens:
+                weighted[token] += FIELD_WEIGHTS[field]
+        length = sum(weighted.values())
+
+        conn.execute("DELETE FROM postings WHERE path = ?", (rel_path,))
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO documents
+            (path, mtime, size, length, title, channel_id, user_id, frontmatter, body)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                rel_path, mtime, size, length, title,
+                _first(frontmatter, CHANNEL_KEYS), _first(frontmatter, USER_KEYS),
+                json.dumps(frontmatter, ensure_ascii=False, default=str), body,
+            )
+        )
+        conn.executemany(
+            "INSERT INTO postings (term, path, tf) VALUES (?, ?, ?)",
+            [(term, rel_path, tf) for term, tf in weighted.items()]
+        )
+
+    def render_index_md(self) -> str:
+        """
+        Render index.md from the indexed memory files.
+
+        Files are grouped by top-level folder and listed with title, tags,
+        summary and last update, sorted by path, so the output only changes
+        when the memories do.
+        """
+        self.refresh(force=True)
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT path, mtime, title, frontmatter FROM documents ORDER BY path").fetchall()
+        finally:
+            conn.close()
+
+        sections: Dict[str, List[str]] = {}
+        for row in rows:
+            frontmatter = json.loads(row["frontmatter"] or "{}")
+            folder = row["path"].split("/", 1)[0] if "/" in row["path"] else "."
+            line = f"- [{row['title']}]({row['path']})"
+
+            tags = [str(tag) for key in INDEX_MD_TAG_KEYS for tag in _flatten(frontmatter.get(key))]
+            if tags:
+                line += f" `{', '.join(tags)}`"
+            summary = _first(frontmatter, INDEX_MD_SUMMARY_KEYS)
+            if summary:
+                summary = " ".join(summary.split())
+                if len(summary) > INDEX_MD_SUMMARY_MAX_CHARS:
+                    summary = summary[:INDEX_MD_SUMMARY_MAX_CHARS].rstrip() + "…"
+                line += f" - {summary}"
+            line += f" ({datetime.fromtimestamp(row['mtime']).strftime('%Y-%m-%d')})"
+            sections.setdefault(folder, []).append(line)
+
+        lines = ["# Memory Index", "", f"{len(rows)} memory files. Generated from the memories folder; do not edit by hand."]
+        for folder, entries in sections.items():
+            lines += ["", f"## {folder} ({len(entries)})", *entries]
+        return "\n".join(lines) + "\n"
+
+    def write_index_md(self) -> bool:
+        """
+        Rebuild memories/index.md from the memory files.
+
+        Returns:
+            True if index.md changed
+        """
+        content = self.render_index_md()
+        index_path = self.memories_path / "index.md"
+        try:
+            if index_path.read_text(encoding="utf-8") == content:
+                return False
+        except OSError:
+            pass
+
+        self.memories_path.mkdir(parents=True, exist_ok=True)
+        temp_path = index_path.with_name(".index.md.tmp")
+        temp_path.write_text(content, encoding="utf-8")
+        os.replace(temp_path, index_path)
+        logging.info(f"[MEMORY_INDEX] Wrote index.md ({content.count(chr(10) + '- ')} files)")
+        return True
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        channel_id: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank memory files for `query` with BM25.
+
+        Files whose frontmatter matches `channel_id`/`user_id` are always
+        included first (they hold channel/user guidelines).
+
+        Returns:
+            [{"path", "title", "score", "pinned", "snippet"}, ...]
+        """
+        self.refresh()
+        terms = list(dict.fromkeys(tokenize(query)))
+
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT COUNT(*) AS n, AVG(length) AS avgdl FROM documents").fetchone()
+            total_docs, avgdl = row["n"], row["avgdl"] or 1.0
+            if not total_docs:
+                return []
+
+            scores: Counter = Counter()
+            for term in terms:
+                postings = conn.execute(
+                    "SELECT p.path, p.tf, d.length FROM postings p JOIN documents d ON d.path = p.path WHERE p.term = ?",
+                    (term,)
+                ).fetchall()
+                if not postings:
+                    continue
+                df = len(postings)
+                idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+                for posting in postings:
+                    tf = posting["tf"]
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * posting["length"] / avgdl)
+                    scores[posting["path"]] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+            pinned = []
+            for column, value in (("channel_id", channel_id), ("user_id", user_id)):
+                if value:
+                    pinned.extend(
+                        r["path"] for r in conn.execute(f"SELECT path FROM documents WHERE {column} = ?", (value,))
+                    )
+            pinned = list(dict.fromkeys(pinned))
+
+            ranked = pinned + [path for path, _ in scores.most_common() if path not in pinned]
+            results = []
+            for path in ranked[:max(top_k, len(pinned))]:
+                doc = conn.execute("SELECT title, body FROM documents WHERE path = ?", (path,)).fetchone()
+                if doc is None:
+                    continue
+                results.append({
+                    "path": path,
+                    "title": doc["title"],
+                    "score": round(scores.get(path, 0.0), 3),
+                    "pinned": path in pinned,
+                    "snippet": make_snippet(doc["body"], terms),
+                })
+            return results
+        finally:
+            conn.close()
+
+
+def make_snippet(body: str, terms: List[str], max_chars: int = SNIPPET_MAX_CHARS) -> str:
+    """Pick the paragraphs with the most query terms, in document order"""
+    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", body or "") if p.strip()]
+    if not paragraphs:
+        return ""
+
+    term_set = set(terms)
+    scored = []
+    for position, paragraph in enumerate(paragraphs):
+        overlap = len(term_set.intersection(tokenize(paragraph)))
+        scored.append((overlap, -position, paragraph))
+
+    chosen = []
+    used = 0
+    for overlap, neg_position, paragraph in sorted(scored, reverse=True):
+        if used and (overlap == 0 or used + len(paragraph) > max_chars):
+            continue
+        chosen.append((-neg_position, paragraph[:max_chars]))
+        used += len(paragraph)
+        if used >= max_chars:
+            break
+
+    return "\n\n".join(paragraph for _, paragraph in sorted(chosen))
+
+
+# Global index instance
+_memory_index: Optional[MemoryIndex] = None
+
+
+def get_memory_index() -> MemoryIndex:
+    """
+    Get or create global memory index instance.
+
+    Returns:
+        MemoryIndex instance
+    """
+    global _memory_index
+    if _memory_index is None:
+        _memory_index = MemoryIndex()
+    return _memory_index
@@ -0,0 +1,285 @@
+"""
+Memory Locks
+Lets several memory_manager runs write to memories/ in parallel
+
+Each write tool call of a memory_manager run locks the memory category it
+targets (the top-level folder or file under memories/, e.g. projects/ or
+decisions/) for as long as the tool runs. add_memory.py calls lock the category or path
+given in their arguments; other Bash commands that may write choose their
+target files themselves, so they lock every category. Runs editing
+different categories write concurrently; edits of the same category are
+serialized, whichever channel or user the run is for. index.md is not
+edited by the writers but rebuilt by IndexUpdater, a single serialized step
+that coalesces all writes since its last run.
+"""
+
+import asyncio
+import logging
+import os
+import shlex
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from claude_agent_sdk import HookMatcher
+
+# Tools that write the single file named in their input
+FILE_WRITE_TOOLS = {"Write": "file_path", "Edit": "file_path", "MultiEdit": "file_path", "NotebookEdit": "notebook_path"}
+
+# Bash commands that never write to memories/ (unless redirected)
+READ_ONLY_COMMANDS = {"cat", "echo", "find", "grep", "head", "ls", "pwd", "rg", "tail", "tree", "wc"}
+
+# Held by every unparsed Bash write, so categories created by a script are covered too
+SCRIPT_LOCK_KEY = "memories:scripts"
+
+# The memory store script (slack-memory-store skill) and its target arguments
+MEMORY_SCRIPT = "add_memory.py"
+CATEGORY_OPTIONS = ("--category",)
+PATH_OPTIONS = ("--path", "--file", "--file-path", "--file_path", "--output")
+
+# PreToolUse hooks give up waiting for a lock after this long (the CLI's hook timeout is 60s)
+LOCK_WAIT_TIMEOUT_SECONDS = 45.0
+
+# Shell syntax that can hide further commands or redirect output
+_SHELL_OPERATORS = (";", "|", ">", "<", "`", "$(")
+
+
+def _category_key(memories_path: str, target: str) -> Optional[str]:
+    """Lock key of the category a path belongs to (None outside memories/)"""
+    root = os.path.realpath(memories_path)
+    target = os.path.realpath(target)
+    if target == root or os.path.commonpath([root, target]) != root:
+        return None
+    return f"category:{os.path.relpath(target, root).split(os.sep)[0]}"
+
+
+def memory_lock_keys(tool_name: str, tool_input: dict, memories_path: str) -> List[str]:
+    """Lock keys of a memory_manager tool call (memory categories it may write)"""
+    if tool_name in FILE_WRITE_TOOLS:
+        key = _category_key(memories_path, tool_input.get(FILE_WRITE_TOOLS[tool_name]) or "")
+        return [key] if key else []
+
+    if tool_name == "Bash":
+        keys = _bash_lock_keys((tool_input.get("command") or "").strip(), memories_path)
+        if keys is not None:
+            return keys
+        try:
+            categories = sorted(os.listdir(memories_path))
+        except OSError:
+            categories = []
+        return [SCRIPT_LOCK_KEY] + [f"category:{name}" for name in categories]
+
+    return []
+
+
+def _bash_lock_keys(command: str, memories_path: str) -> Optional[List[str]]:
+    """
+    Lock keys of a Bash command made of `cd`, read-only commands and
+    add_memory.py calls joined by "&&"; None if the targets are unknown.
+    """
+    if any(operator in command for operator in _SHELL_OPERATORS) or "&" in command.replace("&&", ""):
+        return None
+
+    keys: List[str] = []
+    for part in command.split("&&"):
+        try:
+            args = shlex.split(part)
+        except ValueError:
+            return None
+        if not args or args[0] == "cd" or args[0] in READ_ONLY_COMMANDS:
+            continue
+        script = next((i for i, arg in enumerate(args) if os.path.basename(arg) == MEMORY_SCRIPT), None)
+        if script is None:
+            return None
+        key = _memory_script_key(args[script + 1:], memories_path)
+        if key is None:
+            return None
+        keys.append(key)
+    return keys
+
+
+def _memory_script_key(args: List[str], memories_path: str) -> Optional[str]:
+    """Category lock key of an add_memory.py call from its --category/--path argument"""
+    for i, arg in enumerate(args):
+        option, _, value = arg.partition("=")
+        if not value and i + 1 < len(args):
+            value = args[i + 1]
+        if not value:
+            continue
+        if option in CATEGORY_OPTIONS:
+            category = value.strip("/").split("/")[0]
+            if category and category not in (".", ".."):
+                return f"category:{category}"
+        if option in PATH_OPTIONS:
+            return _category_key(memories_path, os.path.join(memories_path, value))
+    return None
+
+
+class MemoryLockManager:
+    """Named asyncio locks, acquired in sorted order to avoid deadlocks"""
+
+    def __init__(self):
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._holders: Dict[str, int] = {}
+
+    async def acquire(self, keys: Iterable[str]) -> List[str]:
+        """Acquire all `keys`; returns them for release()"""
+        ordered = sorted(set(keys))
+        for key in ordered:
+            self._holders[key] = self._holders.get(key, 0) + 1
+        acquired = []
+        try:
+            for key in ordered:
+                lock = self._locks.setdefault(key, asyncio.Lock())
+                await lock.acquire()
+                acquired.append(key)
+        except BaseException:
+            self._release(ordered, acquired)
+            raise
+        return ordered
+
+    def release(self, keys: Iterable[str]) -> None:
+        ordered = sorted(set(keys))
+        self._release(ordered, ordered)
+
+    def _release(self, ordered: List[str], acquired: List[str]) -> None:
+        for key in reversed(acquired):
+            self._locks[key].release()
+        for key in ordered:
+            # Drop locks nobody holds or waits for
+            self._holders[key] -= 1
+            if not self._holders[key]:
+                del self._holders[key]
+                self._locks.pop(key, None)
+
+    @asynccontextmanager
+    async def hold(self, keys: Iterable[str]):
+        ordered = await self.acquire(keys)
+        try:
+            yield
+        finally:
+            self.release(ordered)
+
+    def active_keys(self) -> List[str]:
+        return sorted(self._holders)
+
+
+_memory_locks: Optional[MemoryLockManager] = None
+
+
+def get_memory_locks() -> MemoryLockManager:
+    """Locks shared by all memory_manager runs of this process"""
+    global _memory_locks
+    if _memory_locks is None:
+        _memory_locks = MemoryLockManager()
+    return _memory_locks
+
+
+class MemoryWriteGuard:
+    """
+    PreToolUse/PostToolUse hooks of one memory_manager session.
+
+    Locks the categories a write tool call targets before it runs and
+    releases them when it finishes. PostToolUse only follows successful
+    calls, so keys left by a failed call stay with the session: its next
+    call reuses them and `release_all()` frees them when the session ends.
+    A call that cannot get its locks within `wait_timeout` is denied (the
+    agent retries it) rather than letting the hook time out.
+    """
+
+    def __init__(self, locks: MemoryLockManager, memories_path: str, wait_timeout: float = LOCK_WAIT_TIMEOUT_SECONDS):
+        self._locks = locks
+        self.memories_path = memories_path
+        self.wait_timeout = wait_timeout
+        self._held: Dict[str, List[str]] = {}
+
+    async def before_tool(self, input_data: dict, tool_use_id: Optional[str], context: Any) -> dict:
+        keys = memory_lock_keys(input_data.get("tool_name", ""), input_data.get("tool_input") or {}, self.memories_path)
+        if not keys or not tool_use_id:
+            return {}
+
+        # Keys this session still holds (e.g. from a failed call) move to this call
+        reused = []
+        for held_id, held_keys in list(self._held.items()):
+            reused += [key for key in held_keys if key in keys]
+            self._held[held_id] = [key for key in held_keys if key not in keys]
+            if not self._held[held_id]:
+                del self._held[held_id]
+        missing = [key for key in keys if key not in reused]
+
+        try:
+            acquired = await asyncio.wait_for(self._locks.acquire(missing), timeout=self.wait_timeout) if missing else []
+        except asyncio.TimeoutError:
+            if reused:
+                self._held[tool_use_id] = reused
+            logging.warning(f"[MEMORY_LOCKS] {input_data.get('tool_name')} waited {self.wait_timeout}s for {missing}, denying")
+            return {
+                "hookSpecificOutput": {
+                    "hookEventName": "PreToolUse",
+                    "permissionDecision": "deny",
+                    "permissionDecisionReason": "Another memory writer is editing these memory files. Try again shortly.",
+                }
+            }
+
+        self._held[tool_use_id] = reused + acquired
+        logging.debug(f"[MEMORY_LOCKS] {input_data.get('tool_name')} holds {keys}")
+        return {}
+
+    async def after_tool(self, input_data: dict, tool_use_id: Optional[str], context: Any) -> dict:
+        keys = self._held.pop(tool_use_id, None) if tool_use_id else None
+        if keys:
+            self._locks.release(keys)
+        return {}
+
+    def release_all(self) -> None:
+        for keys in self._held.values():
+            self._locks.release(keys)
+        self._held.clear()
+
+    def hooks(self) -> dict:
+        """`hooks` option for ClaudeAgentOptions"""
+        matcher = "|".join(["Bash", *FILE_WRITE_TOOLS])
+        return {
+            "PreToolUse": [HookMatcher(matcher=matcher, hooks=[self.before_tool])],
+            "PostToolUse": [HookMatcher(matcher=matcher, hooks=[self.after_tool])],
+        }
+
+
+class IndexUpdater:
+    """
+    Serialized, coalesced index.md rebuild.
+
+    `mark_dirty()` after every memory write; once writes have been quiet for
+    `quiet_seconds`, `index_func()` runs once for all of them. Marks arriving
+    while it runs schedule exactly one more run.
+    """
+
+    def __init__(self, index_func: Callable[[], Awaitable[None]], quiet_seconds: float = 5.0):
+        self._index_func = index_func
+        self.quiet_seconds = quiet_seconds
+        self._dirty = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.marks = 0
+
+    def mark_dirty(self) -> None:
+        self.marks += 1
+        self._dirty.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._dirty.is_set():
+            # Debounce: wait until no new marks arrive for quiet_seconds
+            while True:
+                self._dirty.clear()
+                try:
+                    await asyncio.wait_for(self._dirty.wait(), timeout=self.quiet_seconds)
+                except asyncio.TimeoutError:
+                    break
+
+            self.runs += 1
+            try:
+                logging.info(f"[MEMORY_INDEX] Rebuilding index.md (run {self.runs}, {self.marks} writes so far)")
+                await self._index_func()
+            except Exception as e:
+                logging.error(f"[MEMORY_INDEX] index.md rebuild failed: {e}")
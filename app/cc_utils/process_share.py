@@ -0,0 +1,37 @@
+"""
+Process Share
+Fraction of the bot-wide limits that this process may use
+
+LLM_MAX_CONCURRENT_* and the Slack rate limits are meant for the whole bot.
+In orchestrator process mode every worker process builds its own LLM
+governor and pooled Slack client, so each process (the main process and every
+worker) is given an equal share and scales its limits by it.
+"""
+
+_share = 1.0
+
+
+def process_share_for(num_worker_processes: int) -> float:
+    """Equal share of the main process and `num_worker_processes` workers"""
+    return 1.0 / (num_worker_processes + 1)
+
+
+def set_process_share(share: float) -> None:
+    """Set this process' share (call before the governor/Slack client are used)"""
+    global _share
+    _share = min(1.0, max(share, 0.0))
+
+
+def get_process_share() -> float:
+    """This process' share of the bot-wide limits (1.0 outside process mode)"""
+    return _share
+
+
+def scale_rate(rate: float) -> float:
+    """Per-process part of a bot-wide rate"""
+    return rate * _share
+
+
+def scale_limit(limit: int) -> int:
+    """Per-process part of a bot-wide concurrency limit (at least 1)"""
+    return max(1, int(limit * _share))
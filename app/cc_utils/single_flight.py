@@ -0,0 +1,71 @@
+"""
+Single Flight
+Coalesces concurrent identical async calls into one in-flight computation
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Concurrent callers with the same key share one execution.
+
+    The first caller starts `func` as a task; callers arriving while it is in
+    flight await the same result (or exception). Nothing is cached after
+    completion. A cancelled caller does not cancel the shared computation
+    unless it was the last one waiting for it.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self.executed = 0
+        self.shared = 0
+
+    def is_inflight(self, key: Hashable) -> bool:
+        """Whether a computation for `key` is currently running"""
+        return key in self._inflight
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._waiters.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # Mark retrieved when nobody else is waiting
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `func()` once per key among concurrent callers.
+
+        Args:
+            key: Hashable identity of the call
+            func: Zero-argument coroutine factory
+
+        Returns:
+            Result of the (shared) computation
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            self._waiters[key] = 0
+            self.executed += 1
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        else:
+            self.shared += 1
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and self._waiters.get(key) == 1:
+                task.cancel()
+            raise
+        finally:
+            if self._inflight.get(key) is task:
+                self._waiters[key] -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """Execution/sharing counters for logging"""
+        return {"inflight": len(self._inflight), "executed": self.executed, "shared": self.shared}
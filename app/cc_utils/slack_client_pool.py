@@ -0,0 +1,266 @@
+"""
+Slack Client Pool
+Process-wide, rate-limit-aware AsyncWebClient shared by every module.
+
+- One aiohttp session with keep-alive connections (AsyncWebClient otherwise
+  opens a new session per request)
+- Per-method token buckets tuned to Slack's rate-limit tiers
+  (chat.postMessage is limited per channel)
+- Automatic backoff on HTTP 429 honouring Retry-After; the whole method
+  bucket pauses so other callers do not pile onto the same limit
+- Identical in-flight read calls are coalesced into a single request
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import aiohttp
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from app.cc_utils.process_share import scale_rate
+from app.cc_utils.single_flight import SingleFlight
+from app.config.settings import get_settings
+
+# Requests per minute (https://api.slack.com/apis/rate-limits)
+TIER_2 = 20
+TIER_3 = 50
+TIER_4 = 100
+POST_MESSAGE_PER_CHANNEL = 60  # ~1 message per second per channel
+
+METHOD_TIERS: Dict[str, int] = {
+    "users.list": TIER_2,
+    "conversations.list": TIER_2,
+    "usergroups.users.list": TIER_2,
+    "users.info": TIER_4,
+    "users.profile.get": TIER_4,
+    "conversations.members": TIER_4,
+    "chat.getPermalink": TIER_4,
+    "auth.test": TIER_4,
+    "conversations.info": TIER_3,
+    "conversations.history": TIER_3,
+    "conversations.replies": TIER_3,
+    "conversations.open": TIER_3,
+    "reactions.add": TIER_3,
+    "users.profile.set": TIER_3,
+    "chat.postMessage": TIER_4,  # Workspace-wide ceiling; per-channel bucket below
+}
+DEFAULT_TIER = TIER_3
+
+# Read-only methods whose identical concurrent calls can share one response
+COALESCED_METHODS = {
+    "users.info",
+    "users.list",
+    "users.profile.get",
+    "conversations.info",
+    "conversations.members",
+    "conversations.history",
+    "conversations.replies",
+    "conversations.list",
+    "usergroups.users.list",
+    "chat.getPermalink",
+    "auth.test",
+}
+
+MAX_RATE_LIMIT_RETRIES = 3
+DEFAULT_RETRY_AFTER_SECONDS = 5.0
+
+# aiohttp connection pool
+MAX_CONNECTIONS = 50
+KEEPALIVE_TIMEOUT_SECONDS = 60
+
+
+class TokenBucket:
+    """
+    Async token bucket (single event loop).
+
+    Refills at `rate_per_minute`, holds at most `burst` tokens, and can be
+    paused entirely after a 429.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: Optional[int] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = burst or max(1, int(rate_per_minute // 4))
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self) -> float:
+        """
+        Take one token, sleeping until available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            now = time.monotonic()
+            if now < self.paused_until:
+                delay = self.paused_until - now
+            else:
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Block all acquisitions for `seconds` (Retry-After)"""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+
+class PooledAsyncWebClient(AsyncWebClient):
+    """
+    AsyncWebClient that routes every API call through shared rate limiting,
+    429 backoff and read coalescing.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._buckets: Dict[Hashable, TokenBucket] = {}
+        self._single_flight = SingleFlight()
+        self.rate_limited = 0
+        self.throttle_wait_seconds = 0.0
+
+    def _get_bucket(self, key: Hashable, rate: float, burst: Optional[int] = None) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rate, burst)
+            self._buckets[key] = bucket
+        return bucket
+
+    def _buckets_for(self, api_method: str, payload: Dict[str, Any]) -> List[TokenBucket]:
+        """Method bucket, plus a per-channel bucket for chat.postMessage
+
+        Rates are this process' share of Slack's limits (split in process mode).
+        """
+        buckets = [self._get_bucket(api_method, scale_rate(METHOD_TIERS.get(api_method, DEFAULT_TIER)))]
+        if api_method == "chat.postMessage" and payload.get("channel"):
+            buckets.append(
+                self._get_bucket((api_method, payload["channel"]), scale_rate(POST_MESSAGE_PER_CHANNEL), burst=3)
+            )
+        return buckets
+
+    @staticmethod
+    def _payload(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {}
+        for field in ("params", "data", "json"):
+            value = kwargs.get(field)
+            if isinstance(value, dict):
+                payload.update(value)
+        return payload
+
+    async def _call_with_backoff(self, api_method: str, payload: Dict[str, Any], kwargs: Dict[str, Any]):
+        buckets = self._buckets_for(api_method, payload)
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            for bucket in buckets:
+                self.throttle_wait_seconds += await bucket.acquire()
+            try:
+                return await super().api_call(api_method, **kwargs)
+            except SlackApiError as e:
+                response = e.response
+                if getattr(response, "status_code", None) != 429 or attempt >= MAX_RATE_LIMIT_RETRIES:
+                    raise
+
+                retry_after = DEFAULT_RETRY_AFTER_SECONDS
+                try:
+                    retry_after = float(response.headers.get("Retry-After", retry_after))
+                except (TypeError, ValueError, AttributeError):
+                    pass
+
+                self.rate_limited += 1
+                for bucket in buckets:
+                    bucket.pause(retry_after)
+                logging.warning(
+                    f"[SLACK_POOL] 429 on {api_method}, retrying in {retry_after:.1f}s "
+                    f"(attempt {attempt + 1}/{MAX_RATE_LIMIT_RETRIES})"
+                )
+
+    async def api_call(self, api_method: str, **kwargs):
+        payload = self._payload(kwargs)
+
+        if api_method in COALESCED_METHODS and not kwargs.get("files"):
+            key: Tuple = (api_method, json.dumps(payload, sort_keys=True, default=str))
+            return await self._single_flight.do(
+                key, lambda: self._call_with_backoff(api_method, payload, kwargs)
+            )
+
+        return await self._call_with_backoff(api_method, payload, kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Rate limiting and coalescing counters for logging"""
+        return {
+            "rate_limited": self.rate_limited,
+            "throttle_wait_seconds": round(self.throttle_wait_seconds, 2),
+            "coalesced": self._single_flight.stats(),
+            "buckets": len(self._buckets),
+        }
+
+
+# Global pooled client (bound to the event loop it was created on)
+_pooled_client: Optional[PooledAsyncWebClient] = None
+_pooled_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_pooled_slack_client() -> PooledAsyncWebClient:
+    """
+    Get or create the process-wide pooled Slack client.
+
+    The aiohttp session is created lazily on the running event loop; a new
+    client is built if called from a different loop (e.g. a worker process).
+
+    Returns:
+        PooledAsyncWebClient instance
+    """
+    global _pooled_client, _pooled_loop
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if _pooled_client is not None and (loop is None or loop is _pooled_loop):
+        return _pooled_client
+
+    settings = get_settings()
+    token = settings.SLACK_BOT_TOKEN
+    if not token:
+        raise ValueError("SLACK_BOT_TOKEN is not set in settings")
+
+    session = None
+    if loop is not None:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=MAX_CONNECTIONS,
+                keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS
+            )
+        )
+
+    _pooled_client = PooledAsyncWebClient(token=token, session=session)
+    _pooled_loop = loop
+    logging.info("[SLACK_POOL] Created pooled Slack client")
+    return _pooled_client
+
+
+async def use_pooled_slack_client(context, next):
+    """
+    Bolt global middleware: hand listeners the pooled client.
+
+    Bolt builds a plain AsyncWebClient for every incoming request (copying
+    only token, session and headers), so without this the `client` passed to
+    matchers and handlers would bypass rate limiting, 429 backoff and
+    coalescing. Register with `app.middleware(use_pooled_slack_client)`.
+    """
+    context["client"] = get_pooled_slack_client()
+    await next()
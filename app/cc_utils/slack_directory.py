@@ -0,0 +1,336 @@
+"""
+Slack Directory
+In-process directory of users, channels and memberships.
+
+Warmed once at startup with paginated users.list / conversations.list and kept
+current from Slack events (user_change, member_joined_channel,
+member_left_channel, channel_left, group_left). Lookups that miss fall back to
+a single API call and populate the directory, so the per-message hot path
+rarely has to talk to Slack.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from app.cc_utils.ttl_cache import TTLCache
+
+# Events keep entries current; the TTL only bounds staleness for changes we
+# are not subscribed to (renames, profile edits of users outside the team, ...)
+USER_TTL_SECONDS = 6 * 60 * 60
+CHANNEL_TTL_SECONDS = 60 * 60
+MEMBERS_TTL_SECONDS = 60 * 60
+
+WARM_PAGE_SIZE = 200
+
+# A name search that misses the warmed user list reloads it at most this often
+USERS_RELOAD_MIN_INTERVAL_SECONDS = 5 * 60
+WARM_CHANNEL_TYPES = "public_channel,private_channel,mpim"
+
+
+class SlackDirectory:
+    """
+    Cache of raw Slack user/channel objects and channel member sets.
+
+    Stored objects are the raw `user` / `channel` dicts returned by the Slack
+    API, so callers keep using the field names they already know.
+    """
+
+    def __init__(self):
+        self._users = TTLCache(USER_TTL_SECONDS, max_entries=100000)
+        self._channels = TTLCache(CHANNEL_TTL_SECONDS, max_entries=50000)
+        self._members = TTLCache(MEMBERS_TTL_SECONDS, max_entries=50000)
+        self._client: Optional[AsyncWebClient] = None
+        self._users_loaded_at: Optional[float] = None
+        self._users_lock = asyncio.Lock()
+        self.api_fallbacks = 0
+
+    # -----------------------------------------
+    # Setup
+    # -----------------------------------------
+
+    def set_client(self, client: AsyncWebClient) -> None:
+        """Set the default client used for fallback lookups"""
+        self._client = client
+
+    def _get_client(self, client: Optional[AsyncWebClient]) -> AsyncWebClient:
+        if client is not None:
+            return client
+        if self._client is None:
+            from app.cc_utils.slack_helper import get_async_slack_client
+            self._client = get_async_slack_client()
+        return self._client
+
+    @property
+    def is_warmed(self) -> bool:
+        """Whether the full user list was loaded successfully within USER_TTL_SECONDS"""
+        return (
+            self._users_loaded_at is not None
+            and time.monotonic() - self._users_loaded_at < USER_TTL_SECONDS
+        )
+
+    async def _paginate(self, method, result_key: str, **kwargs) -> List[Dict[str, Any]]:
+        """Collect every page of a cursor-paginated Slack list method"""
+        items: List[Dict[str, Any]] = []
+        cursor = None
+        while True:
+            if cursor:
+                kwargs["cursor"] = cursor
+            response = await method(**kwargs)
+            items.extend(response.get(result_key, []))
+            cursor = response.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                return items
+
+    async def warm(self, client: Optional[AsyncWebClient] = None) -> None:
+        """
+        Load all users and channels with paginated list calls.
+
+        Member lists are loaded lazily per channel on first use.
+        """
+        client = self._get_client(client)
+
+        try:
+            await self.load_users(client)
+        except SlackApiError as e:
+            logging.warning(f"[SLACK_DIRECTORY] Failed to warm users: {e}")
+
+        try:
+            channels = await self._paginate(
+                client.conversations_list,
+                "channels",
+                types=WARM_CHANNEL_TYPES,
+                exclude_archived=True,
+                limit=WARM_PAGE_SIZE
+            )
+            for channel in channels:
+                self._channels.set(channel["id"], channel)
+            logging.info(f"[SLACK_DIRECTORY] Loaded {len(channels)} channels")
+        except SlackApiError as e:
+            logging.warning(f"[SLACK_DIRECTORY] Failed to warm channels: {e}")
+
+    async def load_users(self, client: Optional[AsyncWebClient] = None) -> None:
+        """
+        (Re)load the full user list with paginated users.list.
+
+        Raises:
+            SlackApiError: If the list cannot be fetched (directory stays unwarmed)
+        """
+        async with self._users_lock:
+            users = await self._paginate(self._get_client(client).users_list, "members", limit=WARM_PAGE_SIZE)
+            for user in users:
+                self._users.set(user["id"], user)
+            self._users_loaded_at = time.monotonic()
+        logging.info(f"[SLACK_DIRECTORY] Loaded {len(users)} users")
+
+    # -----------------------------------------
+    # Lookups
+    # -----------------------------------------
+
+    def peek_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Return cached user without calling Slack"""
+        return self._users.get(user_id)
+
+    def peek_channel(self, channel_id: str) -> Optional[Dict[str, Any]]:
+        """Return cached channel without calling Slack"""
+        return self._channels.get(channel_id)
+
+    def peek_channel_members(self, channel_id: str) -> Optional[List[str]]:
+        """Return cached member IDs without calling Slack"""
+        members = self._members.get(channel_id)
+        return list(members) if members is not None else None
+
+    async def get_user(self, user_id: str, client: Optional[AsyncWebClient] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return raw Slack user object (users.info on cache miss).
+
+        Returns:
+            User dict, or None if the user cannot be fetched
+        """
+        user = self._users.get(user_id)
+        if user is not None:
+            return user
+
+        self.api_fallbacks += 1
+        try:
+            response = await self._get_client(client).users_info(user=user_id)
+        except SlackApiError as e:
+            logging.warning(f"[SLACK_DIRECTORY] users.info failed for {user_id}: {e}")
+            return None
+
+        user = response["user"]
+        self._users.set(user_id, user)
+        return user
+
+    async def get_channel(self, channel_id: str, client: Optional[AsyncWebClient] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return raw Slack channel object (conversations.info on cache miss).
+
+        Returns:
+            Channel dict, or None if the channel cannot be fetched
+        """
+        channel = self._channels.get(channel_id)
+        if channel is not None:
+            return channel
+
+        self.api_fallbacks += 1
+        try:
+            response = await self._get_client(client).conversations_info(channel=channel_id)
+        except SlackApiError as e:
+            logging.debug(f"[SLACK_DIRECTORY] conversations.info failed for {channel_id}: {e}")
+            return None
+
+        channel = response["channel"]
+        self._channels.set(channel_id, channel)
+        return channel
+
+    async def get_channel_members(self, channel_id: str, client: Optional[AsyncWebClient] = None) -> List[str]:
+        """
+        Return member IDs of a channel (paginated conversations.members on miss).
+
+        Raises:
+            SlackApiError: If the member list cannot be fetched
+        """
+        members = self._members.get(channel_id)
+        if members is not None:
+            return list(members)
+
+        self.api_fallbacks += 1
+        member_list = await self._paginate(
+            self._get_client(client).conversations_members,
+            "members",
+            channel=channel_id,
+            limit=1000
+        )
+        self._members.set(channel_id, set(member_list))
+        return member_list
+
+    async def is_bot_member(self, channel_id: str, client: Optional[AsyncWebClient] = None) -> bool:
+        """Whether the bot is a member of the channel"""
+        channel = await self.get_channel(channel_id, client)
+        return bool(channel and channel.get("is_member", False))
+
+    async def search_users(self, name: str, client: Optional[AsyncWebClient] = None) -> List[Dict[str, Any]]:
+        """
+        Search users by real_name/display_name, reloading the user list when needed.
+
+        The cached list is searched only while it is fresh. A stale or failed
+        warm, or a search with no cached match, reloads it with users.list
+        (misses reload at most every USERS_RELOAD_MIN_INTERVAL_SECONDS).
+
+        Raises:
+            SlackApiError: If the user list has to be reloaded and cannot be fetched
+        """
+        if self.is_warmed:
+            matches = self.find_users_by_name(name)
+            if matches or time.monotonic() - self._users_loaded_at < USERS_RELOAD_MIN_INTERVAL_SECONDS:
+                return matches
+
+        self.api_fallbacks += 1
+        await self.load_users(client)
+        return self.find_users_by_name(name)
+
+    def find_users_by_name(self, name: str) -> List[Dict[str, Any]]:
+        """
+        Search cached (non-deleted, non-bot) users by real_name/display_name.
+
+        Only complete while the directory is warmed; use search_users() otherwise.
+        """
+        search_name = name.strip().lower()
+        matches = []
+        for user in self._users.values():
+            if user.get("deleted") or user.get("is_bot"):
+                continue
+            real_name = user.get("real_name", "").lower()
+            display_name = user.get("profile", {}).get("display_name", "").lower()
+            if search_name in real_name or search_name in display_name:
+                matches.append(user)
+        return matches
+
+    # -----------------------------------------
+    # Event-driven updates
+    # -----------------------------------------
+
+    def on_user_change(self, user: Dict[str, Any]) -> None:
+        """user_change / team_join: replace the stored user object"""
+        if user and user.get("id"):
+            self._users.set(user["id"], user)
+            logging.debug(f"[SLACK_DIRECTORY] User updated: {user['id']}")
+
+    def on_member_joined(self, channel_id: str, user_id: str, is_self: bool = False) -> None:
+        """member_joined_channel: add member (and mark bot membership)"""
+        members = self._members.get(channel_id)
+        if members is not None:
+            members.add(user_id)
+
+        channel = self._channels.get(channel_id)
+        if is_self:
+            if channel is not None:
+                channel["is_member"] = True
+            else:
+                # Unknown channel - fetch fresh on next lookup
+                self._channels.invalidate(channel_id)
+        elif channel is not None and "num_members" in channel and members is not None:
+            channel["num_members"] = len(members)
+        logging.debug(f"[SLACK_DIRECTORY] {user_id} joined {channel_id}")
+
+    def on_member_left(self, channel_id: str, user_id: str, is_self: bool = False) -> None:
+        """member_left_channel: remove member (and bot membership)"""
+        if is_self:
+            self.on_bot_left(channel_id)
+            return
+
+        members = self._members.get(channel_id)
+        if members is not None:
+            members.discard(user_id)
+            channel = self._channels.get(channel_id)
+            if channel is not None and "num_members" in channel:
+                channel["num_members"] = len(members)
+        logging.debug(f"[SLACK_DIRECTORY] {user_id} left {channel_id}")
+
+    def on_bot_left(self, channel_id: str) -> None:
+        """channel_left / group_left: bot is no longer a member"""
+        channel = self._channels.get(channel_id)
+        if channel is not None:
+            channel["is_member"] = False
+        self._members.invalidate(channel_id)
+        logging.info(f"[SLACK_DIRECTORY] Bot left {channel_id}")
+
+    def invalidate(self, channel_id: Optional[str] = None, user_id: Optional[str] = None) -> None:
+        """Drop cached data so the next lookup refetches"""
+        if channel_id:
+            self._channels.invalidate(channel_id)
+            self._members.invalidate(channel_id)
+        if user_id:
+            self._users.invalidate(user_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics for logging"""
+        return {
+            "warmed": self.is_warmed,
+            "users": self._users.stats(),
+            "channels": self._channels.stats(),
+            "members": self._members.stats(),
+            "api_fallbacks": self.api_fallbacks,
+        }
+
+
+# Global directory instance
+_slack_directory: Optional[SlackDirectory] = None
+
+
+def get_slack_directory() -> SlackDirectory:
+    """
+    Get or create global Slack directory instance.
+
+    Returns:
+        SlackDirectory instance
+    """
+    global _slack_directory
+    if _slack_directory is None:
+        _slack_directory = SlackDirectory()
+    return _slack_directory
@@ -6,18 +6,38 @@ Utility functions for querying channel info, user info, etc.
 from typing import Dict, Any, Optional, List
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+import asyncio
+import logging
 import os
 
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
+
+from app.cc_utils.slack_client_pool import MAX_RATE_LIMIT_RETRIES, get_pooled_slack_client
+from app.cc_utils.slack_directory import get_slack_directory
+
 # Bot profile image cache
 _bot_profile_image: Optional[str] = None
 
+# Shared sync client (connection reuse across helper calls)
+_sync_client: Optional[WebClient] = None
+
 
 def get_slack_client() -> WebClient:
-    """Return Slack WebClient instance"""
-    token = os.getenv("SLACK_BOT_TOKEN")
-    if not token:
-        raise ValueError("SLACK_BOT_TOKEN environment variable is not set")
-    return WebClient(token=token)
+    """Return shared Slack WebClient instance (retries on HTTP 429)"""
+    global _sync_client
+    if _sync_client is None:
+        token = os.getenv("SLACK_BOT_TOKEN")
+        if not token:
+            raise ValueError("SLACK_BOT_TOKEN environment variable is not set")
+        _sync_client = WebClient(token=token)
+        _sync_client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=MAX_RATE_LIMIT_RETRIES))
+    return _sync_client
+
+
+def get_async_slack_client() -> AsyncWebClient:
+    """Return the shared, rate-limit-aware Slack AsyncWebClient"""
+    return get_pooled_slack_client()
 
 
 def get_channel_info(channel_id: str) -> Optional[Dict[str, Any]]:
@@ -39,6 +59,24 @@ def get_channel_info(channel_id: str) -> Optional[Dict[str, Any]]:
             "members": List[str]  # List of channel member IDs
         }
     """
+    # Serve from the Slack directory when both channel and members are cached
+    directory = get_slack_directory()
+    cached_channel = directory.peek_channel(channel_id)
+    cached_members = directory.peek_channel_members(channel_id)
+    if cached_channel and cached_members is not None:
+        channel_type = _classify_channel(cached_channel)
+        members = cached_members if channel_type != "dm" else []
+        return {
+            "channel_id": cached_channel["id"],
+            "channel_name": cached_channel.get("name", "Direct Message"),
+            "channel_type": channel_type,
+            "is_private": cached_channel.get("is_private", False),
+            "topic": cached_channel.get("topic", {}).get("value", ""),
+            "purpose": cached_channel.get("purpose", {}).get("value", ""),
+            "member_count": cached_channel.get("num_members", len(members)),
+            "members": members
+        }
+
     client = get_slack_client()
 
     try:
@@ -130,6 +168,11 @@ def get_user_info(user_id: str) -> Optional[Dict[str, Any]]:
             "timezone": str
         }
     """
+    # Serve from the Slack directory when possible (no blocking API call)
+    cached_user = get_slack_directory().peek_user(user_id)
+    if cached_user:
+        return _user_to_info(cached_user)
+
     client = get_slack_client()
 
     try:
@@ -354,3 +397,246 @@ def get_slack_context_data(channel_id: str, message_limit: int = 10) -> Dict[str
     }
 
 
+# =============================================
+# Async context builder (non-blocking, cached)
+# =============================================
+
+# Upper bound on concurrent users_info calls per context build
+USER_FETCH_CONCURRENCY = 10
+
+
+def _classify_channel(channel: Dict[str, Any]) -> str:
+    """Map conversations.info flags to our channel_type values"""
+    if channel.get("is_im"):
+        return "dm"
+    if channel.get("is_mpim"):
+        return "group_dm"
+    if channel.get("is_private"):
+        return "private_channel"
+    return "public_channel"
+
+
+def _user_to_info(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a users.info `user` object to the get_user_info() shape"""
+    profile = user.get("profile", {})
+    return {
+        "user_id": user["id"],
+        "real_name": user.get("real_name", ""),
+        "display_name": profile.get("display_name", ""),
+        "email": profile.get("email", ""),
+        "is_bot": user.get("is_bot", False),
+        "timezone": user.get("tz", "")
+    }
+
+
+async def get_channel_info_async(
+    channel_id: str,
+    client: Optional[AsyncWebClient] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Async version of get_channel_info(), served from the Slack directory.
+
+    Channel info and member list are resolved concurrently; only cache misses
+    reach the Slack API.
+
+    Args:
+        channel_id: Slack channel ID
+        client: AsyncWebClient to use for cache misses
+
+    Returns:
+        Same shape as get_channel_info(), or None on failure
+    """
+    directory = get_slack_directory()
+
+    # DMs (IDs start with "D") only ever hold the user and the bot - skip conversations.members
+    cached_channel = directory.peek_channel(channel_id)
+    if channel_id.startswith("D") or (cached_channel and cached_channel.get("is_im")):
+        try:
+            channel = await directory.get_channel(channel_id, client)
+        except Exception as e:
+            logging.warning(f"[SLACK_CONTEXT] Error fetching channel info for {channel_id}: {e}")
+            return None
+        members_result = []
+    else:
+        # A failed member fetch is not cached, so the next message retries it
+        channel, members_result = await asyncio.gather(
+            directory.get_channel(channel_id, client),
+            directory.get_channel_members(channel_id, client),
+            return_exceptions=True
+        )
+
+    if isinstance(channel, Exception) or not channel:
+        logging.warning(f"[SLACK_CONTEXT] Error fetching channel info for {channel_id}: {channel}")
+        return None
+
+    channel_type = _classify_channel(channel)
+
+    members: List[str] = []
+    if channel_type != "dm":
+        if isinstance(members_result, Exception):
+            logging.warning(f"[SLACK_CONTEXT] Failed to get channel members for {channel_id}: {members_result}")
+        else:
+            members = members_result
+
+    return {
+        "channel_id": channel["id"],
+        "channel_name": channel.get("name", "Direct Message"),
+        "channel_type": channel_type,
+        "is_private": channel.get("is_private", False),
+        "is_member": channel.get("is_member", False),
+        "topic": channel.get("topic", {}).get("value", ""),
+        "purpose": channel.get("purpose", {}).get("value", ""),
+        "member_count": channel.get("num_members", len(members)),
+        "members": members
+    }
+
+
+async def get_user_info_async(
+    user_id: str,
+    client: Optional[AsyncWebClient] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Async version of get_user_info(), served from the Slack directory.
+
+    Returns:
+        Same shape as get_user_info(), or None on failure
+    """
+    user = await get_slack_directory().get_user(user_id, client)
+    return _user_to_info(user) if user else None
+
+
+async def get_users_info_async(
+    user_ids: List[str],
+    client: Optional[AsyncWebClient] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Resolve many users concurrently (bounded), serving cached entries first.
+
+    Returns:
+        {user_id: user_info} for every user that could be resolved
+    """
+    semaphore = asyncio.Semaphore(USER_FETCH_CONCURRENCY)
+
+    async def fetch(user_id: str):
+        async with semaphore:
+            return user_id, await get_user_info_async(user_id, client)
+
+    results = await asyncio.gather(*(fetch(uid) for uid in dict.fromkeys(user_ids)))
+    return {user_id: info for user_id, info in results if info}
+
+
+async def get_recent_messages_async(
+    channel_id: str,
+    limit: int = 100,
+    client: Optional[AsyncWebClient] = None
+) -> List[Dict[str, Any]]:
+    """
+    Async version of get_recent_messages() (never cached - history is volatile).
+
+    Returns:
+        List of message dicts (newest first)
+    """
+    client = client or get_async_slack_client()
+
+    try:
+        response = await client.conversations_history(channel=channel_id, limit=limit)
+        return response["messages"]
+    except Exception as e:
+        # Timeouts and connection errors degrade to no history like Slack API errors
+        logging.warning(f"[SLACK_CONTEXT] Error fetching recent messages for {channel_id}: {e}")
+        return []
+
+
+def invalidate_slack_context_cache(channel_id: Optional[str] = None, user_id: Optional[str] = None) -> None:
+    """
+    Drop cached channel/member/user data.
+
+    Args:
+        channel_id: Channel whose info and member list should be refetched
+        user_id: User whose profile should be refetched
+    """
+    get_slack_directory().invalidate(channel_id=channel_id, user_id=user_id)
+
+
+async def get_slack_context_data_async(
+    channel_id: str,
+    message_limit: int = 10,
+    client: Optional[AsyncWebClient] = None
+) -> Dict[str, Any]:
+    """
+    Non-blocking equivalent of get_slack_context_data().
+
+    Channel info, member list and history are fetched concurrently; member and
+    message-author profiles are then resolved in one bounded fan-out, with
+    channel/member/user data served from the Slack directory.
+
+    Args:
+        channel_id: Slack channel ID
+        message_limit: Number of recent messages to retrieve (default 10)
+        client: AsyncWebClient to use (e.g. the Bolt app client)
+
+    Returns:
+        Same structure as get_slack_context_data()
+    """
+    client = client or get_async_slack_client()
+
+    channel_info, messages = await asyncio.gather(
+        get_channel_info_async(channel_id, client),
+        get_recent_messages_async(channel_id, message_limit, client)
+    )
+
+    if not channel_info:
+        return {
+            "channel": {
+                "channel_id": channel_id,
+                "channel_name": "Unknown",
+                "channel_type": "unknown",
+                "topic": "",
+                "purpose": "",
+                "member_count": 0
+            },
+            "members": [],
+            "recent_messages": []
+        }
+
+    # Resolve members and message authors in a single fan-out
+    author_ids = [msg["user"] for msg in messages if msg.get("user")]
+    users = await get_users_info_async(channel_info["members"] + author_ids, client)
+
+    members_info = [
+        users[user_id] for user_id in channel_info["members"]
+        if user_id in users and not users[user_id]["is_bot"]  # Exclude bots
+    ]
+
+    # Sort oldest first (messages are returned newest first)
+    conversation_history = []
+    for msg in reversed(messages):
+        user_id = msg.get("user")
+        if user_id:
+            user_name = users[user_id]["real_name"] if user_id in users else user_id
+        elif msg.get("bot_id"):
+            user_name = "Bot"
+        else:
+            user_name = "Unknown"
+        conversation_history.append(f"[{user_name}]: {msg.get('text', '')}")
+
+    return {
+        "channel": {
+            "channel_id": channel_info["channel_id"],
+            "channel_name": channel_info["channel_name"],
+            "channel_type": channel_info["channel_type"],
+            "topic": channel_info["topic"],
+            "purpose": channel_info["purpose"],
+            "member_count": channel_info["member_count"]
+        },
+        "members": [
+            {
+                "user_id": m["user_id"],
+                "real_name": m["real_name"],
+                "display_name": m["display_name"],
+                "email": m["email"]
+            }
+            for m in members_info
+        ],
+        "recent_messages": conversation_history
+    }
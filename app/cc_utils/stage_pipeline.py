@@ -0,0 +1,93 @@
+"""
+Stage Pipeline
+Runs the triage stages of message processing with speculative concurrency.
+
+Independent stages are started up front; gates are awaited in order and
+speculative work that a gate makes unnecessary is cancelled. Every stage's
+duration and outcome is recorded for a per-message timing log.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Dict, Optional
+
+
+class StagePipeline:
+    """
+    Per-message stage executor.
+
+    Usage:
+        pipeline = StagePipeline("C123/1700000000.000100")
+        pipeline.start("memory", call_memory_retriever(...))   # speculative
+        if not await pipeline.run("bot_call", call_bot_call_detector(...)):
+            pipeline.cancel("memory", reason="bot not called")
+            return
+        memory = await pipeline.result("memory")
+        ...
+        pipeline.finish()
+    """
+
+    def __init__(self, label: str):
+        self.label = label
+        self.started_at = time.monotonic()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.timings: Dict[str, Dict[str, Any]] = {}
+
+    async def _timed(self, stage: str, coro: Awaitable[Any]) -> Any:
+        started = time.monotonic()
+        status = "ok"
+        try:
+            return await coro
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            self.timings[stage] = {
+                "seconds": round(time.monotonic() - started, 3),
+                "offset": round(started - self.started_at, 3),
+                "status": status,
+            }
+
+    def start(self, stage: str, coro: Awaitable[Any]) -> asyncio.Task:
+        """Start a stage in the background (speculatively)"""
+        task = asyncio.create_task(self._timed(stage, coro))
+        # Retrieve exceptions of stages nobody ends up awaiting
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._tasks[stage] = task
+        return task
+
+    def is_started(self, stage: str) -> bool:
+        return stage in self._tasks
+
+    async def result(self, stage: str) -> Any:
+        """Wait for a started stage and return its result"""
+        return await self._tasks[stage]
+
+    async def run(self, stage: str, coro: Awaitable[Any]) -> Any:
+        """Run a stage inline (timed)"""
+        return await self._timed(stage, coro)
+
+    def cancel(self, *stages: str, reason: str = "") -> None:
+        """Cancel speculative stages that are no longer needed"""
+        for stage in stages:
+            task = self._tasks.get(stage)
+            if task is not None and not task.done():
+                task.cancel()
+                logging.info(f"[PIPELINE] {self.label} cancelled {stage} ({reason})")
+
+    def finish(self, outcome: Optional[str] = None) -> None:
+        """Cancel leftover speculative stages and log per-stage timings"""
+        leftovers = [stage for stage, task in self._tasks.items() if not task.done()]
+        if leftovers:
+            self.cancel(*leftovers, reason="unused")
+
+        total = time.monotonic() - self.started_at
+        stages = ", ".join(
+            f"{stage}={timing['seconds']}s@{timing['offset']}s/{timing['status']}"
+            for stage, timing in self.timings.items()
+        )
+        logging.info(f"[PIPELINE] {self.label} outcome={outcome} total={total:.2f}s stages: {stages}")
@@ -0,0 +1,250 @@
+"""
+Time Utility
+
+Helper functions for current time, timezone conversion and relative-date
+resolution. Shared by the in-process time MCP server and the state prompt so
+agents rarely need a tool call just to learn what day it is.
+"""
+
+import re
+from datetime import date, datetime, timedelta, tzinfo
+from typing import Any, Dict, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from dateutil import parser as date_parser
+from dateutil.relativedelta import relativedelta
+
+KR_WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
+EN_WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+# Single-day expressions -> offset in days from today
+DAY_OFFSETS = {
+    "오늘": 0, "today": 0,
+    "어제": -1, "yesterday": -1,
+    "그제": -2, "그저께": -2, "엊그제": -2,
+    "내일": 1, "tomorrow": 1,
+    "모레": 2, "내일모레": 2,
+    "글피": 3,
+}
+
+# Calendar periods -> (unit, shift)
+KR_PERIODS = {
+    "이번주": ("weeks", 0), "금주": ("weeks", 0),
+    "지난주": ("weeks", -1), "저번주": ("weeks", -1),
+    "다음주": ("weeks", 1),
+    "이번달": ("months", 0),
+    "지난달": ("months", -1), "저번달": ("months", -1),
+    "다음달": ("months", 1),
+    "올해": ("years", 0), "금년": ("years", 0), "이번년도": ("years", 0),
+    "작년": ("years", -1), "지난해": ("years", -1),
+    "내년": ("years", 1),
+}
+
+KR_SHIFTS = {"지난": -1, "저번": -1, "이번": 0, "다음": 1}
+EN_SHIFTS = {"last": -1, "this": 0, "next": 1}
+KR_UNITS = {"일": "days", "주": "weeks", "주일": "weeks", "개월": "months", "달": "months", "년": "years"}
+
+_KR_UNIT_PATTERN = "주일|개월|일|주|달|년"
+_EN_UNIT_PATTERN = "day|week|month|year"
+_EN_WEEKDAY_PATTERN = "|".join(EN_WEEKDAYS)
+
+
+def get_zone(name: Optional[str] = None) -> tzinfo:
+    """Resolve an IANA timezone name, falling back to the server's local zone
+
+    Raises:
+        ValueError: Unknown timezone name
+    """
+    if not name:
+        return datetime.now().astimezone().tzinfo
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f"Unknown timezone: {name}")
+
+
+def zone_label(moment: datetime) -> str:
+    """IANA name when known, otherwise the abbreviation (e.g. KST)"""
+    return getattr(moment.tzinfo, "key", None) or moment.tzname() or ""
+
+
+def utc_offset(moment: datetime) -> str:
+    """UTC offset formatted as +09:00"""
+    offset = moment.strftime("%z")
+    return f"{offset[:3]}:{offset[3:]}" if offset else "+00:00"
+
+
+def describe_time(moment: datetime) -> Dict[str, Any]:
+    """Structured view of an aware datetime"""
+    return {
+        "datetime": moment.isoformat(timespec="seconds"),
+        "date": moment.strftime("%Y-%m-%d"),
+        "time": moment.strftime("%H:%M:%S"),
+        "weekday": EN_WEEKDAYS[moment.weekday()].capitalize(),
+        "timezone": zone_label(moment),
+        "utc_offset": utc_offset(moment),
+    }
+
+
+def now_in(timezone: Optional[str] = None) -> datetime:
+    """Current aware datetime in the given (or local) timezone"""
+    return datetime.now(get_zone(timezone))
+
+
+def format_current_time(now: Optional[datetime] = None) -> str:
+    """One-line current time for prompts, e.g. '2025-01-06 14:03 (월요일, Asia/Seoul, UTC+09:00)'"""
+    now = now or now_in()
+    return (
+        f"{now.strftime('%Y-%m-%d %H:%M')} "
+        f"({KR_WEEKDAYS[now.weekday()]}요일, {zone_label(now)}, UTC{utc_offset(now)})"
+    )
+
+
+def convert_time(value: str, source_timezone: Optional[str], target_timezone: Optional[str]) -> Dict[str, Any]:
+    """Convert a wall-clock time between timezones
+
+    Args:
+        value: 'HH:MM' (today in the source zone) or 'YYYY-MM-DD HH:MM[:SS]'
+        source_timezone: IANA name of the source zone (local zone when empty)
+        target_timezone: IANA name of the target zone (local zone when empty)
+
+    Raises:
+        ValueError: Unparsable time or unknown timezone
+    """
+    source_zone = get_zone(source_timezone)
+    target_zone = get_zone(target_timezone)
+    default = datetime.now(source_zone).replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+    try:
+        parsed = date_parser.parse(value, default=default)
+    except (ValueError, OverflowError):
+        raise ValueError(f"Unrecognized time: {value}")
+
+    source = parsed.replace(tzinfo=source_zone)
+    target = source.astimezone(target_zone)
+    difference = (target.utcoffset() - source.utcoffset()).total_seconds() / 3600
+    return {
+        "source": describe_time(source),
+        "target": describe_time(target),
+        "time_difference": f"{difference:+g}h",
+    }
+
+
+def _shift(today: date, unit: str, amount: int) -> date:
+    return today + relativedelta(**{unit: amount})
+
+
+def _period(today: date, unit: str, shift: int) -> tuple:
+    """Calendar week (Mon-Sun), month or year containing today, shifted"""
+    if unit == "weeks":
+        start = today - timedelta(days=today.weekday()) + timedelta(weeks=shift)
+        return start, start + timedelta(days=6)
+    if unit == "months":
+        start = today.replace(day=1) + relativedelta(months=shift)
+        return start, start + relativedelta(months=1) - timedelta(days=1)
+    year = today.year + shift
+    return date(year, 1, 1), date(year, 12, 31)
+
+
+def _weekday(today: date, weekday: int, shift: int) -> date:
+    """Given weekday of the calendar week shifted from today's"""
+    monday = today - timedelta(days=today.weekday()) + timedelta(weeks=shift)
+    return monday + timedelta(days=weekday)
+
+
+def _match_range(text: str, compact: str, today: date) -> Optional[tuple]:
+    if compact in DAY_OFFSETS:
+        day = today + timedelta(days=DAY_OFFSETS[compact])
+        return day, day
+
+    # 이번 주 / 지난달 / 작년 / last week / next month
+    if compact in KR_PERIODS:
+        return _period(today, *KR_PERIODS[compact])
+    match = re.fullmatch(rf"(last|this|next) ({_EN_UNIT_PATTERN})", text)
+    if match:
+        return _period(today, f"{match.group(2)}s", EN_SHIFTS[match.group(1)])
+
+    # 3일 전 / 2주 후 / 3 days ago / in 2 weeks / 2 weeks later
+    match = re.fullmatch(rf"(\d+)({_KR_UNIT_PATTERN})(전|후|뒤)", compact)
+    if match:
+        amount = int(match.group(1)) * (-1 if match.group(3) == "전" else 1)
+        day = _shift(today, KR_UNITS[match.group(2)], amount)
+        return day, day
+    match = re.fullmatch(rf"(\d+) ({_EN_UNIT_PATTERN})s? ago", text)
+    if match:
+        day = _shift(today, f"{match.group(2)}s", -int(match.group(1)))
+        return day, day
+    match = (
+        re.fullmatch(rf"in (\d+) ({_EN_UNIT_PATTERN})s?", text)
+        or re.fullmatch(rf"(\d+) ({_EN_UNIT_PATTERN})s? (?:later|from now)", text)
+    )
+    if match:
+        day = _shift(today, f"{match.group(2)}s", int(match.group(1)))
+        return day, day
+
+    # 최근 7일 / 지난 2주간 / last 30 days / past 3 months
+    match = re.fullmatch(rf"(?:지난|최근)(\d+)({_KR_UNIT_PATTERN})간?", compact)
+    if match:
+        return _shift(today, KR_UNITS[match.group(2)], -int(match.group(1))), today
+    match = re.fullmatch(rf"(?:last|past) (\d+) ({_EN_UNIT_PATTERN})s?", text)
+    if match:
+        return _shift(today, f"{match.group(2)}s", -int(match.group(1))), today
+
+    # 다음주 월요일 / 금요일 / last friday / next monday
+    match = re.fullmatch(r"(지난|저번|이번|다음)?주?(월|화|수|목|금|토|일)요일", compact)
+    if match:
+        day = _weekday(today, KR_WEEKDAYS.index(match.group(2)), KR_SHIFTS.get(match.group(1), 0))
+        return day, day
+    match = re.fullmatch(rf"(?:(last|this|next) (?:week )?)?({_EN_WEEKDAY_PATTERN})", text)
+    if match:
+        day = _weekday(today, EN_WEEKDAYS.index(match.group(2)), EN_SHIFTS.get(match.group(1), 0))
+        return day, day
+
+    # 3월 5일 / 2025년 3월 5일
+    match = re.fullmatch(r"(?:(\d{4})년)?(\d{1,2})월(\d{1,2})일", compact)
+    if match:
+        day = date(int(match.group(1) or today.year), int(match.group(2)), int(match.group(3)))
+        return day, day
+
+    return None
+
+
+def resolve_relative_date(expression: str, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Resolve a Korean or English relative date expression to a date range
+
+    Single days resolve to start == end. Weeks run Monday to Sunday.
+
+    Args:
+        expression: e.g. '어제', '다음주 월요일', '지난달', '3 days ago', 'last week'
+        now: Reference time (current local time when omitted)
+
+    Returns:
+        Dict with start/end dates (YYYY-MM-DD) and the reference date
+
+    Raises:
+        ValueError: Expression is not recognized
+    """
+    now = now or now_in()
+    today = now.date()
+    text = re.sub(r"\s+", " ", expression.strip().lower())
+    compact = text.replace(" ", "")
+
+    try:
+        resolved = _match_range(text, compact, today)
+    except ValueError:
+        resolved = None
+    if resolved is None:
+        try:
+            day = date_parser.parse(text, default=now.replace(tzinfo=None)).date()
+        except (ValueError, OverflowError):
+            raise ValueError(f"Unrecognized date expression: {expression}")
+        resolved = (day, day)
+
+    start, end = resolved
+    return {
+        "expression": expression,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "start_weekday": EN_WEEKDAYS[start.weekday()].capitalize(),
+        "reference_date": today.isoformat(),
+        "timezone": zone_label(now),
+    }
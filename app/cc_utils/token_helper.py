@@ -0,0 +1,54 @@
+"""
+Token Estimation Utility
+
+Cheap token estimates for prompt budgeting, without a tokenizer dependency
+"""
+
+import math
+import re
+
+# Hangul, kana and CJK ideographs take roughly one token per character
+_WIDE_CHARS = re.compile(r"[\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u4e00-\u9fff\uac00-\ud7af]")
+
+# Other text averages about four characters per token
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        int: Estimated number of tokens
+    """
+    if not text:
+        return 0
+    wide = len(_WIDE_CHARS.findall(text))
+    return wide + math.ceil((len(text) - wide) / CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, suffix: str = "…") -> str:
+    """Cut text so that its estimate fits within max_tokens
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+        suffix: Appended when the text was cut
+
+    Returns:
+        str: Original text if it fits, otherwise a truncated copy ending in suffix
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    # Binary search on the prefix length
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(text[:middle]) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low].rstrip() + suffix
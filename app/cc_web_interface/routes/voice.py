@@ -5,11 +5,10 @@ Voice input WebSocket and related routes
 
 import logging
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from slack_sdk.web.async_client import AsyncWebClient
 
 from app.queueing_extended import enqueue_message
 from app.cc_web_interface.utils import get_slack_user_id
-from app.config.settings import get_settings
+from app.cc_utils.slack_client_pool import get_pooled_slack_client
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/ws", tags=["voice"])
@@ -20,8 +19,7 @@ async def websocket_voice(websocket: WebSocket):
     """Voice input WebSocket endpoint"""
     await websocket.accept()
 
-    settings = get_settings()
-    slack_client = AsyncWebClient(token=settings.SLACK_BOT_TOKEN)
+    slack_client = get_pooled_slack_client()
 
     try:
         while True:
@@ -77,6 +75,7 @@ async def websocket_voice(websocket: WebSocket):
                         "ts": "",
                         "user": slack_user_id,
                         "thread_ts": None,
+                        "source": "voice",
                     })
 
                     await websocket.send_json({
@@ -18,6 +18,76 @@ class Settings(BaseSettings):
     MODEL_FOR_MODERATE: str = "sonnet"   # For analysis (memory management, summarization, etc.)
     MODEL_FOR_COMPLEX: str = "sonnet"    # For tasks (core task execution)
 
+    # LLM concurrency (each running agent is a CLI subprocess)
+    LLM_MAX_CONCURRENT_SIMPLE: int = 6
+    LLM_MAX_CONCURRENT_MODERATE: int = 3
+    LLM_MAX_CONCURRENT_COMPLEX: int = 3
+    LLM_MAX_CONCURRENT_TOTAL: int = 8
+
+    # Warm ClaudeSDKClient pool for static-prompt agents (0 disables pooling)
+    CLAUDE_POOL_SIZE: int = 2
+    CLAUDE_POOL_MAX_USES: int = 50
+    CLAUDE_POOL_MAX_RSS_MB: int = 1024
+
+    # Memory retrieval from the local BM25 index (falls back to the agent)
+    MEMORY_INDEX_ENABLED: bool = True
+
+    # Memory saves: jobs collected within the window are merged into one memory_manager run
+    MEMORY_BATCH_WINDOW_SECONDS: float = 20.0
+    MEMORY_BATCH_MAX_JOBS: int = 8
+    MEMORY_WRITERS: int = 3  # Parallel memory_manager runs (edits of one memory category are serialized)
+
+    # Persist message/orchestrator/memory queues in SQLite (redelivered after restart)
+    DURABLE_QUEUE_ENABLED: bool = True
+
+    # Shared message worker pool (serves all channels round-robin)
+    MESSAGE_WORKER_POOL_SIZE: int = 16
+    MESSAGE_THREAD_ORDERING: bool = True
+
+    # Orchestrator queue: seconds of waiting that promote a job by one priority class
+    ORCHESTRATOR_AGING_SECONDS: int = 60
+
+    # Run operator jobs in worker processes (0 workers = CPU count - 1)
+    # LLM_MAX_CONCURRENT_* and Slack rate limits are bot-wide: in process mode each of the
+    # main process and the N workers gets 1/(N+1) of them (concurrency limits at least 1)
+    ORCHESTRATOR_PROCESS_MODE: bool = False
+    ORCHESTRATOR_PROCESS_WORKERS: int = 0
+
+    # Adaptive message debounce (commands/short answers are processed immediately)
+    DEBOUNCE_SHORT_SECONDS: float = 1.0     # Single complete sentence/question
+    DEBOUNCE_DEFAULT_SECONDS: float = 2.5
+    DEBOUNCE_LONG_SECONDS: float = 5.0      # Files, links, unfinished text
+    DEBOUNCE_MAX_WAIT_SECONDS: float = 15.0  # Flush a continuous stream after this long
+
+    # Admission control: queue depths at which incoming Slack messages are shed
+    # (soft: drop channel chatter not addressed to the bot, hard: busy reply / drop)
+    ADMISSION_CHANNEL_SOFT_LIMIT: int = 50
+    ADMISSION_CHANNEL_HARD_LIMIT: int = 90
+    ADMISSION_ORCHESTRATOR_SOFT_LIMIT: int = 50
+    ADMISSION_ORCHESTRATOR_HARD_LIMIT: int = 90
+
+    # Slack events already received within this window are dropped (retries/redeliveries)
+    EVENT_DEDUP_TTL_SECONDS: int = 3600
+
+    # Shared MCP server processes (stdio npx servers started once, served over local SSE)
+    MCP_SUPERVISOR_ENABLED: bool = True
+    MCP_SUPERVISOR_PORT: int = 8765
+
+    # Operator tool routing (attach only the MCP servers a request needs)
+    # The small-model fallback for requests no rule matches adds one LLM call before the operator starts
+    # (its latency is logged by [TOOL_ROUTER]); the operator can still request tools mid-session without it
+    TOOL_ROUTER_ENABLED: bool = True
+    TOOL_ROUTER_LLM_FALLBACK: bool = False
+
+    # State prompt token budgets (channel members / recent messages beyond the budget are summarized)
+    STATE_PROMPT_MEMBERS_MAX_TOKENS: int = 1500
+    STATE_PROMPT_MESSAGES_MAX_TOKENS: int = 3000
+
+    # Operator pre-flight context budget (system prompt + retrieved memory + query) and tool result cap
+    OPERATOR_CONTEXT_MAX_TOKENS: int = 60000
+    OPERATOR_MEMORY_MAX_TOKENS: int = 8000
+    OPERATOR_MAX_MCP_OUTPUT_TOKENS: int = 20000
+
     # Slack related
     SLACK_BOT_TOKEN: str = ""
     SLACK_APP_TOKEN: str = ""
@@ -19,7 +19,11 @@ from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 from slack_bolt.async_app import AsyncApp
 
 from app.config.settings import get_settings
-from app.queueing_extended import start_channel_workers
+from app.cc_utils.process_share import process_share_for, set_process_share
+from app.cc_utils.slack_client_pool import get_pooled_slack_client, use_pooled_slack_client
+from app.cc_utils.claude_client_pool import get_claude_client_pool
+from app.queueing_extended import recover_queues, start_channel_workers
+from app.orchestrator_pool import ProcessOrchestratorPool, run_orchestrator_job
 from app.scheduler import scheduler, reload_schedules_from_file
 from app.cc_slack_handlers import _process_message_logic
 from app.cc_slack_handlers import register_handlers
@@ -27,6 +31,7 @@ from app.cc_utils.waiting_answer_db import init_db
 from app.cc_utils.confirm_db import init_db as init_confirm_db
 from app.cc_utils.email_tasks_db import init_db as init_email_tasks_db
 from app.cc_utils.jira_tasks_db import init_db as init_jira_tasks_db
+from app.cc_utils.memory_index import get_memory_index
 
 settings = get_settings()
 
@@ -37,6 +42,12 @@ async def main():
     # 1. Load settings
     settings = get_settings()
 
+    # In process mode the LLM/Slack limits are split between this process and the workers
+    num_processes = 0
+    if settings.ORCHESTRATOR_PROCESS_MODE:
+        num_processes = settings.ORCHESTRATOR_PROCESS_WORKERS or max(1, (os.cpu_count() or 2) - 1)
+        set_process_share(process_share_for(num_processes))
+
     # 1-1. Chrome profile setup (first-time login or always if enabled)
     if settings.CHROME_ENABLED:
         from pathlib import Path
@@ -117,6 +128,14 @@ async def main():
     init_jira_tasks_db()
     logging.info("Jira tasks database initialized")
 
+    # 2-4. Build/refresh memory index (incremental, only changed files)
+    if settings.MEMORY_INDEX_ENABLED:
+        indexed = await asyncio.to_thread(get_memory_index().refresh, True)
+        logging.info(f"Memory index refreshed ({indexed} changed)")
+
+    # 2-5. Redeliver queued jobs left over from the previous run
+    await recover_queues()
+
     # 3. Validate signing secret
     if not settings.SLACK_SIGNING_SECRET or settings.SLACK_SIGNING_SECRET == "...":
         logging.error(
@@ -125,9 +144,12 @@ async def main():
         sys.exit(1)
 
     # 3. Initialize Slack AsyncApp
+    # All handlers share the pooled client (rate limiting, keep-alive, coalescing);
+    # Bolt builds a fresh client per request, so the middleware swaps the pooled one back in
     app = AsyncApp(
-        token=settings.SLACK_BOT_TOKEN, signing_secret=settings.SLACK_SIGNING_SECRET
+        client=get_pooled_slack_client(), signing_secret=settings.SLACK_SIGNING_SECRET
     )
+    app.middleware(use_pooled_slack_client)
 
     # 4. Get bot user ID
     try:
@@ -143,46 +165,38 @@ async def main():
         logging.error(f"Error checking auth: {e}")
         sys.exit(1)
 
+    # 5. Warm Slack directory (users/channels) in background
+    from app.cc_utils.slack_directory import get_slack_directory
+
+    slack_directory = get_slack_directory()
+    slack_directory.set_client(app.client)
+    directory_warm_task = asyncio.create_task(slack_directory.warm())
+
+    def log_directory_warm_result(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logging.error(f"[SLACK_DIRECTORY] Background warm failed: {task.exception()}")
+
+    directory_warm_task.add_done_callback(log_directory_warm_result)
+    logging.info("[SLACK_DIRECTORY] Warming directory in background")
+
     # 6. Register handlers
     register_handlers(app)
 
+    # 6-1. Start shared MCP server processes (operator sessions connect over local SSE)
+    mcp_supervisor = None
+    if settings.MCP_SUPERVISOR_ENABLED:
+        from app.cc_agents.operator.agent import build_mcp_servers_dict
+        from app.cc_utils.mcp_supervisor import start_mcp_supervisor
+
+        mcp_supervisor = await start_mcp_supervisor(build_mcp_servers_dict(settings))
+
     # 7-1. Wrap the message process
     async def process_wrapper(message, client):
         await _process_message_logic(message, client)
 
     # 7-2. Wrap the orchestrator process
     async def orchestrator_wrapper(job, client):
-        # Get memory (reuse if already retrieved, otherwise retrieve new)
-        retrieved_memory = job.get("retrieved_memory")
-        if not retrieved_memory:
-            from app.cc_agents.memory_retriever import call_memory_retriever
-
-            logging.info(f"[ORCHESTRATOR_WRAPPER] Retrieving relevant memories...")
-            retrieved_memory = await call_memory_retriever(
-                query=job["query"],
-                slack_data=job["slack_data"],
-                message_data=job["message_data"],
-            )
-            logging.info(
-                f"[ORCHESTRATOR_WRAPPER] Memory retrieved: {retrieved_memory[:100] if retrieved_memory else 'None'}..."
-            )
-        else:
-            logging.info(
-                f"[ORCHESTRATOR_WRAPPER] Using pre-retrieved memory: {retrieved_memory[:100] if retrieved_memory else 'None'}..."
-            )
-
-        # Run Operator
-        from app.cc_agents.operator.agent import call_operator_agent
-
-        response = await call_operator_agent(
-            user_query=job["query"],
-            slack_data=job["slack_data"],
-            message_data=job["message_data"],
-            retrieved_memory=retrieved_memory,
-        )
-        logging.info(
-            f"[ORCHESTRATOR_WRAPPER] Response: {response[:100] if response else 'None'}..."
-        )
+        await run_orchestrator_job(job)
 
     # 7-3. Wrap the memory process
     async def memory_worker_wrapper(job):
@@ -196,15 +210,41 @@ async def main():
             return
 
         logging.info(f"[MEMORY_WRAPPER] Saving memory: {memory_query[:100]}...")
-        await call_memory_manager(memory_query)
+        # index.md is rebuilt by the serialized index step (memory_index_wrapper)
+        await call_memory_manager(memory_query, update_index=False)
         logging.info(f"[MEMORY_WRAPPER] Memory saved successfully")
 
-    # 7-4. Start the workers
+    # 7-4. Wrap the index.md rebuild (runs serialized after memory writes settle)
+    # Rendered from the parsed memory files, so no memory_manager (LLM) run per batch
+    async def memory_index_wrapper():
+        await asyncio.to_thread(get_memory_index().write_index_md)
+        if settings.MEMORY_INDEX_ENABLED:
+            await asyncio.to_thread(get_memory_index().refresh, True)
+
+    # 7-5. Start the workers
     from app.queueing_extended import start_orchestrator_worker, start_memory_worker
 
-    start_channel_workers(app, process_wrapper, workers_per_channel=8)
-    start_orchestrator_worker(app, orchestrator_wrapper, num_workers=3)
-    start_memory_worker(memory_worker_wrapper)
+    start_channel_workers(
+        app,
+        process_wrapper,
+        pool_size=settings.MESSAGE_WORKER_POOL_SIZE,
+        thread_ordering=settings.MESSAGE_THREAD_ORDERING,
+    )
+    orchestrator_pool = None
+    if settings.ORCHESTRATOR_PROCESS_MODE:
+        # Operator jobs run in worker processes (one job per process at a time)
+        orchestrator_pool = ProcessOrchestratorPool(num_processes)
+        orchestrator_pool.start()
+        start_orchestrator_worker(app, orchestrator_pool.run_job, num_workers=num_processes)
+    else:
+        start_orchestrator_worker(app, orchestrator_wrapper, num_workers=3)
+    start_memory_worker(
+        memory_worker_wrapper,
+        batch_window_seconds=settings.MEMORY_BATCH_WINDOW_SECONDS,
+        batch_max_jobs=settings.MEMORY_BATCH_MAX_JOBS,
+        writers=settings.MEMORY_WRITERS,
+        index_func=memory_index_wrapper,
+    )
 
     # 8. Start the scheduler
     await reload_schedules_from_file()
@@ -404,6 +444,20 @@ async def main():
         logging.info("[SHUTDOWN] Stopping Slack handler...")
         await handler.close_async()
 
+        # 4. Disconnect warm agent clients
+        logging.info("[SHUTDOWN] Closing pooled agent clients...")
+        await get_claude_client_pool().close_all()
+
+        # 5. Stop orchestrator worker processes
+        if orchestrator_pool:
+            logging.info("[SHUTDOWN] Stopping orchestrator worker processes...")
+            await asyncio.to_thread(orchestrator_pool.close)
+
+        # 6. Stop shared MCP server processes
+        if mcp_supervisor:
+            logging.info("[SHUTDOWN] Stopping shared MCP servers...")
+            await mcp_supervisor.close()
+
         logging.info("[SHUTDOWN] ✅ Shutdown complete")
 
 
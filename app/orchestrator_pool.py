@@ -0,0 +1,246 @@
+"""
+Orchestrator job execution, in-process or in a pool of worker processes
+
+In process mode each worker process owns its own event loop, agent SDK
+clients and Slack client, and runs one operator job at a time. The LLM
+concurrency and Slack rate limits are divided equally between the main
+process and the workers (see process_share). Jobs are sent
+over a multiprocessing queue; progress, results and memory-save jobs created
+by the operator come back over a result queue and are handled in the main
+process (memory jobs go to the main memory queue, which stays sequential).
+Schedule changes made by scheduler tools are reloaded by the main process,
+the only one whose scheduler runs.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Set
+
+from app.cc_utils.llm_governor import priority_for_source
+from app.cc_utils.mcp_supervisor import get_bridge_token, set_remote_bridge_token
+from app.cc_utils.process_share import process_share_for, set_process_share
+
+# How often the result reader checks worker processes for crashes
+LIVENESS_CHECK_SECONDS = 1.0
+
+
+async def run_orchestrator_job(job: dict):
+    """Run one orchestrator job: memory retrieval (if not already done) and the operator"""
+    # Get memory (reuse if already retrieved, otherwise retrieve new)
+    retrieved_memory = job.get("retrieved_memory")
+    if not retrieved_memory:
+        from app.cc_agents.memory_retriever import call_memory_retriever
+
+        logging.info(f"[ORCHESTRATOR_WRAPPER] Retrieving relevant memories...")
+        retrieved_memory = await call_memory_retriever(
+            job["query"],
+            slack_data=job["slack_data"],
+            message_data=job["message_data"],
+        )
+        logging.info(
+            f"[ORCHESTRATOR_WRAPPER] Memory retrieved: {retrieved_memory[:100] if retrieved_memory else 'None'}..."
+        )
+    else:
+        logging.info(
+            f"[ORCHESTRATOR_WRAPPER] Using pre-retrieved memory: {retrieved_memory[:100] if retrieved_memory else 'None'}..."
+        )
+
+    # Run Operator (scheduled/checker jobs wait behind user requests for LLM slots)
+    from app.cc_agents.operator.agent import call_operator_agent
+
+    source = job.get("source") or job["message_data"].get("source")
+    response = await call_operator_agent(
+        user_query=job["query"],
+        slack_data=job["slack_data"],
+        message_data=job["message_data"],
+        retrieved_memory=retrieved_memory,
+        priority=priority_for_source(source),
+    )
+    logging.info(
+        f"[ORCHESTRATOR_WRAPPER] Response: {response[:100] if response else 'None'}..."
+    )
+
+
+# =============================================
+# Worker process side
+# =============================================
+
+def _worker_process_main(job_queue, result_queue, limit_share: float, mcp_bridge_token: Optional[str] = None):
+    """Entry point of a worker process"""
+    # LLM slots and Slack rate limits are shared with the other processes
+    set_process_share(limit_share)
+    # Shared MCP servers of the main process (None when its supervisor is not running)
+    set_remote_bridge_token(mcp_bridge_token)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - [orchestrator-%(process)d] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    asyncio.run(_worker_loop(job_queue, result_queue))
+
+
+async def _worker_loop(job_queue, result_queue):
+    from app.queueing_extended import set_memory_job_forwarder
+    from app.scheduler import set_reload_forwarder
+
+    # Memory saves must stay sequential, so they go back to the main process
+    set_memory_job_forwarder(lambda memory_job: result_queue.put(("memory", None, memory_job)))
+    # Only the main process runs the scheduler, so schedule changes are reloaded there
+    set_reload_forwarder(lambda: result_queue.put(("reload_schedules", None, None)))
+    logging.info(f"[ORCHESTRATOR_PROCESS] Worker process {os.getpid()} ready")
+
+    while True:
+        item = await asyncio.to_thread(job_queue.get)
+        if item is None:
+            break
+
+        job_id, job = item
+        result_queue.put(("started", job_id, os.getpid()))
+        try:
+            await run_orchestrator_job(job)
+            result_queue.put(("done", job_id, None))
+        except Exception as e:
+            logging.error(f"[ORCHESTRATOR_PROCESS] Job {job_id} failed: {e}")
+            result_queue.put(("error", job_id, f"{type(e).__name__}: {e}"))
+
+    logging.info(f"[ORCHESTRATOR_PROCESS] Worker process {os.getpid()} stopped")
+
+
+# =============================================
+# Main process side
+# =============================================
+
+class OrchestratorProcessError(Exception):
+    """An orchestrator job failed (or its worker process died) in a worker process"""
+
+
+class ProcessOrchestratorPool:
+    """
+    Runs orchestrator jobs in worker processes.
+
+    Usage:
+        pool = ProcessOrchestratorPool(num_processes=4)
+        pool.start()
+        start_orchestrator_worker(app, pool.run_job, num_workers=pool.num_processes)
+        ...
+        pool.close()
+    """
+
+    def __init__(self, num_processes: int):
+        self.num_processes = num_processes
+        self.limit_share = process_share_for(num_processes)
+        self._context = multiprocessing.get_context("spawn")
+        self._job_queue = self._context.Queue()
+        self._result_queue = self._context.Queue()
+        self._processes: List[multiprocessing.Process] = []
+        self._futures: Dict[str, asyncio.Future] = {}
+        self._running_on: Dict[str, int] = {}
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reader: Optional[threading.Thread] = None
+        self._closed = False
+
+    def start(self):
+        """Spawn the worker processes and the result reader (call from the event loop)"""
+        self._loop = asyncio.get_running_loop()
+        for _ in range(self.num_processes):
+            self._spawn()
+        self._reader = threading.Thread(target=self._read_results, name="orchestrator-results", daemon=True)
+        self._reader.start()
+        logging.info(f"[ORCHESTRATOR_PROCESS] Started {self.num_processes} worker processes")
+
+    def _spawn(self) -> multiprocessing.Process:
+        process = self._context.Process(
+            target=_worker_process_main,
+            args=(self._job_queue, self._result_queue, self.limit_share, get_bridge_token()),
+            daemon=True
+        )
+        process.start()
+        self._processes.append(process)
+        return process
+
+    async def run_job(self, job: dict, client=None):
+        """Orchestrator function for start_orchestrator_worker; waits for the job in a worker process"""
+        job_id = uuid.uuid4().hex
+        future = self._loop.create_future()
+        self._futures[job_id] = future
+        self._job_queue.put((job_id, job))
+        try:
+            await future
+        finally:
+            self._futures.pop(job_id, None)
+            self._running_on.pop(job_id, None)
+
+    # --- result reader thread ---------------------------------------------
+
+    def _read_results(self):
+        next_check = time.monotonic() + LIVENESS_CHECK_SECONDS
+        while not self._closed:
+            # Checked on a timer, so steady result traffic cannot hide a dead worker
+            if time.monotonic() >= next_check:
+                self._check_processes()
+                next_check = time.monotonic() + LIVENESS_CHECK_SECONDS
+            try:
+                kind, job_id, payload = self._result_queue.get(timeout=max(0.0, next_check - time.monotonic()))
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                break
+            self._loop.call_soon_threadsafe(self._handle_result, kind, job_id, payload)
+
+    def _handle_result(self, kind: str, job_id: Optional[str], payload: Any):
+        if kind == "memory":
+            from app.queueing_extended import enqueue_memory_job
+            self._run_in_background(enqueue_memory_job(payload))
+            return
+        if kind == "reload_schedules":
+            from app.scheduler import reload_schedules_from_file
+            self._run_in_background(reload_schedules_from_file())
+            return
+        if kind == "started":
+            self._running_on[job_id] = payload
+            return
+
+        future = self._futures.get(job_id)
+        if future is None or future.done():
+            return
+        if kind == "done":
+            future.set_result(None)
+        else:
+            future.set_exception(OrchestratorProcessError(payload))
+
+    def _run_in_background(self, coro):
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _check_processes(self):
+        for process in list(self._processes):
+            if process.is_alive() or self._closed:
+                continue
+            logging.error(f"[ORCHESTRATOR_PROCESS] Worker process {process.pid} died (exit code {process.exitcode}), respawning")
+            self._processes.remove(process)
+            self._loop.call_soon_threadsafe(self._fail_jobs_of, process.pid)
+            self._spawn()
+
+    def _fail_jobs_of(self, pid: int):
+        for job_id, running_pid in list(self._running_on.items()):
+            if running_pid == pid:
+                self._handle_result("error", job_id, f"worker process {pid} died")
+
+    def close(self, timeout: float = 5.0):
+        """Stop the worker processes"""
+        self._closed = True
+        for _ in self._processes:
+            self._job_queue.put(None)
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        logging.info("[ORCHESTRATOR_PROCESS] Worker processes stopped")
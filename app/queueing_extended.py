@@ -1,30 +1,194 @@
 import asyncio
 import logging
+import time
+import uuid
+from collections import deque
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Callable, Deque, Dict, Optional, Set, Tuple
 
-# Per-channel message queues
-message_queues: Dict[str, asyncio.Queue] = {}
+from app.cc_utils.admission import Admission, AdmissionController
+from app.cc_utils.bot_status import BotStatusReconciler
+from app.cc_utils.debouncer import TimerWheelDebouncer, adaptive_delay
+from app.cc_utils.durable_queue import DurableQueue, get_job_store
+from app.cc_utils.event_dedup import EventDeduplicator
+from app.cc_utils.fair_queue import FairPriorityQueue, JobClass
+from app.cc_utils.memory_batcher import build_memory_batch, group_key
+from app.cc_utils.memory_locks import IndexUpdater
+from app.config.settings import get_settings
 
-# Global orchestrator queue (for heavy tasks)
-orchestrator_queue = asyncio.Queue(maxsize=100)
+# Queue name prefix for per-channel message queues in the job store
+CHANNEL_QUEUE_PREFIX = "message:"
 
-# Memory save dedicated queue (single worker for sequential processing)
-memory_queue = asyncio.Queue(maxsize=100)
+# Per-channel message queues
+message_queues: Dict[str, DurableQueue] = {}
+
+# Message sources with a fixed job class
+_SOURCE_CLASSES = {
+    # A user approved a proactive suggestion and is waiting for the answer
+    "proactive_confirm": JobClass.INTERACTIVE,
+    # Not a person waiting for an answer
+    "scheduled": JobClass.SCHEDULED,
+    "checker": JobClass.CHECKER,
+    "proactive": JobClass.PROACTIVE,
+}
+
+
+def classify_orchestrator_job(entry) -> Tuple[JobClass, str]:
+    """(job class, user) of an orchestrator queue entry for priority/fairness"""
+    _, job = entry
+    message_data = job.get("message_data") or {}
+    source = job.get("source") or message_data.get("source")
+    user = message_data.get("user_id") or ""
+
+    if source in _SOURCE_CLASSES:
+        return _SOURCE_CLASSES[source], user
+    if message_data.get("thread_ts"):
+        return JobClass.THREAD_FOLLOWUP, user
+    return JobClass.INTERACTIVE, user
+
+
+# Global orchestrator queue (for heavy tasks; operator runs can take a long time)
+# Workers renew the lease while a job runs, so the timeout only matters when the owner is gone
+# Interactive requests go first, users share each class fairly, waiting jobs age upward
+orchestrator_queue = DurableQueue(
+    "orchestrator",
+    visibility_timeout=3600,
+    queue=FairPriorityQueue(
+        classify_orchestrator_job,
+        maxsize=100,
+        aging_seconds=get_settings().ORCHESTRATOR_AGING_SECONDS
+    )
+)
+
+# Memory save queue (parallel writers with per-category file locks)
+memory_queue = DurableQueue("memory", maxsize=100, visibility_timeout=900)
+
+# Set in orchestrator worker processes to hand memory jobs to the main process
+_memory_job_forwarder: Optional[Callable[[dict], None]] = None
 
 # Orchestrator worker status management
 _active_orchestrator_workers = 0  # Currently active worker count
-_status_update_lock = asyncio.Lock()  # Prevent duplicate status updates
+_bot_status: Optional[BotStatusReconciler] = None
+
+# Channel queues idle for this long are dropped by the dispatcher
+CHANNEL_QUEUE_IDLE_TTL_SECONDS = 600
 
-# Global variables for debounce management
-_debounce_timers: Dict[str, asyncio.Task] = {}
+# Messages waiting in a debounce window, per "channel:user" key
 _accumulated_messages: Dict[str, list] = {}
 
+# Seen-set of Slack events (see get_event_deduplicator)
+_event_dedup: Optional[EventDeduplicator] = None
+
+# Load shedding in front of the message queues (checked by the Slack handlers)
+_admission = AdmissionController(
+    channel_soft_limit=get_settings().ADMISSION_CHANNEL_SOFT_LIMIT,
+    channel_hard_limit=get_settings().ADMISSION_CHANNEL_HARD_LIMIT,
+    orchestrator_soft_limit=get_settings().ADMISSION_ORCHESTRATOR_SOFT_LIMIT,
+    orchestrator_hard_limit=get_settings().ADMISSION_ORCHESTRATOR_HARD_LIMIT,
+)
+
+
+class ChannelDispatcher:
+    """
+    Fixed-size worker pool shared by all channel queues.
+
+    Channels with pending messages are served round-robin, so one busy channel
+    cannot starve the others. With thread ordering enabled, messages of the
+    same Slack thread are processed one at a time in arrival order. Channel
+    queues that stay idle are garbage-collected.
+    """
 
-def get_or_create_channel_queue(channel_id: str) -> asyncio.Queue:
+    def __init__(self):
+        self._pending: Dict[str, int] = {}
+        self._rotation: Deque[str] = deque()
+        self._available = asyncio.Semaphore(0)
+        self._busy_threads: Set[Tuple[str, str]] = set()
+        self._thread_backlog: Dict[Tuple[str, str], Deque[Tuple[str, dict]]] = {}
+        self._last_active: Dict[str, float] = {}
+
+    def notify(self, channel_id: str):
+        """A job became available in `channel_id`'s queue"""
+        if not self._pending.get(channel_id):
+            self._rotation.append(channel_id)
+        self._pending[channel_id] = self._pending.get(channel_id, 0) + 1
+        self._last_active[channel_id] = time.monotonic()
+        self._available.release()
+
+    async def next_job(self) -> Tuple[str, DurableQueue, str, dict]:
+        """Wait for work and take one job from the next channel in rotation"""
+        await self._available.acquire()
+        channel_id = self._rotation.popleft()
+        self._pending[channel_id] -= 1
+        if self._pending[channel_id]:
+            self._rotation.append(channel_id)
+        else:
+            del self._pending[channel_id]
+
+        queue = message_queues[channel_id]
+        job_id, job = await queue.get()
+        return channel_id, queue, job_id, job
+
+    @staticmethod
+    def thread_key(channel_id: str, job: dict) -> Optional[Tuple[str, str]]:
+        """Ordering key of a message: its thread (a root message keys its own thread)"""
+        message = job["message"]
+        thread_ts = message.get("thread_ts") or message.get("ts")
+        return (channel_id, thread_ts) if thread_ts else None
+
+    def claim_thread(self, thread_key: Tuple[str, str], job_id: str, job: dict) -> bool:
+        """Claim a thread; if it is already being processed the job is parked behind it"""
+        if thread_key in self._busy_threads:
+            self._thread_backlog.setdefault(thread_key, deque()).append((job_id, job))
+            return False
+        self._busy_threads.add(thread_key)
+        return True
+
+    def next_in_thread(self, thread_key: Tuple[str, str]) -> Optional[Tuple[str, dict]]:
+        """Next parked job of a thread (the thread stays claimed), or release the claim"""
+        backlog = self._thread_backlog.get(thread_key)
+        if backlog:
+            job = backlog.popleft()
+            if not backlog:
+                del self._thread_backlog[thread_key]
+            return job
+        self._busy_threads.discard(thread_key)
+        return None
+
+    def parked_job_ids(self, thread_key: Tuple[str, str]) -> list:
+        """Ids of the jobs parked behind a busy thread (they are leased while they wait)"""
+        return [job_id for job_id, _ in self._thread_backlog.get(thread_key, ())]
+
+    def collect_idle(self, ttl: float = CHANNEL_QUEUE_IDLE_TTL_SECONDS) -> int:
+        """Drop channel queues without queued or in-flight work for `ttl` seconds"""
+        now = time.monotonic()
+        removed = 0
+        for channel_id, queue in list(message_queues.items()):
+            idle_for = now - self._last_active.get(channel_id, 0)
+            if idle_for >= ttl and queue.is_idle() and channel_id not in self._pending:
+                del message_queues[channel_id]
+                self._last_active.pop(channel_id, None)
+                removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "channels": len(message_queues),
+            "pending_channels": len(self._pending),
+            "busy_threads": len(self._busy_threads),
+        }
+
+
+_dispatcher = ChannelDispatcher()
+
+
+def get_or_create_channel_queue(channel_id: str) -> DurableQueue:
     """Get or create a per-channel queue"""
     if channel_id not in message_queues:
-        message_queues[channel_id] = asyncio.Queue(maxsize=100)
+        message_queues[channel_id] = DurableQueue(
+            f"{CHANNEL_QUEUE_PREFIX}{channel_id}",
+            maxsize=100,
+            on_ready=lambda: _dispatcher.notify(channel_id)
+        )
         logging.info(f"[QUEUE] Created new queue for channel: {channel_id}")
     return message_queues[channel_id]
 
@@ -37,31 +201,92 @@ async def enqueue_message(message):
     logging.info(f"[QUEUE] Message enqueued to channel {channel_id}, queue size: {queue.qsize()}")
 
 
+def get_event_deduplicator() -> EventDeduplicator:
+    """Global seen-set of Slack events (persisted in the job store when durable queues are on)"""
+    global _event_dedup
+    if _event_dedup is None:
+        _event_dedup = EventDeduplicator(
+            ttl_seconds=get_settings().EVENT_DEDUP_TTL_SECONDS,
+            store=get_job_store()
+        )
+    return _event_dedup
+
+
+async def is_duplicate_event(event: dict, body: Optional[dict] = None) -> bool:
+    """True if this Slack event was already received (marks it as seen otherwise)"""
+    return await get_event_deduplicator().is_duplicate(event, body)
+
+
+def channel_backlog(channel_id: str) -> int:
+    """Messages pending for a channel (queued + waiting in debounce windows)"""
+    queue = message_queues.get(channel_id)
+    queued = queue.qsize() if queue is not None else 0
+    prefix = f"{channel_id}:"
+    debouncing = sum(len(entries) for key, entries in _accumulated_messages.items() if key.startswith(prefix))
+    return queued + debouncing
+
+
+def admit_message(message: dict, addressed: bool) -> Admission:
+    """Non-blocking admission check for an incoming Slack message (see AdmissionController)"""
+    return _admission.decide(
+        user_id=message.get("user"),
+        addressed=addressed,
+        channel_depth=channel_backlog(message.get("channel")),
+        orchestrator_depth=orchestrator_queue.qsize(),
+    )
+
+
+def get_admission_stats() -> Dict[str, int]:
+    """Admitted / shed counters of the admission controller"""
+    return _admission.stats()
+
+
 async def enqueue_orchestrator_job(orchestrator_job: dict):
     """Add job to global orchestrator queue"""
     await orchestrator_queue.put(orchestrator_job)
     logging.info(f"[ORCHESTRATOR_QUEUE] Job enqueued, queue size: {orchestrator_queue.qsize()}")
 
 
+def set_memory_job_forwarder(forwarder: Optional[Callable[[dict], None]]):
+    """Send memory jobs elsewhere instead of the local queue (orchestrator worker processes)"""
+    global _memory_job_forwarder
+    _memory_job_forwarder = forwarder
+
+
 async def enqueue_memory_job(memory_job: dict):
     """Add job to memory save queue (sequential processing)"""
+    if _memory_job_forwarder is not None:
+        _memory_job_forwarder(memory_job)
+        logging.info(f"[MEMORY_QUEUE] Job forwarded to main process")
+        return
+
     await memory_queue.put(memory_job)
     logging.info(f"[MEMORY_QUEUE] Job enqueued, queue size: {memory_queue.qsize()}")
 
 
-async def debounced_enqueue_message(message, delay_seconds: float = 2.0):
+async def debounced_enqueue_message(message, delay_seconds: Optional[float] = None):
     """Debounced version of enqueue_message - merges accumulated messages if no additional messages within specified time
 
     Args:
         message: Slack message object
-        delay_seconds: debounce delay time (seconds), 0 for immediate processing
+        delay_seconds: debounce delay time (seconds), 0 for immediate processing,
+            None to pick one from the message (see adaptive_delay)
     """
     user_id = message.get("user")
     channel_id = message.get("channel")
     debounce_key = f"{channel_id}:{user_id}"
 
-    # Process immediately if 0 seconds
-    if delay_seconds == 0:
+    if delay_seconds is None:
+        settings = get_settings()
+        delay_seconds = adaptive_delay(
+            message,
+            short_seconds=settings.DEBOUNCE_SHORT_SECONDS,
+            default_seconds=settings.DEBOUNCE_DEFAULT_SECONDS,
+            long_seconds=settings.DEBOUNCE_LONG_SECONDS,
+        )
+
+    # Process immediately if 0 seconds and nothing is waiting to be merged with it
+    if delay_seconds == 0 and debounce_key not in _accumulated_messages:
         logging.info(f"[DEBOUNCE] Immediate processing for {user_id} in {channel_id} (delay=0)")
         await enqueue_message(message)
         return
@@ -71,172 +296,187 @@ async def debounced_enqueue_message(message, delay_seconds: float = 2.0):
         _accumulated_messages[debounce_key] = []
         logging.info(f"[DEBOUNCE] First message from {user_id} in {channel_id}, starting {delay_seconds}s timer")
     else:
-        logging.info(f"[DEBOUNCE] Additional message from {user_id} in {channel_id}, resetting timer")
+        logging.info(f"[DEBOUNCE] Additional message from {user_id} in {channel_id}, re-arming timer ({delay_seconds}s)")
 
+    entry_id = uuid.uuid4().hex
     _accumulated_messages[debounce_key].append({
+        "id": entry_id,
         "message": message,
         "timestamp": datetime.now()
     })
 
-    # Cancel existing timer if present
-    if debounce_key in _debounce_timers:
-        _debounce_timers[debounce_key].cancel()
-        logging.info(f"[DEBOUNCE] Cancelled previous timer for {debounce_key}")
-
-    # Start new timer
-    async def delayed_process():
+    # Persist so a restart before the timer fires does not lose the message
+    store = get_job_store()
+    if store is not None:
         try:
-            await asyncio.sleep(delay_seconds)
-
-            # After timer expires, merge accumulated messages and process
-            if debounce_key in _accumulated_messages:
-                accumulated = _accumulated_messages[debounce_key]
-                message_count = len(accumulated)
-                logging.info(f"[DEBOUNCE] Timer expired, merging {message_count} messages from {user_id} in {channel_id}")
-
-                # Merge text from messages
-                merged_text_parts = []
-                base_message = accumulated[0]["message"].copy()  # Use first message as base
-
-                for msg_data in accumulated:
-                    msg = msg_data["message"]
-                    text = msg.get("text", "").strip()
-                    if text:
-                        merged_text_parts.append(text)
-
-                # Create message with merged text
-                if merged_text_parts:
-                    base_message["text"] = "\n".join(merged_text_parts)
-                    logging.info(f"[DEBOUNCE] Merged text: {base_message['text'][:100]}...")
-
-                    # Process actual message
-                    await enqueue_message(base_message)
-                else:
-                    logging.warning(f"[DEBOUNCE] No text content found in {message_count} messages")
-
-                # Cleanup
-                del _accumulated_messages[debounce_key]
-                if debounce_key in _debounce_timers:
-                    del _debounce_timers[debounce_key]
-
-        except asyncio.CancelledError:
-            logging.info(f"[DEBOUNCE] Timer cancelled for {debounce_key}")
-            raise
+            await store.insert_debounced(entry_id, debounce_key, message)
         except Exception as e:
-            logging.error(f"[DEBOUNCE] Error in delayed processing for {debounce_key}: {e}")
-            # Cleanup on error as well
-            if debounce_key in _accumulated_messages:
-                del _accumulated_messages[debounce_key]
-            if debounce_key in _debounce_timers:
-                del _debounce_timers[debounce_key]
+            logging.warning(f"[DEBOUNCE] Failed to persist message for {debounce_key}: {e}")
 
-    # Register new timer
-    _debounce_timers[debounce_key] = asyncio.create_task(delayed_process())
+    if delay_seconds == 0:
+        _debouncer.fire_now(debounce_key)
+    else:
+        _debouncer.touch(debounce_key, delay_seconds)
 
 
-def start_channel_workers(app, process_func, workers_per_channel=5):
-    """Start per-channel workers - process messages in parallel for each channel"""
+async def _flush_debounced(debounce_key: str):
+    """Timer expired - merge the accumulated messages of a key and process them"""
+    # Detach the window first so messages arriving during the enqueue start a new one
+    accumulated = _accumulated_messages.pop(debounce_key, None)
+    if not accumulated:
+        return
 
-    async def channel_worker(channel_id: str, queue: asyncio.Queue, worker_id: int):
-        """Worker that processes messages in parallel for a specific channel"""
-        client = app.client
-        logging.info(f"[CHANNEL_WORKER-{worker_id}] Started worker for channel: {channel_id}")
+    logging.info(f"[DEBOUNCE] Timer expired, merging {len(accumulated)} messages for {debounce_key}")
+    await _enqueue_merged(debounce_key, accumulated)
 
-        while True:
-            try:
-                job = await queue.get()
-                message = job["message"]
 
-                logging.info(f"[CHANNEL_WORKER-{worker_id}] Processing message in {channel_id}, queue size: {queue.qsize()}")
-                await process_func(message, client)
+_debouncer = TimerWheelDebouncer(_flush_debounced, max_wait_seconds=get_settings().DEBOUNCE_MAX_WAIT_SECONDS)
 
-            except Exception as e:
-                logging.error(f"[CHANNEL_WORKER-{worker_id}] Error in channel {channel_id}: {e}")
-            finally:
-                queue.task_done()
 
-    async def monitor_and_spawn_workers():
-        """Automatically spawn workers when new channel queues are created"""
-        monitored_channels = set()
+async def _enqueue_merged(debounce_key: str, accumulated: list):
+    """Merge accumulated messages into one, enqueue it and drop the persisted copies"""
+    # Merge text from messages
+    merged_text_parts = []
+    base_message = accumulated[0]["message"].copy()  # Use first message as base
 
-        while True:
-            await asyncio.sleep(1)  # Check every second
+    for msg_data in accumulated:
+        msg = msg_data["message"]
+        text = msg.get("text", "").strip()
+        if text:
+            merged_text_parts.append(text)
 
-            for channel_id, queue in list(message_queues.items()):
-                if channel_id not in monitored_channels:
-                    # New channel found, spawn multiple workers per channel
-                    for worker_id in range(workers_per_channel):
-                        asyncio.create_task(channel_worker(channel_id, queue, worker_id))
-                    monitored_channels.add(channel_id)
-                    logging.info(f"[MONITOR] Spawned {workers_per_channel} workers for new channel: {channel_id}")
+    # Create message with merged text
+    if merged_text_parts:
+        base_message["text"] = "\n".join(merged_text_parts)
+        logging.info(f"[DEBOUNCE] Merged text: {base_message['text'][:100]}...")
+
+        # Process actual message
+        await enqueue_message(base_message)
+    else:
+        logging.warning(f"[DEBOUNCE] No text content found in {len(accumulated)} messages for {debounce_key}")
+
+    store = get_job_store()
+    if store is not None:
+        await store.delete_debounced([msg_data["id"] for msg_data in accumulated])
+
+
+async def recover_queues():
+    """Redeliver jobs and debounced messages left over from a previous run
+
+    Must run before the workers and Slack handlers start.
+    """
+    store = get_job_store()
+    if store is None:
+        logging.info("[QUEUE] Durable queues disabled, nothing to recover")
+        return
+
+    # Events seen before the restart stay deduplicated (Slack redelivers unacked ones)
+    seen = await asyncio.to_thread(get_event_deduplicator().load)
+    logging.info(f"[EVENT_DEDUP] Restored {seen} seen event keys")
+
+    recovered = 0
+    for queue_name in await asyncio.to_thread(store.queue_names, CHANNEL_QUEUE_PREFIX):
+        channel_id = queue_name[len(CHANNEL_QUEUE_PREFIX):]
+        recovered += await get_or_create_channel_queue(channel_id).recover()
+    recovered += await orchestrator_queue.recover()
+    recovered += await memory_queue.recover()
+
+    # Debounce windows interrupted by the restart are flushed immediately
+    pending = await asyncio.to_thread(store.load_debounced)
+    for debounce_key, entries in pending.items():
+        accumulated = [{"id": entry_id, "message": message} for entry_id, message in entries]
+        logging.info(f"[DEBOUNCE] Recovering {len(accumulated)} debounced messages for {debounce_key}")
+        await _enqueue_merged(debounce_key, accumulated)
+
+    logging.info(f"[QUEUE] Recovered {recovered} jobs and {len(pending)} debounced conversations")
+
+
+def start_channel_workers(app, process_func, pool_size=16, thread_ordering=True):
+    """Start the shared message worker pool - channels are served round-robin by a fixed set of workers"""
+
+    async def process_job(worker_id: int, channel_id: str, queue: DurableQueue, job_id: str, job: dict):
+        try:
+            logging.info(f"[CHANNEL_WORKER-{worker_id}] Processing message in {channel_id}, queue size: {queue.qsize()}")
+            async with queue.keep_alive(job_id):
+                await process_func(job["message"], app.client)
+        except Exception as e:
+            logging.error(f"[CHANNEL_WORKER-{worker_id}] Error in channel {channel_id}: {e}")
+        finally:
+            await queue.task_done(job_id)
+
+    async def channel_worker(worker_id: int):
+        """Worker that takes messages from any channel with pending work"""
+        logging.info(f"[CHANNEL_WORKER-{worker_id}] Started")
+
+        while True:
+            channel_id, queue, job_id, job = await _dispatcher.next_job()
+
+            thread_key = _dispatcher.thread_key(channel_id, job) if thread_ordering else None
+            if thread_key is None:
+                await process_job(worker_id, channel_id, queue, job_id, job)
+                continue
+
+            if not _dispatcher.claim_thread(thread_key, job_id, job):
+                logging.info(f"[CHANNEL_WORKER-{worker_id}] Thread {thread_key[1]} busy in {channel_id}, message parked behind it")
+                continue
+
+            # Drain the thread in arrival order while holding its claim
+            # Parked jobs were leased by next_job(), so their leases are kept alive until they run
+            next_job = (job_id, job)
+            async with queue.keep_alive_each(lambda: _dispatcher.parked_job_ids(thread_key)):
+                while next_job is not None:
+                    await process_job(worker_id, channel_id, queue, *next_job)
+                    next_job = _dispatcher.next_in_thread(thread_key)
+
+    async def collect_idle_queues():
+        """Periodically drop idle channel queues"""
+        while True:
+            await asyncio.sleep(60)
+            removed = _dispatcher.collect_idle()
+            if removed:
+                logging.info(f"[DISPATCHER] Removed {removed} idle channel queues ({_dispatcher.stats()})")
 
     loop = asyncio.get_running_loop()
-    loop.create_task(monitor_and_spawn_workers())
+    for worker_id in range(pool_size):
+        loop.create_task(channel_worker(worker_id))
+    loop.create_task(collect_idle_queues())
+    logging.info(f"[DISPATCHER] Started {pool_size} shared message workers (thread_ordering={thread_ordering})")
 
 
 def start_orchestrator_worker(app, orchestrator_func, num_workers=2):
     """Start global orchestrator worker - process all orchestrator jobs in parallel"""
 
+    global _bot_status
+    _bot_status = BotStatusReconciler(app.client)
+
     async def orchestrator_worker(worker_id: int):
         global _active_orchestrator_workers
         client = app.client
         logging.info(f"[ORCHESTRATOR_WORKER-{worker_id}] Started")
 
-        # Bot status update function
-        async def update_bot_status():
-            global _active_orchestrator_workers
-
-            # Use lock to prevent concurrent updates
-            async with _status_update_lock:
-                active_workers = _active_orchestrator_workers
-                is_busy = active_workers >= num_workers  # Busy if all workers are active
-
-                logging.info(f"[STATUS] Updating bot status (active_workers: {active_workers}/{num_workers}, is_busy: {is_busy})")
-                try:
-                    if is_busy:
-                        await client.users_profile_set(
-                            profile={
-                                "status_text": "i'm busy",
-                                "status_emoji": ":hourglass_flowing_sand:"
-                            }
-                        )
-                        logging.info(f"[STATUS] Bot status updated to BUSY")
-                    else:
-                        await client.users_profile_set(
-                            profile={
-                                "status_text": "",
-                                "status_emoji": "",
-                                "status_expiration": 0
-                            }
-                        )
-                        logging.info(f"[STATUS] Bot status cleared")
-                except Exception as e:
-                    if "not_allowed_token_type" in str(e):
-                        logging.debug(f"[STATUS] Bot status update not supported with current token type")
-                    else:
-                        logging.warning(f"[STATUS] Failed to update bot status: {e}")
-
         while True:
             logging.info(f"[ORCHESTRATOR_WORKER-{worker_id}] Waiting for next job from queue...")
-            job = await orchestrator_queue.get()
-            logging.info(f"[ORCHESTRATOR_WORKER-{worker_id}] Job received from queue")
+            job_id, job = await orchestrator_queue.get()
+            job_class, job_user = classify_orchestrator_job((job_id, job))
+            logging.info(f"[ORCHESTRATOR_WORKER-{worker_id}] Job received from queue (class={job_class.name}, user={job_user}, remaining={orchestrator_queue.qsize()})")
 
             try:
                 # Job started - increment active worker count
                 _active_orchestrator_workers += 1
                 logging.info(f"[ORCHESTRATOR_WORKER-{worker_id}] Started job (active: {_active_orchestrator_workers}/{num_workers})")
-                await update_bot_status()
+                _bot_status.set_load(_active_orchestrator_workers, num_workers)
 
-                await orchestrator_func(job, client)
+                async with orchestrator_queue.keep_alive(job_id):
+                    await orchestrator_func(job, client)
                 logging.info(f"[ORCHESTRATOR_WORKER-{worker_id}] Job completed successfully")
             except Exception as e:
                 logging.error(f"[ORCHESTRATOR_WORKER-{worker_id}] Error: {e}")
             finally:
                 # Job completed - decrement active worker count
                 _active_orchestrator_workers -= 1
-                orchestrator_queue.task_done()
+                await orchestrator_queue.task_done(job_id)
                 logging.info(f"[ORCHESTRATOR_WORKER-{worker_id}] Finished job (active: {_active_orchestrator_workers}/{num_workers})")
-                await update_bot_status()
+                _bot_status.set_load(_active_orchestrator_workers, num_workers)
 
     loop = asyncio.get_running_loop()
     for worker_id in range(num_workers):
@@ -244,28 +484,72 @@ def start_orchestrator_worker(app, orchestrator_func, num_workers=2):
         logging.info(f"[ORCHESTRATOR_WORKER] Created worker {worker_id}/{num_workers}")
 
 
-def start_memory_worker(memory_func):
-    """Start memory save dedicated worker (single worker for sequential processing)
+def start_memory_worker(
+    memory_func,
+    batch_window_seconds: float = 0,
+    batch_max_jobs: int = 1,
+    writers: int = 1,
+    index_func=None
+):
+    """Start memory save worker
+
+    Jobs arriving within `batch_window_seconds` of the first one (up to
+    `batch_max_jobs`) are de-duplicated and split by channel/user group; each
+    group is merged into one memory_func call. Up to `writers` groups run in
+    parallel; memory_manager locks the category each of its writes targets
+    (see memory_locks), so only edits of the same category are serialized.
+    When `index_func` is given, it rebuilds index.md as a separate serialized
+    step after writes settle.
 
     Args:
         memory_func: Memory save function (receives and processes job dict)
+        batch_window_seconds: How long to collect jobs after the first one
+        batch_max_jobs: Maximum jobs per batch
+        writers: Maximum concurrent memory_func calls
+        index_func: Optional coroutine function that rebuilds index.md
     """
+    writer_slots = asyncio.Semaphore(writers)
+    # Running write_group tasks (the loop only keeps weak references)
+    write_tasks: Set[asyncio.Task] = set()
+    index_updater = IndexUpdater(index_func) if index_func else None
+
+    async def write_group(group: list):
+        try:
+            job = build_memory_batch([job for _, job in group])
+            key = group_key(group[0][1])
+            async with memory_queue.keep_alive(*(job_id for job_id, _ in group)):
+                logging.info(f"[MEMORY_WORKER] Writing {len(group)} job(s) for {key}")
+                await memory_func(job)
+            logging.info(f"[MEMORY_WORKER] Group {key} completed successfully")
+            if index_updater:
+                index_updater.mark_dirty()
+        except Exception as e:
+            logging.error(f"[MEMORY_WORKER] Error: {e}")
+        finally:
+            for job_id, _ in group:
+                await memory_queue.task_done(job_id)
+            writer_slots.release()
+
     async def memory_worker():
-        logging.info(f"[MEMORY_WORKER] Started")
+        logging.info(f"[MEMORY_WORKER] Started (batch window: {batch_window_seconds}s, max jobs: {batch_max_jobs}, writers: {writers})")
 
         while True:
             logging.info(f"[MEMORY_WORKER] Waiting for next job...")
-            job = await memory_queue.get()
-            logging.info(f"[MEMORY_WORKER] Job received from queue (queue size: {memory_queue.qsize()})")
+            batch = await memory_queue.get_batch(batch_max_jobs, batch_window_seconds)
+            logging.info(f"[MEMORY_WORKER] {len(batch)} job(s) received from queue (queue size: {memory_queue.qsize()})")
 
-            try:
-                await memory_func(job)
-                logging.info(f"[MEMORY_WORKER] Job completed successfully")
-            except Exception as e:
-                logging.error(f"[MEMORY_WORKER] Error: {e}")
-            finally:
-                memory_queue.task_done()
+            groups = {}
+            for job_id, job in batch:
+                groups.setdefault(group_key(job), []).append((job_id, job))
+
+            # Leases stay renewed while groups wait for a free writer
+            async with memory_queue.keep_alive(*(job_id for job_id, _ in batch)):
+                for group in groups.values():
+                    await writer_slots.acquire()
+                    task = asyncio.create_task(write_group(group))
+                    write_tasks.add(task)
+                    task.add_done_callback(write_tasks.discard)
 
     loop = asyncio.get_running_loop()
     loop.create_task(memory_worker())
-    logging.info(f"[MEMORY_WORKER] Created single worker for sequential memory operations")
\ No newline at end of file
+    logging.info(f"[MEMORY_WORKER] Created memory worker ({writers} parallel writers)")
\ No newline at end of file
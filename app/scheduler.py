@@ -14,7 +14,7 @@ _handler.setFormatter(logging.Formatter(
 ))
 scheduler_logger.addHandler(_handler)
 scheduler_logger.setLevel(logging.INFO)
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.executors.asyncio import AsyncIOExecutor
@@ -38,6 +38,9 @@ settings = get_settings()
 SCHEDULE_DIR = os.path.join(settings.FILESYSTEM_BASE_DIR, "schedule_data")
 SCHEDULE_FILE = os.path.join(SCHEDULE_DIR, "schedules.json")
 
+# Set in orchestrator worker processes: their scheduler never runs, the main process reloads instead
+_reload_forwarder: Optional[Callable[[], None]] = None
+
 
 # Internal file I/O and schedule management logic
 # =================================================================
@@ -77,7 +80,7 @@ async def scheduled_message_wrapper(message: dict, schedule_id: str, schedule_na
         scheduler_logger.info(f"  └─ Channel: {message.get('channel')}, User: {message.get('user')}")
         scheduler_logger.info(f"  └─ Text preview: {message.get('text', '')[:50]}...")
 
-        await enqueue_message(message)
+        await enqueue_message({**message, "source": "scheduled"})
 
         scheduler_logger.info(f"✅ Executed successfully: [{schedule_name}] (ID: {schedule_id})")
     except Exception as e:
@@ -85,8 +88,19 @@ async def scheduled_message_wrapper(message: dict, schedule_id: str, schedule_na
         scheduler_logger.error(f"  └─ Error: {type(e).__name__}: {e}")
 
 
+def set_reload_forwarder(forwarder: Optional[Callable[[], None]]):
+    """Ask another process to reload instead of reloading here (orchestrator worker processes)"""
+    global _reload_forwarder
+    _reload_forwarder = forwarder
+
+
 async def reload_schedules_from_file():
     """Read schedules from file and reload them into the scheduler."""
+    if _reload_forwarder is not None:
+        _reload_forwarder()
+        scheduler_logger.info("Schedule reload forwarded to main process")
+        return
+
     try:
         # Only delete jobs registered with scheduled_message_wrapper (keep checkers/suggester)
         jobs = scheduler.get_jobs()
@@ -0,0 +1,70 @@
+"""
+Tests for Admission Control
+
+Tests that low-priority messages are shed first, addressed messages get a
+rate-limited busy reply at the hard limit, shed counters are kept and
+messages addressing the bot by mention or name count as addressed.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import patch
+
+from app import cc_slack_handlers
+from app.cc_utils.admission import BUSY_MESSAGES, Admission, AdmissionController, pick_busy_message
+
+
+def _controller():
+    return AdmissionController(
+        channel_soft_limit=5,
+        channel_hard_limit=10,
+        orchestrator_soft_limit=20,
+        orchestrator_hard_limit=40
+    )
+
+
+class TestAdmissionController:
+    """Test suite for AdmissionController"""
+
+    def test_admits_everything_under_soft_limit(self):
+        admission = _controller()
+
+        assert admission.decide("U1", addressed=False, channel_depth=4, orchestrator_depth=19) == Admission.ADMIT
+        assert admission.decide("U1", addressed=True, channel_depth=4, orchestrator_depth=19) == Admission.ADMIT
+        assert admission.stats() == {"admitted": 2}
+
+    def test_soft_limit_drops_only_low_priority(self):
+        admission = _controller()
+
+        assert admission.decide("U1", addressed=False, channel_depth=5, orchestrator_depth=0) == Admission.DROP
+        assert admission.decide("U1", addressed=True, channel_depth=5, orchestrator_depth=0) == Admission.ADMIT
+        # Orchestrator backlog counts as well
+        assert admission.decide("U2", addressed=False, channel_depth=0, orchestrator_depth=20) == Admission.DROP
+        assert admission.stats() == {"admitted": 1, "soft:low_priority": 2}
+
+    def test_hard_limit_busy_reply_once_per_user(self):
+        admission = _controller()
+
+        assert admission.decide("U1", addressed=True, channel_depth=10, orchestrator_depth=0) == Admission.BUSY_REPLY
+        assert admission.decide("U1", addressed=True, channel_depth=10, orchestrator_depth=0) == Admission.DROP
+        assert admission.decide("U2", addressed=True, channel_depth=0, orchestrator_depth=40) == Admission.BUSY_REPLY
+        assert admission.stats() == {"admitted": 0, "hard:busy_reply": 2, "hard:busy_suppressed": 1}
+
+    def test_busy_message_follows_language(self):
+        assert pick_busy_message("지금 확인 가능할까요?") in BUSY_MESSAGES["Korean"]
+        assert pick_busy_message("Can you check this?") in BUSY_MESSAGES["English"]
+
+
+@pytest.mark.parametrize("event, addressed", [
+    ({"text": "<@UBOT> 오늘 일정 알려줘"}, True),
+    ({"text": "키라야 오늘 일정 알려줘"}, True),
+    ({"text": "Hey 키라, what's on today?"}, True),
+    ({"text": "점심 뭐 먹지"}, False),
+    ({"text": "점심 뭐 먹지", "thread_ts": "1700000000.000100"}, True),
+])
+def test_addressed_to_bot(event, addressed):
+    settings = SimpleNamespace(BOT_NAME="키라")
+    with patch.object(cc_slack_handlers, "get_settings", return_value=settings), \
+         patch.object(cc_slack_handlers, "_bot_user_id", "UBOT"):
+        assert cc_slack_handlers.is_addressed_to_bot(event) == addressed
@@ -0,0 +1,49 @@
+"""
+Tests for Bot Call Detector fast path
+
+Tests that verify clear-cut messages are decided without an LLM call and only
+the ambiguous middle band reaches the model.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from app.cc_agents.bot_call_detector.agent import call_bot_call_detector, detect_bot_call_fast
+
+
+class TestBotCallFastPath:
+    """Test suite for deterministic bot call detection"""
+
+    @pytest.mark.parametrize("text, expected, source", [
+        ("KIRA(@UBOT) 이거 확인해줘", True, "mention"),
+        ("오늘 점심 뭐 먹지?", False, "no_name"),
+        ("키라야 이거 정리해줘", True, "direct_address"),
+        ("김키라님, 확인 부탁드려요", True, "direct_address"),
+        ("Hey KIRA can you check this", True, "direct_address"),
+        ("키라가 어제 정리한 문서 봤어?", None, "ambiguous"),
+    ])
+    def test_fast_path_decisions(self, text, expected, source):
+        bot_name = "KIRA" if text.startswith(("KIRA", "Hey")) else "김키라"
+
+        assert detect_bot_call_fast(text, bot_name, "UBOT") == (expected, source)
+
+    @pytest.mark.asyncio
+    async def test_no_llm_call_when_name_absent(self):
+        with patch("app.cc_agents.bot_call_detector.agent.get_claude_client_pool") as pool:
+            result = await call_bot_call_detector("배포 일정 공유드립니다", bot_name="김키라", bot_user_id="UBOT")
+
+        assert result is False
+        pool.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_precomputed_fast_result_is_reused(self):
+        with patch("app.cc_agents.bot_call_detector.agent.detect_bot_call_fast") as fast, \
+                patch("app.cc_agents.bot_call_detector.agent.get_claude_client_pool") as pool:
+            result = await call_bot_call_detector(
+                "김키라 배포 일정 알려줘", bot_name="김키라", bot_user_id="UBOT",
+                fast_result=(True, "name_prefix")
+            )
+
+        assert result is True
+        fast.assert_not_called()
+        pool.assert_not_called()
@@ -0,0 +1,53 @@
+"""
+Tests for Bot Status Reconciler
+
+Tests that verify Slack is only written on settled transitions and that
+rapid busy/idle flips are coalesced.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.cc_utils.bot_status import BUSY_PROFILE, IDLE_PROFILE, BotStatusReconciler
+
+
+def _reconciler(client):
+    return BotStatusReconciler(client, busy_settle_seconds=0.05, idle_settle_seconds=0.1, min_interval_seconds=0)
+
+
+class TestBotStatusReconciler:
+    """Test suite for BotStatusReconciler"""
+
+    @pytest.mark.asyncio
+    async def test_rapid_flips_are_coalesced(self):
+        client = MagicMock()
+        client.users_profile_set = AsyncMock()
+        status = _reconciler(client)
+
+        status.set_load(0, 1)
+        await asyncio.sleep(0.02)
+        for _ in range(5):
+            status.set_load(1, 1)
+            status.set_load(0, 1)
+        await asyncio.sleep(0.2)
+
+        # Only the initial reconcile; the flips never held long enough
+        client.users_profile_set.assert_awaited_once_with(profile=IDLE_PROFILE)
+
+    @pytest.mark.asyncio
+    async def test_settled_busy_is_written_once(self):
+        client = MagicMock()
+        client.users_profile_set = AsyncMock()
+        status = _reconciler(client)
+
+        status.set_load(0, 1)
+        await asyncio.sleep(0.02)
+        status.set_load(1, 1)
+        status.set_load(1, 1)
+        await asyncio.sleep(0.15)
+
+        assert client.users_profile_set.await_count == 2
+        client.users_profile_set.assert_awaited_with(profile=BUSY_PROFILE)
+        assert status.applied_busy
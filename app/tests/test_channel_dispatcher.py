@@ -0,0 +1,83 @@
+"""
+Tests for the shared channel worker pool
+
+Tests that verify channels are served round-robin, messages of one thread
+are processed in order and idle channel queues are collected.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app import queueing_extended
+from app.cc_utils import durable_queue
+from app.queueing_extended import ChannelDispatcher, enqueue_message, start_channel_workers
+
+
+@pytest.fixture(autouse=True)
+def memory_only_queues():
+    with patch("app.cc_utils.durable_queue.get_job_store", return_value=None), \
+         patch.object(queueing_extended, "_dispatcher", ChannelDispatcher()), \
+         patch.dict(queueing_extended.message_queues, clear=True):
+        yield
+
+
+class TestChannelDispatcher:
+    """Test suite for ChannelDispatcher"""
+
+    @pytest.mark.asyncio
+    async def test_channels_are_served_round_robin(self):
+        for i in range(3):
+            await enqueue_message({"channel": "C_BUSY", "ts": f"1.{i}", "text": "busy"})
+        await enqueue_message({"channel": "C_QUIET", "ts": "2.0", "text": "quiet"})
+
+        dispatcher = queueing_extended._dispatcher
+        served = [(await dispatcher.next_job())[0] for _ in range(4)]
+
+        assert served[:2] == ["C_BUSY", "C_QUIET"]
+
+    @pytest.mark.asyncio
+    async def test_thread_messages_are_processed_in_order(self):
+        processed = []
+
+        async def process(message, client):
+            await asyncio.sleep(0.02 if message["text"] == "first" else 0)
+            processed.append(message["text"])
+
+        start_channel_workers(MagicMock(), process, pool_size=4)
+        for text in ["first", "second", "third"]:
+            await enqueue_message({"channel": "C1", "ts": "9.9", "thread_ts": "1.0", "text": text})
+
+        await asyncio.sleep(0.1)
+
+        assert processed == ["first", "second", "third"]
+
+    @pytest.mark.asyncio
+    async def test_idle_channel_queues_are_collected(self):
+        await enqueue_message({"channel": "C1", "ts": "1.0", "text": "hi"})
+        dispatcher = queueing_extended._dispatcher
+        _, queue, job_id, _ = await dispatcher.next_job()
+
+        assert dispatcher.collect_idle(ttl=0) == 0  # In flight
+        await queue.task_done(job_id)
+        assert dispatcher.collect_idle(ttl=0) == 1
+        assert "C1" not in queueing_extended.message_queues
+
+    @pytest.mark.asyncio
+    async def test_parked_thread_messages_outlive_the_visibility_timeout(self):
+        processed = []
+
+        async def process(message, client):
+            await asyncio.sleep(0.2 if message["text"] == "first" else 0)
+            processed.append(message["text"])
+
+        queueing_extended.get_or_create_channel_queue("C1").visibility_timeout = 0.03
+        with patch.object(durable_queue, "LEASE_CHECK_INTERVAL_SECONDS", 0.01):
+            start_channel_workers(MagicMock(), process, pool_size=4)
+            for text in ["first", "second", "third"]:
+                await enqueue_message({"channel": "C1", "ts": "9.9", "thread_ts": "1.0", "text": text})
+
+            await asyncio.sleep(0.3)
+
+        assert processed == ["first", "second", "third"]
@@ -0,0 +1,101 @@
+"""
+Tests for Claude Client Pool
+
+Tests that verify warm clients are reused per profile after /clear and that
+failed or worn-out clients are not handed out again.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+from claude_agent_sdk import ClaudeAgentOptions
+
+from app.cc_utils.claude_client_pool import ClaudeClientPool
+
+
+class FakeClient:
+    """Stands in for ClaudeSDKClient without spawning the CLI"""
+
+    instances = []
+
+    def __init__(self, options=None):
+        self.options = options
+        self.queries = []
+        self.connected = False
+        FakeClient.instances.append(self)
+
+    async def connect(self):
+        self.connected = True
+
+    async def disconnect(self):
+        self.connected = False
+
+    async def query(self, prompt, session_id="default"):
+        self.queries.append(prompt)
+
+    async def receive_response(self):
+        yield "result"
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture(autouse=True)
+def fake_sdk_client():
+    FakeClient.instances = []
+    with patch("app.cc_utils.claude_client_pool.ClaudeSDKClient", FakeClient):
+        yield
+
+
+class TestClaudeClientPool:
+    """Test suite for the Claude client pool"""
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_for_same_profile(self):
+        pool = ClaudeClientPool(max_idle_per_profile=2)
+        options = ClaudeAgentOptions(system_prompt="detector", model="sonnet")
+
+        async with pool.client(options, "detector") as first:
+            await first.query("hello")
+        await _settle()
+        async with pool.client(options, "detector") as second:
+            pass
+
+        assert first is second
+        assert "/clear" in first.queries
+        assert pool.stats()["hits"] == 1
+        assert len(FakeClient.instances) == 1
+
+    @pytest.mark.asyncio
+    async def test_different_profiles_do_not_share(self):
+        pool = ClaudeClientPool(max_idle_per_profile=2)
+
+        async with pool.client(ClaudeAgentOptions(system_prompt="a"), "a"):
+            pass
+        await _settle()
+        async with pool.client(ClaudeAgentOptions(system_prompt="b"), "b"):
+            pass
+
+        assert pool.stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_and_worn_out_clients_are_discarded(self):
+        pool = ClaudeClientPool(max_idle_per_profile=2, max_uses=1)
+        options = ClaudeAgentOptions(system_prompt="detector")
+
+        with pytest.raises(RuntimeError):
+            async with pool.client(options, "detector"):
+                raise RuntimeError("boom")
+        await _settle()
+        async with pool.client(options, "detector"):
+            pass
+        await _settle()
+
+        stats = pool.stats()
+        assert stats["discarded"] == 1
+        assert stats["recycled"] == 1
+        assert stats["idle"] == 0
+        assert not any(client.connected for client in FakeClient.instances)
@@ -0,0 +1,71 @@
+"""
+Tests for Context Assembler
+
+Tests that verify sources are gathered concurrently, slow sources time out
+without holding up the others, and per-source stats are recorded.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.cc_agents.context_assembler import ContextAssembler, get_source_stats
+from app.cc_agents.context_sources import ContextSource
+
+
+class FakeSource(ContextSource):
+    """Context source that answers after a fixed delay"""
+
+    def __init__(self, name, delay, context, timeout_seconds=None):
+        self._name = name
+        self._delay = delay
+        self._context = context
+        self.timeout_seconds = timeout_seconds
+
+    async def get_context(self, search_query, slack_data=None, message_data=None, **kwargs):
+        await asyncio.sleep(self._delay)
+        return self._context
+
+    def get_source_name(self):
+        return self._name
+
+
+class TestContextAssembler:
+    """Test suite for concurrent context assembly"""
+
+    @pytest.mark.asyncio
+    async def test_sources_run_concurrently_in_order(self):
+        assembler = ContextAssembler([
+            FakeSource("first", 0.05, "A"),
+            FakeSource("second", 0.05, "B"),
+        ])
+
+        started = time.monotonic()
+        result = await assembler.assemble_context("query")
+
+        assert time.monotonic() - started < 0.09
+        assert result.index("A") < result.index("B")
+
+    @pytest.mark.asyncio
+    async def test_slow_source_times_out_with_partial_result(self):
+        assembler = ContextAssembler([
+            FakeSource("memories", 0.0, "memory context"),
+            FakeSource("slow_remote", 1.0, "late", timeout_seconds=0.05),
+        ])
+
+        result = await assembler.assemble_context("query")
+
+        assert "memory context" in result
+        assert "late" not in result
+        assert get_source_stats()["slow_remote"]["timeouts"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_overall_deadline_bounds_all_sources(self):
+        assembler = ContextAssembler([FakeSource("slow_local", 1.0, "late")], deadline_seconds=0.05)
+
+        started = time.monotonic()
+        result = await assembler.assemble_context("query")
+
+        assert result == ""
+        assert time.monotonic() - started < 0.5
@@ -0,0 +1,92 @@
+"""
+Tests for Operator Context Budget
+
+Tests that retrieved memory and state are trimmed before the first operator
+call when the estimated prompt exceeds the budget, and that it is recorded.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.cc_agents.operator.context_budget import (
+    get_context_budget_stats,
+    plan_operator_context,
+    trim_memory,
+)
+from app.cc_utils.token_helper import estimate_tokens
+
+SETTINGS = SimpleNamespace(
+    FILESYSTEM_BASE_DIR="/tmp/kira",
+    BOT_NAME="KIRA",
+    BOT_EMAIL="",
+    BOT_ORGANIZATION="Acme",
+    BOT_TEAM="",
+    BOT_AUTHORIZED_USERS_EN="",
+    BOT_AUTHORIZED_USERS_KR="",
+    ATLASSIAN_CONFLUENCE_DEFAULT_PAGE_ID="",
+    STATE_PROMPT_MEMBERS_MAX_TOKENS=1500,
+    STATE_PROMPT_MESSAGES_MAX_TOKENS=3000,
+    OPERATOR_CONTEXT_MAX_TOKENS=60000,
+    OPERATOR_MEMORY_MAX_TOKENS=8000,
+)
+
+SLACK_DATA = {
+    "channel": {"channel_id": "C1", "channel_name": "general"},
+    "members": [
+        {"user_id": f"U{index:04d}", "real_name": f"User {index}", "email": f"user{index}@example.com"}
+        for index in range(1000)
+    ],
+    "recent_messages": [f"[User {index}]: {'배포 일정 공유드립니다 ' * 10}" for index in range(100)],
+}
+MESSAGE_DATA = {"user_id": "U0001", "user_text": "지난주 회의 내용 정리해줘", "channel_id": "C1"}
+
+
+def _plan(retrieved_memory, **budget):
+    with patch("app.cc_agents.operator.context_budget.get_settings", return_value=SETTINGS), \
+            patch("app.cc_agents.state_prompt.get_settings", return_value=SETTINGS):
+        return plan_operator_context(
+            MESSAGE_DATA["user_text"], SLACK_DATA, MESSAGE_DATA, retrieved_memory,
+            fixed_prompt_tokens=5000, **budget
+        )
+
+
+class TestContextBudget:
+    """Test suite for operator pre-flight context budgeting"""
+
+    def test_trim_memory_keeps_leading_paragraphs(self):
+        memory = "\n\n".join(f"### 문서 {index}\n{'내용 ' * 100}" for index in range(10))
+
+        trimmed = trim_memory(memory, max_tokens=500)
+
+        assert trimmed.startswith("### 문서 0")
+        assert "### 문서 9" not in trimmed
+        assert trimmed.endswith("문단 생략)")
+        assert trim_memory("짧은 메모리", max_tokens=500) == "짧은 메모리"
+
+    def test_within_budget_is_untouched(self):
+        plan = _plan("### 문서\n짧은 메모리")
+
+        assert plan.actions == []
+        assert plan.retrieved_memory == "### 문서\n짧은 메모리"
+        assert "<retrieved_memory>" in plan.state_prompt
+
+    def test_over_budget_trims_memory_then_state(self):
+        memory = "\n\n".join(f"### 문서 {index}\n{'내용 ' * 400}" for index in range(20))
+        before = get_context_budget_stats()
+
+        plan = _plan(memory, max_tokens=9000, memory_max_tokens=4000)
+
+        assert plan.actions == ["memory", "state"]
+        assert plan.estimated_tokens <= 9000
+        assert estimate_tokens(plan.retrieved_memory) <= 4000
+        assert "members_omitted" in plan.state_prompt
+
+        after = get_context_budget_stats()
+        assert after["memory_trimmed"] == before["memory_trimmed"] + 1
+        assert after["state_trimmed"] == before["state_trimmed"] + 1
+        assert after["tokens_saved"] > before["tokens_saved"]
+
+    def test_no_memory_adds_no_section(self):
+        plan = _plan("관련된 메모리가 없습니다.")
+
+        assert "<retrieved_memory>" not in plan.state_prompt
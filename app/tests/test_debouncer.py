@@ -0,0 +1,71 @@
+"""
+Tests for Timer Wheel Debouncer
+
+Tests that verify adaptive delays by message shape, re-arming within the
+max-wait cap and that one driver task serves every key.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.cc_utils.debouncer import TimerWheelDebouncer, adaptive_delay
+
+
+def _delay(text, **extra):
+    return adaptive_delay({"text": text, **extra}, short_seconds=1.0, default_seconds=2.5, long_seconds=5.0)
+
+
+class TestAdaptiveDelay:
+    """Test suite for adaptive_delay"""
+
+    def test_delay_by_message_shape(self):
+        assert _delay("취소") == 0
+        assert _delay("/status") == 0
+        assert _delay("!help deploy") == 0
+        assert _delay("/home/kira/logs/error.log 확인해줘") == 1.0
+        assert _delay("!!!") == 2.5
+        assert _delay("내일 회의 몇 시야?") == 1.0
+        assert _delay("회의록 정리해줘") == 1.0
+        assert _delay("그리고") == 5.0
+        assert _delay("이거 봐줘 https://example.com") == 5.0
+        assert _delay("", files=[{"id": "F1"}]) == 5.0
+        assert _delay("hey kira") == 2.5
+
+
+class TestTimerWheelDebouncer:
+    """Test suite for TimerWheelDebouncer"""
+
+    @pytest.mark.asyncio
+    async def test_keys_fire_after_their_delay(self):
+        fired = []
+
+        async def on_fire(key):
+            fired.append((key, time.monotonic()))
+
+        debouncer = TimerWheelDebouncer(on_fire)
+        started = time.monotonic()
+        debouncer.touch("C1:U1", 0.2)
+        debouncer.touch("C2:U2", 0.4)
+        debouncer.touch("C1:U1", 0.3)  # Re-armed by a follow-up message
+
+        await asyncio.sleep(0.7)
+
+        assert [key for key, _ in fired] == ["C1:U1", "C2:U2"]
+        assert fired[0][1] - started >= 0.3
+        assert debouncer.pending() == 0
+
+    @pytest.mark.asyncio
+    async def test_max_wait_caps_a_stream(self):
+        fired = []
+
+        async def on_fire(key):
+            fired.append(key)
+
+        debouncer = TimerWheelDebouncer(on_fire, max_wait_seconds=0.3)
+        for _ in range(6):
+            debouncer.touch("C1:U1", 0.2)
+            await asyncio.sleep(0.1)
+
+        assert fired == ["C1:U1"]
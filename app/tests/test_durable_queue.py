@@ -0,0 +1,83 @@
+"""
+Tests for Durable Queue
+
+Tests that verify jobs survive a restart until acknowledged, repeatedly
+failing jobs are parked, concurrent writes share one commit and held leases
+are renewed instead of redelivered.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from app.cc_utils.durable_queue import MAX_DELIVERY_ATTEMPTS, DurableQueue, JobStore
+
+
+class TestDurableQueue:
+    """Test suite for DurableQueue and JobStore"""
+
+    @pytest.mark.asyncio
+    async def test_unacked_job_is_redelivered_after_restart(self, tmp_path):
+        db_path = tmp_path / "job_queue.db"
+
+        with patch("app.cc_utils.durable_queue.get_job_store", return_value=JobStore(db_path)):
+            queue = DurableQueue("orchestrator")
+            await queue.put({"query": "acked"})
+            await queue.put({"query": "in flight"})
+
+            job_id, job = await queue.get()
+            assert job == {"query": "acked"}
+            await queue.task_done(job_id)
+            await queue.get()  # Process "crashes" before acking
+
+        with patch("app.cc_utils.durable_queue.get_job_store", return_value=JobStore(db_path)):
+            restarted = DurableQueue("orchestrator")
+            assert await restarted.recover() == 1
+            _, job = await asyncio.wait_for(restarted.get(), 1)
+            assert job == {"query": "in flight"}
+
+    @pytest.mark.asyncio
+    async def test_poison_job_is_parked(self, tmp_path):
+        store = JobStore(tmp_path / "job_queue.db")
+
+        with patch("app.cc_utils.durable_queue.get_job_store", return_value=store):
+            await DurableQueue("memory").put({"memory_query": "boom"})
+            for _ in range(MAX_DELIVERY_ATTEMPTS):
+                queue = DurableQueue("memory")
+                await queue.recover()
+                await asyncio.wait_for(queue.get(), 1)
+
+            assert await DurableQueue("memory").recover() == 0
+            assert store.stats()["jobs"] == {"memory/dead": 1}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_are_group_committed(self, tmp_path):
+        store = JobStore(tmp_path / "job_queue.db")
+
+        with patch("app.cc_utils.durable_queue.get_job_store", return_value=store):
+            queue = DurableQueue("message:C123")
+            await asyncio.gather(*[queue.put({"message": {"text": str(i)}}) for i in range(20)])
+
+        assert store.writes == 20
+        assert store.commits == 1
+
+    @pytest.mark.asyncio
+    async def test_held_lease_is_renewed_not_redelivered(self):
+        with patch("app.cc_utils.durable_queue.get_job_store", return_value=None), \
+                patch("app.cc_utils.durable_queue.LEASE_CHECK_INTERVAL_SECONDS", 0.01):
+            queue = DurableQueue("orchestrator", visibility_timeout=0.05)
+            await queue.put({"query": "long running"})
+            await queue.put({"query": "abandoned"})
+
+            held_id, _ = await queue.get()
+            await queue.get()  # Owner goes away without holding or acking
+            async with queue.keep_alive(held_id):
+                redelivered_id, job = await asyncio.wait_for(queue.get(), 1)
+                await queue.task_done(redelivered_id)
+                await asyncio.sleep(0.2)
+
+            assert job == {"query": "abandoned"}
+            assert queue.qsize() == 0
+            await queue.task_done(held_id)
+            assert held_id not in queue._leases
@@ -0,0 +1,45 @@
+"""
+Tests for Event Deduplication
+
+Tests that redelivered Slack events are recognized by any of their keys and
+that the seen-set survives a restart when persisted.
+"""
+
+import pytest
+
+from app.cc_utils.durable_queue import JobStore
+from app.cc_utils.event_dedup import EventDeduplicator, event_keys
+
+EVENT = {"type": "message", "channel": "C1", "ts": "1700000000.000100", "client_msg_id": "m-1", "user": "U1"}
+
+
+class TestEventDeduplicator:
+    """Test suite for EventDeduplicator"""
+
+    def test_event_keys(self):
+        assert event_keys(EVENT, {"event_id": "Ev1"}) == [
+            "event:Ev1",
+            "client_msg:m-1",
+            "ts:C1:1700000000.000100",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_retry_with_new_envelope_is_duplicate(self):
+        dedup = EventDeduplicator(ttl_seconds=60)
+
+        assert await dedup.is_duplicate(EVENT, {"event_id": "Ev1"}) is False
+        assert await dedup.is_duplicate(EVENT, {"event_id": "Ev1"}) is True
+        # Same message delivered under another envelope
+        assert await dedup.is_duplicate(EVENT, {"event_id": "Ev2"}) is True
+        assert await dedup.is_duplicate({**EVENT, "ts": "1700000001.000100", "client_msg_id": "m-2"}, {"event_id": "Ev3"}) is False
+        assert dedup.stats()["duplicates"] == 2
+
+    @pytest.mark.asyncio
+    async def test_seen_events_survive_restart(self, tmp_path):
+        db_path = tmp_path / "job_queue.db"
+        dedup = EventDeduplicator(ttl_seconds=60, store=JobStore(db_path))
+        assert await dedup.is_duplicate(EVENT, {"event_id": "Ev1"}) is False
+
+        restarted = EventDeduplicator(ttl_seconds=60, store=JobStore(db_path))
+        assert restarted.load() == 3
+        assert await restarted.is_duplicate(EVENT, {"event_id": "Ev9"}) is True
@@ -0,0 +1,106 @@
+"""
+Tests for Fair Priority Queue
+
+Tests that verify interactive jobs overtake background work, users share a
+class fairly and waiting jobs are promoted by aging.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app import cc_slack_handlers
+from app.cc_utils.fair_queue import FairPriorityQueue, JobClass
+from app.queueing_extended import classify_orchestrator_job
+
+
+def _classify(item):
+    return item["class"], item["user"]
+
+
+def _job(job_class, user, name):
+    return {"class": job_class, "user": user, "name": name}
+
+
+def _drain(queue):
+    return [queue.get_nowait()["name"] for _ in range(queue.qsize())]
+
+
+class TestFairPriorityQueue:
+    """Test suite for FairPriorityQueue"""
+
+    def test_interactive_overtakes_background_work(self):
+        queue = FairPriorityQueue(_classify)
+        queue.put_nowait(_job(JobClass.CHECKER, "U1", "jira"))
+        queue.put_nowait(_job(JobClass.SCHEDULED, "U1", "cron"))
+        queue.put_nowait(_job(JobClass.INTERACTIVE, "U2", "dm"))
+
+        assert _drain(queue) == ["dm", "cron", "jira"]
+
+    def test_users_share_a_class_fairly(self):
+        queue = FairPriorityQueue(_classify)
+        for i in range(3):
+            queue.put_nowait(_job(JobClass.INTERACTIVE, "U_BURST", f"burst{i}"))
+        queue.put_nowait(_job(JobClass.INTERACTIVE, "U_OTHER", "other"))
+
+        assert _drain(queue)[:2] == ["burst0", "other"]
+
+    def test_waiting_jobs_age_upward(self):
+        queue = FairPriorityQueue(_classify, aging_seconds=60)
+
+        with patch("app.cc_utils.fair_queue.time.monotonic", return_value=0):
+            queue.put_nowait(_job(JobClass.PROACTIVE, "U1", "old"))
+        with patch("app.cc_utils.fair_queue.time.monotonic", return_value=300):
+            queue.put_nowait(_job(JobClass.THREAD_FOLLOWUP, "U2", "new"))
+            assert queue.get_nowait()["name"] == "old"
+
+
+async def _orchestrator_job_for(message):
+    """Run a DM through _process_message_logic and return the orchestrator job it enqueues"""
+    enqueue = AsyncMock()
+    with patch.object(cc_slack_handlers, "get_user_name", AsyncMock(return_value="Alice")), \
+         patch.object(cc_slack_handlers, "convert_mentions_to_readable", AsyncMock(side_effect=lambda text, client: text)), \
+         patch.object(cc_slack_handlers, "get_slack_context_data_async", AsyncMock(return_value={"channel": {"channel_type": "dm"}})), \
+         patch.object(cc_slack_handlers, "call_proactive_confirm", AsyncMock(return_value=(False, None))), \
+         patch.object(cc_slack_handlers, "call_answer_aggregator", AsyncMock(return_value=False)), \
+         patch.object(cc_slack_handlers, "call_memory_retriever", AsyncMock(return_value="")), \
+         patch.object(cc_slack_handlers, "call_simple_chat", AsyncMock(return_value=False)), \
+         patch.object(cc_slack_handlers, "is_authorized_user", return_value=True), \
+         patch.object(cc_slack_handlers, "enqueue_orchestrator_job", enqueue):
+        await cc_slack_handlers._process_message_logic(message, client=None)
+
+    enqueue.assert_awaited_once()
+    return enqueue.await_args.args[0]
+
+
+class TestOrchestratorJobClasses:
+    """Test suite for classify_orchestrator_job"""
+
+    def test_approved_proactive_job_is_interactive(self):
+        message_data = {"user_id": "U1", "thread_ts": "1700000000.000100"}
+
+        approved = classify_orchestrator_job(
+            ("job1", {"message_data": message_data, "source": "proactive_confirm"})
+        )
+        unsolicited = classify_orchestrator_job(
+            ("job2", {"message_data": message_data, "source": "proactive"})
+        )
+
+        assert approved == (JobClass.INTERACTIVE, "U1")
+        assert unsolicited == (JobClass.PROACTIVE, "U1")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("source, job_class", [
+        ("scheduled", JobClass.SCHEDULED),
+        ("checker", JobClass.CHECKER),
+        ("voice", JobClass.INTERACTIVE),
+        (None, JobClass.INTERACTIVE),
+    ])
+    async def test_message_source_reaches_the_orchestrator_job(self, source, job_class):
+        message = {"channel": "D1", "user": "U1", "ts": "", "thread_ts": None, "text": "weekly report"}
+        if source:
+            message["source"] = source
+
+        job = await _orchestrator_job_for(message)
+
+        assert job["source"] == (source or "slack")
+        assert classify_orchestrator_job(("job1", job)) == (job_class, "U1")
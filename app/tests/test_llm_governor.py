@@ -0,0 +1,138 @@
+"""
+Tests for LLM Governor
+
+Tests that verify tier/global limits bound concurrent agents, that waiters
+are admitted by priority class, that orchestrator jobs get their priority
+from their source and that process mode splits the limits.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.cc_agents.operator import agent as operator_agent
+from app.cc_utils import llm_governor, process_share
+from app.cc_utils.llm_governor import LLMGovernor, LLMPriority, LLMTier
+from app.orchestrator_pool import run_orchestrator_job
+
+
+def _make_governor(simple: int = 2, total: int = 2) -> LLMGovernor:
+    return LLMGovernor(
+        tier_limits={LLMTier.SIMPLE: simple, LLMTier.MODERATE: 1, LLMTier.COMPLEX: 1},
+        total_limit=total,
+    )
+
+
+class TestLLMGovernor:
+    """Test suite for the LLM governor"""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_slots(self):
+        governor = _make_governor(simple=2, total=2)
+        running = 0
+        peak = 0
+
+        async def agent():
+            nonlocal running, peak
+            async with governor.slot(LLMTier.SIMPLE):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*[agent() for _ in range(6)])
+
+        assert peak == 2
+        stats = governor.stats()
+        assert stats["tiers"]["simple"]["acquired"] == 6
+        assert stats["total"]["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_interactive_waiters_admitted_first(self):
+        governor = _make_governor(simple=1, total=1)
+        order = []
+        release = asyncio.Event()
+
+        async def holder():
+            async with governor.slot(LLMTier.SIMPLE):
+                await release.wait()
+
+        async def waiter(name, priority):
+            async with governor.slot(LLMTier.SIMPLE, priority, name):
+                order.append(name)
+
+        holder_task = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(waiter("proactive", LLMPriority.PROACTIVE)),
+            asyncio.create_task(waiter("memory", LLMPriority.BACKGROUND)),
+            asyncio.create_task(waiter("detector", LLMPriority.INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder_task, *tasks)
+
+        assert order == ["detector", "memory", "proactive"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        governor = _make_governor(simple=1, total=1)
+        release = asyncio.Event()
+
+        async def holder():
+            async with governor.slot(LLMTier.SIMPLE):
+                await release.wait()
+
+        holder_task = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(governor.slot(LLMTier.SIMPLE).__aenter__())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await holder_task
+
+        async with governor.slot(LLMTier.SIMPLE):
+            assert governor.stats()["tiers"]["simple"]["in_use"] == 1
+        assert governor.stats()["tiers"]["simple"]["in_use"] == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("job_source, message_source, priority", [
+        (None, "slack", LLMPriority.INTERACTIVE),
+        ("scheduled", "scheduled", LLMPriority.SCHEDULED),
+        ("checker", "checker", LLMPriority.SCHEDULED),
+        ("proactive_confirm", "slack", LLMPriority.INTERACTIVE),
+        (None, "proactive", LLMPriority.PROACTIVE),
+    ])
+    async def test_orchestrator_job_priority_follows_its_source(self, job_source, message_source, priority):
+        job = {
+            "query": "주간 보고서 정리해줘",
+            "slack_data": {},
+            "message_data": {"channel_id": "C1", "source": message_source},
+            "retrieved_memory": "memory",
+            "source": job_source,
+        }
+
+        with patch.object(operator_agent, "call_operator_agent", new=AsyncMock(return_value="")) as operator:
+            await run_orchestrator_job(job)
+
+        assert operator.await_args.kwargs["priority"] == priority
+
+    def test_process_mode_splits_limits(self):
+        settings = SimpleNamespace(
+            LLM_MAX_CONCURRENT_SIMPLE=6,
+            LLM_MAX_CONCURRENT_MODERATE=3,
+            LLM_MAX_CONCURRENT_COMPLEX=1,
+            LLM_MAX_CONCURRENT_TOTAL=8,
+        )
+
+        with patch.object(llm_governor, "_llm_governor", None), \
+                patch.object(llm_governor, "get_settings", return_value=settings), \
+                patch.object(process_share, "_share", process_share.process_share_for(2)):
+            stats = llm_governor.get_llm_governor().stats()
+
+        assert stats["total"]["limit"] == 2
+        assert {tier: values["limit"] for tier, values in stats["tiers"].items()} == {
+            "simple": 2, "moderate": 1, "complex": 1
+        }
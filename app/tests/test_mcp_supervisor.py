@@ -0,0 +1,149 @@
+"""
+Tests for MCP Supervisor
+
+Tests that sessions sharing one server process get their own responses,
+the handshake is answered from cache, a crashed server is restarted, the
+bridge rejects requests without its token and a taken port falls back to
+stdio.
+"""
+
+import asyncio
+import socket
+import sys
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from app.cc_utils import mcp_supervisor
+from app.cc_utils.mcp_supervisor import McpSupervisor, SupervisedServer, is_supervisable, route_servers
+
+# Minimal stdio MCP server: echoes the method and its pid, exits on "crash"
+FAKE_SERVER = """
+import json, os, sys
+for line in sys.stdin:
+    message = json.loads(line)
+    if message.get("method") == "crash":
+        sys.exit(1)
+    if "id" not in message:
+        continue
+    if message["method"] == "initialize":
+        result = {"protocolVersion": "2024-11-05", "capabilities": {"tools": {}}, "serverInfo": {"name": "fake"}}
+    else:
+        result = {"method": message["method"], "pid": os.getpid()}
+    print(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}), flush=True)
+"""
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_healthy(server: SupervisedServer, timeout: float = 5.0):
+    async def wait():
+        while not server.healthy:
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(wait(), timeout)
+
+
+class TestMcpSupervisor:
+    """Test suite for SupervisedServer"""
+
+    def test_only_shareable_stdio_servers_are_routed(self):
+        servers = {
+            "time": {"command": "npx", "args": ["-y", "@mcpcentral/mcp-time"]},
+            "playwright": {"command": "npx", "args": ["@playwright/mcp@latest"]},
+            "github": {"type": "http", "url": "https://api.githubcopilot.com/mcp/"},
+        }
+        assert [name for name, spec in servers.items() if is_supervisable(name, spec)] == ["time"]
+
+        routed = route_servers(servers, healthy={"time", "playwright"}, port=8765, token="secret")
+        assert routed["time"] == {"type": "sse", "url": "http://127.0.0.1:8765/mcp/time/sse?token=secret"}
+        assert routed["playwright"] == servers["playwright"]
+        assert routed["github"] == servers["github"]
+
+    @pytest.mark.asyncio
+    async def test_sessions_share_one_process(self):
+        server = SupervisedServer("fake", {"command": sys.executable, "args": ["-c", FAKE_SERVER]})
+        task = asyncio.create_task(server.run())
+        try:
+            await _wait_healthy(server)
+            first, second = server.open_session(), server.open_session()
+
+            await server.handle_client_message(first.id, {"jsonrpc": "2.0", "id": 0, "method": "initialize", "params": {}})
+            init = await asyncio.wait_for(first.outbox.get(), 1)
+            assert init["id"] == 0 and init["result"]["serverInfo"] == {"name": "fake"}
+
+            # Both sessions use the same request id
+            await server.handle_client_message(first.id, {"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+            await server.handle_client_message(second.id, {"jsonrpc": "2.0", "id": 1, "method": "tools/call"})
+            first_reply = await asyncio.wait_for(first.outbox.get(), 1)
+            second_reply = await asyncio.wait_for(second.outbox.get(), 1)
+
+            assert first_reply["id"] == 1 and first_reply["result"]["method"] == "tools/list"
+            assert second_reply["id"] == 1 and second_reply["result"]["method"] == "tools/call"
+            assert first_reply["result"]["pid"] == second_reply["result"]["pid"]
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_crashed_server_is_restarted(self):
+        server = SupervisedServer("fake", {"command": sys.executable, "args": ["-c", FAKE_SERVER]})
+        task = asyncio.create_task(server.run())
+        try:
+            await _wait_healthy(server)
+            session = server.open_session()
+            first_pid = server.status()["pid"]
+
+            await server.handle_client_message(session.id, {"jsonrpc": "2.0", "method": "crash"})
+            # Open sessions are closed so clients reconnect to the new process
+            assert await asyncio.wait_for(session.outbox.get(), 2) is None
+
+            await _wait_healthy(server)
+            assert server.restarts == 1
+            assert server.status()["pid"] != first_pid
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_bridge_requires_its_token(self):
+        port = _free_port()
+        supervisor = McpSupervisor({}, port=port)
+        await supervisor.start()
+        try:
+            url = f"http://127.0.0.1:{port}/mcp/status"
+            async with httpx.AsyncClient(timeout=2) as client:
+                for _ in range(50):
+                    try:
+                        anonymous = await client.get(url)
+                        break
+                    except httpx.ConnectError:
+                        await asyncio.sleep(0.05)
+                wrong = await client.get(url, headers={"Authorization": "Bearer wrong"})
+                bearer = await client.get(url, headers={"Authorization": f"Bearer {supervisor.token}"})
+                query = await client.get(url, params={"token": supervisor.token})
+
+            assert anonymous.status_code == 401
+            assert wrong.status_code == 401
+            assert bearer.status_code == 200 and query.status_code == 200
+        finally:
+            await supervisor.close()
+
+    @pytest.mark.asyncio
+    async def test_taken_port_falls_back_to_stdio(self):
+        servers = {"time": {"command": "npx", "args": ["-y", "@mcpcentral/mcp-time"]}}
+        with socket.socket() as taken:
+            taken.bind(("127.0.0.1", 0))
+            taken.listen()
+            settings = SimpleNamespace(MCP_SUPERVISOR_ENABLED=True, MCP_SUPERVISOR_PORT=taken.getsockname()[1])
+
+            with patch.object(mcp_supervisor, "get_settings", return_value=settings), \
+                 patch.object(mcp_supervisor, "_supervisor", None):
+                assert await mcp_supervisor.start_mcp_supervisor(servers) is None
+                assert mcp_supervisor._supervisor is None
+                assert await mcp_supervisor.route_mcp_servers(servers) == servers
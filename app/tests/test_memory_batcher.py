@@ -0,0 +1,56 @@
+"""
+Tests for Memory Batcher
+
+Tests that verify near-duplicate memory jobs are dropped and the rest are
+merged into one memory_manager query grouped by channel/user.
+"""
+
+from app.cc_utils.memory_batcher import build_memory_batch, dedupe_jobs
+
+
+def _job(channel_id, user_id, query, content):
+    return {
+        "memory_query": f"{query}\n{content}",
+        "source": "operator",
+        "channel_id": channel_id,
+        "channel_name": f"name-{channel_id}",
+        "channel_type": "channel",
+        "user_id": user_id,
+        "user_name": f"name-{user_id}",
+        "query": query,
+        "content": content,
+    }
+
+
+class TestMemoryBatcher:
+    """Test suite for memory job batching"""
+
+    def test_near_duplicates_are_dropped(self):
+        jobs = [
+            _job("C1", "U1", "배포 일정 알려줘", "배포는 매주 목요일 오후 3시입니다."),
+            _job("C1", "U1", "배포 일정 알려줘", "배포는 매주 목요일 오후 3시입니다!"),
+            _job("C2", "U1", "배포 일정 알려줘", "배포는 매주 목요일 오후 3시입니다."),
+        ]
+
+        assert len(dedupe_jobs(jobs)) == 2
+
+    def test_batch_is_grouped_into_one_query(self):
+        jobs = [
+            _job("C1", "U1", "회의록 정리해줘", "회의록을 정리해서 공유했습니다."),
+            _job("C2", "U2", "Jira 티켓 만들어줘", "PROJ-123 티켓을 생성했습니다."),
+            _job("C1", "U1", "다음 주 일정 알려줘", "다음 주 화요일 워크숍이 있습니다."),
+            {"memory_query": "Confluence 업데이트 요약", "source": "confluence"},
+        ]
+
+        batch = build_memory_batch(jobs)
+        query = batch["memory_query"]
+
+        assert batch["batch_size"] == 4
+        assert query.count("## 채널 name-C1") == 1
+        assert query.index("회의록") < query.index("다음 주 일정") < query.index("PROJ-123")
+        assert "Confluence 업데이트 요약" in query
+
+    def test_single_job_is_passed_through(self):
+        job = _job("C1", "U1", "안녕", "인사했습니다.")
+
+        assert build_memory_batch([job])["memory_query"] == job["memory_query"]
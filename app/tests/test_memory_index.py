@@ -0,0 +1,89 @@
+"""
+Tests for Memory Index
+
+Tests that verify Korean n-gram BM25 ranking, frontmatter pinning of the
+current channel/user, incremental re-indexing by mtime and the index.md
+rendering.
+"""
+
+import os
+
+import pytest
+
+from app.cc_utils.memory_index import MemoryIndex, tokenize
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+@pytest.fixture
+def memories(tmp_path):
+    root = tmp_path / "memories"
+    _write(root / "channels" / "dev-team.md", """---
+title: 개발팀 채널
+channel_id: C123
+tags: [배포, 릴리즈]
+---
+배포는 매주 목요일 오후 3시에 진행합니다.
+
+코드 리뷰는 최소 2명의 승인이 필요합니다.
+""")
+    _write(root / "users" / "jiho.md", """---
+user_id: U789
+user_name_kr: 전지호
+---
+전지호님은 답변을 짧게 받는 것을 선호합니다.
+""")
+    _write(root / "projects" / "alpha.md", """---
+title: Project Alpha
+tags: [alpha]
+---
+Project Alpha 리드는 Bob Lee 입니다.
+""")
+    _write(root / "index.md", "# Index\n배포 Alpha")
+    return root
+
+
+class TestMemoryIndex:
+    """Test suite for the memory index"""
+
+    def test_tokenize_korean_bigrams(self):
+        assert tokenize("배포일정 Project-Alpha") == ["project", "alpha", "배포", "포일", "일정"]
+
+    def test_search_ranks_and_pins(self, memories, tmp_path):
+        index = MemoryIndex(memories, tmp_path / "index.db")
+
+        results = index.search("다음 배포 일정이 언제야?", user_id="U789")
+
+        assert [r["path"] for r in results][:2] == ["users/jiho.md", "channels/dev-team.md"]
+        assert results[0]["pinned"]
+        assert "목요일" in results[1]["snippet"]
+        assert all(r["path"] != "index.md" for r in results)
+
+    def test_incremental_refresh(self, memories, tmp_path):
+        index = MemoryIndex(memories, tmp_path / "index.db")
+        assert index.refresh(force=True) == 3
+        assert index.refresh(force=True) == 0
+
+        alpha = memories / "projects" / "alpha.md"
+        alpha.write_text("Project Alpha 리드는 Alice Kim 입니다.", encoding="utf-8")
+        os.utime(alpha, (1, 1))
+        (memories / "users" / "jiho.md").unlink()
+
+        assert index.refresh(force=True) == 2
+        assert index.search("Alice")[0]["path"] == "projects/alpha.md"
+
+    def test_index_md_is_rendered_from_files(self, memories, tmp_path):
+        index = MemoryIndex(memories, tmp_path / "index.db")
+
+        assert index.write_index_md() is True
+        content = (memories / "index.md").read_text(encoding="utf-8")
+        assert content.startswith("# Memory Index\n\n3 memory files.")
+        assert "## channels (1)\n- [개발팀 채널](channels/dev-team.md) `배포, 릴리즈`" in content
+        assert "- [jiho](users/jiho.md)" in content
+        assert content.index("## channels") < content.index("## projects") < content.index("## users")
+
+        # Unchanged memories leave index.md untouched
+        assert index.write_index_md() is False
@@ -0,0 +1,180 @@
+"""
+Tests for Memory Locks
+
+Tests that verify writes to different memory categories run in parallel,
+writes to the same category are serialized and index rebuilds coalesce.
+"""
+
+import asyncio
+
+import pytest
+
+from app.cc_utils.memory_locks import (
+    SCRIPT_LOCK_KEY,
+    IndexUpdater,
+    MemoryLockManager,
+    MemoryWriteGuard,
+    memory_lock_keys,
+)
+
+
+class TestMemoryLocks:
+    """Test suite for MemoryLockManager and IndexUpdater"""
+
+    def test_lock_keys(self, tmp_path):
+        (tmp_path / "projects").mkdir()
+        (tmp_path / "decisions").mkdir()
+        memories = str(tmp_path)
+
+        assert memory_lock_keys("Edit", {"file_path": f"{memories}/projects/kira.md"}, memories) == ["category:projects"]
+        assert memory_lock_keys("Write", {"file_path": "/etc/hosts"}, memories) == []
+        assert memory_lock_keys("Bash", {"command": f"ls {memories}/projects"}, memories) == []
+        assert memory_lock_keys("Bash", {"command": "python add_memory.py --title x"}, memories) == [
+            SCRIPT_LOCK_KEY, "category:decisions", "category:projects"
+        ]
+        assert memory_lock_keys("Read", {"file_path": f"{memories}/projects/kira.md"}, memories) == []
+
+    def test_memory_script_locks_only_its_category(self, tmp_path):
+        (tmp_path / "projects").mkdir()
+        (tmp_path / "decisions").mkdir()
+        memories = str(tmp_path)
+
+        def keys(command):
+            return memory_lock_keys("Bash", {"command": command}, memories)
+
+        assert keys("python add_memory.py --category projects --title KIRA") == ["category:projects"]
+        assert keys(f"cd {memories} && python3 scripts/add_memory.py --category=users/U1") == ["category:users"]
+        assert keys("python add_memory.py --path decisions/q3.md --title Q3") == ["category:decisions"]
+        # Targets that cannot be read from the command lock every category
+        assert keys("python add_memory.py --category projects; rm -f decisions/q3.md") == [
+            SCRIPT_LOCK_KEY, "category:decisions", "category:projects"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sessions_editing_one_category_are_serialized(self, tmp_path):
+        locks = MemoryLockManager()
+        memories = str(tmp_path)
+        running = 0
+        peak = 0
+
+        async def edit(session: str, path: str):
+            nonlocal running, peak
+            guard = MemoryWriteGuard(locks, memories)
+            tool = {"tool_name": "Edit", "tool_input": {"file_path": f"{memories}/{path}"}}
+            await guard.before_tool(tool, session, None)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            await guard.after_tool(tool, session, None)
+
+        await asyncio.gather(edit("C1", "projects/kira.md"), edit("C2", "decisions/q3.md"))
+        assert peak == 2
+
+        peak = 0
+        await asyncio.gather(edit("C1", "projects/kira.md"), edit("C2", "projects/kira.md"))
+        assert peak == 1
+        assert locks.active_keys() == []
+
+    @pytest.mark.asyncio
+    async def test_memory_scripts_on_different_categories_run_in_parallel(self, tmp_path):
+        locks = MemoryLockManager()
+        memories = str(tmp_path)
+        running = 0
+        peak = 0
+
+        async def add_memory(session: str, category: str):
+            nonlocal running, peak
+            guard = MemoryWriteGuard(locks, memories)
+            tool = {"tool_name": "Bash", "tool_input": {"command": f"python add_memory.py --category {category} --title t"}}
+            await guard.before_tool(tool, session, None)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            await guard.after_tool(tool, session, None)
+
+        await asyncio.gather(add_memory("C1", "channels"), add_memory("U2", "users"))
+        assert peak == 2
+
+        peak = 0
+        await asyncio.gather(add_memory("C1", "projects"), add_memory("U2", "projects"))
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_guard_releases_locks_of_an_interrupted_session(self, tmp_path):
+        locks = MemoryLockManager()
+        guard = MemoryWriteGuard(locks, str(tmp_path))
+        tool = {"tool_name": "Write", "tool_input": {"file_path": str(tmp_path / "projects" / "kira.md")}}
+
+        await guard.before_tool(tool, "toolu_1", None)
+        assert locks.active_keys() == ["category:projects"]
+
+        guard.release_all()
+        assert locks.active_keys() == []
+
+    @pytest.mark.asyncio
+    async def test_disjoint_keys_run_in_parallel_shared_keys_serialize(self):
+        locks = MemoryLockManager()
+        running = 0
+        peak = 0
+
+        async def write(keys):
+            nonlocal running, peak
+            async with locks.hold(keys):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.02)
+                running -= 1
+
+        await asyncio.gather(write(["channel:C1", "user:U1"]), write(["channel:C2", "user:U2"]))
+        assert peak == 2
+
+        peak = 0
+        await asyncio.gather(write(["channel:C1", "user:U1"]), write(["channel:C2", "user:U1"]))
+        assert peak == 1
+        assert locks.active_keys() == []
+
+    @pytest.mark.asyncio
+    async def test_index_rebuilds_are_coalesced(self):
+        runs = 0
+
+        async def rebuild():
+            nonlocal runs
+            runs += 1
+
+        updater = IndexUpdater(rebuild, quiet_seconds=0.05)
+        for _ in range(5):
+            updater.mark_dirty()
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.15)
+
+        assert runs == 1
+
+    @pytest.mark.asyncio
+    async def test_keys_of_a_failed_call_stay_with_the_session(self, tmp_path):
+        locks = MemoryLockManager()
+        guard = MemoryWriteGuard(locks, str(tmp_path))
+        tool = {"tool_name": "Edit", "tool_input": {"file_path": str(tmp_path / "projects" / "kira.md")}}
+
+        # No PostToolUse follows a failed call; the retry must not wait on its own lock
+        await guard.before_tool(tool, "toolu_failed", None)
+        await asyncio.wait_for(guard.before_tool(tool, "toolu_retry", None), timeout=1)
+        await guard.after_tool(tool, "toolu_retry", None)
+
+        assert locks.active_keys() == []
+
+    @pytest.mark.asyncio
+    async def test_lock_wait_times_out_with_a_deny(self, tmp_path):
+        locks = MemoryLockManager()
+        tool = {"tool_name": "Edit", "tool_input": {"file_path": str(tmp_path / "projects" / "kira.md")}}
+        holder = MemoryWriteGuard(locks, str(tmp_path))
+        waiter = MemoryWriteGuard(locks, str(tmp_path), wait_timeout=0.05)
+
+        await holder.before_tool(tool, "toolu_1", None)
+        result = await waiter.before_tool(tool, "toolu_2", None)
+
+        assert result["hookSpecificOutput"]["permissionDecision"] == "deny"
+        holder.release_all()
+        waiter.release_all()
+        assert locks.active_keys() == []
@@ -0,0 +1,146 @@
+"""
+Tests for the orchestrator process pool
+
+Tests that verify jobs round-trip through the worker loop, failed jobs
+raise in the main process, schedule reloads are forwarded to the main
+process and jobs of a dead worker process are failed even while other
+results keep arriving.
+"""
+
+import asyncio
+import itertools
+import threading
+from contextlib import asynccontextmanager
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app import orchestrator_pool, queueing_extended, scheduler
+from app.orchestrator_pool import OrchestratorProcessError, ProcessOrchestratorPool
+
+_pids = itertools.count(1000)
+
+
+class FakeProcess:
+    """Stands in for a spawned worker process (the worker loop runs in a thread instead)"""
+
+    def __init__(self):
+        self.pid = next(_pids)
+        self.exitcode = None
+        self.alive = True
+
+    def is_alive(self):
+        return self.alive
+
+    def join(self, timeout=None):
+        pass
+
+    def terminate(self):
+        self.alive = False
+
+
+@asynccontextmanager
+async def started_pool():
+    """Pool with one fake worker process; the result reader runs for real"""
+    pool = ProcessOrchestratorPool(num_processes=1)
+
+    def spawn():
+        process = FakeProcess()
+        pool._processes.append(process)
+        return process
+
+    with patch.object(pool, "_spawn", side_effect=spawn), \
+         patch.object(queueing_extended, "_memory_job_forwarder", None), \
+         patch.object(scheduler, "_reload_forwarder", None):
+        pool.start()
+        try:
+            yield pool
+        finally:
+            pool.close(timeout=0)
+
+
+def _run_worker_loop(pool: ProcessOrchestratorPool) -> threading.Thread:
+    thread = threading.Thread(
+        target=lambda: asyncio.run(orchestrator_pool._worker_loop(pool._job_queue, pool._result_queue)),
+        daemon=True
+    )
+    thread.start()
+    return thread
+
+
+class TestProcessOrchestratorPool:
+    """Test suite for ProcessOrchestratorPool"""
+
+    @pytest.mark.asyncio
+    async def test_job_round_trips_through_the_worker_loop(self):
+        async with started_pool() as pool:
+            received = []
+
+            async def run_job(job):
+                received.append(job)
+
+            with patch.object(orchestrator_pool, "run_orchestrator_job", side_effect=run_job):
+                worker = _run_worker_loop(pool)
+                await asyncio.wait_for(pool.run_job({"query": "hello"}), timeout=5)
+                pool._job_queue.put(None)
+                await asyncio.to_thread(worker.join, 5)
+
+            assert received == [{"query": "hello"}]
+
+    @pytest.mark.asyncio
+    async def test_failed_job_raises_in_the_main_process(self):
+        async with started_pool() as pool:
+            async def run_job(job):
+                raise ValueError("boom")
+
+            with patch.object(orchestrator_pool, "run_orchestrator_job", side_effect=run_job):
+                worker = _run_worker_loop(pool)
+                with pytest.raises(OrchestratorProcessError, match="ValueError: boom"):
+                    await asyncio.wait_for(pool.run_job({"query": "hello"}), timeout=5)
+                pool._job_queue.put(None)
+                await asyncio.to_thread(worker.join, 5)
+
+    @pytest.mark.asyncio
+    async def test_schedule_reload_in_a_worker_runs_in_the_main_process(self):
+        async with started_pool() as pool:
+            reloaded = asyncio.Event()
+            reload_in_worker = scheduler.reload_schedules_from_file
+
+            async def run_job(job):
+                # What the scheduler tools do after writing schedules.json
+                await reload_in_worker()
+
+            with patch.object(orchestrator_pool, "run_orchestrator_job", side_effect=run_job), \
+                 patch.object(scheduler, "read_schedules_from_file") as read_schedules, \
+                 patch.object(scheduler, "reload_schedules_from_file", new=AsyncMock(side_effect=reloaded.set)):
+                worker = _run_worker_loop(pool)
+                await asyncio.wait_for(pool.run_job({"query": "매일 9시에 알려줘"}), timeout=5)
+                await asyncio.wait_for(reloaded.wait(), timeout=5)
+                pool._job_queue.put(None)
+                await asyncio.to_thread(worker.join, 5)
+
+            read_schedules.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_dead_worker_fails_its_job_while_results_keep_arriving(self):
+        with patch.object(orchestrator_pool, "LIVENESS_CHECK_SECONDS", 0.05):
+            async with started_pool() as pool:
+                worker = pool._processes[0]
+                job = asyncio.create_task(pool.run_job({"query": "hello"}))
+                job_id, _ = await asyncio.to_thread(pool._job_queue.get, True, 5)
+                pool._result_queue.put(("started", job_id, worker.pid))
+                worker.alive = False
+
+                async def unrelated_results():
+                    while True:
+                        pool._result_queue.put(("started", "other-job", 1))
+                        await asyncio.sleep(0.01)
+
+                traffic = asyncio.create_task(unrelated_results())
+                try:
+                    with pytest.raises(OrchestratorProcessError, match="died"):
+                        await asyncio.wait_for(job, timeout=2)
+                finally:
+                    traffic.cancel()
+
+                assert len(pool._processes) == 1 and pool._processes[0] is not worker
@@ -0,0 +1,157 @@
+"""
+Tests for Slack Client Pool
+
+Tests that verify identical concurrent reads are coalesced and 429 responses
+are retried after Retry-After.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from app.cc_utils.single_flight import SingleFlight
+from slack_bolt.app.async_app import AsyncApp
+from slack_bolt.authorization import AuthorizeResult
+from slack_bolt.request.async_request import AsyncBoltRequest
+
+from app.cc_utils.slack_client_pool import PooledAsyncWebClient, TokenBucket, use_pooled_slack_client
+
+
+class TestSingleFlight:
+    """Test suite for SingleFlight"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*[flight.do("key", fetch) for _ in range(5)])
+
+        assert results == ["value"] * 5
+        assert calls == 1
+        assert flight.stats()["shared"] == 4
+        assert not flight.is_inflight("key")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "value"
+
+        leader = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await follower == "value"
+        assert leader.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_last_cancelled_caller_cancels_computation(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(1)
+            return "value"
+
+        caller = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+
+        # The abandoned computation is gone, so the next caller starts afresh
+        assert not flight.is_inflight("key")
+        follower = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        assert flight.stats() == {"inflight": 1, "executed": 2, "shared": 0}
+        follower.cancel()
+
+
+class TestPooledAsyncWebClient:
+    """Test suite for the pooled Slack client"""
+
+    @pytest.mark.asyncio
+    async def test_identical_reads_are_coalesced(self):
+        client = PooledAsyncWebClient(token="xoxb-test")
+
+        async def fake_call(self, api_method, **kwargs):
+            await asyncio.sleep(0.01)
+            return {"ok": True, "user": {"id": kwargs["params"]["user"]}}
+
+        with patch.object(AsyncWebClient, "api_call", autospec=True, side_effect=fake_call) as api_call:
+            results = await asyncio.gather(
+                client.api_call("users.info", params={"user": "U1"}),
+                client.api_call("users.info", params={"user": "U1"}),
+                client.api_call("users.info", params={"user": "U2"}),
+            )
+
+        assert [r["user"]["id"] for r in results] == ["U1", "U1", "U2"]
+        assert api_call.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_call_is_retried(self):
+        client = PooledAsyncWebClient(token="xoxb-test")
+        response = MagicMock(status_code=429, headers={"Retry-After": "0"})
+        rate_limited = SlackApiError("ratelimited", response)
+
+        with patch.object(
+            AsyncWebClient, "api_call", new=AsyncMock(side_effect=[rate_limited, {"ok": True}])
+        ) as api_call:
+            result = await client.api_call("chat.postMessage", json={"channel": "C1", "text": "hi"})
+
+        assert result == {"ok": True}
+        assert api_call.await_count == 2
+        assert client.stats()["rate_limited"] == 1
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_waits_when_empty(self):
+        bucket = TokenBucket(rate_per_minute=600, burst=1)
+
+        assert await bucket.acquire() == 0
+        assert await bucket.acquire() > 0
+
+    @pytest.mark.asyncio
+    async def test_bolt_listeners_receive_pooled_client(self):
+        pooled = PooledAsyncWebClient(token="xoxb-test")
+
+        async def authorize(**kwargs):
+            return AuthorizeResult(enterprise_id=None, team_id="T1", bot_token="xoxb-test", bot_user_id="UBOT", bot_id="B1")
+
+        app = AsyncApp(authorize=authorize, signing_secret="secret", process_before_response=True)
+        app.middleware(use_pooled_slack_client)
+        seen = {}
+
+        async def matcher(client):
+            seen["matcher"] = client
+            return True
+
+        @app.event("message", matchers=[matcher])
+        async def handle(client):
+            seen["handler"] = client
+
+        body = {
+            "type": "event_callback",
+            "team_id": "T1",
+            "event": {"type": "message", "channel": "C1", "user": "U1", "text": "hi", "ts": "1.0"},
+        }
+        with patch("app.cc_utils.slack_client_pool.get_pooled_slack_client", return_value=pooled):
+            response = await app.async_dispatch(AsyncBoltRequest(body=body, mode="socket_mode"))
+
+        assert response.status == 200
+        assert seen["matcher"] is pooled
+        assert seen["handler"] is pooled
@@ -0,0 +1,121 @@
+"""
+Tests for the async Slack context builder
+
+Tests that verify get_slack_context_data_async() fans out Slack calls and
+serves channel/member/user data from the shared TTL caches.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.cc_utils import slack_helper
+from app.cc_utils.ttl_cache import TTLCache
+
+
+def _make_client():
+    client = MagicMock()
+    client.conversations_info = AsyncMock(return_value={
+        "channel": {"id": "C1", "name": "general", "num_members": 2,
+                    "topic": {"value": "t"}, "purpose": {"value": "p"}}
+    })
+    client.conversations_members = AsyncMock(return_value={
+        "members": ["U1", "B1"], "response_metadata": {"next_cursor": ""}
+    })
+    client.conversations_history = AsyncMock(return_value={
+        "messages": [{"user": "U1", "text": "second"}, {"bot_id": "B1", "text": "first"}]
+    })
+
+    users = {
+        "U1": {"id": "U1", "real_name": "Alice", "profile": {"display_name": "alice", "email": "a@x.com"}},
+        "B1": {"id": "B1", "real_name": "Bot", "is_bot": True, "profile": {}},
+    }
+    client.users_info = AsyncMock(side_effect=lambda user: {"user": users[user]})
+    return client
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    slack_helper.invalidate_slack_context_cache("C1", "U1")
+    slack_helper.invalidate_slack_context_cache(user_id="B1")
+    yield
+
+
+class TestSlackContextCache:
+    """Test suite for the async Slack context builder"""
+
+    def test_ttl_cache_expiry(self):
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl_seconds=-1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats()["hits"] == 1
+
+    def test_ttl_cache_evicts_oldest(self):
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert "a" not in cache
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_context_shape_and_ordering(self):
+        client = _make_client()
+
+        data = await slack_helper.get_slack_context_data_async("C1", message_limit=2, client=client)
+
+        assert data["channel"]["channel_type"] == "public_channel"
+        assert [m["user_id"] for m in data["members"]] == ["U1"]  # bots excluded
+        assert data["recent_messages"] == ["[Bot]: first", "[Alice]: second"]
+
+    @pytest.mark.asyncio
+    async def test_second_call_served_from_cache(self):
+        client = _make_client()
+
+        await slack_helper.get_slack_context_data_async("C1", client=client)
+        await slack_helper.get_slack_context_data_async("C1", client=client)
+
+        assert client.conversations_info.await_count == 1
+        assert client.conversations_members.await_count == 1
+        assert client.users_info.await_count == 2  # U1 and B1 once each
+        assert client.conversations_history.await_count == 2  # history is never cached
+
+    @pytest.mark.asyncio
+    async def test_failed_member_fetch_is_retried(self):
+        client = _make_client()
+        client.conversations_members = AsyncMock(side_effect=[
+            Exception("ratelimited"),
+            {"members": ["U1"], "response_metadata": {"next_cursor": ""}},
+        ])
+
+        first = await slack_helper.get_channel_info_async("C1", client)
+        second = await slack_helper.get_channel_info_async("C1", client)
+
+        assert first["members"] == []
+        assert second["members"] == ["U1"]
+
+    @pytest.mark.asyncio
+    async def test_history_timeout_degrades_to_no_messages(self):
+        client = _make_client()
+        client.conversations_history = AsyncMock(side_effect=asyncio.TimeoutError())
+
+        data = await slack_helper.get_slack_context_data_async("C1", client=client)
+
+        assert data["recent_messages"] == []
+        assert data["channel"]["channel_type"] == "public_channel"
+
+    @pytest.mark.asyncio
+    async def test_dm_skips_member_fetch(self):
+        client = _make_client()
+        client.conversations_info = AsyncMock(return_value={"channel": {"id": "D1", "is_im": True}})
+
+        info = await slack_helper.get_channel_info_async("D1", client)
+
+        assert info["channel_type"] == "dm"
+        client.conversations_members.assert_not_awaited()
+        slack_helper.invalidate_slack_context_cache("D1")
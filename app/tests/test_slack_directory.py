@@ -0,0 +1,115 @@
+"""
+Tests for Slack Directory
+
+Tests that verify the directory is warmed from paginated list calls and kept
+current from membership/user events without extra Slack round-trips.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from slack_sdk.errors import SlackApiError
+
+from app.cc_utils import slack_directory
+from app.cc_utils.slack_directory import SlackDirectory
+
+
+def _make_client():
+    client = MagicMock()
+    client.users_list = AsyncMock(side_effect=[
+        {"members": [{"id": "U1", "real_name": "Alice", "profile": {}}],
+         "response_metadata": {"next_cursor": "page2"}},
+        {"members": [{"id": "U2", "real_name": "Bob", "profile": {"display_name": "bobby"}}],
+         "response_metadata": {"next_cursor": ""}},
+    ])
+    client.conversations_list = AsyncMock(return_value={
+        "channels": [{"id": "C1", "name": "general", "is_member": True}],
+        "response_metadata": {"next_cursor": ""}
+    })
+    client.conversations_members = AsyncMock(return_value={
+        "members": ["U1"], "response_metadata": {"next_cursor": ""}
+    })
+    client.users_info = AsyncMock()
+    client.conversations_info = AsyncMock()
+    return client
+
+
+class TestSlackDirectory:
+    """Test suite for the Slack directory"""
+
+    @pytest.mark.asyncio
+    async def test_warm_follows_pagination(self):
+        client = _make_client()
+        directory = SlackDirectory()
+
+        await directory.warm(client)
+
+        assert client.users_list.await_count == 2
+        assert (await directory.get_user("U2", client))["real_name"] == "Bob"
+        assert await directory.is_bot_member("C1", client)
+        client.users_info.assert_not_awaited()
+        client.conversations_info.assert_not_awaited()
+        assert [u["id"] for u in directory.find_users_by_name("bob")] == ["U2"]
+
+    @pytest.mark.asyncio
+    async def test_membership_events_update_cache(self):
+        client = _make_client()
+        directory = SlackDirectory()
+        await directory.warm(client)
+
+        assert await directory.get_channel_members("C1", client) == ["U1"]
+        directory.on_member_joined("C1", "U2")
+        directory.on_member_left("C1", "U1")
+
+        assert await directory.get_channel_members("C1", client) == ["U2"]
+        assert client.conversations_members.await_count == 1
+
+        directory.on_bot_left("C1")
+        assert not await directory.is_bot_member("C1", client)
+
+    @pytest.mark.asyncio
+    async def test_user_change_replaces_profile(self):
+        client = _make_client()
+        directory = SlackDirectory()
+        await directory.warm(client)
+
+        directory.on_user_change({"id": "U1", "real_name": "Alice Kim", "profile": {}})
+
+        assert (await directory.get_user("U1", client))["real_name"] == "Alice Kim"
+
+    @pytest.mark.asyncio
+    async def test_failed_warm_falls_back_to_users_list(self):
+        client = _make_client()
+        users_pages = list(client.users_list.side_effect)
+        client.users_list = AsyncMock(side_effect=[SlackApiError("ratelimited", {"error": "ratelimited"})] + users_pages)
+        directory = SlackDirectory()
+
+        await directory.warm(client)
+        assert not directory.is_warmed
+
+        matches = await directory.search_users("bob", client)
+        assert [u["id"] for u in matches] == ["U2"]
+        assert directory.is_warmed
+
+    @pytest.mark.asyncio
+    async def test_stale_warm_and_misses_reload_users(self):
+        client = _make_client()
+        directory = SlackDirectory()
+        await directory.warm(client)
+        client.users_list = AsyncMock(return_value={
+            "members": [{"id": "U3", "real_name": "Carol", "profile": {}}],
+            "response_metadata": {"next_cursor": ""},
+        })
+
+        # Fresh warm: a miss right after loading is trusted
+        assert await directory.search_users("carol", client) == []
+        client.users_list.assert_not_awaited()
+
+        # Past the reload interval a miss reloads the list
+        with patch.object(slack_directory, "USERS_RELOAD_MIN_INTERVAL_SECONDS", 0):
+            assert [u["id"] for u in await directory.search_users("carol", client)] == ["U3"]
+        assert client.users_list.await_count == 1
+
+        # Past the user TTL the warm is stale
+        with patch.object(slack_directory, "USER_TTL_SECONDS", 0):
+            assert not directory.is_warmed
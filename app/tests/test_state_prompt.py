@@ -0,0 +1,87 @@
+"""
+Tests for State Prompt Builder
+
+Tests that stable sections come before volatile state so prompt prefixes are
+shared between requests, and that members/messages stay within token budgets.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.cc_agents.state_prompt import budget_messages, build_state_prompt, compact_slack_data
+
+SETTINGS = SimpleNamespace(
+    FILESYSTEM_BASE_DIR="/tmp/kira",
+    BOT_NAME="KIRA",
+    BOT_EMAIL="kira@example.com",
+    BOT_ORGANIZATION="Acme",
+    BOT_TEAM="Platform",
+    BOT_AUTHORIZED_USERS_EN="",
+    BOT_AUTHORIZED_USERS_KR="",
+    ATLASSIAN_CONFLUENCE_DEFAULT_PAGE_ID="",
+    STATE_PROMPT_MEMBERS_MAX_TOKENS=1500,
+    STATE_PROMPT_MESSAGES_MAX_TOKENS=3000,
+)
+
+
+def _member(index):
+    return {"user_id": f"U{index:04d}", "real_name": f"User {index}", "display_name": "", "email": f"user{index}@example.com"}
+
+
+def _slack_data(member_count=3, messages=None):
+    return {
+        "channel": {"channel_id": "C1", "channel_name": "general", "channel_type": "public_channel", "topic": "", "purpose": "", "member_count": member_count},
+        "members": [_member(index) for index in range(member_count)],
+        "recent_messages": messages or ["[User 1]: 안녕하세요"],
+    }
+
+
+@pytest.fixture(autouse=True)
+def settings():
+    with patch("app.cc_agents.state_prompt.get_settings", return_value=SETTINGS):
+        yield
+
+
+class TestStatePrompt:
+    """Test suite for the state prompt builder"""
+
+    def test_stable_sections_precede_volatile_state(self):
+        first, _ = build_state_prompt(_slack_data(), {"user_id": "U0001", "user_text": "회의록 정리해줘"})
+        second, _ = build_state_prompt(_slack_data(), {"user_id": "U0002", "user_text": "배포 일정 알려줘"})
+
+        prefix = first[:first.index("### 현재 시각")]
+        assert second.startswith(prefix)
+        assert "U0001" not in prefix
+        # Compact serialization
+        assert '"current_message":{"user_id":"U0001"' in first
+
+    def test_members_capped_with_sender_and_speakers_first(self):
+        slack_data = _slack_data(member_count=500, messages=["[User 300]: 확인 부탁드려요"])
+
+        compacted = compact_slack_data(slack_data, {"user_id": "U0450"}, members_max_tokens=200)
+
+        user_ids = [member["user_id"] for member in compacted["members"]]
+        assert user_ids[:2] == ["U0450", "U0300"]
+        assert "display_name" not in compacted["members"][0]
+        assert compacted["members_omitted"].startswith(f"{500 - len(user_ids)}명 생략")
+
+    def test_messages_keep_newest_and_summarize_the_rest(self):
+        messages = [f"[User {index % 3}]: {'긴 메시지 ' * 20}{index}" for index in range(50)]
+
+        kept, omitted = budget_messages(messages, max_tokens=300)
+
+        assert kept and kept[-1].endswith("49")
+        assert omitted == messages[:len(messages) - len(kept)]
+        compacted = compact_slack_data(_slack_data(messages=messages), messages_max_tokens=300)
+        assert compacted["earlier_messages"].startswith(f"이전 메시지 {len(omitted)}개 생략 (참여자: User 0, User 1, User 2)")
+
+    def test_section_token_report(self):
+        small, small_tokens = build_state_prompt(_slack_data(member_count=5))
+        large, large_tokens = build_state_prompt(_slack_data(member_count=2000))
+
+        assert set(small_tokens) == {"guide", "current_time", "state_data", "language"}
+        assert small_tokens["guide"] == large_tokens["guide"]
+        # Members beyond the budget are not serialized
+        assert large_tokens["state_data"] <= SETTINGS.STATE_PROMPT_MEMBERS_MAX_TOKENS + SETTINGS.STATE_PROMPT_MESSAGES_MAX_TOKENS + 200
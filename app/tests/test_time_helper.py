@@ -0,0 +1,54 @@
+"""
+Tests for Time Helper
+
+Tests relative-date resolution and timezone conversion used by the
+in-process time MCP server and the state prompt.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.cc_utils.time_helper import convert_time, format_current_time, resolve_relative_date
+
+# Wednesday
+NOW = datetime(2025, 1, 8, 15, 30, tzinfo=ZoneInfo("Asia/Seoul"))
+
+
+def _range(expression):
+    resolved = resolve_relative_date(expression, NOW)
+    return resolved["start"], resolved["end"]
+
+
+class TestTimeHelper:
+    """Test suite for time helper functions"""
+
+    def test_single_days(self):
+        assert _range("어제") == ("2025-01-07", "2025-01-07")
+        assert _range("3일 전") == ("2025-01-05", "2025-01-05")
+        assert _range("in 2 weeks") == ("2025-01-22", "2025-01-22")
+        assert _range("다음 주 월요일") == ("2025-01-13", "2025-01-13")
+        assert _range("last friday") == ("2025-01-03", "2025-01-03")
+
+    def test_periods_cross_boundaries(self):
+        assert _range("이번 주") == ("2025-01-06", "2025-01-12")
+        assert _range("last week") == ("2024-12-30", "2025-01-05")
+        assert _range("지난달") == ("2024-12-01", "2024-12-31")
+        assert _range("작년") == ("2024-01-01", "2024-12-31")
+        assert _range("최근 7일") == ("2025-01-01", "2025-01-08")
+
+    def test_unrecognized_expression(self):
+        with pytest.raises(ValueError):
+            resolve_relative_date("언젠가", NOW)
+
+    def test_convert_time(self):
+        converted = convert_time("2025-01-08 09:00", "Asia/Seoul", "America/New_York")
+
+        assert converted["target"]["datetime"] == "2025-01-07T19:00:00-05:00"
+        assert converted["time_difference"] == "-14h"
+        with pytest.raises(ValueError):
+            convert_time("09:00", "Mars/Olympus", "Asia/Seoul")
+
+    def test_format_current_time(self):
+        assert format_current_time(NOW) == "2025-01-08 15:30 (수요일, Asia/Seoul, UTC+09:00)"
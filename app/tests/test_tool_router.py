@@ -0,0 +1,100 @@
+"""
+Tests for Operator Tool Router
+
+Tests that requests attach only the MCP servers they need, that servers
+requested mid-session are handed over once and that the operator resumes
+for them only when it has not answered yet.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.cc_agents.operator import agent as operator_agent
+from app.config.settings import get_settings
+from app.cc_agents.operator.tool_router import (
+    CORE_SERVERS,
+    ToolEscalation,
+    select_servers_by_rules,
+    select_tool_servers,
+)
+
+AVAILABLE = CORE_SERVERS | {
+    "context7", "arxiv", "airbnb", "youtube-info", "steam-review",
+    "perplexity", "github", "atlassian", "playwright",
+}
+
+
+class TestToolRouter:
+    """Test suite for the operator tool router"""
+
+    def test_keywords_and_urls_select_servers(self):
+        assert select_servers_by_rules("이 논문 요약해줘 https://arxiv.org/abs/2401.00001", available=AVAILABLE) == {"arxiv"}
+        assert select_servers_by_rules("https://acme.atlassian.net/wiki/spaces/X/pages/1 정리해줘", available=AVAILABLE) == {"atlassian"}
+        # Links without a dedicated server are opened in the browser
+        assert select_servers_by_rules("https://example.com/blog 내용 알려줘", available=AVAILABLE) == {"playwright"}
+        # Links in retrieved memory count, its wording does not
+        assert select_servers_by_rules("지난번 문서 다시 보여줘", retrieved_memory="문서: https://github.com/acme/repo 워크샵 논문", available=AVAILABLE) == {"github"}
+
+    def test_disabled_servers_are_never_selected(self):
+        assert select_servers_by_rules("깃랩 MR 확인해줘", available=AVAILABLE) == set()
+
+    @pytest.mark.asyncio
+    async def test_short_lookup_gets_only_core_servers(self):
+        with patch("app.cc_agents.operator.tool_router.select_servers_by_llm", new=AsyncMock()) as llm:
+            selected = await select_tool_servers("오늘 몇 시야?", AVAILABLE)
+
+        assert selected == CORE_SERVERS
+        llm.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_llm_fallback_for_unmatched_requests(self):
+        query = "다음 분기 팀 온보딩 프로그램을 어떻게 구성하면 좋을지 아이디어를 정리해서 알려줘"
+        llm = AsyncMock(return_value={"perplexity"})
+        with patch("app.cc_agents.operator.tool_router.select_servers_by_llm", new=llm):
+            # Off by default
+            assert await select_tool_servers(query, AVAILABLE) == CORE_SERVERS
+            llm.assert_not_awaited()
+
+            with patch.object(get_settings(), "TOOL_ROUTER_LLM_FALLBACK", True):
+                selected = await select_tool_servers(query, AVAILABLE)
+
+        assert selected == CORE_SERVERS | {"perplexity"}
+
+    def test_escalation_hands_out_requested_servers_once(self):
+        escalation = ToolEscalation({"github": "GitHub", "arxiv": "arXiv"})
+
+        assert escalation.request(["github", "unknown"]) == {"github"}
+        assert escalation.take() == {"github"}
+        assert escalation.take() == set()
+        assert list(escalation.unattached) == ["arxiv"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("replied, expected_rounds", [(False, 2), (True, 1)])
+    async def test_resume_only_when_not_answered(self, replied, expected_rounds):
+        escalation = ToolEscalation({"github": "GitHub"})
+        rounds = []
+
+        async def run_session(options, query, message_data, settings, priority):
+            rounds.append(query)
+            if len(rounds) == 1:
+                escalation.request(["github"])
+                return "도구를 요청했습니다.", "session-1", replied
+            return "PR 목록입니다.", "session-1", True
+
+        context = SimpleNamespace(state_prompt="", retrieved_memory="", estimated_tokens=0, actions=[])
+        with patch.object(operator_agent, "build_mcp_servers_dict", return_value={"slack": {}, "github": {}}), \
+                patch.object(operator_agent, "select_tool_servers", new=AsyncMock(return_value={"slack"})), \
+                patch.object(operator_agent, "ToolEscalation", return_value=escalation), \
+                patch.object(operator_agent, "create_tool_request_server", return_value=MagicMock()), \
+                patch.object(operator_agent, "route_mcp_servers", new=AsyncMock(side_effect=lambda servers: servers)), \
+                patch.object(operator_agent, "plan_operator_context", return_value=context), \
+                patch.object(operator_agent, "_run_operator_session", new=run_session), \
+                patch.object(operator_agent, "save_to_memory", new=AsyncMock()) as save:
+            await operator_agent.call_operator_agent("깃허브 PR 목록 보여줘", {"channel": {}}, {"channel_id": "C1"})
+
+        assert len(rounds) == expected_rounds
+        saved = save.await_args.args[1]
+        assert saved.startswith("도구를 요청했습니다.")
+        assert ("PR 목록입니다." in saved) == (expected_rounds == 2)